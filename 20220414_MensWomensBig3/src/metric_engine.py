@@ -0,0 +1,171 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 15:45:01 2026
+
+@author: agent
+
+:DESCRIPTION: Compute composite win/loss metrics (win pct., group totals,
+    group averages, RPI averages and group differences) for any number of
+    sports in a single vectorized pass.
+
+    Sports are stacked into a (team-season x sport) matrix and every derived
+    metric is produced with NumPy matrix operations against a membership
+    matrix (group totals) and a weight matrix (group averages) built from
+    the configuration in `dict_sport_groups`.
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import numpy as np
+import pandas as pd
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+# sport groups and the weight each sport carries within its group
+#   (weights are normalized within each group, so equal weights give a
+#    simple average)
+dict_sport_groups = {'Men':{'MBA':1, 'MBB':1, 'MFB':1},
+                     'Women':{'WBB':1, 'WSB':1, 'WVB':1}}
+
+# group comparisons to compute as differences (first group minus second);
+#   the key is appended to the `Diff_*` variable names
+dict_group_diffs = {'':('Men', 'Women')}
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def buildGroupMatrices(list_sports, dict_groups):
+    '''
+    Purpose: Build the (sport x group) membership and weight matrices used
+        to roll sport-level metrics up to group-level metrics
+
+    Inputs
+    ------
+        list_sports : list of strings
+            Sport abbreviations in the column order of the metric matrices
+        dict_groups : dictionary
+            Keys are group names, values are dictionaries of sport: weight
+
+    Outputs
+    -------
+        array_member : NumPy array
+            1 where a sport belongs to a group, 0 otherwise
+        array_weight : NumPy array
+            Normalized weight of each sport within each group (columns sum to 1)
+    '''
+    array_member = np.zeros((len(list_sports), len(dict_groups)))
+    array_weight = np.zeros((len(list_sports), len(dict_groups)))
+
+    for idx_group, dict_weights in enumerate(dict_groups.values()):
+        for sport, weight in dict_weights.items():
+            idx_sport = list_sports.index(sport)
+            array_member[idx_sport, idx_group] = 1
+            array_weight[idx_sport, idx_group] = weight
+
+    # normalize weights within each group
+    array_weight = array_weight / array_weight.sum(axis = 0)
+
+    return array_member, array_weight
+
+def computeCompositeMetrics(df, dict_groups = dict_sport_groups,
+                            dict_diffs = dict_group_diffs):
+    '''
+    Purpose: Compute win pct. for every sport and the totals, averages, RPI
+        averages and differences for every sport group in one vectorized pass
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Contains `{sport}_W`, `{sport}_L` and `{sport}_Rank` variables for
+            every sport referenced in `dict_groups`
+        dict_groups : dictionary
+            Keys are group names, values are dictionaries of sport: weight
+            (default: `dict_sport_groups`)
+        dict_diffs : dictionary
+            Keys are `Diff_*` name suffixes, values are (group, group) tuples
+            (default: `dict_group_diffs`)
+
+    Outputs
+    -------
+        df : Pandas DataFrame
+            Original DataFrame with the following variables added:
+                - `{sport}_Win_Pct` for every sport
+                - `W_{group}` / `L_{group}` (group totals)
+                - `win_pct_{group}` (pct. of group totals)
+                - `win_pct_avg_{group}` (weighted avg. of sport win pcts.)
+                - `rpi_avg_{group}` (weighted avg. of sport rankings)
+                - `Diff_Win_Pct`, `Diff_Win_Pct_Avg`, `Diff_RPI_Avg`
+    '''
+    # retain the order in which sports first appear in the configuration
+    list_sports = list(dict.fromkeys(
+        [sport for dict_weights in dict_groups.values() for sport in dict_weights]))
+    list_groups = list(dict_groups.keys())
+    array_member, array_weight = buildGroupMatrices(list_sports, dict_groups)
+
+    # stack every sport into (team-season x sport) matrices
+    array_w    = df[[f'{x}_W' for x in list_sports]].to_numpy(dtype = float)
+    array_l    = df[[f'{x}_L' for x in list_sports]].to_numpy(dtype = float)
+    array_rank = df[[f'{x}_Rank' for x in list_sports]].to_numpy(dtype = float)
+
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        # sport-level win pct.
+        array_win_pct = array_w / (array_w + array_l)
+
+        # group-level totals, win pct., averages and RPI averages
+        array_w_group = array_w @ array_member
+        array_l_group = array_l @ array_member
+        array_win_pct_group = array_w_group / (array_w_group + array_l_group)
+    array_win_pct_avg = array_win_pct @ array_weight
+    array_rpi_avg     = array_rank @ array_weight
+
+    # assemble output variables
+    dict_metrics = {}
+    for idx, sport in enumerate(list_sports):
+        dict_metrics[f'{sport}_Win_Pct'] = array_win_pct[:, idx]
+    for idx, group in enumerate(list_groups):
+        dict_metrics[f'W_{group}'] = array_w_group[:, idx]
+        dict_metrics[f'L_{group}'] = array_l_group[:, idx]
+    for idx, group in enumerate(list_groups):
+        dict_metrics[f'win_pct_{group.lower()}'] = array_win_pct_group[:, idx]
+    for idx, group in enumerate(list_groups):
+        dict_metrics[f'win_pct_avg_{group.lower()}'] = array_win_pct_avg[:, idx]
+    for idx, group in enumerate(list_groups):
+        dict_metrics[f'rpi_avg_{group.lower()}'] = array_rpi_avg[:, idx]
+
+    # differences between groups
+    for suffix, (group_a, group_b) in dict_diffs.items():
+        idx_a = list_groups.index(group_a)
+        idx_b = list_groups.index(group_b)
+        dict_metrics[f'Diff_Win_Pct{suffix}'] = (
+            array_win_pct_group[:, idx_a] - array_win_pct_group[:, idx_b])
+        dict_metrics[f'Diff_Win_Pct_Avg{suffix}'] = (
+            array_win_pct_avg[:, idx_a] - array_win_pct_avg[:, idx_b])
+        dict_metrics[f'Diff_RPI_Avg{suffix}'] = (
+            array_rpi_avg[:, idx_a] - array_rpi_avg[:, idx_b])
+
+    # add all metrics to the table at once
+    df_metrics = pd.DataFrame(dict_metrics, index = df.index)
+    df = df.drop(columns = [x for x in df_metrics.columns if x in df.columns])
+    df = pd.concat([df, df_metrics], axis = 1)
+
+    return df
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Compute composite metrics for the men's vs. women's Big 3
+# df = pd.read_csv(r'data/results_all_years.csv').dropna()
+# df = computeCompositeMetrics(df)
+
+# # Add a new grouping (e.g. all six sports) without editing any formulas
+# dict_groups = dict(dict_sport_groups)
+# dict_groups['All'] = {'MBA':1, 'MBB':1, 'MFB':1, 'WBB':1, 'WSB':1, 'WVB':1}
+# df = computeCompositeMetrics(df, dict_groups)
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 15:45:35 2026
+
+@author: agent
+
+:DESCRIPTION: Rank a list of team-season metrics globally, within a season,
+    within a conference and within a conference-season in one pass.
+
+    All metrics (and their absolute-value variants) are oriented so that a
+    single ascending `rank(method = 'min')` call per grouping level ranks
+    every metric at once:
+        - standard metrics are negated (largest value = rank 1)
+        - absolute-value metrics are left as-is (smallest value = rank 1)
+
+    Ranks can also be maintained incrementally when a new season is
+    appended: global ranks with a sorted-array order-statistic index and
+    ranks within a grouping level by re-ranking only the groups of the new
+    team-seasons (a new season is a group of its own).
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import numpy as np
+import pandas as pd
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+# grouping levels to rank within; the key is appended to the `rank_*`
+#   variable names ('' = rank against every team-season on file)
+dict_rank_levels = {'':[],
+                    'season':['season'],
+                    'conf':['conf'],
+                    'conf_season':['conf', 'season']}
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def orientMetrics(df, list_metrics, list_metrics_abs = []):
+    '''
+    Purpose: Orient metrics so that an ascending rank gives the desired
+        ordering (standard metrics are negated, absolute-value metrics are
+        converted to their absolute values)
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Contains the metrics to be oriented
+        list_metrics : list of strings
+            Variables to rank in descending order
+        list_metrics_abs : list of strings
+            Variables whose absolute values are ranked in ascending order
+            (default: [])
+
+    Outputs
+    -------
+        df_oriented : Pandas DataFrame
+            Oriented metrics named after their global rank variables
+            (i.e. `rank_{metric}` and `rank_{metric}_abs`)
+    '''
+    df_oriented = pd.concat([-df[list_metrics], df[list_metrics_abs].abs()],
+                            axis = 1)
+    df_oriented.columns = [f'rank_{x}' for x in list_metrics] + [
+        f'rank_{x}_abs' for x in list_metrics_abs]
+
+    return df_oriented
+
+def rankMetrics(df, list_metrics, list_metrics_abs = [],
+                dict_levels = dict_rank_levels):
+    '''
+    Purpose: Rank every metric (largest value = 1) and the absolute value of
+        every absolute-value metric (smallest value = 1) within each
+        grouping level using ties ranked by their minimum value
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Contains the metrics to be ranked and the grouping variables
+            referenced in `dict_levels`
+        list_metrics : list of strings
+            Variables to rank in descending order
+        list_metrics_abs : list of strings
+            Variables whose absolute values are ranked in ascending order
+            (default: [])
+        dict_levels : dictionary
+            Keys are name suffixes, values are lists of grouping variables
+            (default: `dict_rank_levels`)
+
+    Outputs
+    -------
+        df : Pandas DataFrame
+            Original DataFrame with the following variables added for every
+            grouping level:
+                - `rank_{metric}_{level}` for every metric in `list_metrics`
+                - `rank_{metric}_abs_{level}` for every metric in
+                  `list_metrics_abs`
+            (the `_{level}` suffix is omitted for the global level)
+    '''
+    # orient every metric so that ascending rank order is correct
+    df_oriented = orientMetrics(df, list_metrics, list_metrics_abs)
+    list_names = list(df_oriented.columns)
+
+    # rank all metrics at once for each grouping level
+    list_ranks = []
+    for level, list_keys in dict_levels.items():
+        if len(list_keys) == 0:
+            df_rank = df_oriented.rank(method = 'min')
+        else:
+            df_rank = df_oriented.groupby(
+                [df[x] for x in list_keys]).rank(method = 'min')
+        if level != '':
+            df_rank.columns = [f'{x}_{level}' for x in list_names]
+        list_ranks.append(df_rank)
+
+    # add all ranks to the table at once
+    df_ranks = pd.concat(list_ranks, axis = 1)
+    df = df.drop(columns = [x for x in df_ranks.columns if x in df.columns])
+    df = pd.concat([df, df_ranks], axis = 1)
+
+    return df
+
+def buildRankIndex(df, list_metrics, list_metrics_abs = []):
+    '''
+    Purpose: Build a sorted-array order-statistic index for the global rank
+        of every metric so that new rows can be ranked incrementally
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Contains the metrics to be indexed
+        list_metrics : list of strings
+            Variables ranked in descending order
+        list_metrics_abs : list of strings
+            Variables whose absolute values are ranked in ascending order
+            (default: [])
+
+    Outputs
+    -------
+        dict_index : dictionary
+            Keys are global rank variable names, values are tuples of
+            (oriented values sorted ascending, row labels in the same order);
+            missing values are excluded
+    '''
+    df_oriented = orientMetrics(df, list_metrics, list_metrics_abs)
+
+    dict_index = {}
+    for name in df_oriented.columns:
+        series = df_oriented[name].dropna()
+        array_order = np.argsort(series.to_numpy(), kind = 'mergesort')
+        dict_index[name] = (series.to_numpy()[array_order],
+                            series.index.to_numpy()[array_order])
+
+    return dict_index
+
+def appendRanks(df, df_new, dict_index, list_metrics, list_metrics_abs = [],
+                dict_levels = dict_rank_levels):
+    '''
+    Purpose: Append new team-seasons to a ranked table, rank the new rows and
+        update only the existing ranks that change
+
+        With ties ranked by their minimum value, a row's rank is one plus the
+        number of (oriented) values strictly below it. Each new row is ranked
+        with binary searches against the index and an existing row's rank
+        only increases by the number of new values strictly below it, so only
+        rows above the smallest new value are rewritten.
+
+        Within every other grouping level only the groups containing a new
+        team-season are re-ranked. A new season is a group of its own at the
+        `season` and `conf_season` levels (existing ranks are unchanged),
+        while every conference of the new season is re-ranked at the `conf`
+        level.
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Ranked table (with a default integer index) on which `dict_index`
+            was built (existing ranks are updated in place)
+        df_new : Pandas DataFrame
+            New team-seasons containing the same metrics
+        dict_index : dictionary
+            Index returned by `buildRankIndex` (or a previous `appendRanks`)
+        list_metrics : list of strings
+            Variables ranked in descending order
+        list_metrics_abs : list of strings
+            Variables whose absolute values are ranked in ascending order
+            (default: [])
+        dict_levels : dictionary
+            Keys are name suffixes, values are lists of grouping variables
+            (default: `dict_rank_levels`, the levels `rankMetrics` used)
+
+    Outputs
+    -------
+        df : Pandas DataFrame
+            Ranked table with the new team-seasons appended
+        dict_index : dictionary
+            Index updated to include the new team-seasons
+        dict_changed : dictionary
+            Keys are rank variable names, values are the row labels of
+            existing team-seasons whose rank changed
+    '''
+    # continue the existing row labels for the new team-seasons
+    df_new = df_new.copy()
+    df_new.index = pd.RangeIndex(len(df), len(df) + len(df_new))
+    df_oriented_new = orientMetrics(df_new, list_metrics, list_metrics_abs)
+
+    dict_changed = {}
+    for name, (array_values, array_labels) in dict_index.items():
+        series_new = df_oriented_new[name].dropna()
+        array_order = np.argsort(series_new.to_numpy(), kind = 'mergesort')
+        array_values_new = series_new.to_numpy()[array_order]
+        array_labels_new = series_new.index.to_numpy()[array_order]
+
+        # rank new rows against existing rows and against each other
+        array_rank_new = (np.searchsorted(array_values, array_values_new, 'left')
+                          + np.searchsorted(array_values_new, array_values_new, 'left')
+                          + 1)
+        df_new[name] = pd.Series(array_rank_new.astype(float),
+                                 index = array_labels_new)
+
+        # shift existing ranks above the smallest new value
+        if len(array_values_new) > 0:
+            pos = np.searchsorted(array_values, array_values_new[0], 'right')
+            array_shift = np.searchsorted(array_values_new,
+                                          array_values[pos:], 'left')
+            df.loc[array_labels[pos:], name] = (
+                df.loc[array_labels[pos:], name].to_numpy() + array_shift)
+            dict_changed[name] = array_labels[pos:]
+        else:
+            dict_changed[name] = array_labels[:0]
+
+        # merge new values into the sorted index
+        array_insert = np.searchsorted(array_values, array_values_new, 'right')
+        dict_index[name] = (np.insert(array_values, array_insert, array_values_new),
+                            np.insert(array_labels, array_insert, array_labels_new))
+
+    df = pd.concat([df, df_new])
+
+    # re-rank the groups of the new team-seasons within every other level
+    df_oriented = orientMetrics(df, list_metrics, list_metrics_abs)
+    for level, list_keys in dict_levels.items():
+        if len(list_keys) == 0:
+            continue
+        array_groups = pd.MultiIndex.from_frame(df[list_keys]).isin(
+            pd.MultiIndex.from_frame(df_new[list_keys]))
+        df_rank = df_oriented[array_groups].groupby(
+            [df.loc[array_groups, x] for x in list_keys]).rank(method = 'min')
+        df_rank.columns = [f'{x}_{level}' for x in df_oriented.columns]
+
+        # existing team-seasons whose rank changed
+        df_old = df.reindex(columns = df_rank.columns).loc[df_rank.index]
+        array_existing = df_rank.index < len(df) - len(df_new)
+        for name in df_rank.columns:
+            array_diff = ((df_old[name] != df_rank[name])
+                          & ~(df_old[name].isna() & df_rank[name].isna())).to_numpy()
+            dict_changed[name] = df_rank.index.to_numpy()[array_diff & array_existing]
+        df.loc[df_rank.index, list(df_rank.columns)] = df_rank
+
+    return df, dict_index, dict_changed
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Rank the men's vs. women's metrics at every level
+# df = pd.read_csv(r'data/teams_2006_to_2022.csv')
+# df = rankMetrics(df,
+#                  ['win_pct_men', 'win_pct_women', 'diff_win_pct'],
+#                  ['diff_win_pct'])
+
+# # Nebraska's standing within the Big Ten for each season
+# df[df['team'] == 'Nebraska'][['season', 'rank_diff_win_pct_conf_season']]
+
+# # Add a new season without re-ranking every team-season on file
+# list_metrics, list_metrics_abs = ['diff_win_pct'], ['diff_win_pct']
+# dict_index = buildRankIndex(df, list_metrics, list_metrics_abs)
+# df, dict_index, dict_changed = appendRanks(df, df_season_new, dict_index,
+#                                            list_metrics, list_metrics_abs)
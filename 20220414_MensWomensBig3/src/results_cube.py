@@ -0,0 +1,219 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 15:46:58 2026
+
+@author: agent
+
+:DESCRIPTION: Store win/loss/rank results for every team, season and sport
+    as a dense, memory-mapped NumPy cube indexed by
+    [team, season, sport, stat] with stats ordered (W, L, Rank).
+
+    The cube is written once from `results_all_years.csv` to
+    `data/results_cube.npy` alongside a `data/results_cube.json` sidecar that
+    maps team, season, sport and stat names to indices. Loading the cube
+    memory-maps it read-only, so several processes can share the same pages
+    without copying and slices such as "Nebraska, all seasons, all sports"
+    are O(1) views. Missing team/season/sport combinations are NaN.
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import json
+import numpy as np
+import pandas as pd
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+list_cube_sports = ['MFB', 'MBA', 'MBB', 'WBB', 'WSB', 'WVB']
+list_cube_stats  = ['W', 'L', 'Rank']
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def buildResultsCube(df, path_cube = r'data/results_cube.npy',
+                     list_sports = list_cube_sports):
+    '''
+    Purpose: Convert the wide results table into a dense
+        [team, season, sport, stat] cube and write it (and its sidecar
+        index dictionaries) to disk
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Contains `Season`, `Team` and `{sport}_W`, `{sport}_L` and
+            `{sport}_Rank` variables (i.e. the output of `mergeAllData`)
+        path_cube : string
+            File path of the `.npy` cube; the sidecar is written next to it
+            with a `.json` extension (default: 'data/results_cube.npy')
+        list_sports : list of strings
+            Sports to include in the cube (default: `list_cube_sports`)
+
+    Outputs
+    -------
+        cube : NumPy memmap
+            Read-only memory-mapped cube of shape
+            (# teams, # seasons, # sports, # stats)
+        dict_lookup : dictionary
+            Keys are 'team', 'season', 'sport' and 'stat', values are
+            dictionaries of name: index
+    '''
+    # build sorted sidecar dictionaries of name -> index
+    list_teams   = sorted(df['Team'].dropna().unique())
+    list_seasons = sorted(df['Season'].dropna().unique())
+    dict_lookup = {'team':{x:i for i, x in enumerate(list_teams)},
+                   'season':{x:i for i, x in enumerate(list_seasons)},
+                   'sport':{x:i for i, x in enumerate(list_sports)},
+                   'stat':{x:i for i, x in enumerate(list_cube_stats)}}
+
+    # map every row to its (team, season) cell
+    df = df.dropna(subset = ['Team', 'Season'])
+    array_team   = df['Team'].map(dict_lookup['team']).to_numpy()
+    array_season = df['Season'].map(dict_lookup['season']).to_numpy()
+
+    # stack stats into a (row x sport x stat) block
+    list_cols = [f'{sport}_{stat}' for sport in list_sports
+                 for stat in list_cube_stats]
+    array_rows = df.reindex(columns = list_cols).apply(
+        pd.to_numeric, errors = 'coerce').to_numpy(dtype = float)
+    array_rows = array_rows.reshape(len(df), len(list_sports),
+                                    len(list_cube_stats))
+
+    # write the cube straight to disk and scatter every row into place
+    cube = np.lib.format.open_memmap(
+        path_cube, mode = 'w+', dtype = np.float64,
+        shape = (len(list_teams), len(list_seasons),
+                 len(list_sports), len(list_cube_stats)))
+    cube[:] = np.nan
+    cube[array_team, array_season] = array_rows
+    cube.flush()
+    del cube
+
+    # write the sidecar dictionaries
+    with open(path_cube.replace('.npy', '.json'), 'w') as file:
+        json.dump(dict_lookup, file, indent = 1)
+
+    return loadResultsCube(path_cube)
+
+def loadResultsCube(path_cube = r'data/results_cube.npy'):
+    '''
+    Purpose: Memory-map the results cube (read-only) and load its sidecar
+        index dictionaries
+
+    Inputs
+    ------
+        path_cube : string
+            File path of the `.npy` cube (default: 'data/results_cube.npy')
+
+    Outputs
+    -------
+        cube : NumPy memmap
+            Read-only memory-mapped cube of shape
+            (# teams, # seasons, # sports, # stats)
+        dict_lookup : dictionary
+            Keys are 'team', 'season', 'sport' and 'stat', values are
+            dictionaries of name: index
+    '''
+    cube = np.load(path_cube, mmap_mode = 'r')
+    with open(path_cube.replace('.npy', '.json'), 'r') as file:
+        dict_lookup = json.load(file)
+
+    return cube, dict_lookup
+
+def sliceCube(cube, dict_lookup, team = None, season = None, sport = None,
+              stat = None):
+    '''
+    Purpose: Retrieve a slice of the results cube by name
+
+    Inputs
+    ------
+        cube : NumPy memmap
+            Cube returned by `buildResultsCube` or `loadResultsCube`
+        dict_lookup : dictionary
+            Sidecar index dictionaries for the cube
+        team : string or list of strings
+            Team name(s) to select (default: None = all teams)
+        season : string or list of strings
+            Season(s) to select, e.g. '2021-22' (default: None = all seasons)
+        sport : string or list of strings
+            Sport abbreviation(s) to select (default: None = all sports)
+        stat : string or list of strings
+            Stat(s) to select: 'W', 'L' or 'Rank' (default: None = all stats)
+
+    Outputs
+    -------
+        array_slice : NumPy array
+            Selected values; single names drop their axis and are returned
+            as views of the memory map, lists keep their axis
+    '''
+    list_index = []
+    for axis, value in zip(['team', 'season', 'sport', 'stat'],
+                           [team, season, sport, stat]):
+        if value is None:
+            list_index.append(slice(None))
+        elif isinstance(value, str):
+            list_index.append(dict_lookup[axis][value])
+        else:
+            list_index.append([dict_lookup[axis][x] for x in value])
+
+    # apply list (fancy) indices one axis at a time so that they are not
+    #   broadcast against each other
+    array_slice = cube[tuple(x if not isinstance(x, list) else slice(None)
+                             for x in list_index)]
+    axis = 0
+    for x in list_index:
+        if isinstance(x, list):
+            array_slice = np.take(array_slice, x, axis = axis)
+        if not isinstance(x, int):
+            axis += 1
+
+    return array_slice
+
+def computeCubeWinPct(cube, dict_lookup):
+    '''
+    Purpose: Compute win pct. for every team, season and sport at once
+
+    Inputs
+    ------
+        cube : NumPy memmap
+            Cube returned by `buildResultsCube` or `loadResultsCube`
+        dict_lookup : dictionary
+            Sidecar index dictionaries for the cube
+
+    Outputs
+    -------
+        array_win_pct : NumPy array
+            Win pct. of shape (# teams, # seasons, # sports)
+    '''
+    array_w = cube[..., dict_lookup['stat']['W']]
+    array_l = cube[..., dict_lookup['stat']['L']]
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        array_win_pct = array_w / (array_w + array_l)
+
+    return array_win_pct
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Build the cube from the merged results for all sports/years
+# cube, dict_lookup = buildResultsCube(pd.read_csv(r'data/results_all_years.csv'))
+
+# # Memory-map the existing cube (e.g. from another process)
+# cube, dict_lookup = loadResultsCube()
+
+# # Nebraska, all seasons, all sports
+# array_neb = sliceCube(cube, dict_lookup, team = 'Nebraska')
+
+# # Men's Big 3 wins for every team in 2021-22
+# array_wins = sliceCube(cube, dict_lookup, season = '2021-22',
+#                        sport = ['MBA', 'MBB', 'MFB'], stat = 'W')
+
+# # Win pct. for every team, season and sport
+# array_win_pct = computeCubeWinPct(cube, dict_lookup)
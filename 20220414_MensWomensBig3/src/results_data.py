@@ -0,0 +1,286 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:55:35 2026
+
+@author: agent
+
+:DESCRIPTION: Combine the scraped win/loss records of every sport and season
+    and engineer the men's vs. women's variables analyzed by
+    `analyze_results.py`:
+
+        - rollUpData       : per-season files -> `{sport}_all_years.csv`
+        - mergeAllData     : every sport -> `data/results_all_years.csv`
+        - engineerFeatures : win pct., group totals/averages, differences,
+                             conference and ranks of every team-season
+
+    Every step reads and writes paths relative to the project root.
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import glob
+import os
+import pandas as pd
+import sys
+
+# modules shared by every project (`huskerProjects/common`)
+path_common = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            os.pardir, os.pardir, 'common'))
+if path_common not in sys.path:
+    sys.path.append(path_common)
+
+from metric_engine import computeCompositeMetrics
+from ranking_engine import rankMetrics
+from run_metrics import timeStage
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def renameSchool(df, name_var):
+    '''
+    Purpose: Rename a school/university to a standard name as specified in 
+        the file `school_abbreviations.csv`
+
+    Inputs
+    ------
+        df : Pandas Dataframe
+            DataFrame containing a school-name variable for which the names
+            need to be standardized
+        name_var : string
+            Name of the variable which is to be renamed/standardized
+    
+    Outputs
+    -------
+        list(row)[0] : string
+            Standardized version of the school's name based on the first value
+            in the row in the file `school_abbreviations_and_pictures.csv`
+    '''  
+    # read in school name information
+    df_school_names = pd.read_csv('references/school_abbreviations_and_pictures.csv', 
+                                  encoding = 'latin-1')
+     
+    # convert the dataframe to a dictionary such that the keys are the
+    #   optional spelling of each school and the value is the standardized
+    #   name of the school
+    dict_school_names = {}
+    
+    for index, row in df_school_names.iterrows():
+        # isolate the alternative name columns
+        names = row[[x for x in row.index if 'Name' in x]]
+        # convert the row to a list that doesn't include NaN values
+        list_names = [x for x in names.values.tolist() if str(x) != 'nan']
+        # add the nickname to the team names as an alternative name
+        nickname = row['Nickname']
+        list_names_nicknames = list_names.copy()
+        for name in list_names:
+            list_names_nicknames.append(name + ' ' + nickname)
+        # extract the standardized team name
+        name_standardized = row['Team']
+        # add the standardized name
+        list_names_nicknames.append(name_standardized)
+        # add the nickname to the standardized name
+        list_names_nicknames.append(name_standardized + ' ' + nickname)
+        # for every alternative spelling of the team, set the value to be
+        #   the standardized name
+        for name_alternate in list_names_nicknames:
+            dict_school_names[name_alternate] = name_standardized
+            
+    # df[name_var] = df[name_var].apply(
+    #         lambda x: dict_school_names[x] if str(x) != 'nan' else '')
+    df[name_var] = df[name_var].apply(
+            lambda x: rename_school_helper(x, dict_school_names))
+        
+    return df   
+
+def rename_school_helper(name_school, dict_school_names):
+    try:
+        if str(name_school) != 'nan':
+            return dict_school_names[name_school]
+        else:
+            return ''
+    except:
+        print(f'School not found in school abbreviations .csv file: {name_school} ')
+        return name_school
+    
+def rollUpData():
+    '''
+    Purpose: Import and combine win/loss records for every year for every sport
+        on file in the local '.csv' folders (every sport is recorded as a
+        `rollUpData` stage of the active run)
+
+    Inputs   
+    ------
+        NONE
+            
+    Outputs
+    -------
+        NONE
+    '''
+    # create a list of file paths for every sport
+    list_sports = glob.glob(r'data/csv/*')
+    list_sports = [os.path.split(x)[1] for x in list_sports]
+    
+    # iterate over every sport
+    for sport in list_sports:
+        # create a list of file paths for every .csv file stored locally
+        list_files = glob.glob(rf'data/csv/{sport}/*.csv')
+        list_files = [x for x in list_files if '_all_years' not in x]
+        
+        with timeStage('rollUpData', Sport = sport) as stage:
+            # import all available files (one table for all sport/year combos)
+            df_all = pd.concat([pd.read_csv(file) for file in list_files])
+                    
+            # standardize school names
+            df_all = renameSchool(df_all, 'Team')
+                    
+            # save file to disk
+            df_all.to_csv(rf'data/csv/{sport}/{sport}_all_years.csv', index = False)
+            stage['Rows'] = len(df_all)
+        
+        print(f'Done with {sport}')
+        
+    return
+
+def mergeAllData():
+    '''
+    Purpose: Combine win/loss records for every sport/year combination
+        on file in the local '.csv' folder
+
+    Inputs   
+    ------
+        NONE
+            
+    Outputs
+    -------
+        df_all : Pandas DataFrame
+            Contains win/loss record for all available year/sport combinations
+    '''
+    # create DataFrame for storing all sports/all years
+    df_all = pd.DataFrame()
+    
+    # create a list of file paths for every sport
+    list_sports = ['MFB', 'MBA', 'MBB', 'WBB', 'WSB', 'WVB']
+    # list_sports = glob.glob(r'data/csv/*')
+    # list_sports = [os.path.split(x)[1] for x in list_sports]
+    
+    # iterate over every sport
+    for sport in list_sports:
+        
+        # import data for sport
+        df_sport = pd.read_csv(rf'data/csv/{sport}/{sport}_all_years.csv')
+        
+        # rename sport variables
+        try:
+            df_sport = df_sport.drop(columns = {'Sport', 'Conf'})
+        except:
+            df_sport = df_sport.drop(columns = {'Sport'})
+        df_sport = df_sport.rename(columns = {'Rank':f'{sport}_Rank',
+                                              'W':f'{sport}_W',
+                                              'L':f'{sport}_L'})
+        
+        # merge sports (left joins starting with football to isolate to FBS teams)
+        if len(df_all) == 0:
+            df_sport = df_sport[['Season', 'Team', 'MFB_Rank', 'MFB_W', 'MFB_L']]
+            df_all = df_sport.copy()
+        else:
+            df_all = pd.merge(df_all, df_sport, how = 'left', on = ['Season', 'Team'])
+    
+    # sort data by season/team
+    df_all = df_all.sort_values(by = ['Team', 'Season'])
+    
+    # cast to numeric to ensure data types are all ints
+    df_all['MBB_W'] = pd.to_numeric(df_all['MBB_W'])
+    
+    # save to disk
+    df_all.to_csv(r'data/results_all_years.csv', index = False)
+    
+    return df_all
+
+def engineerFeatures(df, df_teams):
+    '''
+    Purpose: Engineer the men's vs. women's variables of every team-season
+        that has all 6 sports (win pct., group totals/averages, differences,
+        conference and ranks)
+
+    Inputs   
+    ------
+        df : Pandas DataFrame
+            Output of `mergeAllData` (i.e. `data/results_all_years.csv`)
+        df_teams : Pandas DataFrame
+            Conference of every team (variables `team` and `conf`)
+            
+    Outputs
+    -------
+        df : Pandas DataFrame
+            One row per team-season with every engineered and ranked variable
+    '''
+    # Focus only on school/years that have all 6 sports (drop rows with NaNs)
+    df = df.dropna()
+    
+    # Engineer new variables (win pct., group totals/averages, differences)
+    df = computeCompositeMetrics(df)
+    df.columns = [x.lower() for x in list(df.columns)]
+    
+    # Add conference information to each table
+    df = pd.merge(df, df_teams, how = 'left', on = 'team')
+    df.reset_index(drop = True)
+
+    # Rename columns
+    df = df.rename(columns = {'mfb_w':'w_mfb', 'mba_w':'w_mba', 'mbb_w':'w_mbb',
+                              'mfb_l':'l_mfb', 'mba_l':'l_mba', 'mbb_l':'l_mbb',
+                              'wbb_w':'w_wbb', 'wsb_w':'w_wsb', 'wvb_w':'w_wvb',
+                              'wbb_l':'l_wbb', 'wsb_l':'l_wsb', 'wvb_l':'l_wvb',
+                              'mfb_rank':'fpi_mfb', 'mba_rank':'rpi_mba', 'mbb_rank':'rpi_mbb',
+                              'wbb_rank':'rpi_wbb', 'wsb_rank':'rpi_wsb', 'wvb_rank':'rpi_wvb',
+                              })
+
+    # Reorder columns
+    df = df[['season', 'team', 'conf', 
+             'win_pct_men', 'win_pct_avg_men', 
+             'w_men', 'w_mba', 'w_mbb', 'w_mfb',
+             'l_men', 'l_mba', 'l_mbb', 'l_mfb',
+             'win_pct_women', 'win_pct_avg_women',
+             'w_women', 'w_wbb', 'w_wsb', 'w_wvb', 
+             'l_women', 'l_wbb', 'l_wsb', 'l_wvb',
+             'diff_win_pct', 'diff_win_pct_avg',
+             'rpi_avg_men', 'rpi_mba', 'rpi_mbb', 'fpi_mfb', 
+             'rpi_avg_women', 'rpi_wbb', 'rpi_wsb', 'rpi_wvb', 
+             'diff_rpi_avg']]
+
+    # Round the decimal places of variables (2 places for win pct., 0 for RPI)
+    df = round(df,2)
+    df['rpi_avg_men']   = round(df['rpi_avg_men'], 0)
+    df['rpi_avg_women'] = round(df['rpi_avg_women'], 0)
+    df['diff_rpi_avg']  = round(df['diff_rpi_avg'], 0)
+
+    # Rank each variable (globally, by season, by conference, by conference-season)
+    df = rankMetrics(df, 
+                     ['win_pct_men', 'win_pct_women', 
+                      'win_pct_avg_men', 'win_pct_avg_women',
+                      'diff_win_pct', 'diff_win_pct_avg', 'diff_rpi_avg'],
+                     # absolute values
+                     ['diff_win_pct', 'diff_win_pct_avg', 'diff_rpi_avg'])
+    
+    return df
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Roll up, merge and engineer every team-season (from the project root)
+# rollUpData()
+# df_teams = pd.read_csv(r'references/school_abbreviations_and_pictures.csv',
+#                        encoding = 'latin-1')
+# df_teams = df_teams[['Team', 'ConferenceAbbrev']].rename(
+#     columns = {'Team':'team', 'ConferenceAbbrev':'conf'})
+# df = engineerFeatures(mergeAllData(), df_teams)
@@ -0,0 +1,830 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:40:25 2026
+
+@author: agent
+
+:DESCRIPTION: Parse the pages scraped by `scape_results.py` without fetching
+    them, so parsers can be run (and timed) on saved pages.
+
+    Every page layout has two steps which take the BeautifulSoup HTML of a
+    page:
+        - extract : find the page's table(s) and convert them to raw
+                    DataFrames (with any links the scraper keeps)
+        - clean   : turn the raw DataFrames into the scraper's output table
+
+    Page layouts (keys of `dict_page_parsers`):
+        - espn_fpi     : ESPN FPI standings (football, `scrapeSportsResults`)
+        - ncaa_rpi     : NCAA weekly RPI archive (`scrapeSportsResults`)
+        - warren_nolan : WarrenNolan.com live RPI (`scrapeWarrenNolan`)
+        - softball_rpi : D1Softball nitty-gritty RPI (`scrapeSoftballRPI`)
+        - cfb_schools  : sports-reference school index (`scrapeCfbSchoolLinks`)
+        - cfb_schedule : sports-reference team schedule
+                         (`scrapeCfbResultsAllYears`)
+
+    For testing without network access, `writeFixturePages` renders the
+    existing `data/csv/` and `data/results_all_years.csv` tables into every
+    layout (see `common/benchmark_parsers.py`).
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import datetime
+import io
+import json
+import numpy as np
+import os
+import pandas as pd
+import re
+import sys
+import time
+
+# modules shared by every project (`huskerProjects/common`)
+path_common = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            os.pardir, os.pardir, 'common'))
+if path_common not in sys.path:
+    sys.path.append(path_common)
+
+from run_metrics import recordEvent
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+# conferences listed after team names on the RPI pages
+list_conferences = ['ACC', 'America East', 'American Athletic',
+                    'Atlantic 10', 'Atlantic Sun', 'ASUN', 'Big 12',
+                    'Big East', 'Big Sky', 'Big South', 'Big Ten',
+                    'Big West', 'Colonial Athletic', 'Conference USA',
+                    'Horizon League', 'Ivy League', 'MAAC', 'MEAC',
+                    'Mid-American', 'Missouri Valley', 'Mountain West',
+                    'Northeast', 'Ohio Valley', 'Pac-12', 'Patriot League',
+                    'SEC', 'Southern', 'Southland', 'Sun Belt', 'SWAC',
+                    'The Summit League',
+                    'West Coast', 'Western Athletic']
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def readTable(table, header):
+    '''
+    Purpose: Convert the HTML of a table to a DataFrame
+
+    Inputs
+    ------
+        table : html
+            BeautifulSoup formatted HTML of the table
+        header : list of ints
+            Row(s) to use as the column names
+
+    Outputs
+    -------
+        df_table : Pandas DataFrame
+            Contents of the table
+    '''
+    return pd.read_html(io.StringIO(str(table)), flavor = None, header = header)[0]
+
+def stripConferences(df, name_var = 'Team'):
+    '''
+    Purpose: Separate team names from the conference/record listed after
+        them on the RPI pages
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Table with a team-name variable
+        name_var : string
+            Name of the team-name variable (default: 'Team')
+
+    Outputs
+    -------
+        df : Pandas DataFrame
+            Original DataFrame with only team names in `name_var`
+    '''
+    for conf in list_conferences:
+        df[name_var] = df[name_var].apply(
+            lambda x: x.replace(conf +  ' (', ' ('))
+    df[name_var] = df[name_var].apply(lambda x: x.split('  ')[0])
+
+    return df
+
+def extractFpiTables(soup):
+    '''
+    Purpose: Extract the team and ranking tables of an ESPN FPI page
+
+    Inputs
+    ------
+        soup : html
+            BeautifulSoup formatted HTML of the page
+
+    Outputs
+    -------
+        list_tables : list of Pandas DataFrames
+            Team table and ranking table
+    '''
+    # Retrieve the team table
+    table = soup.find('table', {
+        'class':'Table Table--align-right Table--fixed Table--fixed-left'})
+    df_teams = readTable(table, [0])
+    # Retrieve the rankings table
+    table = soup.find('table', {
+        'class':'Table Table--align-right'})
+    df_ranks = readTable(table, [1])
+
+    return [df_teams, df_ranks]
+
+def cleanFpiTables(list_tables, season, sport = 'MFB'):
+    '''
+    Purpose: Convert the tables of an ESPN FPI page to the results format
+
+    Inputs
+    ------
+        list_tables : list of Pandas DataFrames
+            Output of `extractFpiTables`
+        season : string
+            Season of the page (e.g. '2021-22')
+        sport : string
+            Sport abbreviation (default: 'MFB')
+
+    Outputs
+    -------
+        df_year : Pandas DataFrame
+            Sport, Season, Rank, Team, W, L of every team
+    '''
+    # Merge tables together
+    df_year = pd.concat(list_tables, axis = 1)
+    # Split win/loss columns
+    df_year['W'] = df_year['W-L'].apply(lambda x: x.split('-')[0])
+    df_year['L'] = df_year['W-L'].apply(lambda x: x.split('-')[1])
+    # Add season and sport to table
+    df_year['Season'] = season
+    df_year['Sport'] = sport
+    # Rename variables
+    df_year = df_year.rename(columns = {'RK':'Rank'})
+    # Reorder and isolate columns of interest
+    df_year = df_year[['Sport', 'Season', 'Rank', 'Team', 'W', 'L']]
+
+    return df_year
+
+def extractRpiTable(soup):
+    '''
+    Purpose: Extract the RPI table of an NCAA weekly RPI archive page
+
+    Inputs
+    ------
+        soup : html
+            BeautifulSoup formatted HTML of the page
+
+    Outputs
+    -------
+        list_tables : list of Pandas DataFrames
+            RPI table
+    '''
+    # Retrieve the team table
+    table_rpi = soup.find_all('table')[1]
+
+    return [readTable(table_rpi, [0])]
+
+def cleanRpiTable(list_tables, season, sport):
+    '''
+    Purpose: Convert the table of an NCAA weekly RPI archive page to the
+        results format
+
+    Inputs
+    ------
+        list_tables : list of Pandas DataFrames
+            Output of `extractRpiTable`
+        season : string
+            Season of the page (e.g. '2021-22')
+        sport : string
+            Sport abbreviation (e.g. 'MBB')
+
+    Outputs
+    -------
+        df_year : Pandas DataFrame
+            Sport, Season, Rank, Team, W, L of every team
+    '''
+    df_year = list_tables[0]
+    if len(df_year.columns) == 9:
+        df_year.columns = ['Rank', 'Rank_Prev', 'Team', 'Conf', 'W-L',
+                           'Road', 'Neut', 'Home', 'Non-Div-I']
+    else:
+        df_year.columns = ['Rank', 'Team', 'Conf', 'W-L',
+                           'Road', 'Neut', 'Home', 'Non-Div-I']
+    # Split win/loss columns
+    df_year['W'] = df_year['W-L'].apply(lambda x: x.split('-')[0])
+    df_year['L'] = df_year['W-L'].apply(lambda x: x.split('-')[1])
+    # Add season and sport to table
+    df_year['Season'] = season
+    df_year['Sport'] = sport
+    # Reorder and isolate columns of interest
+    df_year = df_year[['Sport', 'Season', 'Rank', 'Team', 'W', 'L']]
+
+    return df_year
+
+def extractWarrenNolanTable(soup):
+    '''
+    Purpose: Extract the RPI table of a WarrenNolan.com live RPI page
+
+    Inputs
+    ------
+        soup : html
+            BeautifulSoup formatted HTML of the page
+
+    Outputs
+    -------
+        list_tables : list of Pandas DataFrames
+            RPI table
+    '''
+    try:
+        div_table = soup.find('div', {'class':'datatable'})
+        table_rpi = div_table.find('table')
+    except:
+        div_table = soup.find('div', {'class':'full-width-box-x'})
+        table_rpi = div_table.find('table')
+
+    return [readTable(table_rpi, [0])]
+
+def cleanWarrenNolanTable(list_tables, season, sport):
+    '''
+    Purpose: Convert the table of a WarrenNolan.com live RPI page to the
+        results format
+
+    Inputs
+    ------
+        list_tables : list of Pandas DataFrames
+            Output of `extractWarrenNolanTable`
+        season : string
+            Season of the page (e.g. '2021-22')
+        sport : string
+            Sport abbreviation (e.g. 'MBA')
+
+    Outputs
+    -------
+        df_year : Pandas DataFrame
+            Sport, Season, Rank, Team, W, L of every team
+    '''
+    df_year = list_tables[0]
+
+    # remove header rows
+    df_year = df_year[df_year['RPI'] != 'RPI']
+    df_year = df_year[~df_year['RPI'].str.contains('freestar')]
+
+    # Split win/loss columns
+    df_year['W'] = df_year['Record'].apply(lambda x: x.split('-')[0])
+    df_year['L'] = df_year['Record'].apply(lambda x: x.split('-')[1])
+
+    # Add season and sport to table
+    df_year['Season'] = season
+    df_year['Sport'] = sport
+
+    # rename RPI to rank
+    df_year = df_year.rename(columns = {'RPI':'Rank'})
+
+    # Reorder and isolate columns of interest
+    df_year = df_year[['Sport', 'Season', 'Rank', 'Team', 'W', 'L']]
+
+    # Separate team name from conference/record
+    return stripConferences(df_year)
+
+def extractSoftballTables(soup):
+    '''
+    Purpose: Extract every section of the RPI table of a D1Softball page
+
+    Inputs
+    ------
+        soup : html
+            BeautifulSoup formatted HTML of the page
+
+    Outputs
+    -------
+        list_tables : list of Pandas DataFrames
+            One table per section
+    '''
+    return [readTable(table_rpi_section, [1])
+            for table_rpi_section in soup.find_all('table')]
+
+def cleanSoftballTables(list_tables, season, sport = 'WSB'):
+    '''
+    Purpose: Convert the sections of a D1Softball RPI page to the results
+        format
+
+    Inputs
+    ------
+        list_tables : list of Pandas DataFrames
+            Output of `extractSoftballTables`
+        season : string
+            Season of the page (e.g. '2021-22')
+        sport : string
+            Sport abbreviation (default: 'WSB')
+
+    Outputs
+    -------
+        df_year : Pandas DataFrame
+            Sport, Season, Rank, Team, W, L of every team
+    '''
+    list_subgroups = []
+    for df_subgroup in list_tables:
+        # remove header rows
+        df_subgroup = df_subgroup[df_subgroup['RPI'] != 'RPI']
+
+        # Split win/loss columns
+        df_subgroup['W'] = df_subgroup['Record'].apply(lambda x: x.split('-')[0])
+        df_subgroup['L'] = df_subgroup['Record'].apply(lambda x: x.split('-')[1])
+
+        # Add season and sport to table
+        df_subgroup['Season'] = season
+        df_subgroup['Sport']  = sport
+
+        # rename RPI to rank
+        df_subgroup = df_subgroup.rename(columns = {'RPI':'Rank'})
+
+        # Reorder and isolate columns of interest
+        df_subgroup = df_subgroup[['Sport', 'Season', 'Rank', 'Team', 'W', 'L']]
+
+        # Separate team name from conference/record
+        list_subgroups.append(stripConferences(df_subgroup))
+
+    return pd.concat(list_subgroups)
+
+def extractSchoolLinks(soup):
+    '''
+    Purpose: Extract the school table (and the link to every school's page)
+        of the sports-reference school index
+
+    Inputs
+    ------
+        soup : html
+            BeautifulSoup formatted HTML of the page
+
+    Outputs
+    -------
+        list_tables : list of Pandas DataFrames
+            School table with a `URL` variable
+    '''
+    # Retrieve the HTML of the combine table
+    table = soup.find('table', {'id':'schools'})
+
+    # Extract school URLs from the html data
+    url_schools = [[td.a['href'] if td.find('a') else ''
+             for td in row.find_all('td')] for row in table.find_all('tr')]
+
+    # Remove the first two rows as they apply to headers
+    url_schools = url_schools[2:]
+    url_schools = [x[0] if x != [] else [] for x in url_schools]
+
+    # Convert the table to a dataframe
+    df_schools = readTable(table, [1])
+
+    # Add the URLs to the table
+    df_schools['URL'] = url_schools
+
+    return [df_schools]
+
+def cleanSchoolLinks(list_tables, year_end = None):
+    '''
+    Purpose: Reduce the sports-reference school table to current schools
+
+    Inputs
+    ------
+        list_tables : list of Pandas DataFrames
+            Output of `extractSchoolLinks`
+        year_end : int
+            Current year (default: None = this year)
+
+    Outputs
+    -------
+        df_schools : Pandas DataFrame
+            School, URL, From, To of every current school
+    '''
+    if year_end is None:
+        year_end = datetime.datetime.now().year
+    df_schools = list_tables[0]
+
+    # Reduce the table to only current schools
+    if not all(df_schools['To'].str.contains(str(year_end))):
+        df_schools = df_schools[df_schools['To'] == str(year_end - 1)]
+    else:
+        df_schools = df_schools[df_schools['To'] == str(year_end)]
+
+    # Remove unnecessary tables
+    df_schools = df_schools[['School', 'URL', 'From', 'To']]
+
+    return df_schools
+
+def extractScheduleTable(soup):
+    '''
+    Purpose: Extract the schedule table (and the link to every boxscore) of
+        a sports-reference team schedule page
+
+    Inputs
+    ------
+        soup : html
+            BeautifulSoup formatted HTML of the page
+
+    Outputs
+    -------
+        list_tables : list of Pandas DataFrames
+            Schedule table with a `url_boxscore` variable
+    '''
+    # Retrieve the HTML of the combine table
+    table = soup.find('table', {'class':'sortable stats_table'})
+
+    # Extract URLs from the html data
+    url_games = [[td.a['href'] if td.find('a') else ''
+             for td in row.find_all('td')] for row in table.find_all('tr')]
+    # Remove the first row as that is the header row
+    url_games = url_games[1:]
+
+    # Isolate the year URLs
+    url_boxscores = []
+    for line in url_games:
+        url_boxscores.append(line[0])
+
+    # Make the full link to coach URL
+    url_boxscores = ['https://www.sports-reference.com' + x for x in url_boxscores]
+
+    # Convert the table to a dataframe
+    df_school = readTable(table, [0])
+
+    # Add the URLs to the table
+    df_school['url_boxscore'] = url_boxscores
+
+    return [df_school]
+
+def cleanScheduleTable(list_tables):
+    '''
+    Purpose: Convert the table of a sports-reference team schedule page to
+        the week-by-week results format
+
+    Inputs
+    ------
+        list_tables : list of Pandas DataFrames
+            Output of `extractScheduleTable`
+
+    Outputs
+    -------
+        df_school : Pandas DataFrame
+            One row per game with home/away, result and both teams' ranks
+    '''
+    df_school = list_tables[0]
+
+    # find Home/Away and Result columns
+    col_names = [x for x in df_school.columns if 'Unnamed' in x]
+
+    # Fix Home/Away Column
+    df_school[col_names[0]] = df_school[col_names[0]].apply(lambda x: 'Home' if pd.isna(x) else
+                                                           ('Neutral' if x == 'N' else 'Away'))
+    df_school = df_school.rename(columns = {col_names[0]:'Home_Away'})
+
+    # Fix Result column
+    df_school = df_school.rename(columns = {col_names[1]:'Result'})
+
+    # Rename other columns
+    df_school = df_school.rename(columns = {'W':'Cum_W', 'L':'Cum_L'})
+
+    # Create Team and Opp Ranking columns
+    df_school['Rank'] = df_school['School'].apply(lambda x: x.split(')\xa0')[0].replace('(','') if x[0] == '(' else '')
+    df_school['School'] = df_school['School'].apply(lambda x: x.split(')\xa0')[1] if x[0] == '(' in x else x)
+    df_school['Rank_Opp'] = df_school['Opponent'].apply(lambda x: x.split(')\xa0')[0].replace('(','') if x[0] == '(' in x else '')
+    df_school['Opponent'] = df_school['Opponent'].apply(lambda x: x.split(')\xa0')[1] if x[0] == '(' in x else x)
+
+    # Reorder columns
+    num_cols = [3, 6]
+    if 'Time' in df_school.columns:
+        num_cols = [4, 7]
+    rank_col = df_school.pop('Rank')
+    df_school.insert(num_cols[0], 'Rank', rank_col)
+    rank_opp_col = df_school.pop('Rank_Opp')
+    df_school.insert(num_cols[1], 'Rank_Opp', rank_opp_col)
+
+    return df_school
+
+# extract/clean steps of every page layout
+dict_page_parsers = {'espn_fpi':(extractFpiTables, cleanFpiTables),
+                     'ncaa_rpi':(extractRpiTable, cleanRpiTable),
+                     'warren_nolan':(extractWarrenNolanTable, cleanWarrenNolanTable),
+                     'softball_rpi':(extractSoftballTables, cleanSoftballTables),
+                     'cfb_schools':(extractSchoolLinks, cleanSchoolLinks),
+                     'cfb_schedule':(extractScheduleTable, cleanScheduleTable)}
+
+def parsePage(parser, soup, **context):
+    '''
+    Purpose: Parse a page with the extract/clean steps of its layout (and
+        record the time of both steps as a `parse` event of the active run)
+
+    Inputs
+    ------
+        parser : string
+            Page layout (a key of `dict_page_parsers`)
+        soup : html
+            BeautifulSoup formatted HTML of the page
+        **context
+            Keyword arguments of the clean step (e.g. season, sport)
+
+    Outputs
+    -------
+        df_page : Pandas DataFrame
+            Parsed table of the page
+    '''
+    extract, clean = dict_page_parsers[parser]
+
+    time_start = time.perf_counter()
+    list_tables = extract(soup)
+    time_extract = time.perf_counter()
+    df_page = clean(list_tables, **context)
+    time_cleanup = time.perf_counter()
+    recordEvent('parse', Parser = parser, Rows = len(df_page),
+                Seconds = time_cleanup - time_start,
+                Seconds_Extract = time_extract - time_start,
+                Seconds_Cleanup = time_cleanup - time_extract)
+
+    return df_page
+
+def renderFpiPage(df_year):
+    '''
+    Purpose: Render a season of results in the layout of an ESPN FPI page
+
+    Inputs
+    ------
+        df_year : Pandas DataFrame
+            Sport, Season, Rank, Team, W, L of every team
+
+    Outputs
+    -------
+        page : string
+            HTML of the page
+    '''
+    df_teams = pd.DataFrame({'Team':df_year['Team']})
+    df_ranks = pd.DataFrame({'W-L':(df_year['W'].astype(str) + '-'
+                                    + df_year['L'].astype(str)).to_numpy(),
+                             'FPI':np.round(np.linspace(25, -25, len(df_year)), 1),
+                             'RK':df_year['Rank'].to_numpy()})
+    df_ranks.columns = pd.MultiIndex.from_tuples(
+        [('', 'W-L'), ('Efficiencies', 'FPI'), ('Efficiencies', 'RK')])
+
+    return ('<html><body>'
+            + df_teams.to_html(index = False, classes = 'Table--fixed Table--fixed-left',
+                               border = 0).replace('class="dataframe ',
+                                                   'class="Table Table--align-right ')
+            + df_ranks.to_html(index = False, border = 0).replace(
+                'class="dataframe"', 'class="Table Table--align-right"')
+            + '</body></html>')
+
+def renderRpiPage(df_year):
+    '''
+    Purpose: Render a season of results in the layout of an NCAA weekly RPI
+        archive page
+
+    Inputs
+    ------
+        df_year : Pandas DataFrame
+            Sport, Season, Rank, Team, W, L of every team
+
+    Outputs
+    -------
+        page : string
+            HTML of the page
+    '''
+    record = df_year['W'].astype(str) + '-' + df_year['L'].astype(str)
+    df_page = pd.DataFrame({'Rank':df_year['Rank'], 'Team':df_year['Team'],
+                            'Conference':'', 'Record':record, 'Road':record,
+                            'Neutral':'0-0', 'Home':'0-0', 'Non Div I':'0-0'})
+
+    return ('<html><body><table><tr><td>Weekly RPI</td></tr></table>'
+            + df_page.to_html(index = False) + '</body></html>')
+
+def renderWarrenNolanPage(df_year):
+    '''
+    Purpose: Render a season of results in the layout of a WarrenNolan.com
+        live RPI page (with repeated headers and ad rows)
+
+    Inputs
+    ------
+        df_year : Pandas DataFrame
+            Sport, Season, Rank, Team, W, L of every team
+
+    Outputs
+    -------
+        page : string
+            HTML of the page
+    '''
+    list_rows = ['<tr><th>RPI</th><th>Team</th><th>Record</th></tr>']
+    for i, row in enumerate(df_year.itertuples(index = False)):
+        if i > 0 and i % 25 == 0:
+            list_rows.append('<tr><td>freestar ad</td><td></td><td></td></tr>'
+                             '<tr><td>RPI</td><td>Team</td><td>Record</td></tr>')
+        list_rows.append(f'<tr><td>{row.Rank}</td><td>{row.Team}  Big Ten ({row.W}-{row.L})</td>'
+                         f'<td>{row.W}-{row.L}</td></tr>')
+
+    return ('<html><body><div class="datatable"><table>' + ''.join(list_rows)
+            + '</table></div></body></html>')
+
+def renderSoftballPage(df_year, rows_section = 50):
+    '''
+    Purpose: Render a season of results in the layout of a D1Softball RPI
+        page (one table per section of teams)
+
+    Inputs
+    ------
+        df_year : Pandas DataFrame
+            Sport, Season, Rank, Team, W, L of every team
+        rows_section : int
+            Teams per section (default: 50)
+
+    Outputs
+    -------
+        page : string
+            HTML of the page
+    '''
+    list_tables = []
+    for start in range(0, len(df_year), rows_section):
+        df_section = df_year.iloc[start:start + rows_section]
+        list_rows = [f'<tr><th colspan="3">Teams {start + 1}-{start + len(df_section)}</th></tr>',
+                     '<tr><th>RPI</th><th>Team</th><th>Record</th></tr>']
+        for row in df_section.itertuples(index = False):
+            list_rows.append(f'<tr><td>{row.Rank}</td><td>{row.Team}  SEC ({row.W}-{row.L})</td>'
+                             f'<td>{row.W}-{row.L}</td></tr>')
+        list_tables.append('<table>' + ''.join(list_rows) + '</table>')
+
+    return '<html><body>' + ''.join(list_tables) + '</body></html>'
+
+def getSchoolSlug(school):
+    '''
+    Purpose: sports-reference style URL name of a school
+
+    Inputs
+    ------
+        school : string
+            Name of the school
+
+    Outputs
+    -------
+        slug : string
+            Lower-case name with dashes (e.g. 'Ohio St.' -> 'ohio-st')
+    '''
+    return re.sub(r'[^a-z0-9]+', '-', school.lower()).strip('-')
+
+def renderSchoolsPage(list_schools, year_end):
+    '''
+    Purpose: Render a list of schools in the layout of the sports-reference
+        school index (two header rows, repeated every 20 schools)
+
+    Inputs
+    ------
+        list_schools : list of strings
+            Names of the schools
+        year_end : int
+            Last season played by every school
+
+    Outputs
+    -------
+        page : string
+            HTML of the page
+    '''
+    header = ('<tr><th></th><th></th><th colspan="2">Years</th></tr>'
+              '<tr><th>Rk</th><th>School</th><th>From</th><th>To</th></tr>')
+    list_rows = [header]
+    for i, school in enumerate(list_schools):
+        if i > 0 and i % 20 == 0:
+            list_rows.append(header)
+        list_rows.append(f'<tr><th>{i + 1}</th><td><a href="/cfb/schools/{getSchoolSlug(school)}/">'
+                         f'{school}</a></td><td>1970</td><td>{year_end}</td></tr>')
+
+    return ('<html><body><table id="schools">' + ''.join(list_rows)
+            + '</table></body></html>')
+
+def renderSchedulePage(school, year, wins, losses, list_opponents, seed = 0):
+    '''
+    Purpose: Render a season of games in the layout of a sports-reference
+        team schedule page
+
+    Inputs
+    ------
+        school : string
+            Name of the school
+        year : int
+            Season
+        wins : int
+            Number of wins
+        losses : int
+            Number of losses
+        list_opponents : list of strings
+            Possible opponents
+        seed : int
+            Seed of the random opponents, ranks and scores (default: 0)
+
+    Outputs
+    -------
+        page : string
+            HTML of the page
+    '''
+    rng = np.random.default_rng(seed)
+    array_results = rng.permutation(['W'] * wins + ['L'] * losses)
+    list_rows = ['<tr><th>G</th><th>Date</th><th>Time</th><th>Day</th><th>School</th>'
+                 '<th></th><th>Opponent</th><th>Conf</th><th></th><th>Pts</th><th>Opp</th>'
+                 '<th>W</th><th>L</th><th>Streak</th><th>Notes</th></tr>']
+    count_w = count_l = 0
+    for game, result in enumerate(array_results):
+        count_w, count_l = count_w + (result == 'W'), count_l + (result == 'L')
+        date = (datetime.date(year, 9, 1) + datetime.timedelta(days = 7 * game)).isoformat()
+        rank = f'({rng.integers(1, 26)})\xa0' if rng.random() < .2 else ''
+        rank_opp = f'({rng.integers(1, 26)})\xa0' if rng.random() < .2 else ''
+        home_away = ['', '@', 'N'][rng.choice(3, p = [.5, .45, .05])]
+        points = rng.integers(0, 50, size = 2)
+        pts, opp = (points.max() + 1, points.min()) if result == 'W' else (points.min(), points.max() + 1)
+        list_rows.append(f'<tr><th>{game + 1}</th>'
+                         f'<td><a href="/cfb/boxscores/{date}-{getSchoolSlug(school)}.html">{date}</a></td>'
+                         f'<td>12:00 PM</td><td>Sat</td><td>{rank}{school}</td><td>{home_away}</td>'
+                         f'<td>{rank_opp}{rng.choice(list_opponents)}</td><td>Big Ten</td>'
+                         f'<td>{result}</td><td>{pts}</td><td>{opp}</td><td>{count_w}</td>'
+                         f'<td>{count_l}</td><td>{result} 1</td><td></td></tr>')
+
+    return ('<html><body><table class="sortable stats_table">' + ''.join(list_rows)
+            + '</table></body></html>')
+
+def writeFixturePages(path_pages, path_data = r'data', list_seasons = None,
+                      schedules = 100):
+    '''
+    Purpose: Render existing results into every page layout (stand-ins for
+        recorded pages) and list them in `{path_pages}/pages.csv`
+
+    Inputs
+    ------
+        path_pages : string
+            Folder in which to write the pages
+        path_data : string
+            Folder containing `csv/{sport}/` and `results_all_years.csv`
+            (default: 'data')
+        list_seasons : list of strings
+            Seasons to render (default: None = every season on file)
+        schedules : int
+            Number of team schedule pages to render (default: 100)
+
+    Outputs
+    -------
+        df_pages : Pandas DataFrame
+            One row per page with its file name (`File`), layout (`Parser`)
+            and the keyword arguments of its clean step (`Context`, JSON)
+    '''
+    os.makedirs(path_pages, exist_ok = True)
+    list_pages = []
+
+    def writePage(name, page, parser, dict_context):
+        with open(os.path.join(path_pages, name), 'w', encoding = 'utf-8') as file:
+            file.write(page)
+        list_pages.append({'File':name, 'Parser':parser,
+                           'Context':json.dumps(dict_context)})
+
+    # RPI/FPI pages of every sport and season
+    dict_layouts = {'MFB':[('espn_fpi', renderFpiPage)],
+                    'MBB':[('ncaa_rpi', renderRpiPage),
+                           ('warren_nolan', renderWarrenNolanPage)],
+                    'WBB':[('ncaa_rpi', renderRpiPage)],
+                    'WVB':[('ncaa_rpi', renderRpiPage)],
+                    'MBA':[('ncaa_rpi', renderRpiPage),
+                           ('warren_nolan', renderWarrenNolanPage)],
+                    'WSB':[('ncaa_rpi', renderRpiPage),
+                           ('softball_rpi', renderSoftballPage)]}
+    for sport, list_layouts in dict_layouts.items():
+        df_sport = pd.read_csv(os.path.join(path_data, 'csv', sport, f'{sport}_all_years.csv'))
+        for season, df_year in df_sport.groupby('Season'):
+            if list_seasons is not None and season not in list_seasons:
+                continue
+            for parser, render in list_layouts:
+                writePage(f'{parser}_{sport}_{season}.html', render(df_year),
+                          parser, {'season':season, 'sport':sport})
+
+    # sports-reference school index and team schedules
+    df_results = pd.read_csv(os.path.join(path_data, 'results_all_years.csv'))
+    df_results = df_results.dropna(subset = ['MFB_W', 'MFB_L'])
+    list_schools = sorted(df_results['Team'].unique())
+    year_end = datetime.datetime.now().year
+    writePage('cfb_schools.html', renderSchoolsPage(list_schools, year_end - 1),
+              'cfb_schools', {'year_end':year_end})
+    for i, row in enumerate(df_results.head(schedules).itertuples(index = False)):
+        year = int(row.Season[:4])
+        writePage(f'cfb_schedule_{getSchoolSlug(row.Team)}_{year}.html',
+                  renderSchedulePage(row.Team, year, int(row.MFB_W), int(row.MFB_L),
+                                     list_schools, seed = i),
+                  'cfb_schedule', {})
+
+    df_pages = pd.DataFrame(list_pages)
+    df_pages.to_csv(os.path.join(path_pages, 'pages.csv'), index = False)
+
+    return df_pages
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Parse a saved page
+# from bs4 import BeautifulSoup
+# with open(r'data/pages/ncaa_rpi_MBB_2021-22.html', encoding = 'utf-8') as file:
+#     soup = BeautifulSoup(file.read(), 'html.parser')
+# df_year = parsePage('ncaa_rpi', soup, season = '2021-22', sport = 'MBB')
@@ -22,11 +22,22 @@ import os
 import pandas as pd
 import pathlib
 import requests
+import sys
 import time
 
 from bs4 import BeautifulSoup
 from requests.packages.urllib3.util.retry import Retry
 
+# modules shared by every project (`huskerProjects/common`)
+path_common = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            os.pardir, os.pardir, 'common'))
+if path_common not in sys.path:
+    sys.path.append(path_common)
+
+from results_parsers import parsePage
+from run_metrics import (endRun, fetchUrl, recordEvent, sleepBetweenRequests,
+                         startRun)
+
 #==============================================================================
 # Reference Variable Declaration
 #==============================================================================
@@ -37,6 +48,8 @@ from requests.packages.urllib3.util.retry import Retry
 def soupifyURL(url):
     '''
     Purpose: Turns a specified URL into BeautifulSoup formatted HTML 
+        (the request and the HTML parse are recorded as events of the
+        active run)
 
     Inputs
     ------
@@ -55,9 +68,12 @@ def soupifyURL(url):
     session.mount('http://', adapter)
     session.mount('https://', adapter)
     
-    r = session.get(url, verify = False)
+    r = fetchUrl(session, url, verify = False)
     #r = requests.get(url)
+    time_start = time.perf_counter()
     soup = BeautifulSoup(r.content,'html.parser')   
+    recordEvent('html', URL = url, Bytes = len(r.content), 
+                Seconds = time.perf_counter() - time_start)
     return soup
 
 def renameSchool(df, name_var):
@@ -146,31 +162,8 @@ def scrapeCfbSchoolLinks():
     url = 'https://www.sports-reference.com/cfb/schools/'
     soup = soupifyURL(url)
     
-    # Retrieve the HTML of the combine table
-    table = soup.find('table', {'id':'schools'})
-    
-    # Extract school URLs from the html data
-    url_schools = [[td.a['href'] if td.find('a') else ''
-             for td in row.find_all('td')] for row in table.find_all('tr')]
-    
-    # Remove the first two rows as they apply to headers
-    url_schools = url_schools[2:]
-    url_schools = [x[0] if x != [] else [] for x in url_schools]
-    
-    # Convert the table to a dataframe
-    df_schools = pd.read_html(str(table), flavor = None, header = [1])[0]
-    
-    # Add the URLs to the table
-    df_schools['URL'] = url_schools
-    
-    # Reduce the table to only current schools    
-    if not all(df_schools['To'].str.contains(str(year_end))):
-        df_schools = df_schools[df_schools['To'] == str(year_end - 1)]
-    else:
-        df_schools = df_schools[df_schools['To'] == str(year_end)]
-        
-    # Remove unnecessary tables
-    df_schools = df_schools[['School', 'URL', 'From', 'To']]
+    # Extract current schools and their URLs from the school table
+    df_schools = parsePage('cfb_schools', soup, year_end = year_end)
             
     return df_schools
 
@@ -209,6 +202,7 @@ def scrapeCbbSchoolsAllYears():
         # Scrape data for the specific team
         url = 'https://www.sports-reference.com' + url
         soup = soupifyURL(url)
+        time_parse = time.perf_counter()
     
         # Retrieve the HTML of the combine table
         table = soup.find('table', {'class':'sortable stats_table'})        
@@ -246,6 +240,8 @@ def scrapeCbbSchoolsAllYears():
         # Add School name to table
         df_school['Rk'] = school
         df_school = df_school.rename(columns = {'Rk':'School'})
+        recordEvent('parse', Parser = 'cbb_school', Rows = len(df_school),
+                    Seconds = time.perf_counter() - time_parse)
         
         # Append school data to history table
         if len(df_history) == 0:
@@ -255,7 +251,7 @@ def scrapeCbbSchoolsAllYears():
             
         print('Done with: ' + school)
         
-        time.sleep(1)
+        sleepBetweenRequests(1, url)
         
     # print('*** DONE WITH ALL SCRAPING ***')
     ts = datetime.date.fromtimestamp(time.time())
@@ -307,57 +303,8 @@ def scrapeCfbResultsAllYears(year = 1970):
                 print('ERROR: Data not found for: ' + school)
                 continue
         
-            # Retrieve the HTML of the combine table
-            table = soup.find('table', {'class':'sortable stats_table'})        
-            
-            # Extract URLs from the html data
-            url_games = [[td.a['href'] if td.find('a') else ''
-                     for td in row.find_all('td')] for row in table.find_all('tr')]
-            # Remove the first row as that is the header row
-            url_games = url_games[1:]
-            
-            # Isolate the year URLs
-            url_boxscores = []
-            for line in url_games:
-                url_boxscores.append(line[0])
-            
-            # Make the full link to coach URL
-            url_boxscores = ['https://www.sports-reference.com' + x for x in url_boxscores]
-            
-            # Convert the table to a dataframe
-            df_school = pd.read_html(str(table), flavor = None, header = [0])[0]
-            
-            # find Home/Away and Result columns
-            col_names = [x for x in df_school.columns if 'Unnamed' in x]
-            
-            # Fix Home/Away Column
-            df_school[col_names[0]] = df_school[col_names[0]].apply(lambda x: 'Home' if pd.isna(x) else 
-                                                                   ('Neutral' if x == 'N' else 'Away'))
-            df_school = df_school.rename(columns = {col_names[0]:'Home_Away'})
-            
-            # Fix Result column
-            df_school = df_school.rename(columns = {col_names[1]:'Result'})
-            
-            # Rename other columns
-            df_school = df_school.rename(columns = {'W':'Cum_W', 'L':'Cum_L'})
-            
-            # Create Team and Opp Ranking columns
-            df_school['Rank'] = df_school['School'].apply(lambda x: x.split(')\xa0')[0].replace('(','') if x[0] == '(' else '')
-            df_school['School'] = df_school['School'].apply(lambda x: x.split(')\xa0')[1] if x[0] == '(' in x else x)
-            df_school['Rank_Opp'] = df_school['Opponent'].apply(lambda x: x.split(')\xa0')[0].replace('(','') if x[0] == '(' in x else '')
-            df_school['Opponent'] = df_school['Opponent'].apply(lambda x: x.split(')\xa0')[1] if x[0] == '(' in x else x)
-            
-            # Reorder columns
-            num_cols = [3, 6]
-            if 'Time' in df_school.columns:
-                num_cols = [4, 7]
-            rank_col = df_school.pop('Rank')
-            df_school.insert(num_cols[0], 'Rank', rank_col)
-            rank_opp_col = df_school.pop('Rank_Opp')
-            df_school.insert(num_cols[1], 'Rank_Opp', rank_opp_col)
-            
-            # Add the URLs to the table
-            df_school['url_boxscore'] = url_boxscores
+            # Convert the schedule table (and boxscore URLs) to a dataframe
+            df_school = parsePage('cfb_schedule', soup)
             
             # # Append school data to all schools history table
             # if len(df_history) == 0:
@@ -373,7 +320,7 @@ def scrapeCfbResultsAllYears(year = 1970):
                 
             print(f' -- Done with: {scrape_year}')
             
-            time.sleep(1)
+            sleepBetweenRequests(1)
         
         print(f'*** FINISHED SCRAPING: {school} ***')            
         # Append school data to individual school's history table
@@ -435,53 +382,9 @@ def scrapeWarrenNolan(sport):
             print(f'ERROR: Data not found for: {year}')
             continue
     
-        # Create a dataframe for the given season
-        df_year = pd.DataFrame()
-        
-        # Retrieve the HTML from the website
-        try:
-            div_table = soup.find('div', {'class':'datatable'})
-            table_rpi = div_table.find('table')
-        except:
-            div_table = soup.find('div', {'class':'full-width-box-x'})
-            table_rpi = div_table.find('table')
-        
-        # Convert the html to a dataframe
-        df_year = pd.read_html(str(table_rpi), flavor = None, header = [0])[0]
-        
-        # remove header rows
-        df_year = df_year[df_year['RPI'] != 'RPI']
-        df_year = df_year[~df_year['RPI'].str.contains('freestar')]
-        
-        # Split win/loss columns
-        df_year['W'] = df_year['Record'].apply(lambda x: x.split('-')[0])
-        df_year['L'] = df_year['Record'].apply(lambda x: x.split('-')[1])
-        
-        # Add season and sport to table            
-        df_year['Season'] = season
-        df_year['Sport'] = dict_sport[sport]
-        
-        # rename RPI to rank
-        df_year = df_year.rename(columns = {'RPI':'Rank'})
-        
-        # Reorder and isolate columns of interest
-        df_year = df_year[['Sport', 'Season', 'Rank', 'Team', 'W', 'L']]
-        
-        # Separate team name from conference/record
-        list_conferences = ['ACC', 'America East', 'American Athletic', 
-                            'Atlantic 10', 'Atlantic Sun', 'ASUN', 'Big 12', 
-                            'Big East', 'Big Sky', 'Big South', 'Big Ten', 
-                            'Big West', 'Colonial Athletic', 'Conference USA',
-                            'Horizon League', 'Ivy League', 'MAAC', 'MEAC',
-                            'Mid-American', 'Missouri Valley', 'Mountain West',
-                            'Northeast', 'Ohio Valley', 'Pac-12', 'Patriot League',
-                            'SEC', 'Southern', 'Southland', 'Sun Belt', 'SWAC', 
-                            'The Summit League',
-                            'West Coast', 'Western Athletic']
-        for conf in list_conferences:
-            df_year['Team'] = df_year['Team'].apply(
-                lambda x: x.replace(conf +  ' (', ' ('))
-        df_year['Team'] = df_year['Team'].apply(lambda x: x.split('  ')[0])
+        # Convert the RPI table to a dataframe for the given season
+        df_year = parsePage('warren_nolan', soup, season = season,
+                            sport = dict_sport[sport])
           
         # save individual year to disk
         df_year.to_csv(f'data/csv/{dict_sport[sport]}/{dict_sport[sport]}_{season}.csv', 
@@ -489,7 +392,7 @@ def scrapeWarrenNolan(sport):
         
         print(f"Done scraping {sport} data for {season}")   
         
-        time.sleep(1)
+        sleepBetweenRequests(1, url)
         
     return
 
@@ -525,56 +428,9 @@ def scrapeSoftballRPI():
             print(f'ERROR: Data not found for: {year}')
             continue
     
-        # Create a dataframe for the given season
-        df_year = pd.DataFrame()
-        
-        # Retrieve the HTML from the website
-        table_rpi = soup.find_all('table')
-        
-        # iterate over each section of the table
-        for table_rpi_section in table_rpi:
-        
-            # Convert the html to a dataframe
-            df_subgroup = pd.read_html(str(table_rpi_section), flavor = None, header = [1])[0]
-            
-            # remove header rows
-            df_subgroup = df_subgroup[df_subgroup['RPI'] != 'RPI']
-            
-            # Split win/loss columns
-            df_subgroup['W'] = df_subgroup['Record'].apply(lambda x: x.split('-')[0])
-            df_subgroup['L'] = df_subgroup['Record'].apply(lambda x: x.split('-')[1])
-            
-            # Add season and sport to table            
-            df_subgroup['Season'] = season
-            df_subgroup['Sport']  = sport
-            
-            # rename RPI to rank
-            df_subgroup = df_subgroup.rename(columns = {'RPI':'Rank'})
-            
-            # Reorder and isolate columns of interest
-            df_subgroup = df_subgroup[['Sport', 'Season', 'Rank', 'Team', 'W', 'L']]
-            
-            # Separate team name from conference/record
-            list_conferences = ['ACC', 'America East', 'American Athletic', 
-                                'Atlantic 10', 'Atlantic Sun', 'ASUN', 'Big 12', 
-                                'Big East', 'Big Sky', 'Big South', 'Big Ten', 
-                                'Big West', 'Colonial Athletic', 'Conference USA',
-                                'Horizon League', 'Ivy League', 'MAAC', 'MEAC',
-                                'Mid-American', 'Missouri Valley', 'Mountain West',
-                                'Northeast', 'Ohio Valley', 'Pac-12', 'Patriot League',
-                                'SEC', 'Southern', 'Southland', 'Sun Belt', 'SWAC', 
-                                'The Summit League',
-                                'West Coast', 'Western Athletic']
-            for conf in list_conferences:
-                df_subgroup['Team'] = df_subgroup['Team'].apply(
-                    lambda x: x.replace(conf +  ' (', ' ('))
-            df_subgroup['Team'] = df_subgroup['Team'].apply(lambda x: x.split('  ')[0])
-            
-            # add subgroup to year table
-            if len(df_year) == 0:
-                df_year = df_subgroup.copy()
-            else:
-                df_year = df_year.append(df_subgroup)
+        # Convert every section of the RPI table to a dataframe for the
+        #   given season
+        df_year = parsePage('softball_rpi', soup, season = season, sport = sport)
           
         # save individual year to disk
         df_year.to_csv(f'data/csv/{sport}/{sport}_{season}.csv', 
@@ -582,7 +438,7 @@ def scrapeSoftballRPI():
         
         print(f"Done scraping {sport} data for {season}")   
         
-        time.sleep(1)
+        sleepBetweenRequests(1, url)
         
     return
     
@@ -643,47 +499,11 @@ def scrapeSportsResults(sport):
             continue
     
         # Process Football data from ESPN
-        df_year = pd.DataFrame()
         if sport == 'MFB':
-            # Retrieve the team table
-            table = soup.find('table', {
-                'class':'Table Table--align-right Table--fixed Table--fixed-left'})  
-            df_teams = pd.read_html(str(table), flavor = None, header = [0])[0]
-            # Retrieve the rankings table
-            table = soup.find('table', {
-                'class':'Table Table--align-right'})
-            df_ranks = pd.read_html(str(table), flavor = None, header = [1])[0]
-            # Merge tables together
-            df_year = pd.concat([df_teams, df_ranks], axis = 1)
-            # Split win/loss columns
-            df_year['W'] = df_year['W-L'].apply(lambda x: x.split('-')[0])
-            df_year['L'] = df_year['W-L'].apply(lambda x: x.split('-')[1])    
-            # Add season and sport to table           
-            df_year['Season'] = season
-            df_year['Sport'] = sport 
-            # Rename variables
-            df_year = df_year.rename(columns = {'RK':'Rank'})
-            # Reorder and isolate columns of interest
-            df_year = df_year[['Sport', 'Season', 'Rank', 'Team', 'W', 'L']]   
+            df_year = parsePage('espn_fpi', soup, season = season, sport = sport)
         # Process other sport data from NCAA
         else:
-            # Retrieve the team table
-            table_rpi = soup.find_all('table')[1]
-            df_year = pd.read_html(str(table_rpi), flavor = None, header = [0])[0]
-            if len(df_year.columns) == 9:
-                df_year.columns = ['Rank', 'Rank_Prev', 'Team', 'Conf', 'W-L',
-                                   'Road', 'Neut', 'Home', 'Non-Div-I']
-            else:
-                df_year.columns = ['Rank', 'Team', 'Conf', 'W-L',
-                                   'Road', 'Neut', 'Home', 'Non-Div-I']                    
-            # Split win/loss columns
-            df_year['W'] = df_year['W-L'].apply(lambda x: x.split('-')[0])
-            df_year['L'] = df_year['W-L'].apply(lambda x: x.split('-')[1])
-            # Add season and sport to table            
-            df_year['Season'] = season
-            df_year['Sport'] = sport
-            # Reorder and isolate columns of interest
-            df_year = df_year[['Sport', 'Season', 'Rank', 'Team', 'W', 'L']]
+            df_year = parsePage('ncaa_rpi', soup, season = season, sport = sport)
           
         # save individual year to disk
         df_year.to_csv(f'data/csv/{sport}/{sport}_{season}.csv', index = False)         
@@ -693,7 +513,7 @@ def scrapeSportsResults(sport):
         # add year table to all-years table
         df_all_years = df_all_years.append(df_year)      
         
-        time.sleep(1)
+        sleepBetweenRequests(1, url)
         
     # save data for all years to disk
     df_all_years.to_csv(f'data/csv/{sport}/{sport}_all_years.csv', index = False)
@@ -709,6 +529,9 @@ path_dir = pathlib.Path(
     r'C:\Users\reideej1\Projects\a_Personal\huskerProjects\20220414_MensWomensBig3')
 os.chdir(path_dir)
 
+# record request, parse and wait metrics (summary printed by `endRun`)
+startRun('scrape_results')
+
 # # Scrape NCAA Men's Baseball
 # df_mba = scrapeSportsResults('MBA')
 scrapeWarrenNolan('baseball')
@@ -731,4 +554,7 @@ scrapeWarrenNolan('baseball')
 scrapeSoftballRPI()
 
 # # Scrape NCAA Women's Volleyball
-# df_wvb = scrapeSportsResults('WVB')
\ No newline at end of file
+# df_wvb = scrapeSportsResults('WVB')
+
+# print the run summary (histograms of request, parse and wait times)
+df_events = endRun()
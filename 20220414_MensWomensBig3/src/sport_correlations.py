@@ -0,0 +1,356 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:03:53 2026
+
+@author: agent
+
+:DESCRIPTION: Measure how closely the results of a school's sports move
+    together: pairwise correlation matrices between the win pct. and RPI
+    (FPI for football) of MFB, MBB, MBA, WBB, WSB and WVB over team-seasons,
+    globally, per conference and over windows of seasons.
+
+    Missing sports are masked rather than dropped, so every pair of
+    variables uses every team-season in which both are available. The
+    masked sums behind each correlation (count, sums, sums of squares and
+    cross-products) are computed with NumPy matrix products once per
+    (conference, season) and then simply added together for any scope, so:
+
+        - global, per-conference and per-window matrices never revisit rows
+        - adding a season only computes that season's sums
+        - a rolling window adds the newest season and subtracts the season
+          leaving the window instead of recomputing over its history
+
+    Pearson correlations use the values themselves. Rank correlations use
+    each value's percentile rank among all teams in the same season, which
+    keeps the ranks (and therefore the sums) of past seasons unchanged when
+    a season is added.
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import numpy as np
+import pandas as pd
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+list_corr_sports = ['MFB', 'MBB', 'MBA', 'WBB', 'WSB', 'WVB']
+
+# correlation types and the transformation applied to each season's values
+list_corr_kinds = ['pearson', 'rank']
+
+# minimum number of shared team-seasons for a correlation to be reported
+min_corr_periods = 10
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def buildCorrelationVariables(df, list_sports = list_corr_sports):
+    '''
+    Purpose: Compute the win pct. and RPI variable of every sport from the
+        merged results table (i.e. the output of `mergeAllData`)
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Contains `{sport}_W`, `{sport}_L` and `{sport}_Rank` variables
+        list_sports : list of strings
+            Sports to include (default: `list_corr_sports`)
+
+    Outputs
+    -------
+        df_vars : Pandas DataFrame
+            `{sport}_Win_Pct` for every sport followed by `{sport}_RPI` for
+            every sport (missing where a sport has no results)
+    '''
+    df_vars = pd.DataFrame(index = df.index)
+    for sport in list_sports:
+        wins = pd.to_numeric(df[f'{sport}_W'], errors = 'coerce')
+        losses = pd.to_numeric(df[f'{sport}_L'], errors = 'coerce')
+        df_vars[f'{sport}_Win_Pct'] = wins / (wins + losses)
+    for sport in list_sports:
+        df_vars[f'{sport}_RPI'] = pd.to_numeric(df[f'{sport}_Rank'], errors = 'coerce')
+
+    return df_vars
+
+def computeMaskedSums(array_values):
+    '''
+    Purpose: Compute the pairwise sums behind a correlation matrix, using
+        only the rows in which both variables of a pair are available
+
+    Inputs
+    ------
+        array_values : NumPy array
+            One row per team-season, one column per variable (NaN = missing)
+
+    Outputs
+    -------
+        array_sums : NumPy array
+            Shape (4, variables, variables) holding, for every pair (i, j):
+            the number of shared rows, the sum of i, the sum of squares of i
+            and the sum of i x j over the shared rows
+    '''
+    array_mask = (~np.isnan(array_values)).astype(float)
+    array_zero = np.nan_to_num(array_values)
+
+    return np.stack([array_mask.T @ array_mask,
+                     array_zero.T @ array_mask,
+                     (array_zero ** 2).T @ array_mask,
+                     array_zero.T @ array_zero])
+
+def sumsToCorrelation(array_sums, list_vars, min_periods = min_corr_periods):
+    '''
+    Purpose: Convert pairwise sums into a correlation matrix
+
+    Inputs
+    ------
+        array_sums : NumPy array
+            Output of `computeMaskedSums` (or the sum of several)
+        list_vars : list of strings
+            Variable names in column order
+        min_periods : int
+            Minimum number of shared rows per pair (default: `min_corr_periods`)
+
+    Outputs
+    -------
+        df_corr : Pandas DataFrame
+            Correlation matrix (missing where a pair has too few shared rows)
+    '''
+    n, sum_x, sum_xx, sum_xy = array_sums
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        cov = n * sum_xy - sum_x * sum_x.T
+        var = n * sum_xx - sum_x ** 2
+        array_corr = cov / np.sqrt(var * var.T)
+    array_corr[n < min_periods] = np.nan
+
+    return pd.DataFrame(array_corr, index = list_vars, columns = list_vars)
+
+def buildCorrelationStats(df, conf_var = None, season_var = 'Season',
+                          list_sports = list_corr_sports, dict_corr = None):
+    '''
+    Purpose: Compute the pairwise sums of every (conference, season) for
+        both correlation types (seasons already in `dict_corr` are skipped,
+        so the same call adds new seasons to existing statistics)
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Merged results table (see `buildCorrelationVariables`)
+        conf_var : string
+            Name of the conference variable (default: None = one group)
+        season_var : string
+            Name of the season variable (default: 'Season')
+        list_sports : list of strings
+            Sports to include (default: `list_corr_sports`)
+        dict_corr : dictionary
+            Existing output of this function to add seasons to
+            (default: None)
+
+    Outputs
+    -------
+        dict_corr : dictionary
+            Contains the variable names ('vars'), sorted seasons ('seasons')
+            and, for every correlation type, the pairwise sums of every
+            (conference, season) ({kind: {(conf, season): array}})
+    '''
+    if dict_corr is None:
+        dict_corr = {'vars':None, 'seasons':[],
+                     **{kind:{} for kind in list_corr_kinds}}
+
+    df = df[~df[season_var].isin(dict_corr['seasons'])]
+    df_vars = buildCorrelationVariables(df, list_sports)
+    dict_corr['vars'] = list(df_vars.columns)
+    series_season = df[season_var]
+    series_conf = (df[conf_var].fillna('') if conf_var is not None
+                   else pd.Series('', index = df.index))
+
+    # rank transformation within each season only
+    dict_values = {'pearson':df_vars,
+                   'rank':df_vars.groupby(series_season).rank(pct = True)}
+
+    for (conf, season), index in df.groupby([series_conf, series_season]).groups.items():
+        for kind in list_corr_kinds:
+            dict_corr[kind][(conf, season)] = computeMaskedSums(
+                dict_values[kind].loc[index].to_numpy(dtype = float))
+
+    dict_corr['seasons'] = sorted(set(dict_corr['seasons']) | set(series_season))
+
+    return dict_corr
+
+def sumCorrelationStats(dict_corr, kind = 'pearson', conf = None, list_seasons = None):
+    '''
+    Purpose: Add up the pairwise sums of a scope
+
+    Inputs
+    ------
+        dict_corr : dictionary
+            Output of `buildCorrelationStats`
+        kind : string
+            'pearson' or 'rank' (default: 'pearson')
+        conf : string
+            Conference to include (default: None = every conference)
+        list_seasons : list
+            Seasons to include (default: None = every season)
+
+    Outputs
+    -------
+        array_sums : NumPy array
+            Pairwise sums of the scope (see `computeMaskedSums`)
+    '''
+    n_vars = len(dict_corr['vars'])
+    array_sums = np.zeros((4, n_vars, n_vars))
+    for (key_conf, key_season), array_cell in dict_corr[kind].items():
+        if ((conf is None or key_conf == conf) and
+                (list_seasons is None or key_season in list_seasons)):
+            array_sums += array_cell
+
+    return array_sums
+
+def computeCorrelation(dict_corr, kind = 'pearson', conf = None,
+                       list_seasons = None, min_periods = min_corr_periods):
+    '''
+    Purpose: Compute the correlation matrix of a scope (globally, for one
+        conference and/or for a set of seasons)
+
+    Inputs
+    ------
+        dict_corr : dictionary
+            Output of `buildCorrelationStats`
+        kind : string
+            'pearson' or 'rank' (default: 'pearson')
+        conf : string
+            Conference to include (default: None = every conference)
+        list_seasons : list
+            Seasons to include (default: None = every season)
+        min_periods : int
+            Minimum number of shared rows per pair (default: `min_corr_periods`)
+
+    Outputs
+    -------
+        df_corr : Pandas DataFrame
+            Correlation matrix
+    '''
+    return sumsToCorrelation(sumCorrelationStats(dict_corr, kind, conf, list_seasons),
+                             dict_corr['vars'], min_periods)
+
+def computeConferenceCorrelations(dict_corr, kind = 'pearson',
+                                  min_periods = min_corr_periods):
+    '''
+    Purpose: Compute the correlation matrix of every conference
+
+    Inputs
+    ------
+        dict_corr : dictionary
+            Output of `buildCorrelationStats` (with a conference variable)
+        kind : string
+            'pearson' or 'rank' (default: 'pearson')
+        min_periods : int
+            Minimum number of shared rows per pair (default: `min_corr_periods`)
+
+    Outputs
+    -------
+        dict_conf : dictionary
+            Keys are conferences, values are correlation matrices
+    '''
+    list_confs = sorted(set(conf for conf, season in dict_corr[kind].keys()))
+
+    return {conf:computeCorrelation(dict_corr, kind, conf, None, min_periods)
+            for conf in list_confs}
+
+def advanceWindow(dict_corr, dict_window, season):
+    '''
+    Purpose: Move a rolling window of seasons forward by one season, adding
+        the new season's sums and subtracting those of the season leaving
+        the window
+
+    Inputs
+    ------
+        dict_corr : dictionary
+            Output of `buildCorrelationStats`
+        dict_window : dictionary
+            Window state with its length ('window'), type ('kind'),
+            conference ('conf'), seasons ('seasons') and running sums
+            ('sums'); create it with `{'window':5, 'kind':'pearson',
+            'conf':None, 'seasons':[], 'sums':None}`
+        season : string
+            Season to add
+
+    Outputs
+    -------
+        dict_window : dictionary
+            Updated window state
+    '''
+    array_new = sumCorrelationStats(dict_corr, dict_window['kind'],
+                                    dict_window['conf'], [season])
+    if dict_window['sums'] is None:
+        dict_window['sums'] = np.zeros_like(array_new)
+
+    dict_window['sums'] += array_new
+    dict_window['seasons'].append(season)
+    if len(dict_window['seasons']) > dict_window['window']:
+        season_old = dict_window['seasons'].pop(0)
+        dict_window['sums'] -= sumCorrelationStats(
+            dict_corr, dict_window['kind'], dict_window['conf'], [season_old])
+
+    return dict_window
+
+def rollingCorrelations(dict_corr, window = 5, kind = 'pearson', conf = None,
+                        min_periods = min_corr_periods):
+    '''
+    Purpose: Compute the correlation matrix of every window of consecutive
+        seasons
+
+    Inputs
+    ------
+        dict_corr : dictionary
+            Output of `buildCorrelationStats`
+        window : int
+            Number of seasons per window (default: 5)
+        kind : string
+            'pearson' or 'rank' (default: 'pearson')
+        conf : string
+            Conference to include (default: None = every conference)
+        min_periods : int
+            Minimum number of shared rows per pair (default: `min_corr_periods`)
+
+    Outputs
+    -------
+        dict_rolling : dictionary
+            Keys are the last season of each full window, values are
+            correlation matrices
+    '''
+    dict_window = {'window':window, 'kind':kind, 'conf':conf,
+                   'seasons':[], 'sums':None}
+    dict_rolling = {}
+    for season in dict_corr['seasons']:
+        dict_window = advanceWindow(dict_corr, dict_window, season)
+        if len(dict_window['seasons']) == window:
+            dict_rolling[season] = sumsToCorrelation(
+                dict_window['sums'], dict_corr['vars'], min_periods)
+
+    return dict_rolling
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Pairwise sums of every conference/season
+# dict_corr = buildCorrelationStats(df_results, conf_var = 'conf')
+
+# # Correlations across all team-seasons, for the Big Ten, and 2016-17 onward
+# df_corr = computeCorrelation(dict_corr, 'pearson')
+# df_corr_b1g = computeCorrelation(dict_corr, 'rank', conf = 'B1G')
+# df_corr_recent = computeCorrelation(
+#     dict_corr, 'pearson', list_seasons = [x for x in dict_corr['seasons'] if x >= '2016-17'])
+
+# # Five-season rolling correlations
+# dict_rolling = rollingCorrelations(dict_corr, window = 5)
+
+# # Add a new season without recomputing past seasons
+# dict_corr = buildCorrelationStats(df_results_new, conf_var = 'conf', dict_corr = dict_corr)
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:55:35 2026
+
+@author: agent
+
+:DESCRIPTION: Write synthetic win/loss data in the schema of the scraped
+    results (`data/csv/{sport}/{sport}_{season}.csv` with Sport, Season,
+    Rank, Team, W, L) at multiples of the real data's size, and benchmark
+    the analysis pipeline on it:
+
+        - rollUpData       : per-season files -> `{sport}_all_years.csv`
+        - mergeAllData     : every sport -> `data/results_all_years.csv`
+        - engineerFeatures : win pct., group totals/averages, differences,
+                             conference and ranks
+
+    Scale 1 matches the real data (16 seasons of ~130 FBS teams, with ~2.7
+    times as many teams in the other sports). Larger scales add seasons
+    (up to 50) and then teams. Team names are written as the standard name,
+    the name plus nickname or an alternate name, so that every name has to
+    be standardized through the synthetic `school_abbreviations` file like
+    the real data, and ~3% of team-seasons are missing from every sport.
+
+    Usage from the command line (run from the project root):
+        python src/synthetic_results.py --scales 1 10 100 --output data/benchmarks/stages.csv
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import argparse
+import numpy as np
+import os
+import pandas as pd
+import sys
+
+# modules shared by every project (`huskerProjects/common`)
+path_common = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            os.pardir, os.pardir, 'common'))
+if path_common not in sys.path:
+    sys.path.append(path_common)
+
+from benchmark_stages import (benchmarkStages, plotScaling, summarizeScaling,
+                              writeSyntheticSchools)
+from results_data import engineerFeatures, mergeAllData, rollUpData
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+# games per season of every sport
+dict_sport_games = {'MFB':12, 'MBA':55, 'MBB':32, 'WBB':32, 'WSB':55, 'WVB':30}
+
+# size of the real data
+real_seasons     = 16
+real_teams_fbs   = 130
+ratio_teams_d1   = 2.7
+last_season      = 2022
+pct_missing      = 0.03
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def getScaleSize(scale):
+    '''
+    Purpose: Number of seasons and teams of a synthetic project
+
+    Inputs
+    ------
+        scale : int
+            Multiple of the real data's size
+
+    Outputs
+    -------
+        seasons : int
+            Number of seasons (up to 50)
+        teams_fbs : int
+            Number of football (FBS) teams
+        teams_d1 : int
+            Number of teams in the other sports
+    '''
+    seasons = min(real_seasons * scale, 50)
+    teams_fbs = round(real_teams_fbs * real_seasons * scale / seasons)
+
+    return seasons, teams_fbs, round(teams_fbs * ratio_teams_d1)
+
+def writeSyntheticProject(path_dir, scale = 1, seed = 0):
+    '''
+    Purpose: Write a synthetic project (win/loss records of every sport and
+        season plus the school names) at a multiple of the real data's size
+
+    Inputs
+    ------
+        path_dir : string
+            Project root of the synthetic project
+        scale : int
+            Multiple of the real data's size (default: 1)
+        seed : int
+            Seed of the random number generator (default: 0)
+
+    Outputs
+    -------
+        rows : int
+            Number of team-seasons written across all sports
+    '''
+    rng = np.random.default_rng(seed)
+    seasons, teams_fbs, teams_d1 = getScaleSize(scale)
+    df_schools = writeSyntheticSchools(path_dir, teams_d1,
+                                       conference_size = 12, seed = seed)
+
+    # every team is listed under its standard name, with its nickname or
+    #   under an alternate name
+    array_names = np.stack([df_schools['Team'],
+                            df_schools['Team'] + ' ' + df_schools['Nickname'],
+                            df_schools['Name1'], df_schools['Name2']], axis = 1)
+
+    rows = 0
+    for sport, games in dict_sport_games.items():
+        teams = teams_fbs if sport == 'MFB' else teams_d1
+        os.makedirs(os.path.join(path_dir, 'data', 'csv', sport), exist_ok = True)
+        for year in range(last_season - seasons, last_season):
+            season = f'{year}-{str(year + 1)[-2:]}'
+            array_teams = np.flatnonzero(rng.random(teams) >= pct_missing)
+            array_w = rng.binomial(games, rng.random(len(array_teams)))
+            df_season = pd.DataFrame({'Sport':sport, 'Season':season,
+                                      'Team':array_names[array_teams,
+                                                         rng.integers(0, 4, len(array_teams))],
+                                      'W':array_w, 'L':games - array_w})
+            df_season = df_season.sort_values('W', ascending = False)
+            df_season.insert(2, 'Rank', np.arange(1, len(df_season) + 1))
+            df_season.to_csv(os.path.join(path_dir, 'data', 'csv', sport,
+                                          f'{sport}_{season}.csv'), index = False)
+            rows += len(df_season)
+
+    return rows
+
+def loadFeatureInputs():
+    '''
+    Purpose: Load the input of `engineerFeatures` (merged results and the
+        conference of every team) from the project root
+
+    Inputs
+    ------
+        NONE
+
+    Outputs
+    -------
+        inputs : tuple
+            (df, df_teams)
+    '''
+    df_teams = pd.read_csv(r'references/school_abbreviations_and_pictures.csv',
+                           encoding = 'latin-1')
+    df_teams = df_teams[['Team', 'ConferenceAbbrev']]
+    df_teams = df_teams.rename(columns = {'Team':'team', 'ConferenceAbbrev':'conf'})
+
+    return pd.read_csv(r'data/results_all_years.csv'), df_teams
+
+# stages of the analysis pipeline (run in order, see `benchmarkStages`)
+dict_pipeline_stages = {'rollUpData':(None, rollUpData),
+                        'mergeAllData':(None, mergeAllData),
+                        'engineerFeatures':(loadFeatureInputs, engineerFeatures)}
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Write synthetic projects at 1x and 10x and benchmark the pipeline on both
+# dict_paths = {scale:rf'data/synthetic/scale_{scale}' for scale in [1, 10]}
+# for scale, path in dict_paths.items():
+#     writeSyntheticProject(path, scale)
+# df_stages = benchmarkStages(dict_pipeline_stages, dict_paths)
+# df_summary = summarizeScaling(df_stages)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description = 'Benchmark the results pipeline on synthetic data')
+    parser.add_argument('--scales', type = int, nargs = '+', default = [1, 10, 100],
+                        help = 'multiples of the real data size to benchmark')
+    parser.add_argument('--path', default = os.path.join('data', 'synthetic'),
+                        help = 'folder of the synthetic projects')
+    parser.add_argument('--repeat', type = int, default = 1,
+                        help = 'runs per stage (fastest is reported)')
+    parser.add_argument('--output', default = None,
+                        help = 'path of the .csv results (a .png of the '
+                               'scaling curves is saved alongside)')
+    args = parser.parse_args()
+
+    dict_paths = {}
+    for scale in args.scales:
+        dict_paths[scale] = os.path.join(args.path, f'scale_{scale}')
+        rows = writeSyntheticProject(dict_paths[scale], scale)
+        print(f'Wrote {rows:,} team-seasons at {scale}x to {dict_paths[scale]}')
+    df_stages = benchmarkStages(dict_pipeline_stages, dict_paths, args.repeat)
+
+    pd.set_option('display.width', 200)
+    print(df_stages.round(3).to_string(index = False))
+    print(summarizeScaling(df_stages).round(3).to_string(index = False))
+    if args.output is not None:
+        if os.path.dirname(args.output):
+            os.makedirs(os.path.dirname(args.output), exist_ok = True)
+        df_stages.to_csv(args.output, index = False)
+        plotScaling(df_stages, os.path.splitext(args.output)[0] + '.png')
+        print(f'Saved results to {args.output}')
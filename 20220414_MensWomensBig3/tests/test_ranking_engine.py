@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:08:33 2026
+
+@author: agent
+
+:DESCRIPTION: Check that ranking a new season incrementally (`appendRanks`)
+    gives the same ranks at every level as re-ranking every team-season
+    (`rankMetrics`).
+
+:REQUIRES: pytest
+
+:TODO: NONE
+"""
+
+import numpy as np
+import pandas as pd
+
+from ranking_engine import appendRanks, buildRankIndex, rankMetrics
+
+list_metrics, list_metrics_abs = ['win_pct', 'diff'], ['diff']
+
+def makeSeasons(list_seasons, teams = 60, seed = 0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({'season':np.repeat(list_seasons, teams),
+                       'team':np.tile([f'Team {i}' for i in range(teams)],
+                                      len(list_seasons)),
+                       'conf':np.tile(rng.choice(['A', 'B', 'C', None], teams),
+                                      len(list_seasons))})
+    # rounded values so that ties occur within and across seasons
+    df['win_pct'] = rng.integers(0, 13, len(df)) / 12
+    df['diff'] = rng.integers(-6, 7, len(df)) / 12
+    df.loc[rng.random(len(df)) < 0.05, 'win_pct'] = np.nan
+
+    return df
+
+def test_append_matches_full_rerank():
+    df_all = makeSeasons([2018, 2019, 2020, 2021, 2022])
+    df_old = df_all[df_all['season'] < 2022].reset_index(drop = True)
+    df_new = df_all[df_all['season'] == 2022].reset_index(drop = True)
+
+    df = rankMetrics(df_old, list_metrics, list_metrics_abs)
+    dict_index = buildRankIndex(df, list_metrics, list_metrics_abs)
+    df, dict_index, dict_changed = appendRanks(df, df_new, dict_index,
+                                               list_metrics, list_metrics_abs)
+    df_full = rankMetrics(df_all, list_metrics, list_metrics_abs)
+
+    list_ranks = [x for x in df_full.columns if x.startswith('rank_')]
+    assert sorted(list_ranks) == sorted(x for x in df.columns if x.startswith('rank_'))
+    pd.testing.assert_frame_equal(df[list_ranks].reset_index(drop = True),
+                                  df_full[list_ranks], check_dtype = False)
+
+    # only the ranks of existing team-seasons that changed are reported
+    df_before = rankMetrics(df_old, list_metrics, list_metrics_abs)
+    for name in list_ranks:
+        array_diff = ~np.isclose(df_before[name], df_full.loc[:len(df_old) - 1, name],
+                                 equal_nan = True)
+        assert sorted(dict_changed[name]) == list(np.flatnonzero(array_diff))
+
+def test_append_twice():
+    df_all = makeSeasons([2019, 2020, 2021, 2022], seed = 1)
+    df = rankMetrics(df_all[df_all['season'] < 2021].reset_index(drop = True),
+                     list_metrics, list_metrics_abs)
+    dict_index = buildRankIndex(df, list_metrics, list_metrics_abs)
+    for season in [2021, 2022]:
+        df, dict_index, dict_changed = appendRanks(
+            df, df_all[df_all['season'] == season], dict_index,
+            list_metrics, list_metrics_abs)
+    df_full = rankMetrics(df_all.reset_index(drop = True), list_metrics, list_metrics_abs)
+
+    list_ranks = [x for x in df_full.columns if x.startswith('rank_')]
+    pd.testing.assert_frame_equal(df[list_ranks].reset_index(drop = True),
+                                  df_full[list_ranks], check_dtype = False)
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:12:39 2026
+
+@author: agent
+
+:DESCRIPTION: Check that the correlation matrices built from masked sums
+    match pandas' pairwise-complete `corr()` for every scope (global, per
+    conference, per window of seasons) and that adding seasons
+    incrementally gives the same sums as building them all at once.
+
+:REQUIRES: pytest
+
+:TODO: NONE
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sport_correlations import (buildCorrelationStats, buildCorrelationVariables,
+                                computeConferenceCorrelations, computeCorrelation,
+                                list_corr_sports, min_corr_periods,
+                                rollingCorrelations)
+
+tolerance = 1e-12
+
+def makeResults(seasons = 8, teams = 150, seed = 0):
+    rng = np.random.default_rng(seed)
+    list_seasons = [f'{2010 + i}-{str(2011 + i)[-2:]}' for i in range(seasons)]
+    df = pd.DataFrame({'Season':np.repeat(list_seasons, teams),
+                       'Team':np.tile([f'Team {i}' for i in range(teams)], seasons),
+                       'conf':np.tile(rng.choice(['A', 'B', 'C', None], teams), seasons)})
+    strength = rng.normal(size = len(df))
+    for sport in list_corr_sports:
+        games = 30
+        df[f'{sport}_W'] = rng.binomial(games, 1 / (1 + np.exp(-strength - rng.normal(size = len(df)))))
+        df[f'{sport}_L'] = games - df[f'{sport}_W']
+        df[f'{sport}_Rank'] = df.groupby('Season')[f'{sport}_W'].rank(ascending = False)
+        array_missing = rng.random(len(df)) < 0.2
+        df.loc[array_missing, [f'{sport}_W', f'{sport}_L', f'{sport}_Rank']] = np.nan
+
+    return df
+
+@pytest.fixture(scope = 'module')
+def df_results():
+    return makeResults()
+
+def expectedCorrelation(df, kind):
+    df_vars = buildCorrelationVariables(df)
+    if kind == 'rank':
+        df_vars = df_vars.groupby(df['Season']).rank(pct = True)
+
+    return df_vars.corr(min_periods = min_corr_periods)
+
+@pytest.mark.parametrize('kind', ['pearson', 'rank'])
+def test_global_and_conference_match_pandas(df_results, kind):
+    dict_corr = buildCorrelationStats(df_results, conf_var = 'conf')
+    df_corr = computeCorrelation(dict_corr, kind)
+    pd.testing.assert_frame_equal(df_corr, expectedCorrelation(df_results, kind),
+                                  atol = tolerance, rtol = 0)
+
+    # ranks are taken among all teams of the season, not within the conference
+    df_vars = buildCorrelationVariables(df_results)
+    if kind == 'rank':
+        df_vars = df_vars.groupby(df_results['Season']).rank(pct = True)
+
+    dict_conf = computeConferenceCorrelations(dict_corr, kind)
+    for conf in ['A', 'B', 'C']:
+        df_expected = df_vars[df_results['conf'] == conf].corr(min_periods = min_corr_periods)
+        pd.testing.assert_frame_equal(dict_conf[conf], df_expected,
+                                      atol = tolerance, rtol = 0)
+
+def test_rolling_windows_match_pandas(df_results):
+    dict_corr = buildCorrelationStats(df_results)
+    dict_rolling = rollingCorrelations(dict_corr, window = 3)
+    list_seasons = dict_corr['seasons']
+    assert list(dict_rolling.keys()) == list_seasons[2:]
+    for i, season in enumerate(list_seasons[2:]):
+        df_window = df_results[df_results['Season'].isin(list_seasons[i:i + 3])]
+        pd.testing.assert_frame_equal(dict_rolling[season],
+                                      expectedCorrelation(df_window, 'pearson'),
+                                      atol = tolerance, rtol = 0)
+
+def test_incremental_seasons_match_full_build(df_results):
+    list_seasons = sorted(df_results['Season'].unique())
+    dict_full = buildCorrelationStats(df_results, conf_var = 'conf')
+    dict_corr = buildCorrelationStats(
+        df_results[df_results['Season'].isin(list_seasons[:-2])], conf_var = 'conf')
+    for season in list_seasons[-2:]:
+        dict_corr = buildCorrelationStats(df_results[df_results['Season'] == season],
+                                          conf_var = 'conf', dict_corr = dict_corr)
+
+    assert dict_corr['seasons'] == dict_full['seasons']
+    for kind in ['pearson', 'rank']:
+        assert dict_corr[kind].keys() == dict_full[kind].keys()
+        for key, array_sums in dict_full[kind].items():
+            np.testing.assert_array_equal(dict_corr[kind][key], array_sums)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 15:53:23 2026
+
+@author: agent
+
+:DESCRIPTION: Compute a configurable list of height/weight statistics for
+    roster position groups at any number of grouping levels (e.g. school,
+    conference, class, position x class).
+
+    Each grouping level is computed from a single groupby: the standard
+    aggregates (count, mean, median, std, min, max) come from one `agg` call
+    and the percentiles from one `quantile` call on the same grouper, and
+    the two are joined on their shared index (no per-statistic merges).
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+list_stat_vars        = ['Height_Inches', 'Weight']
+list_stat_aggs        = ['count', 'mean', 'median', 'std', 'min', 'max']
+list_stat_percentiles = [0.10, 0.25, 0.75, 0.90]
+
+# grouping levels (the conference level needs the `Conference` recorded by
+#   the roster store, so rosters of several conferences are never pooled)
+dict_stat_levels = {'school':['School', 'Pos_Std'],
+                    'conference':['Conference', 'Pos_Std'],
+                    'class':['Class'],
+                    'position_class':['Pos_Std', 'Class']}
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def computeGroupStats(df, list_keys, list_vars = list_stat_vars,
+                      list_aggs = list_stat_aggs,
+                      list_percentiles = list_stat_percentiles):
+    '''
+    Purpose: Compute every requested statistic for every variable within
+        one grouping level
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Contains the grouping and stat variables
+        list_keys : list of strings
+            Grouping variables
+        list_vars : list of strings
+            Variables to summarize (default: `list_stat_vars`)
+        list_aggs : list of strings
+            Pandas aggregations to compute (default: `list_stat_aggs`)
+        list_percentiles : list of floats
+            Percentiles to compute between 0 and 1
+            (default: `list_stat_percentiles`)
+
+    Outputs
+    -------
+        df_stats : Pandas DataFrame
+            One row per group with the grouping variables and a
+            `{var}_{Stat}` variable for every statistic (e.g.
+            `Height_Inches_Mean`, `Weight_P90`)
+    '''
+    grouped = df.groupby(list_keys)[list_vars]
+
+    # standard aggregates in a single pass
+    df_stats = grouped.agg(list_aggs)
+    df_stats.columns = [f'{var}_{agg.capitalize()}' for var, agg in df_stats.columns]
+
+    # percentiles in a single pass on the same groups
+    if len(list_percentiles) > 0:
+        df_pct = grouped.quantile(list_percentiles).unstack(level = -1)
+        df_pct.columns = [f'{var}_P{round(pct*100)}' for var, pct in df_pct.columns]
+        df_stats = df_stats.join(df_pct)
+
+    return df_stats.reset_index(drop = False)
+
+def computeStatLevels(df, dict_levels = dict_stat_levels, **kwargs):
+    '''
+    Purpose: Compute statistics for every grouping level
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Contains the grouping and stat variables (e.g. the output of
+            `roster_store.loadRosterStore`)
+        dict_levels : dictionary
+            Keys are level names, values are lists of grouping variables
+            (default: `dict_stat_levels`)
+        **kwargs
+            Passed on to `computeGroupStats` (i.e. `list_vars`, `list_aggs`,
+            `list_percentiles`)
+
+    Outputs
+    -------
+        dict_stats : dictionary
+            Keys are level names, values are the output of `computeGroupStats`
+    '''
+    return {level:computeGroupStats(df, list_keys, **kwargs)
+            for level, list_keys in dict_levels.items()}
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Stats for every level of every stored conference
+# dict_stats = computeStatLevels(loadRosterStore())
+
+# # Weight spread of each position by class
+# df_pos_class = dict_stats['position_class'][['Pos_Std', 'Class', 'Weight_Std',
+#                                              'Weight_P10', 'Weight_P90']]
+
+# # Median only, per school/position
+# df_median = computeGroupStats(df, ['School', 'Pos_Std'],
+#                               list_aggs = ['median'], list_percentiles = [])
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:55:35 2026
+
+@author: agent
+
+:DESCRIPTION: Clean raw roster files and compute the position-group
+    height/weight stats analyzed by `analyze_rosters.py`:
+
+        - processRawRosters    : raw roster .csv -> cleaned, standardized roster
+        - computePositionStats : mean/median height/weight of every team's
+                                 position groups and of the conference
+
+    Every step reads paths relative to the project root.
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import os
+import pandas as pd
+import sys
+
+# modules shared by every project (`huskerProjects/common`)
+path_common = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            os.pardir, os.pardir, 'common'))
+if path_common not in sys.path:
+    sys.path.append(path_common)
+
+from position_stats import computeStatLevels
+from position_taxonomy import standardizePositions
+from roster_store import parseHeights
+from scrape_rosters import dict_table_columns, list_roster_columns, normalizeRoster
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+# raw roster columns (see `list_roster_columns`) required by the analysis
+list_required_columns = ['SCHOOL', 'NAME', 'POS.', 'HT.', 'WT.', 'YEAR']
+
+# names of the raw roster columns in the cleaned rosters
+dict_clean_columns = {'SCHOOL':'School', 'NO.':'#', 'NAME':'Name', 'POS.':'Pos',
+                      'HT.':'Height', 'WT.':'Weight', 'YEAR':'Class',
+                      'HOMETOWN/PREVIOUS_SCHOOL':'Hometown',
+                      'HIGH_SCHOOL':'High_School', 'LAST_SCHOOL':'Prev_School'}
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def renameSchool(df, name_var):
+    '''
+    Purpose: Rename a school/university to a standard name as specified in 
+        the file `school_abbreviations.csv`
+
+    Inputs
+    ------
+        df : Pandas Dataframe
+            DataFrame containing a school-name variable for which the names
+            need to be standardized
+        name_var : string
+            Name of the variable which is to be renamed/standardized
+    
+    Outputs
+    -------
+        list(row)[0] : string
+            Standardized version of the school's name based on the first value
+            in the row in the file `school_abbreviations.csv`
+    '''  
+    # read in school name information
+    df_school_names = pd.read_csv('references/school_abbreviations_and_pictures.csv', 
+                                  encoding = 'latin-1')
+     
+    # convert the dataframe to a dictionary such that the keys are the
+    #   optional spelling of each school and the value is the standardized
+    #   name of the school
+    dict_school_names = {}
+    
+    for index, row in df_school_names.iterrows():
+        # isolate the alternative name columns
+        names = row[[x for x in row.index if 'Name' in x]]
+        # convert the row to a list that doesn't include NaN values
+        list_names = [x for x in names.values.tolist() if str(x) != 'nan']
+        # add the nickname to the team names as an alternative name
+        nickname = row['Nickname']
+        list_names_nicknames = list_names.copy()
+        for name in list_names:
+            list_names_nicknames.append(name + ' ' + nickname)
+        # extract the standardized team name
+        name_standardized = row['Team']
+        # add the standardized name
+        list_names_nicknames.append(name_standardized)
+        # add the nickname to the standardized name
+        list_names_nicknames.append(name_standardized + ' ' + nickname)
+        # for every alternative spelling of the team, set the value to be
+        #   the standardized name
+        for name_alternate in list_names_nicknames:
+            dict_school_names[name_alternate] = name_standardized
+            
+    # df[name_var] = df[name_var].apply(
+    #         lambda x: dict_school_names[x] if str(x) != 'nan' else '')
+    df[name_var] = df[name_var].apply(
+            lambda x: rename_school_helper(x, dict_school_names))
+        
+    return df   
+
+def rename_school_helper(name_school, dict_school_names):
+    try:
+        if str(name_school) != 'nan':
+            return dict_school_names[name_school]
+        else:
+            return ''
+    except:
+        print(f'School not found in school abbreviations .csv file: {name_school} ')
+        return name_school
+
+def processRawRosters(path = r'data/2022_Big_Ten_Rosters.csv', encoding = 'cp1252'):
+    '''
+    Purpose: Read in a conference's raw rosters, clean up the data, and 
+        create new variables (as required)
+
+        Columns are matched by their header: the raw roster headers (see
+        `list_roster_columns`) or any header the table adapter of
+        `scrape_rosters.py` recognizes (e.g. 'Position', 'Ht.', 'Class';
+        see `dict_table_columns`). Heights, weights and numbers are
+        normalized like scraped rosters.
+
+    Inputs   
+    ------
+        path : string
+            File path of the raw rosters 
+            (default: 'data/2022_Big_Ten_Rosters.csv')
+        encoding : string
+            Encoding of the raw rosters (default: 'cp1252', as saved by Excel)
+            
+    Outputs
+    -------
+        df : Pandas DataFrame
+            Contains final, cleaned, engineered rosters across all teams
+    '''
+    # Load latest rosters (as text, normalized below)
+    df = pd.read_csv(path, encoding = encoding, dtype = str)
+    
+    # map columns to the raw roster format by header
+    df.columns = [x if x in list_roster_columns else 
+                  dict_table_columns.get(str(x).strip().lower(), x) for x in df.columns]
+    list_missing = [x for x in list_required_columns if x not in df.columns]
+    if len(list_missing) > 0:
+        raise ValueError(f'Unable to find columns {list_missing} in {path} '
+                         f'(columns: {list(df.columns)})')
+    df = df.loc[:, ~df.columns.duplicated()]
+    df = normalizeRoster(df, df['SCHOOL'])
+    
+    # clean up years
+    list_years = df.YEAR
+    list_years = list_years.replace('R-So.', 'So.')
+    list_years = list_years.replace('R-Jr.', 'Jr.')
+    list_years = list_years.replace('R-Sr.', 'Sr.')
+    list_years = list_years.replace('RS Fr.', 'R-Fr.')
+    list_years = list_years.replace('5th', 'Sr.')
+    list_years = list_years.replace('6th', 'Sr.')
+    list_years.value_counts()
+    df.YEAR = list_years
+    
+    # standardize positions (standard position, position group, side of ball)
+    df = standardizePositions(df, 'POS.')
+    
+    # Generate new height variable in inches
+    df['height_inches'] = parseHeights(df['HT.'])
+    
+    # Rename variables
+    df = df.rename(columns = {**dict_clean_columns, 'height_inches':'Height_Inches'})
+    
+    # Reorder variables
+    df = df[['School', '#', 'Name', 'Pos', 'Pos_Std', 'Pos_Group', 'Pos_Side',
+             'Height', 'Height_Inches', 'Weight', 'Class']]
+    
+    # Rename teams
+    df = renameSchool(df, 'School')
+    
+    return df
+
+def computePositionStats(df, path_dir, conference = 'Big Ten'):
+    '''
+    Purpose: Compute median/mean height/weight for each team's position groups
+        and for the conference as a whole
+
+    Inputs   
+    ------
+        df : Pandas DataFrame
+            Contains the rosers of every Big Ten team
+        path_dir : pathlib Path
+            path to project root directory
+        conference : string
+            Name used for the conference-wide rows (default: 'Big Ten')
+            
+    Outputs
+    -------
+        df_stats : Pandas DataFrame
+            Height/Weight stats by position group for each Big Ten Team and Conference
+    '''
+    # compute team and conference stats (one groupby per level)
+    dict_stats = computeStatLevels(df, 
+                                   {'school':['School', 'Pos_Std'],
+                                    'conference':['Pos_Std']},
+                                   list_aggs = ['mean', 'median'],
+                                   list_percentiles = [])
+    
+    # make school name for the conference
+    df_stats_conf = dict_stats['conference']
+    df_stats_conf['School'] = conference
+    
+    # append Conference Stats to Team Stats
+    df_stats = pd.concat([dict_stats['school'], df_stats_conf], ignore_index = True)
+    df_stats = df_stats.rename(columns = {'Pos_Std':'Pos'})
+    df_stats = df_stats[['School', 'Pos', 'Height_Inches_Mean', 
+                         'Height_Inches_Median', 'Weight_Mean', 
+                         'Weight_Median']]
+    
+    # Remove positions we don't care about
+    #   -- LS, FB, K, P
+    df_stats = df_stats[~df_stats['Pos'].isin(['LS', 'FB', 'K', 'P'])]
+    
+    # Add Logos to table
+    list_image_paths = []
+    for school in df_stats['School']:
+        list_image_paths.append(rf'images/logos_school_square/{school}.png')
+        # list_image_paths.append(str(path_dir.joinpath('images', 
+        #                                               'logos_school_square', 
+        #                                               school + '.png')))
+    df_stats['Logo'] = list_image_paths
+    
+    return df_stats
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Clean the rosters and compute position stats (from the project root)
+# df = processRawRosters()
+# df_stats = computePositionStats(df, pathlib.Path.cwd())
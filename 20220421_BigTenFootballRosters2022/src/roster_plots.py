@@ -0,0 +1,341 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:17:54 2026
+
+@author: agent
+
+:DESCRIPTION: Plot the average height and weight of Big Ten position groups,
+    one figure per position group, every position group as panels of one
+    figure (small multiples) or as the pages of one PDF.
+
+    The plots live in their own module (rather than in `analyze_rosters.py`)
+    so that `render_figures.py` can import them in worker processes without
+    running the analysis script.
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import math
+import matplotlib.pyplot as plt
+import os
+import sys
+from matplotlib.backends.backend_pdf import PdfPages
+
+# modules shared by every project (`huskerProjects/common`)
+path_common = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            os.pardir, os.pardir, 'common'))
+if path_common not in sys.path:
+    sys.path.append(path_common)
+
+from logo_atlas import loadLogoAtlas, scatterLogos
+from render_figures import (dict_render_profiles, findStaleOutputs, getHashPath,
+                            getOutputHash, getOutputPath, hashPlotData,
+                            list_default_profiles, saveFigure)
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def drawPositionAxes(ax, df, dict_atlas, bgcol = '#fafafa', zoom = .4,
+                     labelsize = 12):
+    '''
+    Purpose: Draw the height vs. weight plot of one position group on a set
+        of axes (logos, ticks in feet-inches and conference average lines)
+
+    Inputs
+    ------
+        ax : Matplotlib Axes
+            Axes to draw on
+        df : Pandas DataFrame
+            Stats of one position group, including the conference row
+            ('Big Ten')
+        dict_atlas : dictionary
+            Output of `loadLogoAtlas`
+        bgcol : string
+            Background colour (default: '#fafafa')
+        zoom : float
+            Logo zoom (default: .4)
+        labelsize : int
+            Font size of the tick labels (default: 12)
+
+    Outputs
+    -------
+        NONE
+    '''
+    ax.set_facecolor(bgcol)
+    
+    # Change plot spines
+    ax.spines['right'].set_visible(False)
+    ax.spines['top'].set_visible(False)
+    ax.spines['left'].set_color('#ccc8c8')
+    ax.spines['bottom'].set_color('#ccc8c8')
+    
+    # Change ticks
+    ax.tick_params(axis='x', labelsize=labelsize, color='#ccc8c8')
+    ax.tick_params(axis='y', labelsize=labelsize, color='#ccc8c8')
+    
+    # Plot badges (composited by a single artist) for every school but the
+    #   conference average
+    scatterLogos(ax, df['Weight_Mean'], df['Height_Inches_Mean'], df['School'],
+                 dict_atlas, zoom = zoom, c = bgcol,
+                 list_highlight = [x for x in df['School'] if x != 'Big Ten'])
+        
+    # Ensure X-Axis are whole numbers
+    def round_down(m, n):
+        return m // n * n
+    def round_up(n):
+        return n + (5 - n) % 5
+    min_xaxis = round_down(math.floor(df['Weight_Mean'].min()),5)
+    max_xaxis = round_up(math.ceil(df['Weight_Mean'].max()))
+    new_xaxis = range(min_xaxis, max_xaxis+5, 5)
+    ax.set_xticks(list(new_xaxis))
+    
+    # Set Y-Axis to traditional height values (i.e. 6'1" etc)
+    min_yaxis = math.floor(df['Height_Inches_Mean'].min())
+    max_yaxis = math.ceil(df['Height_Inches_Mean'].max())
+    new_yaxis = range(min_yaxis, max_yaxis+1)
+                      
+    ax.set_yticks(list(new_yaxis))
+    yaxis_labels = [str(x) for x in new_yaxis]
+    yaxis_labels = [str(math.floor(int(y)/12)) + '-' + str(int(y)%12) for y in yaxis_labels]
+    ax.set_yticklabels(yaxis_labels)
+    
+    # Add average lines
+    ax.hlines(float(df[df['School'] == 'Big Ten']['Height_Inches_Mean'].iloc[0]), 
+              min_xaxis, 
+              max_xaxis, 
+              color='#c2c1c0')
+    ax.vlines(float(df[df['School'] == 'Big Ten']['Weight_Mean'].iloc[0]), 
+              min_yaxis, 
+              max_yaxis, 
+              color='#c2c1c0')
+
+def plotStats(df, name_position, dict_atlas = None,
+              list_profiles = list_default_profiles, force = False):
+    '''
+    Purpose: Plot the average height vs. average weight of a position group
+        for every school (as logos) against the conference average
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Stats of one position group (i.e. the rows of the output of
+            `computePositionStats` for one position), including the
+            conference row ('Big Ten')
+        name_position : string
+            Name of the position group used in the title and file names
+        dict_atlas : dictionary
+            Output of `loadLogoAtlas` (default: None = load it)
+        list_profiles : list of strings
+            Render profiles to save (default: `list_default_profiles`, i.e.
+            1200 dpi .png and .pdf)
+        force : Boolean
+            Save every output even if its data and profile are unchanged
+            (default: False)
+
+    Outputs
+    -------
+        list_paths : list of strings
+            File paths of the outputs of every profile
+    '''
+    # Skip the plot if every output is up to date
+    hash_data = hashPlotData('plotStats', df, name_position)
+    list_paths = [getOutputPath(name_position, x) for x in list_profiles]
+    list_stale = list_profiles if force else findStaleOutputs(
+        name_position, hash_data, list_profiles)
+    if len(list_stale) == 0:
+        return list_paths
+    
+    # Load pre-scaled logos (memory-mapped, no PNG decoding)
+    if dict_atlas is None:
+        dict_atlas = loadLogoAtlas()
+    
+    # Set font and background colour
+    # plt.rcParams.update({'font.family':'Avenir'})
+    bgcol = '#fafafa'
+    
+    # Create initial plot
+    fig, ax = plt.subplots(figsize=(6, 4), dpi=1200)
+    fig.set_facecolor(bgcol)
+    drawPositionAxes(ax, df, dict_atlas, bgcol)
+         
+    fig.text(.15,.98,f'Big Ten {name_position}',size=20)
+    fig.text(.15,.93,'Average Height and Weight as of April 2022', size=12)
+    
+    # Set Axis Labels
+    ax.set_xlabel('Average Weight (lbs).')
+    ax.set_ylabel('Average Height')
+    
+    # Add Made by to bottom of image
+    fig.text(.68, .02, 'Created by @Stewmanji', size=8, color='#c2c1c0')
+    
+    ## Save plot (only the outputs that are out of date)
+    saveFigure(fig, name_position, hash_data, list_stale)
+    
+    return list_paths
+
+def plotStatsGrid(df_stats, dict_pos, dict_atlas = None, 
+                  name = 'Big Ten Position Groups', ncols = 4,
+                  list_profiles = list_default_profiles, force = False):
+    '''
+    Purpose: Plot every position group as a panel of one figure (small
+        multiples), with shared styling and a single save
+
+    Inputs
+    ------
+        df_stats : Pandas DataFrame
+            Output of `computePositionStats`
+        dict_pos : dictionary
+            Keys are positions (`Pos`), values are the names of the position
+            groups, in panel order
+        dict_atlas : dictionary
+            Output of `loadLogoAtlas` (default: None = load it)
+        name : string
+            Title and file name of the figure 
+            (default: 'Big Ten Position Groups')
+        ncols : int
+            Number of panels per row (default: 4)
+        list_profiles : list of strings
+            Render profiles to save (default: `list_default_profiles`; the
+            raster is scaled down to the profile's pixel budget)
+        force : Boolean
+            Save every output even if its data and profile are unchanged
+            (default: False)
+
+    Outputs
+    -------
+        list_paths : list of strings
+            File paths of the outputs of every profile
+    '''
+    # Skip the plot if every output is up to date
+    hash_data = hashPlotData('plotStatsGrid', df_stats[df_stats['Pos'].isin(dict_pos)],
+                             dict_pos, name, ncols)
+    list_paths = [getOutputPath(name, x) for x in list_profiles]
+    list_stale = list_profiles if force else findStaleOutputs(
+        name, hash_data, list_profiles)
+    if len(list_stale) == 0:
+        return list_paths
+    
+    # Load pre-scaled logos (memory-mapped, no PNG decoding)
+    if dict_atlas is None:
+        dict_atlas = loadLogoAtlas()
+    
+    bgcol = '#fafafa'
+    
+    # One panel per position group
+    nrows = math.ceil(len(dict_pos) / ncols)
+    fig, array_axes = plt.subplots(nrows, ncols, figsize=(4 * ncols, 3.2 * nrows + 1),
+                                   dpi=1200, squeeze=False)
+    fig.set_facecolor(bgcol)
+    fig.subplots_adjust(top=1 - 1 / (3.2 * nrows + 1), hspace=.35, wspace=.25)
+    
+    list_axes = list(array_axes.flat)
+    for idx, (pos, name_position) in enumerate(dict_pos.items()):
+        ax = list_axes[idx]
+        drawPositionAxes(ax, df_stats[df_stats['Pos'] == pos], dict_atlas, 
+                         bgcol, zoom = .3, labelsize = 9)
+        ax.set_title(name_position, size=12, loc='left')
+        # axis labels on the outer panels only
+        if idx % ncols == 0:
+            ax.set_ylabel('Average Height')
+        if idx + ncols >= len(dict_pos):
+            ax.set_xlabel('Average Weight (lbs).')
+    for ax in list_axes[len(dict_pos):]:
+        ax.set_visible(False)
+         
+    fig.text(.125,1 - .25 / (3.2 * nrows + 1),name,size=24)
+    fig.text(.125,1 - .65 / (3.2 * nrows + 1),
+             'Average Height and Weight as of April 2022', size=14)
+    
+    # Add Made by to bottom of image
+    fig.text(.8, .01, 'Created by @Stewmanji', size=10, color='#c2c1c0')
+    
+    ## Save plot (only the outputs that are out of date)
+    saveFigure(fig, name, hash_data, list_stale)
+    
+    return list_paths
+
+def plotStatsPages(df_stats, dict_pos, dict_atlas = None, 
+                   name = 'Big Ten Position Groups (pages)', force = False):
+    '''
+    Purpose: Save the plot of every position group as one page of a single
+        PDF, reusing one figure for every page
+
+    Inputs
+    ------
+        df_stats : Pandas DataFrame
+            Output of `computePositionStats`
+        dict_pos : dictionary
+            Keys are positions (`Pos`), values are the names of the position
+            groups, in page order
+        dict_atlas : dictionary
+            Output of `loadLogoAtlas` (default: None = load it)
+        name : string
+            File name of the PDF (default: 'Big Ten Position Groups (pages)')
+        force : Boolean
+            Save the PDF even if its data are unchanged (default: False)
+
+    Outputs
+    -------
+        path : string
+            File path of the PDF
+    '''
+    # Skip the PDF if it is up to date
+    hash_data = hashPlotData('plotStatsPages', df_stats[df_stats['Pos'].isin(dict_pos)],
+                             dict_pos)
+    path = getOutputPath(name, 'vector')
+    if not force and len(findStaleOutputs(name, hash_data, ['vector'])) == 0:
+        return path
+    
+    # Load pre-scaled logos (memory-mapped, no PNG decoding)
+    if dict_atlas is None:
+        dict_atlas = loadLogoAtlas()
+    
+    bgcol = '#fafafa'
+    
+    # Figure, titles and labels are created once and updated for every page
+    fig, ax = plt.subplots(figsize=(6, 4), dpi=1200)
+    fig.set_facecolor(bgcol)
+    text_title = fig.text(.15,.98,'',size=20)
+    fig.text(.15,.93,'Average Height and Weight as of April 2022', size=12)
+    fig.text(.68, .02, 'Created by @Stewmanji', size=8, color='#c2c1c0')
+    
+    with PdfPages(path) as pdf:
+        for pos, name_position in dict_pos.items():
+            ax.clear()
+            drawPositionAxes(ax, df_stats[df_stats['Pos'] == pos], dict_atlas, bgcol)
+            ax.set_xlabel('Average Weight (lbs).')
+            ax.set_ylabel('Average Height')
+            text_title.set_text(f'Big Ten {name_position}')
+            pdf.savefig(fig, bbox_inches = "tight", 
+                        dpi = dict_render_profiles['vector']['dpi'])
+    
+    os.makedirs(os.path.dirname(getHashPath(path)), exist_ok = True)
+    with open(getHashPath(path), 'w') as file:
+        file.write(getOutputHash(hash_data, 'vector'))
+    
+    return path
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Plot the defensive linemen of every school
+# plotStats(df_stats[df_stats.Pos == 'DL'], 'Defensive Linemen')
+
+# # Quick low-resolution look (saved as `Defensive Linemen_preview.png`)
+# plotStats(df_stats[df_stats.Pos == 'DL'], 'Defensive Linemen',
+#           list_profiles = ['preview'])
+
+# # Every position group in one figure, and as one PDF with a page each
+# plotStatsGrid(df_stats, dict_pos)
+# plotStatsPages(df_stats, dict_pos)
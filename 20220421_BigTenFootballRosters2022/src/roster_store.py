@@ -0,0 +1,218 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 15:55:04 2026
+
+@author: agent
+
+:DESCRIPTION: Store dated roster snapshots for any conference and season so
+    that multi-season questions (e.g. year-over-year size trends across all
+    FBS programs) are answered from stored data instead of re-parsing the
+    raw roster .csv files.
+
+    Each snapshot (the output of `processRawRosters`) is ingested once:
+    heights are already parsed, columns are cast to compact types and the
+    snapshot is written in columnar (Parquet) form alongside precomputed
+    per-team and per-position aggregates:
+
+        data/roster_store/rosters/{season}_{conference}_{date}.parquet
+        data/roster_store/aggregates/{season}_{conference}_{date}_{level}.parquet
+
+    Re-ingesting the same (season, conference, date) replaces the snapshot.
+
+:REQUIRES: See Package Import section for required packages
+    (Parquet support requires `pyarrow`)
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import glob
+import os
+import pandas as pd
+
+from position_stats import computeGroupStats
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+dict_roster_types = {'School':'category',
+                     'Pos':'category',
+                     'Pos_Std':'category',
+                     'Pos_Group':'category',
+                     'Pos_Side':'category',
+                     'Class':'category',
+                     'Height_Inches':'Int16',
+                     'Weight':'Int16'}
+
+# precomputed aggregate levels for every snapshot
+dict_store_levels = {'team':['School', 'Pos_Std'],
+                     'position':['Pos_Std']}
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def parseHeights(series_height):
+    '''
+    Purpose: Convert heights listed as feet-inches (e.g. '6-2', 6'2") into
+        inches for a whole column at once
+
+    Inputs
+    ------
+        series_height : Pandas Series
+            Heights as strings
+
+    Outputs
+    -------
+        series_inches : Pandas Series
+            Heights in inches (missing where the height can't be parsed)
+    '''
+    df_parts = series_height.astype(str).str.extract(r'^\s*(\d+)\D+(\d+)')
+    df_parts = df_parts.apply(pd.to_numeric, errors = 'coerce')
+
+    return (df_parts[0]*12 + df_parts[1]).astype('Int16')
+
+def ingestRosterSnapshot(df, season, conference, snapshot_date,
+                         path_store = r'data/roster_store'):
+    '''
+    Purpose: Add a cleaned roster snapshot (and its aggregates) to the store
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Cleaned rosters (i.e. the output of `processRawRosters`)
+        season : int
+            Season the rosters apply to (e.g. 2022)
+        conference : string
+            Conference name (e.g. 'Big Ten')
+        snapshot_date : string
+            Date the rosters were collected in YYYY-MM-DD format
+        path_store : string
+            Root folder of the store (default: 'data/roster_store')
+
+    Outputs
+    -------
+        df_snapshot : Pandas DataFrame
+            Typed snapshot as stored
+    '''
+    # cast to compact types and tag the snapshot
+    df_snapshot = df.astype({k:v for k, v in dict_roster_types.items()
+                             if k in df.columns})
+    df_snapshot.insert(0, 'Season', season)
+    df_snapshot.insert(1, 'Conference', conference)
+    df_snapshot.insert(2, 'Snapshot', pd.Timestamp(snapshot_date))
+    df_snapshot = df_snapshot.astype({'Season':'int16',
+                                      'Conference':'category'})
+
+    # write the snapshot
+    name = f'{season}_{conference}_{snapshot_date}'
+    os.makedirs(os.path.join(path_store, 'rosters'), exist_ok = True)
+    os.makedirs(os.path.join(path_store, 'aggregates'), exist_ok = True)
+    df_snapshot.to_parquet(os.path.join(path_store, 'rosters', f'{name}.parquet'),
+                           index = False)
+
+    # precompute aggregates for every level
+    df_numeric = df_snapshot.astype({'Height_Inches':float, 'Weight':float})
+    for level, list_keys in dict_store_levels.items():
+        df_agg = computeGroupStats(df_numeric, list_keys,
+                                   list_aggs = ['count', 'mean', 'median'],
+                                   list_percentiles = [])
+        df_agg.insert(0, 'Season', season)
+        df_agg.insert(1, 'Conference', conference)
+        df_agg.insert(2, 'Snapshot', pd.Timestamp(snapshot_date))
+        for key in list_keys:
+            df_agg[key] = df_agg[key].astype(str)
+        df_agg.to_parquet(os.path.join(path_store, 'aggregates',
+                                       f'{name}_{level}.parquet'), index = False)
+
+    return df_snapshot
+
+def loadRosterStore(path_store = r'data/roster_store', level = None,
+                    latest_only = True, columns = None):
+    '''
+    Purpose: Load stored roster snapshots (or their aggregates)
+
+    Inputs
+    ------
+        path_store : string
+            Root folder of the store (default: 'data/roster_store')
+        level : string
+            Aggregate level to load ('team' or 'position'); None loads the
+            player-level rosters (default: None)
+        latest_only : boolean
+            Keep only the latest snapshot of each (season, conference)
+            (default: True)
+        columns : list of strings
+            Columns to read (default: None = all columns)
+
+    Outputs
+    -------
+        df_store : Pandas DataFrame
+            All requested snapshots
+    '''
+    if level is None:
+        list_files = glob.glob(os.path.join(path_store, 'rosters', '*.parquet'))
+    else:
+        list_files = glob.glob(os.path.join(path_store, 'aggregates',
+                                            f'*_{level}.parquet'))
+    if columns is not None:
+        columns = list(dict.fromkeys(['Season', 'Conference', 'Snapshot'] + columns))
+
+    df_store = pd.concat([pd.read_parquet(x, columns = columns) for x in list_files],
+                         ignore_index = True)
+    df_store['Conference'] = df_store['Conference'].astype(str)
+
+    # keep the latest snapshot of each season/conference
+    if latest_only:
+        series_latest = df_store.groupby(['Season', 'Conference'])[
+            'Snapshot'].transform('max')
+        df_store = df_store[df_store['Snapshot'] == series_latest]
+
+    return df_store.reset_index(drop = True)
+
+def querySizeTrends(path_store = r'data/roster_store', list_keys = ['Pos_Std'],
+                    stat = 'Weight'):
+    '''
+    Purpose: Compute year-over-year average size for every group from the
+        precomputed per-team aggregates (no player-level data is read)
+
+    Inputs
+    ------
+        path_store : string
+            Root folder of the store (default: 'data/roster_store')
+        list_keys : list of strings
+            Groups to trend, from 'Conference', 'School' and 'Pos_Std'
+            (default: ['Pos_Std'])
+        stat : string
+            'Weight' or 'Height_Inches' (default: 'Weight')
+
+    Outputs
+    -------
+        df_trends : Pandas DataFrame
+            One row per group and one column per season containing the
+            player-weighted average of `stat`
+    '''
+    df_team = loadRosterStore(path_store, level = 'team')
+
+    # weight each team's average by its number of players
+    df_team['Total'] = df_team[f'{stat}_Mean'] * df_team[f'{stat}_Count']
+    df_sums = df_team.groupby(list_keys + ['Season'])[
+        ['Total', f'{stat}_Count']].sum()
+    series_avg = df_sums['Total'] / df_sums[f'{stat}_Count']
+
+    return series_avg.unstack(level = 'Season')
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Ingest the April 2022 Big Ten snapshot
+# ingestRosterSnapshot(processRawRosters(), 2022, 'Big Ten', '2022-04-21')
+
+# # Player-level rosters for every stored season/conference
+# df_rosters = loadRosterStore()
+
+# # Average weight by position for every season on file
+# df_trends = querySizeTrends(list_keys = ['Pos_Std'], stat = 'Weight')
@@ -0,0 +1,541 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 15:57:51 2026
+
+@author: agent
+
+:DESCRIPTION: Scrape the football rosters of every team in a conference
+    directly from the official athletics sites listed in
+    `references/roster_sites.csv` and normalize them to the raw roster
+    format read by `processRawRosters` (i.e. the columns of
+    `data/2022_Big_Ten_Rosters.csv`):
+
+        SCHOOL, NO., NAME, POS., HT., WT., YEAR, HOMETOWN/PREVIOUS_SCHOOL,
+        HIGH_SCHOOL, LAST_SCHOOL
+
+    Every site is parsed by the adapter named in the reference file:
+        - sidearm : player cards of the Sidearm Sports roster layout
+        - table   : any roster laid out as an HTML table (columns are matched
+                    by their header, see `dict_table_columns`)
+
+    All pages are fetched concurrently through a single pooled session.
+    Requests to the same host are spaced at least `min_interval` seconds
+    apart so that no site receives a burst of requests.
+
+    For testing, `writeStandInPages` renders an existing raw roster file
+    into each site's layout and `startStandInServer` serves those pages
+    locally, so the scraper can be run end-to-end without touching the
+    real sites.
+
+    Every request, wait, HTML parse and roster parse is recorded to
+    `data/metrics` (see `run_metrics`) and summarized at the end of a run.
+
+    Usage from the command line (run from the project root):
+        python src/scrape_rosters.py --conference "Big Ten"
+        python src/scrape_rosters.py --stand-in data/2022_Big_Ten_Rosters.csv
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import argparse
+import concurrent.futures
+import datetime
+import functools
+import html
+import http.server
+import os
+import pandas as pd
+import sys
+import threading
+import time
+import urllib.parse
+
+from bs4 import BeautifulSoup
+
+# modules shared by every project (`huskerProjects/common`)
+path_common = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            os.pardir, os.pardir, 'common'))
+if path_common not in sys.path:
+    sys.path.append(path_common)
+
+from run_metrics import (createSession, endRun, fetchUrl, recordEvent, startRun,
+                         waitForHost)
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+list_roster_columns = ['SCHOOL', 'NO.', 'NAME', 'POS.', 'HT.', 'WT.', 'YEAR',
+                       'HOMETOWN/PREVIOUS_SCHOOL', 'HIGH_SCHOOL', 'LAST_SCHOOL']
+
+# Sidearm player card fields (CSS selector within each card)
+dict_sidearm_fields = {'NO.':'.sidearm-roster-player-jersey-number',
+                       'NAME':'.sidearm-roster-player-name a',
+                       'POS.':'.sidearm-roster-player-position .text-bold',
+                       'HT.':'.sidearm-roster-player-height',
+                       'WT.':'.sidearm-roster-player-weight',
+                       'YEAR':'.sidearm-roster-player-academic-year',
+                       'HOMETOWN/PREVIOUS_SCHOOL':'.sidearm-roster-player-hometown',
+                       'HIGH_SCHOOL':'.sidearm-roster-player-highschool',
+                       'LAST_SCHOOL':'.sidearm-roster-player-previous-school'}
+
+# table headers (lower case) used by the various sites for each column
+dict_table_columns = {'school':'SCHOOL', 'team':'SCHOOL',
+                      '#':'NO.', 'no':'NO.', 'no.':'NO.', 'number':'NO.',
+                      'name':'NAME', 'full name':'NAME', 'player':'NAME',
+                      'pos':'POS.', 'pos.':'POS.', 'position':'POS.',
+                      'ht':'HT.', 'ht.':'HT.', 'height':'HT.',
+                      'wt':'WT.', 'wt.':'WT.', 'weight':'WT.',
+                      'yr':'YEAR', 'yr.':'YEAR', 'year':'YEAR', 'cl.':'YEAR',
+                      'class':'YEAR', 'academic year':'YEAR',
+                      'hometown':'HOMETOWN/PREVIOUS_SCHOOL',
+                      'hometown/previous school':'HOMETOWN/PREVIOUS_SCHOOL',
+                      'hometown / previous school':'HOMETOWN/PREVIOUS_SCHOOL',
+                      'high school':'HIGH_SCHOOL',
+                      'previous school':'LAST_SCHOOL',
+                      'last school':'LAST_SCHOOL'}
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def fetchPage(session, url, min_interval = 1.0, timeout = 30):
+    '''
+    Purpose: Request a page (respecting the per-host rate limit) and turn it
+        into BeautifulSoup formatted HTML
+
+    Inputs
+    ------
+        session : requests Session
+            Session returned by `createSession`
+        url : string
+            Link to the page to be scraped
+        min_interval : float
+            Minimum number of seconds between requests to the same host
+            (default: 1.0)
+        timeout : float
+            Seconds to wait for the server to respond (default: 30)
+
+    Outputs
+    -------
+        soup : html
+            BeautifulSoup formatted HTML of the page
+    '''
+    waitForHost(url, min_interval)
+    r = fetchUrl(session, url, timeout = timeout)
+    r.raise_for_status()
+
+    time_start = time.perf_counter()
+    soup = BeautifulSoup(r.content, 'html.parser')
+    recordEvent('html', URL = url, Bytes = len(r.content),
+                Seconds = time.perf_counter() - time_start)
+
+    return soup
+
+def parseSidearmRoster(soup):
+    '''
+    Purpose: Extract every player from a Sidearm Sports roster page
+
+    Inputs
+    ------
+        soup : html
+            BeautifulSoup formatted roster page
+
+    Outputs
+    -------
+        df_roster : Pandas DataFrame
+            One row per player card with the raw roster columns found on
+            the card (missing fields are blank)
+    '''
+    list_players = []
+    for card in soup.select('li.sidearm-roster-player'):
+        dict_player = {}
+        for column, selector in dict_sidearm_fields.items():
+            tag = card.select_one(selector)
+            dict_player[column] = tag.get_text(' ', strip = True) if tag else ''
+        list_players.append(dict_player)
+
+    return pd.DataFrame(list_players, columns = list(dict_sidearm_fields.keys()))
+
+def parseTableRoster(soup):
+    '''
+    Purpose: Extract every player from a roster laid out as an HTML table
+
+    Inputs
+    ------
+        soup : html
+            BeautifulSoup formatted roster page
+
+    Outputs
+    -------
+        df_roster : Pandas DataFrame
+            One row per table row with every recognized column (see
+            `dict_table_columns`); unrecognized columns are dropped
+    '''
+    for table in soup.find_all('table'):
+        list_headers = [th.get_text(' ', strip = True).lower()
+                        for th in table.select('thead th')]
+        list_columns = [dict_table_columns.get(x) for x in list_headers]
+        if 'NAME' not in list_columns:
+            continue
+
+        list_rows = []
+        for tr in table.select('tbody tr'):
+            list_cells = [td.get_text(' ', strip = True)
+                          for td in tr.find_all(['td', 'th'])]
+            list_rows.append({column:cell for column, cell in
+                              zip(list_columns, list_cells) if column})
+
+        return pd.DataFrame(list_rows, columns = [x for x in list_columns if x])
+
+    return pd.DataFrame(columns = ['NAME'])
+
+dict_adapters = {'sidearm':parseSidearmRoster,
+                 'table':parseTableRoster}
+
+def normalizeRoster(df_roster, school):
+    '''
+    Purpose: Convert an adapter's output to the raw roster format of
+        `data/2022_Big_Ten_Rosters.csv`
+
+    Inputs
+    ------
+        df_roster : Pandas DataFrame
+            Output of one of the roster adapters
+        school : string or Pandas Series
+            Name of the school (as listed in `references/roster_sites.csv`),
+            or the school of every row of a multi-school roster file
+
+    Outputs
+    -------
+        df_roster : Pandas DataFrame
+            Contains `list_roster_columns` in order with heights as
+            feet-inches (e.g. 6-2), weights without units and blanks as
+            missing values
+    '''
+    df_roster = df_roster.reindex(columns = list_roster_columns)
+    df_roster['SCHOOL'] = school
+    df_roster = df_roster.replace('', None)
+
+    # heights (e.g. 6'2", 6' 2'') and weights (e.g. 205 lbs)
+    df_roster['HT.'] = df_roster['HT.'].str.replace(
+        r'^\s*(\d+)\D+(\d+)\D*$', r'\1-\2', regex = True)
+    df_roster['WT.'] = pd.to_numeric(
+        df_roster['WT.'].str.extract(r'(\d+)', expand = False), errors = 'coerce')
+    df_roster['NO.'] = pd.to_numeric(df_roster['NO.'], errors = 'coerce')
+
+    return df_roster[df_roster['NAME'].notna()].reset_index(drop = True)
+
+def scrapeSchoolRoster(session, row, base_url = None, min_interval = 1.0):
+    '''
+    Purpose: Scrape and normalize the roster of a single school
+
+    Inputs
+    ------
+        session : requests Session
+            Session returned by `createSession`
+        row : Pandas Series
+            Row of `references/roster_sites.csv` for the school
+        base_url : string
+            Root of a stand-in server to request `{base_url}/{school}.html`
+            from instead of the official site (default: None)
+        min_interval : float
+            Minimum number of seconds between requests to the same host
+            (default: 1.0)
+
+    Outputs
+    -------
+        df_roster : Pandas DataFrame
+            The school's roster in the raw roster format
+    '''
+    url = row['url']
+    if base_url is not None:
+        url = f"{base_url}/{urllib.parse.quote(row['school'])}.html"
+
+    soup = fetchPage(session, url, min_interval)
+    time_start = time.perf_counter()
+    df_roster = dict_adapters[row['adapter']](soup)
+    df_roster = normalizeRoster(df_roster, row['school'])
+    recordEvent('parse', Parser = row['adapter'], URL = url, Rows = len(df_roster),
+                Seconds = time.perf_counter() - time_start)
+
+    return df_roster
+
+def scrapeConferenceRosters(conference = 'Big Ten', base_url = None,
+                            max_workers = 8, min_interval = 1.0,
+                            path_sites = r'references/roster_sites.csv'):
+    '''
+    Purpose: Scrape the rosters of every team in a conference concurrently
+
+    Inputs
+    ------
+        conference : string
+            Conference to scrape; None scrapes every site on file
+            (default: 'Big Ten')
+        base_url : string
+            Root of a stand-in server to scrape instead of the official
+            sites (default: None)
+        max_workers : int
+            Number of pages fetched at the same time (default: 8)
+        min_interval : float
+            Minimum number of seconds between requests to the same host
+            (default: 1.0)
+        path_sites : string
+            File path of the roster site table
+            (default: 'references/roster_sites.csv')
+
+    Outputs
+    -------
+        df_rosters : Pandas DataFrame
+            Every team's roster in the raw roster format (teams whose
+            roster could not be scraped are reported and left out)
+    '''
+    df_sites = pd.read_csv(path_sites)
+    if conference is not None:
+        df_sites = df_sites[df_sites['conference'] == conference]
+
+    session = createSession(max_workers)
+    dict_rosters = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers = max_workers) as executor:
+        dict_futures = {executor.submit(scrapeSchoolRoster, session, row,
+                                        base_url, min_interval):row['school']
+                        for index, row in df_sites.iterrows()}
+        for future in concurrent.futures.as_completed(dict_futures):
+            school = dict_futures[future]
+            try:
+                dict_rosters[school] = future.result()
+                print(f'Done with: {school} ({len(dict_rosters[school])} players)')
+            except Exception as e:
+                print(f'Unable to scrape roster for {school}: {e}')
+
+    # keep the order of the site table
+    list_rosters = [dict_rosters[x] for x in df_sites['school'] if x in dict_rosters]
+    if len(list_rosters) == 0:
+        return pd.DataFrame(columns = list_roster_columns)
+    return pd.concat(list_rosters, ignore_index = True)
+
+def renderSidearmPage(df_school):
+    '''
+    Purpose: Render a school's raw roster as a Sidearm Sports roster page
+
+    Inputs
+    ------
+        df_school : Pandas DataFrame
+            One school's rows of a raw roster file
+
+    Outputs
+    -------
+        page : string
+            HTML of the roster page
+    '''
+    list_cards = []
+    for index, row in df_school.fillna('').iterrows():
+        number = '' if row['NO.'] == '' else int(row['NO.'])
+        height = row['HT.'].replace('-', "' ") + "''" if row['HT.'] else ''
+        dict_text = {x:html.escape(str(row[x])) for x in list_roster_columns}
+        list_cards.append(
+            '<li class="sidearm-roster-player">'
+            f'<div class="sidearm-roster-player-jersey"><span class="sidearm-roster-player-jersey-number">{number}</span></div>'
+            f'<div class="sidearm-roster-player-name"><h3><a href="#">{dict_text["NAME"]}</a></h3></div>'
+            f'<div class="sidearm-roster-player-position"><span class="text-bold">{dict_text["POS."]}</span>'
+            f'<span class="sidearm-roster-player-height">{html.escape(height)}</span>'
+            f'<span class="sidearm-roster-player-weight">{dict_text["WT."]} lbs</span></div>'
+            f'<div class="sidearm-roster-player-other"><span class="sidearm-roster-player-academic-year">{dict_text["YEAR"]}</span>'
+            f'<span class="sidearm-roster-player-hometown">{dict_text["HOMETOWN/PREVIOUS_SCHOOL"]}</span>'
+            f'<span class="sidearm-roster-player-highschool">{dict_text["HIGH_SCHOOL"]}</span>'
+            f'<span class="sidearm-roster-player-previous-school">{dict_text["LAST_SCHOOL"]}</span></div>'
+            '</li>')
+
+    return ('<html><body><ul class="sidearm-roster-players">'
+            + '\n'.join(list_cards) + '</ul></body></html>')
+
+def renderTablePage(df_school):
+    '''
+    Purpose: Render a school's raw roster as an HTML table roster page
+
+    Inputs
+    ------
+        df_school : Pandas DataFrame
+            One school's rows of a raw roster file
+
+    Outputs
+    -------
+        page : string
+            HTML of the roster page
+    '''
+    dict_headers = {'NO.':'#', 'NAME':'Name', 'POS.':'Pos.', 'HT.':'Ht.',
+                    'WT.':'Wt.', 'YEAR':'Yr.', 'HOMETOWN/PREVIOUS_SCHOOL':'Hometown',
+                    'HIGH_SCHOOL':'High School', 'LAST_SCHOOL':'Previous School'}
+    df_table = df_school[list(dict_headers.keys())].rename(columns = dict_headers)
+    df_table['#'] = df_table['#'].astype('Int64')
+
+    return ('<html><body>' + df_table.to_html(index = False, na_rep = '')
+            + '</body></html>')
+
+dict_renderers = {'sidearm':renderSidearmPage,
+                  'table':renderTablePage}
+
+def writeStandInPages(df_raw, path_pages, path_sites = r'references/roster_sites.csv'):
+    '''
+    Purpose: Render every school in a raw roster file into its site's layout
+        so the scraper can be run against a local stand-in server
+
+    Inputs
+    ------
+        df_raw : Pandas DataFrame
+            Raw roster file (e.g. `data/2022_Big_Ten_Rosters.csv`)
+        path_pages : string
+            Folder in which to write `{school}.html` for every school
+        path_sites : string
+            File path of the roster site table
+            (default: 'references/roster_sites.csv')
+
+    Outputs
+    -------
+        NONE
+    '''
+    dict_site_adapters = dict(pd.read_csv(path_sites)[['school', 'adapter']].values)
+    os.makedirs(path_pages, exist_ok = True)
+    for school, df_school in df_raw.groupby('SCHOOL', sort = False):
+        page = dict_renderers[dict_site_adapters[school]](df_school)
+        with open(os.path.join(path_pages, f'{school}.html'), 'w',
+                  encoding = 'utf-8') as file:
+            file.write(page)
+
+class StandInHandler(http.server.SimpleHTTPRequestHandler):
+    '''
+    Purpose: Serve stand-in pages without logging every request
+    '''
+    def log_message(self, format, *args):
+        pass
+
+def startStandInServer(path_pages, port = 0):
+    '''
+    Purpose: Serve a folder of stand-in roster pages on localhost from a
+        background thread
+
+    Inputs
+    ------
+        path_pages : string
+            Folder containing the stand-in pages
+        port : int
+            Port to listen on (default: 0 = any free port)
+
+    Outputs
+    -------
+        server : http.server ThreadingHTTPServer
+            Running server (stop it with `server.shutdown()`)
+        base_url : string
+            Root URL of the server to pass to `scrapeConferenceRosters`
+    '''
+    handler = functools.partial(StandInHandler, directory = path_pages)
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', port), handler)
+    threading.Thread(target = server.serve_forever, daemon = True).start()
+
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+def compareRosters(df_expected, df_scraped):
+    '''
+    Purpose: List every value of a scraped roster which differs from the
+        expected (i.e. hand-built) raw roster
+
+    Inputs
+    ------
+        df_expected : Pandas DataFrame
+            Expected raw rosters
+        df_scraped : Pandas DataFrame
+            Output of `scrapeConferenceRosters`
+
+    Outputs
+    -------
+        df_diff : Pandas DataFrame
+            One row per differing value with the school, row, column and
+            both values (empty if the rosters match)
+    '''
+    # put the expected rosters in the scraped school order
+    df_expected = df_expected.sort_values(
+        by = 'SCHOOL', kind = 'stable',
+        key = lambda x: pd.Categorical(x, pd.unique(df_scraped['SCHOOL'])))
+    df_expected = df_expected.reset_index(drop = True)
+    df_scraped = df_scraped.reindex(columns = df_expected.columns).reset_index(drop = True)
+    if len(df_expected) != len(df_scraped):
+        print(f'Row counts differ: {len(df_expected)} expected, '
+              f'{len(df_scraped)} scraped')
+        return pd.DataFrame(columns = ['SCHOOL', 'row', 'column', 'expected', 'scraped'])
+
+    # compare as text with missing values blanked
+    df_a = df_expected.astype(str).mask(df_expected.isna(), '')
+    df_b = df_scraped.astype(str).mask(df_scraped.isna(), '')
+    for column in ['NO.', 'WT.']:
+        df_a[column] = df_expected[column].map(lambda x: '' if pd.isna(x) else str(int(x)))
+        df_b[column] = df_scraped[column].map(lambda x: '' if pd.isna(x) else str(int(x)))
+
+    df_diff = (df_a != df_b).stack()
+    df_diff = df_diff[df_diff].reset_index()
+    df_diff.columns = ['row', 'column', 'different']
+    df_diff['SCHOOL'] = df_a.loc[df_diff['row'], 'SCHOOL'].to_numpy()
+    df_diff['expected'] = [df_a.at[r, c] for r, c in zip(df_diff['row'], df_diff['column'])]
+    df_diff['scraped'] = [df_b.at[r, c] for r, c in zip(df_diff['row'], df_diff['column'])]
+
+    return df_diff[['SCHOOL', 'row', 'column', 'expected', 'scraped']]
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Scrape every Big Ten roster
+# df_rosters = scrapeConferenceRosters('Big Ten')
+# df_rosters.to_csv(r'data/2022_Big_Ten_Rosters_scraped.csv', index = False)
+
+# # Check the scraper end-to-end against a local stand-in of the sites
+# df_raw = pd.read_csv(r'data/2022_Big_Ten_Rosters.csv', encoding = 'cp1252')
+# writeStandInPages(df_raw, r'data/stand_in_pages')
+# server, base_url = startStandInServer(r'data/stand_in_pages')
+# df_rosters = scrapeConferenceRosters('Big Ten', base_url = base_url, min_interval = 0)
+# server.shutdown()
+# df_diff = compareRosters(df_raw, df_rosters)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description = 'Scrape official conference football rosters')
+    parser.add_argument('--conference', default = 'Big Ten',
+                        help = 'conference to scrape')
+    parser.add_argument('--output', default = None,
+                        help = 'path of the output .csv file')
+    parser.add_argument('--workers', type = int, default = 8,
+                        help = 'number of pages fetched at the same time')
+    parser.add_argument('--interval', type = float, default = 1.0,
+                        help = 'minimum seconds between requests to a host')
+    parser.add_argument('--stand-in', default = None, metavar = 'RAW_CSV',
+                        help = 'scrape a local stand-in of the sites built '
+                               'from this raw roster file and compare')
+    args = parser.parse_args()
+
+    time_start = time.perf_counter()
+    startRun('scrape_rosters')
+    if args.stand_in is not None:
+        df_raw = pd.read_csv(args.stand_in, encoding = 'cp1252')
+        path_pages = os.path.join('data', 'stand_in_pages')
+        writeStandInPages(df_raw, path_pages)
+        server, base_url = startStandInServer(path_pages)
+        df_rosters = scrapeConferenceRosters(args.conference, base_url,
+                                             args.workers, args.interval)
+        server.shutdown()
+        df_diff = compareRosters(df_raw, df_rosters)
+        print(f'{len(df_diff)} values differ from {args.stand_in}')
+        if len(df_diff) > 0:
+            print(df_diff.head(20))
+    else:
+        df_rosters = scrapeConferenceRosters(args.conference, None,
+                                             args.workers, args.interval)
+        date = datetime.datetime.now().strftime('%Y-%m-%d')
+        path_output = args.output or os.path.join(
+            'data', f"{args.conference.replace(' ', '_')}_Rosters_{date}.csv")
+        df_rosters.to_csv(path_output, index = False)
+        print(f'Saved {len(df_rosters)} players to {path_output}')
+    endRun()
+    print(f'Finished in {time.perf_counter() - time_start:.1f} seconds')
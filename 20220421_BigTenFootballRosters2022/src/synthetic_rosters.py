@@ -0,0 +1,239 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:55:35 2026
+
+@author: agent
+
+:DESCRIPTION: Write synthetic rosters in the schema of the raw roster file
+    (SCHOOL, NO., NAME, POS., HT., WT., YEAR, HOMETOWN/PREVIOUS_SCHOOL,
+    HIGH_SCHOOL, LAST_SCHOOL) at multiples of the real data's size, and
+    benchmark the analysis pipeline on it:
+
+        - processRawRosters    : raw roster .csv -> cleaned, standardized roster
+        - computePositionStats : position-group stats of every team and the
+                                 conference
+        - computeStatLevels    : stats of every level (school, conference,
+                                 class, position x class)
+
+    Scale 1 matches the real data (14 schools of ~105 players). Larger
+    scales add schools. Schools are listed under their standard or an
+    alternate name (standardized through the synthetic `school_abbreviations`
+    file like the real data) and positions, heights and classes are written
+    in the same mix of spellings as the real rosters.
+
+    Usage from the command line (run from the project root):
+        python src/synthetic_rosters.py --scales 1 10 100 --output data/benchmarks/stages.csv
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import argparse
+import numpy as np
+import os
+import pandas as pd
+import pathlib
+import sys
+
+# modules shared by every project (`huskerProjects/common`)
+path_common = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            os.pardir, os.pardir, 'common'))
+if path_common not in sys.path:
+    sys.path.append(path_common)
+
+from benchmark_stages import (benchmarkStages, plotScaling, summarizeScaling,
+                              writeSyntheticSchools)
+from position_stats import computeStatLevels
+from roster_data import computePositionStats, processRawRosters
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+# share of the roster, mean height (inches) and mean weight of every
+#   position as listed on the real rosters
+dict_position_sizes = {'OL':(0.15, 77, 300), 'WR':(0.13, 73, 190),
+                       'LB':(0.10, 74, 230), 'DB':(0.10, 72, 190),
+                       'DL':(0.08, 76, 280), 'TE':(0.07, 77, 245),
+                       'RB':(0.07, 71, 205), 'QB':(0.05, 75, 215),
+                       'CB':(0.04, 72, 185), 'DE':(0.04, 76, 265),
+                       'S':(0.03, 73, 200), 'DT':(0.02, 75, 295),
+                       'OLB':(0.02, 75, 235), 'ILB':(0.02, 74, 235),
+                       'LS':(0.02, 74, 230), 'K':(0.02, 72, 190),
+                       'P':(0.02, 74, 200), 'SAF':(0.01, 73, 200),
+                       'PK':(0.01, 72, 190), 'FB':(0.01, 72, 240)}
+
+# classes as listed on the real rosters
+list_classes = ['Fr.', 'RS Fr.', 'R-Fr.', 'So.', 'R-So.', 'Jr.', 'R-Jr.',
+                'Sr.', 'R-Sr.', 'Gr.', '5th', '6th']
+list_class_shares = [0.10, 0.02, 0.13, 0.24, 0.06, 0.18, 0.04, 0.15, 0.02,
+                     0.03, 0.01, 0.02]
+
+# size of the real data
+real_schools = 14
+real_players = 105
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def writeSyntheticProject(path_dir, scale = 1, seed = 0):
+    '''
+    Purpose: Write a synthetic project (raw rosters plus the school names)
+        at a multiple of the real data's size
+
+    Inputs
+    ------
+        path_dir : string
+            Project root of the synthetic project
+        scale : int
+            Multiple of the real data's size (default: 1)
+        seed : int
+            Seed of the random number generator (default: 0)
+
+    Outputs
+    -------
+        rows : int
+            Number of players written
+    '''
+    rng = np.random.default_rng(seed)
+    schools = real_schools * scale
+    df_schools = writeSyntheticSchools(path_dir, schools,
+                                       conference_size = 14, seed = seed)
+
+    # players of every school, listed under its standard or an alternate name
+    array_players = rng.poisson(real_players, schools)
+    array_school = np.repeat(np.arange(schools), array_players)
+    rows = len(array_school)
+    array_names = np.stack([df_schools['Team'], df_schools['Name1'],
+                            df_schools['Name2']], axis = 1)
+
+    list_positions = list(dict_position_sizes)
+    array_shares = np.array([x[0] for x in dict_position_sizes.values()])
+    array_pos = rng.choice(len(list_positions), rows, p = array_shares / array_shares.sum())
+    array_height = np.round(rng.normal([dict_position_sizes[list_positions[x]][1]
+                                        for x in array_pos], 2)).astype(int)
+    array_weight = np.round(rng.normal([dict_position_sizes[list_positions[x]][2]
+                                        for x in array_pos], 15)).astype(int)
+
+    df_rosters = pd.DataFrame({
+        'SCHOOL':array_names[array_school, rng.integers(0, 3, rows)],
+        'NO.':rng.integers(0, 100, rows),
+        'NAME':[f'Player {i:07d}' for i in range(rows)],
+        'POS.':np.array(list_positions)[array_pos],
+        'HT.':[f'{x // 12}-{x % 12}' for x in array_height],
+        'WT.':array_weight,
+        'YEAR':rng.choice(list_classes, rows, p = list_class_shares),
+        'HOMETOWN/PREVIOUS_SCHOOL':[f'Town {x:04d}, St. / High School {x:04d}'
+                                    for x in rng.integers(0, 5000, rows)],
+        'HIGH_SCHOOL':np.nan,
+        'LAST_SCHOOL':np.nan})
+
+    os.makedirs(os.path.join(path_dir, 'data'), exist_ok = True)
+    df_rosters.to_csv(os.path.join(path_dir, 'data', 'synthetic_rosters.csv'),
+                      index = False)
+
+    return rows
+
+def loadRawRosters():
+    '''
+    Purpose: Input of `processRawRosters` (the synthetic raw roster file)
+
+    Inputs
+    ------
+        NONE
+
+    Outputs
+    -------
+        inputs : tuple
+            (path,)
+    '''
+    return (r'data/synthetic_rosters.csv',)
+
+def loadRosters():
+    '''
+    Purpose: Input of the stats stages (the cleaned synthetic rosters,
+        tagged with the conference of their school as in the roster store)
+
+    Inputs
+    ------
+        NONE
+
+    Outputs
+    -------
+        inputs : tuple
+            (df,)
+    '''
+    df = processRawRosters(r'data/synthetic_rosters.csv')
+    df_schools = pd.read_csv(r'references/school_abbreviations_and_pictures.csv',
+                             encoding = 'latin-1')
+    df.insert(0, 'Conference', df['School'].map(
+        df_schools.set_index('Team')['Conference']))
+
+    return (df,)
+
+def loadPositionInputs():
+    '''
+    Purpose: Input of `computePositionStats` (the cleaned synthetic rosters
+        and the project root)
+
+    Inputs
+    ------
+        NONE
+
+    Outputs
+    -------
+        inputs : tuple
+            (df, path_dir)
+    '''
+    return loadRosters() + (pathlib.Path.cwd(),)
+
+# stages of the analysis pipeline (run in order, see `benchmarkStages`)
+dict_pipeline_stages = {'processRawRosters':(loadRawRosters, processRawRosters),
+                        'computePositionStats':(loadPositionInputs, computePositionStats),
+                        'computeStatLevels':(loadRosters, computeStatLevels)}
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Write synthetic projects at 1x and 10x and benchmark the pipeline on both
+# dict_paths = {scale:rf'data/synthetic/scale_{scale}' for scale in [1, 10]}
+# for scale, path in dict_paths.items():
+#     writeSyntheticProject(path, scale)
+# df_stages = benchmarkStages(dict_pipeline_stages, dict_paths)
+# df_summary = summarizeScaling(df_stages)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description = 'Benchmark the roster pipeline on synthetic data')
+    parser.add_argument('--scales', type = int, nargs = '+', default = [1, 10, 100],
+                        help = 'multiples of the real data size to benchmark')
+    parser.add_argument('--path', default = os.path.join('data', 'synthetic'),
+                        help = 'folder of the synthetic projects')
+    parser.add_argument('--repeat', type = int, default = 1,
+                        help = 'runs per stage (fastest is reported)')
+    parser.add_argument('--output', default = None,
+                        help = 'path of the .csv results (a .png of the '
+                               'scaling curves is saved alongside)')
+    args = parser.parse_args()
+
+    dict_paths = {}
+    for scale in args.scales:
+        dict_paths[scale] = os.path.join(args.path, f'scale_{scale}')
+        rows = writeSyntheticProject(dict_paths[scale], scale)
+        print(f'Wrote {rows:,} players at {scale}x to {dict_paths[scale]}')
+    df_stages = benchmarkStages(dict_pipeline_stages, dict_paths, args.repeat)
+
+    pd.set_option('display.width', 200)
+    print(df_stages.round(3).to_string(index = False))
+    print(summarizeScaling(df_stages).round(3).to_string(index = False))
+    if args.output is not None:
+        if os.path.dirname(args.output):
+            os.makedirs(os.path.dirname(args.output), exist_ok = True)
+        df_stages.to_csv(args.output, index = False)
+        plotScaling(df_stages, os.path.splitext(args.output)[0] + '.png')
+        print(f'Saved results to {args.output}')
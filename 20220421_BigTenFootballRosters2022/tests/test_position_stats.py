@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 18:02:41 2026
+
+@author: agent
+
+:DESCRIPTION: Check that the conference level of `computeStatLevels` keeps
+    the rosters of every conference apart.
+
+:REQUIRES: pytest
+
+:TODO: NONE
+"""
+
+import pandas as pd
+
+from position_stats import computeStatLevels
+
+def test_conference_level_groups_by_conference():
+    df = pd.DataFrame({'Conference':['Big Ten', 'Big Ten', 'SEC', 'SEC'],
+                       'School':['Nebraska', 'Iowa', 'Alabama', 'Georgia'],
+                       'Pos_Std':['QB', 'QB', 'QB', 'QB'],
+                       'Class':['Senior'] * 4,
+                       'Height_Inches':[74, 76, 72, 78],
+                       'Weight':[210, 220, 200, 240]})
+    df_conf = computeStatLevels(df)['conference'].set_index('Conference')
+
+    assert list(df_conf.index) == ['Big Ten', 'SEC']
+    assert df_conf.loc['Big Ten', 'Weight_Count'] == 2
+    assert df_conf.loc['Big Ten', 'Weight_Mean'] == 215
+    assert df_conf.loc['SEC', 'Height_Inches_Mean'] == 75
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:14:23 2026
+
+@author: agent
+
+:DESCRIPTION: Check that rendering nothing returns an empty table and that
+    rendering in the current process leaves the caller's backend and
+    figures alone.
+
+:REQUIRES: pytest
+
+:TODO: NONE
+"""
+
+import matplotlib
+import matplotlib.pyplot as plt
+import numpy as np
+import os
+import pytest
+from PIL import Image
+
+from render_figures import renderFigures
+
+def plotSquare(path, dict_atlas):
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [0, len(dict_atlas['index'])])
+    fig.savefig(path)
+    return [path]
+
+@pytest.fixture
+def path_logos(tmp_path):
+    path = tmp_path / 'logos'
+    path.mkdir()
+    Image.fromarray(np.zeros((8, 8, 4), dtype = np.uint8)).save(path / 'Nebraska.png')
+    return str(path)
+
+def test_no_tasks_returns_empty_table(path_logos):
+    df_render, seconds = renderFigures([], path_logos = path_logos)
+    assert len(df_render) == 0
+    assert list(df_render.columns) == ['Task', 'Paths', 'Seconds', 'PID']
+
+def test_current_process_keeps_backend_and_figures(tmp_path, path_logos):
+    backend = matplotlib.get_backend()
+    matplotlib.use('svg')
+    try:
+        fig_caller = plt.figure()
+        path = str(tmp_path / 'square.png')
+        list_tasks = [{'name':'Square', 'func':plotSquare, 'kwargs':{'path':path},
+                       'shared':{'dict_atlas':'dict_atlas'}}]
+        df_render, seconds = renderFigures(list_tasks, max_workers = 1,
+                                           path_logos = path_logos)
+
+        assert matplotlib.get_backend() == 'svg'
+        assert plt.get_fignums() == [fig_caller.number]
+        assert df_render['Paths'].tolist() == [[path]]
+        assert df_render['PID'].tolist() == [os.getpid()]
+        assert os.path.exists(path)
+    finally:
+        plt.close('all')
+        matplotlib.use(backend)
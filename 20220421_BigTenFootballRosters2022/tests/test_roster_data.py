@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:10:09 2026
+
+@author: agent
+
+:DESCRIPTION: Check that `processRawRosters` matches columns by header so
+    that roster files in other layouts are read like the Big Ten 2022 file.
+
+:REQUIRES: pytest
+
+:TODO: NONE
+"""
+
+import pandas as pd
+import pytest
+
+from roster_data import processRawRosters
+
+def test_other_layout_matches_raw_layout(project_root, tmp_path):
+    df_raw = pd.read_csv(r'data/2022_Big_Ten_Rosters.csv', encoding = 'cp1252',
+                         dtype = str).head(200)
+    df_expected = processRawRosters(r'data/2022_Big_Ten_Rosters.csv').head(200)
+
+    # another site's layout: other headers, other order, units and an
+    #   unused column, saved as UTF-8
+    df_other = pd.DataFrame({'Position':df_raw['POS.'],
+                             'Full Name':df_raw['NAME'],
+                             'Team':df_raw['SCHOOL'],
+                             'Ht.':df_raw['HT.'].str.replace('-', "' ") + '"',
+                             'Wt.':df_raw['WT.'] + ' lbs',
+                             'Class':df_raw['YEAR'],
+                             '#':df_raw['NO.'],
+                             'Major':'Undeclared'})
+    df_other.to_csv(tmp_path / 'rosters.csv', index = False, encoding = 'utf-8')
+    df = processRawRosters(tmp_path / 'rosters.csv', encoding = 'utf-8')
+
+    pd.testing.assert_frame_equal(df, df_expected, check_dtype = False)
+
+def test_missing_columns_raise(project_root, tmp_path):
+    pd.DataFrame({'Name':['A'], 'Team':['Nebraska']}).to_csv(
+        tmp_path / 'rosters.csv', index = False)
+    with pytest.raises(ValueError, match = 'POS.'):
+        processRawRosters(tmp_path / 'rosters.csv')
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:16:00 2026
+
+@author: agent
+
+:DESCRIPTION: Check that plots skip every output whose data and render
+    profile are unchanged, that the position group grid and PDF have a panel
+    or page per position group, and that rasters stay within the pixel
+    budget of their profile.
+
+:REQUIRES: pytest
+
+:TODO: NONE
+"""
+
+import matplotlib.pyplot as plt
+import os
+import pandas as pd
+import pytest
+import re
+
+from render_figures import capDpi, dict_render_profiles, getHashPath, getOutputPath
+import roster_plots
+from roster_plots import plotStats, plotStatsGrid, plotStatsPages
+
+@pytest.fixture
+def df_position():
+    return pd.DataFrame({'School':['Iowa', 'Nebraska', 'Big Ten'],
+                         'Weight_Mean':[301.5, 296.25, 298.9],
+                         'Height_Inches_Mean':[76.2, 77.1, 76.6]})
+
+@pytest.fixture
+def df_stats(df_position):
+    dict_offsets = {'DL':0, 'OL':15, 'TE':-50}
+    return pd.concat([df_position.assign(Pos = pos,
+                                         Weight_Mean = df_position['Weight_Mean'] + x)
+                      for pos, x in dict_offsets.items()], ignore_index = True)
+
+@pytest.fixture
+def list_saved(monkeypatch):
+    '''
+    Profiles passed to every `saveFigure` call of `roster_plots`
+    '''
+    list_saved = []
+    saveFigure = roster_plots.saveFigure
+    def saveFigureLogged(fig, name, hash_data, list_profiles, *args, **kwargs):
+        list_saved.append(list(list_profiles))
+        return saveFigure(fig, name, hash_data, list_profiles, *args, **kwargs)
+    monkeypatch.setattr(roster_plots, 'saveFigure', saveFigureLogged)
+    return list_saved
+
+def test_unchanged_outputs_are_skipped(df_position, dict_atlas, list_saved):
+    list_paths = plotStats(df_position, 'Tight Ends', dict_atlas, ['preview'])
+    assert list_paths == [getOutputPath('Tight Ends', 'preview')]
+    assert list_saved == [['preview']]
+
+    # same data and profile: nothing is drawn
+    assert plotStats(df_position, 'Tight Ends', dict_atlas, ['preview']) == list_paths
+    assert list_saved == [['preview']]
+
+    # only the profile without an output is drawn
+    plotStats(df_position, 'Tight Ends', dict_atlas, ['preview', 'vector'])
+    assert list_saved[-1] == ['vector']
+
+    # changed data, a missing hash or force=True redraw the output
+    df_changed = df_position.assign(Weight_Mean = df_position['Weight_Mean'] + 1)
+    plotStats(df_changed, 'Tight Ends', dict_atlas, ['preview'])
+    assert list_saved[-1] == ['preview']
+    plotStats(df_changed, 'Tight Ends', dict_atlas, ['preview'], force = True)
+    assert list_saved[-1] == ['preview']
+    os.remove(getHashPath(list_paths[0]))
+    plotStats(df_changed, 'Tight Ends', dict_atlas, ['preview'])
+    assert len(list_saved) == 5
+
+def test_profile_change_redraws(df_position, dict_atlas, list_saved, monkeypatch):
+    plotStats(df_position, 'Tight Ends', dict_atlas, ['preview'])
+    monkeypatch.setitem(dict_render_profiles, 'preview',
+                        {**dict_render_profiles['preview'], 'dpi':100})
+    plotStats(df_position, 'Tight Ends', dict_atlas, ['preview'])
+    assert list_saved == [['preview'], ['preview']]
+
+def test_grid_has_a_panel_per_position(df_stats, dict_atlas, list_saved):
+    dict_pos = {'DL':'Defensive Linemen', 'OL':'Offensive Linemen', 'TE':'Tight Ends'}
+    list_paths = plotStatsGrid(df_stats, dict_pos, dict_atlas, ncols = 2,
+                               list_profiles = ['preview'])
+    list_axes = [ax for ax in plt.gcf().axes if ax.get_visible()]
+    assert [ax.get_title(loc = 'left') for ax in list_axes] == list(dict_pos.values())
+    assert len(plt.gcf().axes) == 4
+    assert list_saved == [['preview']]
+
+    # unchanged data and profile: nothing is drawn
+    plt.close('all')
+    assert plotStatsGrid(df_stats, dict_pos, dict_atlas, ncols = 2,
+                         list_profiles = ['preview']) == list_paths
+    assert list_saved == [['preview']]
+    assert plt.get_fignums() == []
+
+def test_pages_have_a_page_per_position(df_stats, dict_atlas):
+    dict_pos = {'DL':'Defensive Linemen', 'OL':'Offensive Linemen', 'TE':'Tight Ends'}
+    path = plotStatsPages(df_stats, dict_pos, dict_atlas)
+    with open(path, 'rb') as file:
+        assert len(re.findall(rb'/Type\s*/Page\b', file.read())) == len(dict_pos)
+
+    # unchanged data: the PDF is not written again
+    time_modified = os.stat(path).st_mtime_ns
+    plt.close('all')
+    assert plotStatsPages(df_stats, dict_pos, dict_atlas) == path
+    assert os.stat(path).st_mtime_ns == time_modified
+    assert plt.get_fignums() == []
+
+    # a position group dropped from the PDF rewrites it
+    del dict_pos['TE']
+    plotStatsPages(df_stats, dict_pos, dict_atlas)
+    with open(path, 'rb') as file:
+        assert len(re.findall(rb'/Type\s*/Page\b', file.read())) == len(dict_pos)
+
+def test_raster_within_pixel_budget():
+    fig = plt.figure(figsize = (6.5, 5))
+    dpi = capDpi(fig, 1200, dict_render_profiles['publish']['max_pixels'])
+    plt.close(fig)
+    assert dpi < 1200
+    assert 6.5 * 5 * dpi ** 2 <= dict_render_profiles['publish']['max_pixels']
+    assert 6.5 * 5 * (dpi + 1) ** 2 > dict_render_profiles['publish']['max_pixels']
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 18:21:07 2026
+
+@author: agent
+
+:DESCRIPTION: Scrape a local stand-in of every roster site (each in the
+    layout of its site adapter) and check that the scraped rosters clean up
+    to the same table as the Big Ten 2022 roster file.
+
+:REQUIRES: pytest
+
+:TODO: NONE
+"""
+
+import pandas as pd
+import pytest
+
+from roster_data import processRawRosters
+from scrape_rosters import (compareRosters, scrapeConferenceRosters,
+                            startStandInServer, writeStandInPages)
+
+@pytest.fixture
+def stand_in(project_root, tmp_path):
+    '''
+    Serve the stand-in pages of the Big Ten 2022 roster file
+    '''
+    df_raw = pd.read_csv(r'data/2022_Big_Ten_Rosters.csv', encoding = 'cp1252')
+    writeStandInPages(df_raw, tmp_path / 'pages')
+    server, base_url = startStandInServer(tmp_path / 'pages')
+    yield df_raw, base_url
+    server.shutdown()
+
+def test_stand_in_scrape_matches_roster_file(stand_in, tmp_path):
+    df_raw, base_url = stand_in
+    df_sites = pd.read_csv(r'references/roster_sites.csv')
+    assert set(df_sites['adapter']) == {'sidearm', 'table'}
+
+    df_rosters = scrapeConferenceRosters(None, base_url = base_url, min_interval = 0)
+    assert list(pd.unique(df_rosters['SCHOOL'])) == list(df_sites['school'])
+    assert len(compareRosters(df_raw, df_rosters)) == 0
+
+    df_rosters.to_csv(tmp_path / 'rosters.csv', index = False, encoding = 'cp1252')
+    df = processRawRosters(tmp_path / 'rosters.csv')
+    df_expected = processRawRosters(r'data/2022_Big_Ten_Rosters.csv')
+
+    list_sort = ['School', 'Name']
+    pd.testing.assert_frame_equal(
+        df.sort_values(list_sort, kind = 'stable').reset_index(drop = True),
+        df_expected.sort_values(list_sort, kind = 'stable').reset_index(drop = True),
+        check_dtype = False)
@@ -23,6 +23,17 @@ import glob
 import os  
 import pandas as pd
 import pathlib
+import sys
+
+# modules shared by every project (`huskerProjects/common`)
+path_common = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            os.pardir, os.pardir, 'common'))
+if path_common not in sys.path:
+    sys.path.append(path_common)
+
+from draft_join import buildDraftRecordTable, updateDraftRecordTable
+from run_metrics import endRun, startRun, timeStage
+from school_names import renameSchool
 
 #==============================================================================
 # Reference Variable Declaration
@@ -38,10 +49,37 @@ import pathlib
 
 # Set the project working directory
 path_dir = pathlib.Path(r'C:\Users\reideej1\Projects\a_Personal\huskerProjects\20220425_DraftVsRecord')
+os.chdir(path_dir)
+
+# record stage metrics of the analysis (saved to data/metrics)
+startRun('analyze_draft_vs_record')
 
 # ingest the latest draft data
-df_draft = pd.read_csv(max(glob.iglob(
-    r'data\historic_draft_*.csv'), key=os.path.getmtime))
-df_coaches = df_coaches.apply(pd.to_numeric, errors = 'ignore')
+with timeStage('loadDraft') as stage:
+    df_draft = pd.read_csv(max(glob.iglob(
+        r'data/historic_draft_*.csv'), key=os.path.getmtime))
+    stage['Rows'] = len(df_draft)
+
+# ingest the latest CFB results data
+with timeStage('loadResults') as stage:
+    df_results = pd.read_csv(r'data/results_cfb.csv')
+    df_results = renameSchool(df_results, 'school')
+    stage['Rows'] = len(df_results)
+
+# join picks in each draft to the record of the preceding season
+#   (only draft years not already on file are processed)
+with timeStage('buildDraftRecordTable') as stage:
+    if os.path.exists(r'data/draft_vs_record.csv'):
+        df_table = pd.read_csv(r'data/draft_vs_record.csv', keep_default_na = False)
+        df_table = updateDraftRecordTable(df_table, df_draft, df_results)
+    else:
+        df_table = buildDraftRecordTable(df_draft, df_results)
+    df_table.to_csv(r'data/draft_vs_record.csv', index = False)
+    stage['Rows'] = len(df_table)
+
+# has a team with 3 (or fewer) wins ever had 4+ players drafted?
+df_answer = df_table[(df_table['wins'] <= 3) & (df_table['picks'] >= 4)]
+df_answer = df_answer.sort_values(by = ['picks', 'season'], ascending = False)
+print(df_answer)
 
-# ingest the latest CFB results data
\ No newline at end of file
+df_events = endRun()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 15:48:18 2026
+
+@author: agent
+
+:DESCRIPTION: Join NFL draft picks to the previous season's record for every
+    college football program.
+
+    Draft rows are aggregated into picks per (college, draft year) with a
+    single hashed groupby on integer team keys and joined to
+    `results_cfb.csv` such that draft year N lines up with season N-1. The
+    result is a typed (school, season, wins, losses, picks, rounds) table
+    that can be extended one draft year at a time.
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import pandas as pd
+
+from school_names import renameSchool
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def buildTeamKeys(list_names):
+    '''
+    Purpose: Assign an integer key to every distinct school name
+
+    Inputs
+    ------
+        list_names : list of Pandas Series
+            School names from every table that will be joined
+
+    Outputs
+    -------
+        dict_team_ids : dictionary
+            Keys are school names, values are integer team keys
+    '''
+    series_names = pd.concat(list_names, ignore_index = True).dropna()
+    array_names = pd.unique(series_names)
+
+    return {name:idx for idx, name in enumerate(sorted(array_names))}
+
+def aggregateDraftPicks(df_draft, dict_team_ids):
+    '''
+    Purpose: Aggregate individual draft picks into picks per
+        (college, draft year)
+
+    Inputs
+    ------
+        df_draft : Pandas DataFrame
+            Contains one row per draft pick (`year`, `round`, `college`)
+        dict_team_ids : dictionary
+            Keys are school names, values are integer team keys
+
+    Outputs
+    -------
+        df_picks : Pandas DataFrame
+            Contains `team_id`, `season` (draft year - 1), `picks` and
+            `rounds` (the round of every pick, e.g. '1,3,3,7')
+    '''
+    df_draft = df_draft[['year', 'round', 'college']].dropna()
+    series_ids = df_draft['college'].map(dict_team_ids)
+    list_missing = df_draft.loc[series_ids.isna(), 'college'].unique()
+    if len(list_missing) > 0:
+        raise ValueError(f'Colleges without a team key: {list(list_missing)}')
+    df_draft = df_draft.assign(
+        team_id = series_ids.astype(int),
+        season  = df_draft['year'] - 1,
+        round   = df_draft['round'].astype(int))
+    df_draft = df_draft.sort_values(by = ['round'], kind = 'mergesort')
+    df_draft['round'] = df_draft['round'].astype(str)
+
+    # single hashed groupby over integer keys
+    df_picks = df_draft.groupby(['team_id', 'season'], sort = False).agg(
+        picks  = ('round', 'size'),
+        rounds = ('round', ','.join))
+    df_picks = df_picks.reset_index(drop = False)
+
+    return df_picks
+
+def joinDraftToRecords(df_picks, df_results, dict_team_ids, list_seasons):
+    '''
+    Purpose: Join draft picks to the record of the season preceding the draft
+
+    Inputs
+    ------
+        df_picks : Pandas DataFrame
+            Output of `aggregateDraftPicks`
+        df_results : Pandas DataFrame
+            Contains `school`, `year`, `w_fb` and `l_fb` for every season
+        dict_team_ids : dictionary
+            Keys are school names, values are integer team keys
+        list_seasons : list of ints
+            Seasons to include (i.e. seasons whose following draft is on file)
+
+    Outputs
+    -------
+        df_table : Pandas DataFrame
+            Typed (school, season, wins, losses, picks, rounds) table
+    '''
+    df_results = df_results[df_results['year'].isin(list_seasons)]
+    series_ids = df_results['school'].map(dict_team_ids)
+    list_missing = df_results.loc[series_ids.isna(), 'school'].unique()
+    if len(list_missing) > 0:
+        raise ValueError(f'Schools without a team key: {list(list_missing)}')
+    df_results = pd.DataFrame({
+        'school':df_results['school'],
+        'team_id':series_ids.astype(int),
+        'season':df_results['year'],
+        'wins':df_results['w_fb'],
+        'losses':df_results['l_fb']})
+
+    # join on integer keys (seasons without a pick have 0 picks)
+    df_table = pd.merge(df_results, df_picks, how = 'left',
+                        on = ['team_id', 'season'])
+    df_table['picks']  = df_table['picks'].fillna(0)
+    df_table['rounds'] = df_table['rounds'].fillna('')
+
+    # set final types
+    df_table = df_table[['school', 'season', 'wins', 'losses', 'picks', 'rounds']]
+    df_table = df_table.astype({'school':str, 'season':'int16', 'wins':'int8',
+                                'losses':'int8', 'picks':'int16', 'rounds':str})
+    df_table = df_table.sort_values(by = ['school', 'season'])
+    df_table = df_table.reset_index(drop = True)
+
+    return df_table
+
+def buildDraftRecordTable(df_draft, df_results):
+    '''
+    Purpose: Build the draft picks vs. record table for every draft on file
+
+    Inputs
+    ------
+        df_draft : Pandas DataFrame
+            Contains one row per draft pick with standardized college names
+        df_results : Pandas DataFrame
+            Contains season records with standardized school names
+
+    Outputs
+    -------
+        df_table : Pandas DataFrame
+            Typed (school, season, wins, losses, picks, rounds) table
+    '''
+    dict_team_ids = buildTeamKeys([df_draft['college'], df_results['school']])
+    df_picks = aggregateDraftPicks(df_draft, dict_team_ids)
+    list_seasons = [x - 1 for x in df_draft['year'].unique()]
+
+    return joinDraftToRecords(df_picks, df_results, dict_team_ids, list_seasons)
+
+def updateDraftRecordTable(df_table, df_draft, df_results):
+    '''
+    Purpose: Extend an existing draft picks vs. record table with any draft
+        years that are not yet in it (only the new years are aggregated)
+
+    Inputs
+    ------
+        df_table : Pandas DataFrame
+            Existing output of `buildDraftRecordTable`
+        df_draft : Pandas DataFrame
+            Contains one row per draft pick with standardized college names
+        df_results : Pandas DataFrame
+            Contains season records with standardized school names
+
+    Outputs
+    -------
+        df_table : Pandas DataFrame
+            Table with the seasons preceding the new draft years appended
+    '''
+    df_draft_new = df_draft[df_draft['year'] - 1 > df_table['season'].max()]
+    if len(df_draft_new) == 0:
+        return df_table
+
+    df_table_new = buildDraftRecordTable(df_draft_new, df_results)
+    df_table = pd.concat([df_table, df_table_new], ignore_index = True)
+    df_table = df_table.sort_values(by = ['school', 'season'])
+
+    return df_table.reset_index(drop = True)
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Build the table for every draft on file
+# df_draft   = pd.read_csv(r'data/historic_draft_data_2022-04-25.csv')
+# df_results = renameSchool(pd.read_csv(r'data/results_cfb.csv'), 'school')
+# df_table   = buildDraftRecordTable(df_draft, df_results)
+
+# # Add a newly scraped draft year without rebuilding the whole table
+# df_table = updateDraftRecordTable(df_table, df_draft, df_results)
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:40:25 2026
+
+@author: agent
+
+:DESCRIPTION: Parse the drafthistory.com pages scraped by
+    `scrape_draft_history.py` without fetching them, so parsers can be run
+    (and timed) on saved pages.
+
+    Every page layout has two steps which take the BeautifulSoup HTML of a
+    page:
+        - extract : find the page's table and convert it to a raw DataFrame
+        - clean   : turn the raw DataFrame into the scraper's output table
+
+    Page layouts (keys of `dict_page_parsers`):
+        - draft_years : index of every draft year (`scrapeDraftYearLinks`)
+        - draft_year  : every pick of a draft (`scrapeDraftYear`)
+
+    For testing without network access, `writeFixturePages` renders an
+    existing `historic_draft_data_*.csv` file into both layouts (see
+    `common/benchmark_parsers.py`).
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import html
+import io
+import json
+import operator
+import os
+import pandas as pd
+import sys
+import time
+
+# modules shared by every project (`huskerProjects/common`)
+path_common = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            os.pardir, os.pardir, 'common'))
+if path_common not in sys.path:
+    sys.path.append(path_common)
+
+from run_metrics import recordEvent
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def extractDraftLinks(soup):
+    '''
+    Purpose: Extract the year and link of every draft on the drafthistory.com
+        year index
+
+    Inputs
+    ------
+        soup : html
+            BeautifulSoup formatted HTML of the page
+
+    Outputs
+    -------
+        list_tables : list of Pandas DataFrames
+            Table of every draft's `year` and `url`
+    '''
+    table = soup.find('table')
+
+    url_list = []
+    for row in table.find_all('td'):
+        temp_dict = {}
+        if (len(row.text) > 1):
+            temp_dict['year'] = row.text
+            temp_dict['url'] = row.find('a')['href']
+            url_list.append(temp_dict)
+
+    return [pd.DataFrame(url_list, columns = ['year', 'url'])]
+
+def cleanDraftLinks(list_tables):
+    '''
+    Purpose: Sort the drafts of the year index by year
+
+    Inputs
+    ------
+        list_tables : list of Pandas DataFrames
+            Output of `extractDraftLinks`
+
+    Outputs
+    -------
+        df_links : Pandas DataFrame
+            `year` and `url` of every draft, sorted by year
+    '''
+    # sort the url_list by year
+    url_list = list_tables[0].to_dict(orient = 'records')
+    url_list.sort(key=operator.itemgetter('year'))
+
+    return pd.DataFrame(url_list, columns = ['year', 'url'])
+
+def extractDraftTable(soup):
+    '''
+    Purpose: Extract the draft table of a drafthistory.com year page
+
+    Inputs
+    ------
+        soup : html
+            BeautifulSoup formatted HTML of the page
+
+    Outputs
+    -------
+        list_tables : list of Pandas DataFrames
+            Draft table
+    '''
+    # Retrieve the HTML of the draft table
+    table = soup.find('table')
+
+    # Convert the table to a dataframe
+    return [pd.read_html(io.StringIO(str(table)), flavor = None, header = [1])[0]]
+
+def cleanDraftTable(list_tables, year):
+    '''
+    Purpose: Convert the draft table of a year page to one row per pick
+
+    Inputs
+    ------
+        list_tables : list of Pandas DataFrames
+            Output of `extractDraftTable`
+        year : string
+            Year of the draft
+
+    Outputs
+    -------
+        df_year : Pandas DataFrame
+            Contains all draft picks for the year (college and team names
+            are not yet standardized)
+    '''
+    df_year = list_tables[0]
+
+    # drop any players not in a round (i.e. Sam Mills, 1981)
+    df_year = df_year[df_year['Round'] != 0].copy()
+
+    # fill in missing round values with the most recent listed round
+    df_year['Round'] = df_year['Round'].ffill().fillna(0)
+
+    # add year to table
+    df_year['Year'] = year
+
+    # reorder table variables
+    df_year.columns = [x.lower() for x in list(df_year.columns)]
+    df_year = df_year[['year', 'round', 'pick', 'player', 'name', 'team',
+                       'position', 'college']]
+
+    return df_year
+
+# extract/clean steps of every page layout
+dict_page_parsers = {'draft_years':(extractDraftLinks, cleanDraftLinks),
+                     'draft_year':(extractDraftTable, cleanDraftTable)}
+
+def parsePage(parser, soup, **context):
+    '''
+    Purpose: Parse a page with the extract/clean steps of its layout (and
+        record the time of both steps as a `parse` event of the active run)
+
+    Inputs
+    ------
+        parser : string
+            Page layout (a key of `dict_page_parsers`)
+        soup : html
+            BeautifulSoup formatted HTML of the page
+        **context
+            Keyword arguments of the clean step (e.g. year)
+
+    Outputs
+    -------
+        df_page : Pandas DataFrame
+            Parsed table of the page
+    '''
+    extract, clean = dict_page_parsers[parser]
+
+    time_start = time.perf_counter()
+    list_tables = extract(soup)
+    time_extract = time.perf_counter()
+    df_page = clean(list_tables, **context)
+    time_cleanup = time.perf_counter()
+    recordEvent('parse', Parser = parser, Rows = len(df_page),
+                Seconds = time_cleanup - time_start,
+                Seconds_Extract = time_extract - time_start,
+                Seconds_Cleanup = time_cleanup - time_extract)
+
+    return df_page
+
+def renderDraftYearsPage(list_years, columns = 10):
+    '''
+    Purpose: Render a list of draft years in the layout of the
+        drafthistory.com year index
+
+    Inputs
+    ------
+        list_years : list of strings
+            Years of the drafts
+        columns : int
+            Years per table row (default: 10)
+
+    Outputs
+    -------
+        page : string
+            HTML of the page
+    '''
+    list_cells = [f'<td><a href="http://www.drafthistory.com/index.php/years/{year}">{year}</a></td>'
+                  for year in list_years]
+    list_rows = ['<tr>' + ''.join(list_cells[i:i + columns]) + '</tr>'
+                 for i in range(0, len(list_cells), columns)]
+
+    return '<html><body><table>' + ''.join(list_rows) + '</table></body></html>'
+
+def renderDraftYearPage(df_year):
+    '''
+    Purpose: Render a year of draft picks in the layout of a drafthistory.com
+        year page (round listed on the first pick of every round only)
+
+    Inputs
+    ------
+        df_year : Pandas DataFrame
+            One year of a `historic_draft_data_*.csv` file
+
+    Outputs
+    -------
+        page : string
+            HTML of the page
+    '''
+    list_rows = [f'<tr><th colspan="7">{df_year["year"].iloc[0]} NFL Draft</th></tr>',
+                 '<tr><th>Round</th><th>Pick</th><th>Player</th><th>Name</th>'
+                 '<th>Team</th><th>Position</th><th>College</th></tr>']
+    round_prev = None
+    for row in df_year.itertuples(index = False):
+        cell_round = '' if row.round == round_prev else int(row.round)
+        round_prev = row.round
+        list_rows.append(f'<tr><td>{cell_round}</td><td>{row.pick}</td><td>{row.player}</td>'
+                         f'<td>{html.escape(str(row.name))}</td><td>{html.escape(str(row.team))}</td>'
+                         f'<td>{row.position}</td><td>{html.escape(str(row.college))}</td></tr>')
+
+    return '<html><body><table>' + ''.join(list_rows) + '</table></body></html>'
+
+def writeFixturePages(path_pages, path_draft = None, list_years = None):
+    '''
+    Purpose: Render an existing draft history into both page layouts
+        (stand-ins for recorded pages) and list them in `{path_pages}/pages.csv`
+
+    Inputs
+    ------
+        path_pages : string
+            Folder in which to write the pages
+        path_draft : string
+            File path of a `historic_draft_data_*.csv` file
+            (default: None = the most recent file in `data/`)
+        list_years : list of ints
+            Drafts to render (default: None = every draft on file)
+
+    Outputs
+    -------
+        df_pages : Pandas DataFrame
+            One row per page with its file name (`File`), layout (`Parser`)
+            and the keyword arguments of its clean step (`Context`, JSON)
+    '''
+    if path_draft is None:
+        list_files = [os.path.join('data', x) for x in os.listdir('data')
+                      if x.startswith('historic_draft_data_')]
+        path_draft = max(list_files, key = os.path.getmtime)
+    df_draft = pd.read_csv(path_draft)
+    if list_years is not None:
+        df_draft = df_draft[df_draft['year'].isin(list_years)]
+
+    os.makedirs(path_pages, exist_ok = True)
+    list_pages = []
+
+    def writePage(name, page, parser, dict_context):
+        with open(os.path.join(path_pages, name), 'w', encoding = 'utf-8') as file:
+            file.write(page)
+        list_pages.append({'File':name, 'Parser':parser,
+                           'Context':json.dumps(dict_context)})
+
+    writePage('draft_years.html', renderDraftYearsPage(
+        [str(x) for x in sorted(df_draft['year'].unique())]), 'draft_years', {})
+    for year, df_year in df_draft.groupby('year'):
+        writePage(f'draft_year_{year}.html', renderDraftYearPage(df_year),
+                  'draft_year', {'year':str(year)})
+
+    df_pages = pd.DataFrame(list_pages)
+    df_pages.to_csv(os.path.join(path_pages, 'pages.csv'), index = False)
+
+    return df_pages
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Parse a saved page
+# from bs4 import BeautifulSoup
+# with open(r'data/benchmark_pages/draft_year_2022.html', encoding = 'utf-8') as file:
+#     soup = BeautifulSoup(file.read(), 'html.parser')
+# df_year = parsePage('draft_year', soup, year = '2022')
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 15:51:35 2026
+
+@author: agent
+
+:DESCRIPTION: Resolve NFL team nicknames (as listed on drafthistory.com) to
+    a franchise id and the team name/city in use in a given year.
+
+    Franchise history is stored in `references/nfl_franchise_history.csv`
+    with one row per (franchise, nickname, city) era and the first/last
+    draft year of that era (a blank last year means the era is ongoing).
+    Years follow the draft, so a team renamed between the draft and the
+    season (e.g. the 2020 Redskins) keeps its old name for that year.
+
+    Eras are loaded into interval indexes keyed by nickname and by franchise
+    so that a whole column of (nickname, year) pairs is resolved with one
+    as-of lookup, e.g.:
+        - ('Oilers', 1975) -> TEN, Houston Oilers
+        - ('Titans', 1961) -> NYJ, New York Titans
+        - ('Raiders', 1985) -> LV, Los Angeles Raiders
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import numpy as np
+import pandas as pd
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+# multiplier used to give every key its own range of years in the index
+key_stride = 10000
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def loadFranchiseHistory(path = r'references/nfl_franchise_history.csv'):
+    '''
+    Purpose: Load the franchise history table and build its interval indexes
+
+    Inputs
+    ------
+        path : string
+            File path of the franchise history table
+            (default: 'references/nfl_franchise_history.csv')
+
+    Outputs
+    -------
+        dict_history : dictionary
+            Contains the history table ('table') and the as-of indexes by
+            nickname ('nickname') and by franchise ('franchise'), plus
+            lookups of every franchise's latest team name ('current') and
+            of nicknames only ever used by one franchise ('unique')
+    '''
+    df_history = pd.read_csv(path)
+    df_history['end_year'] = df_history['end_year'].fillna(key_stride - 1)
+    df_history['end_year'] = df_history['end_year'].astype(int)
+    df_history['nickname_key'] = df_history['nickname'].str.casefold()
+
+    # latest team name of every franchise (for data already mapped to
+    #   current team names)
+    df_current = df_history.sort_values(by = ['start_year']).drop_duplicates(
+        subset = ['franchise_id'], keep = 'last')
+    dict_current = dict(zip(df_current['team'], df_current['franchise_id']))
+
+    # nicknames only ever used by a single franchise
+    df_unique = df_history.drop_duplicates(subset = ['nickname_key', 'franchise_id'])
+    df_unique = df_unique.drop_duplicates(subset = ['nickname_key'], keep = False)
+    dict_unique = dict(zip(df_unique['nickname_key'], df_unique['franchise_id']))
+
+    return {'table':df_history,
+            'nickname':buildAsOfIndex(df_history['nickname_key'],
+                                      df_history['start_year'],
+                                      df_history['end_year']),
+            'franchise':buildAsOfIndex(df_history['franchise_id'],
+                                       df_history['start_year'],
+                                       df_history['end_year']),
+            'current':dict_current,
+            'unique':dict_unique}
+
+def buildAsOfIndex(series_keys, series_start, series_end):
+    '''
+    Purpose: Build an interval index over (key, year) pairs such that each
+        key's eras occupy their own non-overlapping range of the index
+
+    Inputs
+    ------
+        series_keys : Pandas Series
+            Key of each era (e.g. nickname or franchise id)
+        series_start : Pandas Series
+            First year of each era
+        series_end : Pandas Series
+            Last year of each era
+
+    Outputs
+    -------
+        dict_index : dictionary
+            Contains the key codes ('codes': key -> int) and the interval
+            index ('intervals') whose positions match the input rows
+    '''
+    dict_codes = {key:idx for idx, key in enumerate(pd.unique(series_keys))}
+    array_offset = series_keys.map(dict_codes).to_numpy() * key_stride
+
+    intervals = pd.IntervalIndex.from_arrays(
+        array_offset + series_start.to_numpy(),
+        array_offset + series_end.to_numpy(),
+        closed = 'both')
+
+    return {'codes':dict_codes, 'intervals':intervals}
+
+def lookupAsOf(dict_index, series_keys, series_years):
+    '''
+    Purpose: Find the era in effect for every (key, year) pair at once
+
+    Inputs
+    ------
+        dict_index : dictionary
+            Index returned by `buildAsOfIndex`
+        series_keys : Pandas Series
+            Keys to look up
+        series_years : Pandas Series
+            Years to look up
+
+    Outputs
+    -------
+        array_rows : NumPy array
+            Row position of the matching era (-1 where nothing matches)
+    '''
+    array_code = series_keys.map(dict_index['codes']).to_numpy(dtype = float)
+    array_year = pd.to_numeric(series_years, errors = 'coerce').to_numpy(dtype = float)
+    array_valid = ~np.isnan(array_code) & ~np.isnan(array_year)
+
+    array_rows = np.full(len(array_code), -1)
+    array_rows[array_valid] = dict_index['intervals'].get_indexer(
+        (array_code[array_valid] * key_stride
+         + array_year[array_valid]).astype(int))
+
+    return array_rows
+
+def addFranchises(df, team_var, year_var, dict_history = None):
+    '''
+    Purpose: Add the franchise id of every team and replace the team name
+        with the name in use in that year
+
+        Teams are matched by nickname (the last word of the team name, so
+        both 'Oilers' and 'Houston Oilers' work). Teams already mapped to a
+        franchise's current name (e.g. 'Tennessee Titans' for a 1975 Oilers
+        pick), or listed under a nickname only one franchise has used,
+        fall back to the franchise's era in that year.
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            DataFrame containing team and year variables
+        team_var : string
+            Name of the team (nickname) variable
+        year_var : string
+            Name of the year variable
+        dict_history : dictionary
+            Output of `loadFranchiseHistory` (default: None = load it)
+
+    Outputs
+    -------
+        df : Pandas DataFrame
+            Original DataFrame with a `franchise_id` variable added and
+            `team_var` set to the contemporary team name (teams that cannot
+            be resolved are left as-is with a missing `franchise_id`)
+    '''
+    if dict_history is None:
+        dict_history = loadFranchiseHistory()
+    df_history = dict_history['table']
+    series_team = df[team_var].astype(str)
+
+    # match on nickname in effect for the year
+    series_nickname = series_team.str.split().str[-1].str.casefold()
+    array_rows = lookupAsOf(dict_history['nickname'], series_nickname,
+                            df[year_var])
+
+    # fall back to the franchise's era for current team names
+    array_missing = array_rows == -1
+    if array_missing.any():
+        series_franchise = series_team[array_missing].map(dict_history['current'])
+        series_franchise = series_franchise.fillna(
+            series_nickname[array_missing].map(dict_history['unique']))
+        array_rows[array_missing] = lookupAsOf(
+            dict_history['franchise'], series_franchise,
+            df.loc[array_missing, year_var])
+
+    # add franchise information in bulk
+    array_found = array_rows != -1
+    array_franchise = np.full(len(df), np.nan, dtype = object)
+    array_team = series_team.to_numpy(dtype = object).copy()
+    array_franchise[array_found] = df_history['franchise_id'].to_numpy()[array_rows[array_found]]
+    array_team[array_found] = df_history['team'].to_numpy()[array_rows[array_found]]
+    df['franchise_id'] = array_franchise
+    df[team_var] = array_team
+
+    return df
+
+def countFranchisePicks(df_draft, list_keys = ['franchise_id']):
+    '''
+    Purpose: Count draft picks for every franchise (optionally by additional
+        grouping variables) in a single grouped operation
+
+    Inputs
+    ------
+        df_draft : Pandas DataFrame
+            Draft picks with a `franchise_id` variable (see `addFranchises`)
+        list_keys : list of strings
+            Grouping variables (default: ['franchise_id'])
+
+    Outputs
+    -------
+        df_counts : Pandas DataFrame
+            Contains the grouping variables, `picks`, `first_year` and
+            `last_year`
+    '''
+    df_counts = df_draft.groupby(list_keys, sort = True).agg(
+        picks = ('year', 'size'),
+        first_year = ('year', 'min'),
+        last_year = ('year', 'max'))
+
+    return df_counts.reset_index(drop = False)
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Resolve franchises for the full draft history
+# df_draft = pd.read_csv(r'data/historic_draft_data_2022-04-25.csv')
+# df_draft = addFranchises(df_draft, 'team', 'year')
+
+# # Picks by franchise, and by franchise and college
+# df_franchise = countFranchisePicks(df_draft)
+# df_franchise_college = countFranchisePicks(df_draft, ['franchise_id', 'college'])
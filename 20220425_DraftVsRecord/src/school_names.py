@@ -0,0 +1,75 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 19:30:00 2026
+
+@author: agent
+
+:DESCRIPTION: Standardize school names across the draft and results tables
+    using `references/school_abbreviations_and_pictures.csv`.
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import pandas as pd
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def renameSchool(df, name_var):
+    '''
+    Purpose: Rename a school/university to a standard name as specified in
+        the file `school_abbreviations.csv` (applied to the whole column at
+        once, with every unknown name reported in a single message)
+
+    Inputs
+    ------
+        df : Pandas Dataframe
+            DataFrame containing a school-name variable for which the names
+            need to be standardized
+        name_var : string
+            Name of the variable which is to be renamed/standardized
+
+    Outputs
+    -------
+        df : Pandas DataFrame
+            Original DataFrame with `name_var` standardized based on the
+            first value in the row in the file `school_abbreviations.csv`
+            (unknown names are kept as-is, missing names become '')
+    '''
+    # read in school name information
+    df_school_names = pd.read_csv('references/school_abbreviations_and_pictures.csv',
+                                  encoding = 'latin-1')
+
+    # convert the dataframe to a dictionary such that the keys are the
+    #   optional spelling of each school and the value is the standardized
+    #   name of the school
+    dict_school_names = {}
+    list_name_cols = [x for x in df_school_names.columns if 'Name' in x]
+    for row in df_school_names.itertuples(index = False):
+        row = row._asdict()
+        list_names = [row[x] for x in list_name_cols if str(row[x]) != 'nan']
+        list_names.append(row['Team'])
+        for name in list_names:
+            dict_school_names[name] = row['Team']
+            dict_school_names[name + ' ' + row['Nickname']] = row['Team']
+
+    # standardize every name at once, leaving unknown names as-is
+    series_names = df[name_var].map(dict_school_names)
+    list_missing = df.loc[series_names.isna() & df[name_var].notna(),
+                          name_var].unique()
+    if len(list_missing) > 0:
+        print(f'{len(list_missing)} schools not found in school abbreviations '
+              f'.csv file: {", ".join(sorted(map(str, list_missing)))}')
+    df[name_var] = series_names.fillna(df[name_var]).fillna('')
+
+    return df
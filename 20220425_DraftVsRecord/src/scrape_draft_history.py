@@ -17,131 +17,46 @@ Created on Mon Apr  2 14:26:57 2018
 #==============================================================================
 # Package Import
 #==============================================================================
+import concurrent.futures
 import datetime
+import glob
 import json
 import os
 import requests
 import operator
 import pandas as pd
+import sys
 import time
 
 from bs4 import BeautifulSoup
 from requests.packages.urllib3.util.retry import Retry
 
+# modules shared by every project (`huskerProjects/common`)
+path_common = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            os.pardir, os.pardir, 'common'))
+if path_common not in sys.path:
+    sys.path.append(path_common)
+
+from draft_parsers import parsePage
+from nfl_franchises import addFranchises
+from position_taxonomy import standardizePositions
+from run_metrics import endRun, fetchUrl, recordEvent, startRun, timeStage
+from school_names import renameSchool
+
 #==============================================================================
 # Reference Variable Declaration
 #==============================================================================
 positionList = ['T','G','C']
 positionAbbrList = ['OT','OG','OC']
 
-dict_nfl_teams = {'49ers':'San Francisco 49ers',
-            'Bears':'Chicago Bears',
-            'Bengals':'Cincinnati Bengals',
-            'Bills':'Buffalo Bills',
-            'Broncos':'Denver Broncos',
-            'Browns':'Cleveland Browns',
-            'Buccaneers':'Tampa Bay Buccaneers',
-            'Cardinals':'Arizona Cardinals',
-            'Chargers':'Los Angeles Chargers',
-            'Chiefs':'Kansas City Chiefs',
-            'Colts':'Indianapolis Colts',
-            'Cowboys':'Dallas Cowboys',
-            'Dolphins':'Miami Dolphins',
-            'Eagles':'Philadelphia Eagles',
-            'Falcons':'Atlanta Falcons',
-            'Giants':'New York Giants',
-            'Jaguars':'Jacksonville Jaguars',
-            'Jets':'New York Jets',
-            'Lions':'Detroit Lions',
-            'Oilers':'Tennessee Titans',
-            'Packers':'Green Bay Packers',
-            'Panthers':'Carolina Panthers',
-            'Patriots':'New England Patriots',
-            'Raiders':'Oakland Raiders',
-            'Rams':'Los Angeles Rams',
-            'Ravens':'Baltimore Ravens',
-            'Redskins':'Washington Redskins',
-            'Team':'Washington Commodores',
-            'Saints':'New Orleans Saints',
-            'Seahawks':'Seattle Seahawks',
-            'Steelers':'Pittsburgh Steelers',
-            'Texans':'Houston Texans',
-            'Titans':'Tennessee Titans',
-            'Vikings':'Minnesota Vikings',
-            'redskins':'Washington Redskins',
-        }
-
 #==============================================================================
 # Function Definitions / Reference Variable Declaration
 #==============================================================================
-def renameSchool(df, name_var):
-    '''
-    Purpose: Rename a school/university to a standard name as specified in 
-        the file `school_abbreviations.csv`
-
-    Inputs
-    ------
-        df : Pandas Dataframe
-            DataFrame containing a school-name variable for which the names
-            need to be standardized
-        name_var : string
-            Name of the variable which is to be renamed/standardized
-    
-    Outputs
-    -------
-        list(row)[0] : string
-            Standardized version of the school's name based on the first value
-            in the row in the file `school_abbreviations.csv`
-    '''  
-    # read in school name information
-    df_school_names = pd.read_csv('references/school_abbreviations_and_pictures.csv')
-     
-    # convert the dataframe to a dictionary such that the keys are the
-    #   optional spelling of each school and the value is the standardized
-    #   name of the school
-    dict_school_names = {}
-    
-    for index, row in df_school_names.iterrows():
-        # isolate the alternative name columns
-        names = row[[x for x in row.index if 'Name' in x]]
-        # convert the row to a list that doesn't include NaN values
-        list_names = [x for x in names.values.tolist() if str(x) != 'nan']
-        # add the nickname to the team names as an alternative name
-        nickname = row['Nickname']
-        list_names_nicknames = list_names.copy()
-        for name in list_names:
-            list_names_nicknames.append(name + ' ' + nickname)
-        # extract the standardized team name
-        name_standardized = row['Team']
-        # add the standardized name
-        list_names_nicknames.append(name_standardized)
-        # add the nickname to the standardized name
-        list_names_nicknames.append(name_standardized + ' ' + nickname)
-        # for every alternative spelling of the team, set the value to be
-        #   the standardized name
-        for name_alternate in list_names_nicknames:
-            dict_school_names[name_alternate] = name_standardized
-            
-    # df[name_var] = df[name_var].apply(
-    #         lambda x: dict_school_names[x] if str(x) != 'nan' else '')
-    df[name_var] = df[name_var].apply(
-            lambda x: rename_school_helper(x, dict_school_names))
-        
-    return df   
-
-def rename_school_helper(name_school, dict_school_names):
-    try:
-        if str(name_school) != 'nan':
-            return dict_school_names[name_school]
-        else:
-            return ''
-    except:
-        print(f'School not found in school abbreviations .csv file: {name_school} ')
-        return name_school
-    
 def soupifyURL(url):
     '''
     Purpose: Turns a specified URL into BeautifulSoup formatted HTML 
+        (the request and the HTML parse are recorded as events of the
+        active run)
 
     Inputs
     ------
@@ -160,14 +75,17 @@ def soupifyURL(url):
     session.mount('http://', adapter)
     session.mount('https://', adapter)
     
-    r = session.get(url, verify = False)
+    r = fetchUrl(session, url, verify = False)
     #r = requests.get(url)
+    time_start = time.perf_counter()
     soup = BeautifulSoup(r.content,'html.parser')   
+    recordEvent('html', URL = url, Bytes = len(r.content), 
+                Seconds = time.perf_counter() - time_start)
     return soup
 
-def scrapeDraftHistory():
+def scrapeDraftYearLinks():
     '''
-    Purpose: Scrapes all players drafted for all available years from
+    Purpose: Scrapes the year and link of every draft page available on
         drafthistory.com
         
     Inputs
@@ -176,86 +94,117 @@ def scrapeDraftHistory():
     
     Outputs
     -------
-        df_draft : Pandas DataFrame
-            Contains all recorded draft picks from all available years
+        url_list : list of dictionaries
+            Contains the 'year' and 'url' of every draft, sorted by year
     '''   
     # Set the link that we will be scraping
     url = r'http://www.drafthistory.com/index.php/years/'
     
     # Iterate through every subsequent page in the position group
     soup = soupifyURL(url)
-    table = soup.find('table')
     
-    url_list = []
-    for row in table.find_all('td'):
-        temp_dict = {}
-        if (len(row.text) > 1):
-            temp_dict['year'] = row.text
-            temp_dict['url'] = row.find('a')['href']
-            url_list.append(temp_dict)
-            
-    # sort the url_list by year
-    url_list.sort(key=operator.itemgetter('year'))
-            
-    df_draft = pd.DataFrame()
-    # Extract data for all available drafts
-    for url in url_list:
-        # retrieve the html data and convert it to BS4 format
-        soup = soupifyURL(url['url'])
-        
-        # Retrieve the HTML of the draft table
-        table = soup.find('table')
-        
-        # Convert the table to a dataframe
-        df_year = pd.read_html(str(table), flavor = None, header = [1])[0]
-        
-        # drop any players not in a round (i.e. Sam Mills, 1981)
-        df_year = df_year[df_year['Round'] != 0]
-            
-        # Change the names of all teams to reflect the format used by NFL.com
-        #   and fill in missing round values
-        list_teams = []
-        list_rounds = []
-        draft_round = 0
-        for index, row in df_year.iterrows():
-            # handle team names
-            if row['Team'] in dict_nfl_teams.keys():
-                list_teams.append(dict_nfl_teams[row['Team']])
-            else:
-                list_teams.append(row['Team'])
-                
-            # handle draft round
-            if not pd.isna(row['Round']):
-                draft_round = row['Round']
-            list_rounds.append(draft_round)
-                
-        df_year['Team'] = list_teams
-        df_year['Round'] = list_rounds
-        
-        # add year to table
-        df_year['Year'] = url['year']
+    # extract the year and url of every draft, sorted by year
+    url_list = parsePage('draft_years', soup).to_dict(orient = 'records')
+    
+    return url_list
+
+def scrapeDraftYear(url):
+    '''
+    Purpose: Fetches and parses the draft page for a single year
         
-        # reorder table variables
-        df_year.columns = [x.lower() for x in list(df_year.columns)]
-        df_year = df_year[['year', 'round', 'pick', 'player', 'name', 'team', 
-                           'position', 'college']]
+    Inputs
+    ------
+        url : dictionary
+            Contains the 'year' and 'url' of the draft
+    
+    Outputs
+    -------
+        df_year : Pandas DataFrame
+            Contains all draft picks for the year (college and team names
+            are not yet standardized)
+    '''   
+    # retrieve the html data and convert it to BS4 format
+    soup = soupifyURL(url['url'])
+    
+    # Convert the draft table to a dataframe (one row per pick)
+    df_year = parsePage('draft_year', soup, year = url['year'])
+    
+    print('Done with: ' + url['year'])
+    
+    return df_year
+
+def scrapeDraftHistory(latest_only = False, max_workers = 8):
+    '''
+    Purpose: Scrapes all players drafted for all available years from
+        drafthistory.com (each year is fetched and parsed on a worker pool)
         
-        # standardize College team names
-        df_year = renameSchool(df_year, 'college')
+    Inputs
+    ------
+        latest_only : boolean
+            If True, only scrape draft years newer than (or equal to) the
+            latest year in the most recent `historic_draft_data_*.csv` and
+            update that file in place (default: False = scrape every year
+            and write a new `historic_draft_data_{date}.csv`)
+        max_workers : int
+            Number of draft years fetched at the same time (default: 8)
+    
+    Outputs
+    -------
+        df_draft : Pandas DataFrame
+            Contains all recorded draft picks from all available years
+            (`year` is an integer in both modes)
+    '''   
+    url_list = scrapeDraftYearLinks()
+    
+    # limit the scrape to the latest year on file and anything newer
+    df_existing = pd.DataFrame()
+    path_output = None
+    if latest_only:
+        list_files = glob.glob(r'data/historic_draft_data_*.csv')
+        if len(list_files) > 0:
+            path_output = max(list_files, key = os.path.getmtime)
+            df_existing = pd.read_csv(path_output)
+            year_latest = int(df_existing['year'].max())
+            url_list = [x for x in url_list if int(x['year']) >= year_latest]
+            df_existing = df_existing[df_existing['year'] < year_latest]
+    
+    # Extract data for all requested drafts in parallel
+    with concurrent.futures.ThreadPoolExecutor(max_workers = max_workers) as pool:
+        list_years = list(pool.map(scrapeDraftYear, url_list))
+    df_draft = pd.concat(list_years, ignore_index = True)
+    df_draft['year'] = df_draft['year'].astype(int)
+    
+    # standardize College team names for all years at once
+    with timeStage('renameSchool') as stage:
+        df_draft = renameSchool(df_draft, 'college')
+        stage['Rows'] = len(df_draft)
+    
+    # add newly scraped years to the existing history
+    if len(df_existing) > 0:
+        df_draft = pd.concat([df_existing, df_draft], ignore_index = True)
         
-        # add year to table for all years
-        if len(df_draft) == 0:
-            df_draft = df_year.copy()
-        else:
-            df_draft = df_draft.append(df_year)
-                
-        print('Done with: ' + url['year'])
+    # resolve every team nickname to its franchise and the team name in use
+    #   in the year of the draft (e.g. 'Oilers' in 1975 -> Houston Oilers)
+    with timeStage('addFranchises') as stage:
+        df_draft = addFranchises(df_draft, 'team', 'year')
+        stage['Rows'] = len(df_draft)
+    
+    # standardize positions (standard position, position group, side of ball)
+    with timeStage('standardizePositions') as stage:
+        df_draft = standardizePositions(df_draft, 'position',
+                                        ['position_std', 'position_group', 'side'])
+        stage['Rows'] = len(df_draft)
         
     # print('*** DONE WITH ALL SCRAPING ***')
     ts = datetime.date.fromtimestamp(time.time())
         
-    # Write the historic list to a .csv file    
-    df_draft.to_csv(f'data/historic_draft_data_{ts}.csv', index=False)
+    # Write the historic list to a .csv file (the latest years replace those
+    #   of the existing file)
+    if path_output is None:
+        path_output = f'data/historic_draft_data_{ts}.csv'
+    df_draft.to_csv(path_output, index=False)
+    
+    return df_draft
 
 #==============================================================================
 # Working Code
@@ -264,5 +213,11 @@ def scrapeDraftHistory():
 # Set the project working directory
 os.chdir(r'C:\Users\reideej1\Projects\a_Personal\huskerProjects\20220425_DraftVsRecord')
 
-# Scrape Draft History
-scrapeDraftHistory()
\ No newline at end of file
+# Scrape Draft History (request, parse and stage metrics are saved to
+#   data/metrics and summarized at the end of the run)
+startRun('scrape_draft_history')
+scrapeDraftHistory()
+df_events = endRun()
+
+# # Add the latest draft to the existing history
+# scrapeDraftHistory(latest_only = True)
\ No newline at end of file
@@ -23,6 +23,7 @@ import os
 import pandas as pd
 import pathlib
 import requests
+import sys
 import tqdm
 import time
 
@@ -30,6 +31,14 @@ from bs4 import BeautifulSoup
 from requests.packages.urllib3.util.retry import Retry
 from string import digits
 
+# modules shared by every project (`huskerProjects/common`)
+path_common = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            os.pardir, os.pardir, 'common'))
+if path_common not in sys.path:
+    sys.path.append(path_common)
+
+from run_metrics import fetchUrl, recordEvent, sleepBetweenRequests
+
 #==============================================================================
 # Reference Variable Declaration
 #==============================================================================
@@ -44,6 +53,8 @@ list_categories_cfb = ['passing', 'rushing', 'receiving', 'kicking',
 def soupifyURL(url):
     '''
     Purpose: Turns a specified URL into BeautifulSoup formatted HTML 
+        (the request and the HTML parse are recorded as events of the
+        active run)
 
     Inputs
     ------
@@ -62,9 +73,12 @@ def soupifyURL(url):
     session.mount('http://', adapter)
     session.mount('https://', adapter)
     
-    r = session.get(url)
+    r = fetchUrl(session, url)
     #r = requests.get(url)
+    time_start = time.perf_counter()
     soup = BeautifulSoup(r.content,'html.parser')   
+    recordEvent('html', URL = url, Bytes = len(r.content), 
+                Seconds = time.perf_counter() - time_start)
     return soup
 
 def renameSchool(df, name_var):
@@ -152,6 +166,7 @@ def scrapeCfbSchoolLinks():
     # Scrape data for all available years
     url = 'https://www.sports-reference.com/cfb/schools/'
     soup = soupifyURL(url)
+    time_parse = time.perf_counter()
     
     # Retrieve the HTML of the combine table
     table = soup.find('table', {'id':'schools'})
@@ -178,6 +193,8 @@ def scrapeCfbSchoolLinks():
         
     # Remove unnecessary tables
     df_schools = df_schools[['School', 'URL', 'From', 'To']]
+    recordEvent('parse', Parser = 'cfb_schools', Rows = len(df_schools),
+                Seconds = time.perf_counter() - time_parse)
             
     return df_schools
  
@@ -211,6 +228,7 @@ def scrapeCfbSchoolsAllYears(year = 1970):
         # Scrape data for the specific team
         url = 'https://www.sports-reference.com' + url
         soup = soupifyURL(url)
+        time_parse = time.perf_counter()
         
         # Test for a year with no data (happens in new year w/o combine)
         if 'Page Not Found' in str(soup):
@@ -257,6 +275,8 @@ def scrapeCfbSchoolsAllYears(year = 1970):
         # Add School name to table
         df_school['Rk'] = school
         df_school = df_school.rename(columns = {'Rk':'School'})
+        recordEvent('parse', Parser = 'cfb_school', Rows = len(df_school),
+                    Seconds = time.perf_counter() - time_parse)
         
         # Append school data to history table
         if len(df_history) == 0:
@@ -266,7 +286,7 @@ def scrapeCfbSchoolsAllYears(year = 1970):
             
         print('Done with: ' + school)
         
-        time.sleep(1)
+        sleepBetweenRequests(1, url)
     
     return df_history
 
@@ -308,6 +328,7 @@ def scrapeCfbResultsAllYears(year = 1970):
         for scrape_year in range(year, year_end+1):
             # Scrape data for the specific team
             soup = soupifyURL(f'https://www.sports-reference.com{url}{scrape_year}-schedule.html')
+            time_parse = time.perf_counter()
         
             # Test for a year with no data (happens in new year w/o combine)
             if 'Page Not Found' in str(soup):
@@ -365,6 +386,8 @@ def scrapeCfbResultsAllYears(year = 1970):
             
             # Add the URLs to the table
             df_school['url_boxscore'] = url_boxscores
+            recordEvent('parse', Parser = 'cfb_schedule', Rows = len(df_school),
+                        Seconds = time.perf_counter() - time_parse)
             
             # # Append school data to all schools history table
             # if len(df_history) == 0:
@@ -380,7 +403,7 @@ def scrapeCfbResultsAllYears(year = 1970):
                 
             print(f' -- Done with: {scrape_year}')
             
-            time.sleep(1)
+            sleepBetweenRequests(1)
         
         print(f'*** FINISHED SCRAPING: {school} ***')
         ts = datetime.date.fromtimestamp(time.time())
@@ -420,6 +443,7 @@ def scrapeNflDraft(year = ''):
     for scrape_year in range(year_start, year_end):
         # Scrape data for the specific year
         soup = soupifyURL(f'https://www.pro-football-reference.com/years/{scrape_year}/draft.htm')
+        time_parse = time.perf_counter()
     
         # Test for a year with no data (happens in new year w/o combine)
         if 'Page Not Found' in str(soup):
@@ -450,6 +474,8 @@ def scrapeNflDraft(year = ''):
         
         # Convert rows to numeric values (if applicable)
         df_year = df_year.apply(pd.to_numeric, errors = 'ignore')
+        recordEvent('parse', Parser = 'nfl_draft', Rows = len(df_year),
+                    Seconds = time.perf_counter() - time_parse)
             
         # Standardize School Names
         df_year = renameSchool(df_year, 'School')
@@ -466,7 +492,7 @@ def scrapeNflDraft(year = ''):
             
         print(f' -- Done with: {scrape_year}')
         
-        time.sleep(1)
+        sleepBetweenRequests(1)
         
         df_year.to_csv(rf'data\raw\NFL Draft\nfl_draft_{scrape_year}.csv', index = False)
         
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 15:49:02 2026
+
+@author: agent
+
+:DESCRIPTION: Answer "similar season" questions over the draft picks vs.
+    record table (i.e. `data/draft_vs_record.csv`) without re-filtering the
+    whole table for every question.
+
+    - Range queries (e.g. every season with <= 3 wins and >= 4 picks) use a
+      sorted index per feature: the bounds of each feature are located with
+      binary searches and only the smallest candidate set is checked against
+      the remaining bounds.
+    - Nearest-neighbor queries (e.g. the 20 seasons closest to Nebraska 2021)
+      use a KD-tree built over the standardized feature columns (so that
+      e.g. wins and picks count equally despite their different spreads).
+
+    Usage from the command line (run from the project root):
+        python src/season_query.py --range wins:..3 picks:4..
+        python src/season_query.py --nearest Nebraska 2020 --k 20
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import argparse
+import numpy as np
+import pandas as pd
+
+from scipy.spatial import cKDTree
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+list_season_features = ['wins', 'losses', 'picks']
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def buildSeasonIndex(df_table, list_features = list_season_features):
+    '''
+    Purpose: Build sorted indexes for range queries and a KD-tree for
+        nearest-neighbor queries over the standardized season features
+
+    Inputs
+    ------
+        df_table : Pandas DataFrame
+            Contains `school`, `season` and every feature in `list_features`
+        list_features : list of strings
+            Numeric variables to index (default: `list_season_features`)
+
+    Outputs
+    -------
+        dict_index : dictionary
+            Contains the table ('table'), feature names ('features'), the
+            sorted index of every feature ('sorted': feature -> (values
+            sorted ascending, row positions in the same order)), a
+            (school, season) -> row position lookup ('lookup'), the mean
+            ('mean') and standard deviation ('std') of every feature and
+            the KD-tree of the standardized features ('tree')
+    '''
+    df_table = df_table.reset_index(drop = True)
+    array_features = df_table[list_features].to_numpy(dtype = float)
+
+    dict_sorted = {}
+    for idx, feature in enumerate(list_features):
+        array_order = np.argsort(array_features[:, idx], kind = 'mergesort')
+        dict_sorted[feature] = (array_features[array_order, idx], array_order)
+
+    dict_lookup = {(school, season):idx for idx, (school, season) in
+                   enumerate(zip(df_table['school'], df_table['season']))}
+
+    # standardize every feature (constant features are left unscaled)
+    array_mean = array_features.mean(axis = 0)
+    array_std = array_features.std(axis = 0)
+    array_std[array_std == 0] = 1
+
+    return {'table':df_table,
+            'features':list_features,
+            'sorted':dict_sorted,
+            'lookup':dict_lookup,
+            'mean':array_mean,
+            'std':array_std,
+            'tree':cKDTree((array_features - array_mean) / array_std)}
+
+def queryRange(dict_index, dict_ranges):
+    '''
+    Purpose: Retrieve every season whose features fall within the given
+        (inclusive) bounds
+
+    Inputs
+    ------
+        dict_index : dictionary
+            Index returned by `buildSeasonIndex`
+        dict_ranges : dictionary
+            Keys are feature names, values are (minimum, maximum) tuples where
+            None leaves that side of the range open, e.g.
+            {'wins':(None, 3), 'picks':(4, None)}
+
+    Outputs
+    -------
+        df_matches : Pandas DataFrame
+            Seasons satisfying every range (every season if no range is
+            given)
+    '''
+    # locate the candidate row positions for every range
+    list_candidates = []
+    for feature, (value_min, value_max) in dict_ranges.items():
+        array_values, array_order = dict_index['sorted'][feature]
+        pos_start = 0 if value_min is None else np.searchsorted(
+            array_values, value_min, 'left')
+        pos_end = len(array_values) if value_max is None else np.searchsorted(
+            array_values, value_max, 'right')
+        list_candidates.append(array_order[pos_start:pos_end])
+
+    if len(list_candidates) == 0:
+        return dict_index['table']
+
+    # check the smallest candidate set against the remaining ranges
+    list_candidates.sort(key = len)
+    array_positions = list_candidates[0]
+    for array_other in list_candidates[1:]:
+        array_positions = array_positions[np.isin(array_positions, array_other)]
+
+    return dict_index['table'].iloc[np.sort(array_positions)]
+
+def queryNearest(dict_index, school, season, k = 20):
+    '''
+    Purpose: Retrieve the seasons most similar to a given team-season based
+        on euclidean distance across the standardized features
+
+    Inputs
+    ------
+        dict_index : dictionary
+            Index returned by `buildSeasonIndex`
+        school : string
+            Standardized school name (e.g. 'Nebraska')
+        season : int
+            Season of interest (e.g. 2021)
+        k : int
+            Number of similar seasons to return, excluding the season of
+            interest itself (default: 20)
+
+    Outputs
+    -------
+        df_matches : Pandas DataFrame
+            The `k` most similar seasons with a `distance` variable (in
+            standard deviations), sorted from most to least similar
+    '''
+    pos = dict_index['lookup'].get((school, int(season)))
+    if pos is None:
+        list_seasons = sorted(x for (name, x) in dict_index['lookup'] if name == school)
+        seasons = f'{list_seasons[0]}-{list_seasons[-1]}' if list_seasons else 'none'
+        raise ValueError(f'No season {season} for {school} in the table '
+                         f'(seasons available: {seasons})')
+    array_point = dict_index['table'].loc[
+        pos, dict_index['features']].to_numpy(dtype = float)
+    array_point = (array_point - dict_index['mean']) / dict_index['std']
+
+    # query one extra neighbor as the season of interest matches itself
+    k_query = min(k + 1, len(dict_index['table']))
+    array_dist, array_pos = dict_index['tree'].query(array_point, k = k_query)
+    array_dist = np.atleast_1d(array_dist)
+    array_pos = np.atleast_1d(array_pos)
+    array_keep = array_pos != pos
+    array_dist = array_dist[array_keep][:k]
+    array_pos = array_pos[array_keep][:k]
+
+    df_matches = dict_index['table'].iloc[array_pos].copy()
+    df_matches['distance'] = array_dist
+
+    return df_matches
+
+def parseRange(text):
+    '''
+    Purpose: Convert a command-line range (e.g. 'wins:..3', 'picks:4..',
+        'losses:6..9' or 'picks:4') into a feature name and bounds
+
+    Inputs
+    ------
+        text : string
+            Range in the format `feature:min..max` (either side optional)
+
+    Outputs
+    -------
+        feature : string
+            Name of the feature
+        bounds : tuple
+            (minimum, maximum) with None for open bounds
+    '''
+    feature, bounds = text.split(':')
+    if '..' not in bounds:
+        return feature, (float(bounds), float(bounds))
+    value_min, value_max = bounds.split('..')
+    return feature, (float(value_min) if value_min != '' else None,
+                     float(value_max) if value_max != '' else None)
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Build the index once
+# dict_index = buildSeasonIndex(pd.read_csv(r'data/draft_vs_record.csv',
+#                                           keep_default_na = False))
+
+# # Every season with 3 or fewer wins and 4 or more draft picks
+# df_matches = queryRange(dict_index, {'wins':(None, 3), 'picks':(4, None)})
+
+# # The 20 seasons closest to Nebraska 2020
+# df_matches = queryNearest(dict_index, 'Nebraska', 2020, k = 20)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description = 'Query the draft picks vs. record table')
+    parser.add_argument('--data', default = r'data/draft_vs_record.csv',
+                        help = 'path to the draft picks vs. record table')
+    parser.add_argument('--range', nargs = '+', default = [],
+                        help = 'ranges in the format feature:min..max')
+    parser.add_argument('--nearest', nargs = 2, metavar = ('SCHOOL', 'SEASON'),
+                        help = 'find the seasons most similar to this one')
+    parser.add_argument('--k', type = int, default = 20,
+                        help = 'number of similar seasons to return')
+    args = parser.parse_args()
+
+    dict_index = buildSeasonIndex(pd.read_csv(args.data, keep_default_na = False))
+    pd.set_option('display.max_rows', None)
+    if args.range:
+        print(queryRange(dict_index, dict(parseRange(x) for x in args.range)))
+    if args.nearest:
+        print(queryNearest(dict_index, args.nearest[0], args.nearest[1], args.k))
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 19:04:18 2026
+
+@author: agent
+
+:DESCRIPTION: Benchmark the draft page parsers on a fixture page set and
+    check that a saved benchmark compares equal to itself.
+
+:REQUIRES: pytest
+
+:TODO: NONE
+"""
+
+import json
+import pandas as pd
+
+from benchmark_parsers import (benchmarkParsers, compareBenchmark, list_compare_cols,
+                               saveBenchmark)
+from draft_parsers import dict_page_parsers, writeFixturePages
+
+def test_benchmark_round_trip(project_root, tmp_path):
+    path_draft = r'data/historic_draft_data_2022-04-25.csv'
+    path_pages = str(tmp_path / 'pages')
+    df_pages = writeFixturePages(path_pages, path_draft, list_years = [2020, 2021])
+    assert df_pages['Parser'].tolist() == ['draft_years', 'draft_year', 'draft_year']
+
+    df_bench = benchmarkParsers(path_pages, dict_page_parsers, repeat = 1)
+    df_draft = pd.read_csv(path_draft)
+    assert df_bench['Parser'].tolist() == ['draft_years', 'draft_year']
+    assert df_bench['Pages'].tolist() == [1, 2]
+    assert df_bench['Rows'].tolist() == [2, df_draft['year'].isin([2020, 2021]).sum()]
+    assert (df_bench[list_compare_cols] > 0).all().all()
+    assert (df_bench['Seconds'] - df_bench.filter(like = 'Seconds_').sum(axis = 1)
+            ).abs().max() < 1e-12
+
+    # only the layouts asked for are benchmarked
+    df_subset = benchmarkParsers(path_pages, dict_page_parsers, ['draft_year'], repeat = 1)
+    assert df_subset['Parser'].tolist() == ['draft_year']
+
+    path_json = str(tmp_path / 'benchmarks' / 'baseline.json')
+    saveBenchmark(df_bench, path_json, path_pages)
+    with open(path_json, 'r') as file:
+        dict_run = json.load(file)
+    assert dict_run['Pages'] == path_pages
+    assert [x['Parser'] for x in dict_run['Results']] == df_bench['Parser'].tolist()
+
+    df_compare = compareBenchmark(df_bench, path_json).set_index('Parser')
+    assert sorted(df_compare.index) == sorted(df_bench['Parser'])
+    for col in list_compare_cols:
+        assert (df_compare[f'{col}_Ratio'] - 1).abs().max() < 1e-9
+
+    # a slower run shows up as a ratio above 1
+    df_slower = df_bench.assign(Seconds = df_bench['Seconds'] * 2)
+    df_compare = compareBenchmark(df_slower, path_json)
+    assert (df_compare['Seconds_Ratio'] - 2).abs().max() < 1e-9
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 19:30:00 2026
+
+@author: agent
+
+:DESCRIPTION: Check school name standardization and that schools missing
+    from the team keys are reported instead of failing a type cast.
+
+:REQUIRES: pytest
+
+:TODO: NONE
+"""
+
+import pandas as pd
+import pytest
+
+from draft_join import (aggregateDraftPicks, buildDraftRecordTable,
+                        joinDraftToRecords)
+from school_names import renameSchool
+
+@pytest.fixture
+def df_draft():
+    return pd.DataFrame({'year':[2021, 2021, 2021, 2022],
+                         'round':[1, 3, 2, 7],
+                         'college':['Nebraska', 'Iowa', 'Nebraska', 'Iowa']})
+
+@pytest.fixture
+def df_results():
+    return pd.DataFrame({'school':['Nebraska', 'Iowa', 'Nebraska', 'Iowa'],
+                         'year':[2020, 2020, 2021, 2021],
+                         'w_fb':[3, 6, 3, 10], 'l_fb':[5, 2, 9, 4]})
+
+def test_rename_reports_unknown_names_once(project_root, capsys):
+    df = pd.DataFrame({'school':['Nebraska', 'Not A School', None, 'Not A School']})
+    df = renameSchool(df, 'school')
+    assert df['school'].tolist() == ['Nebraska', 'Not A School', '', 'Not A School']
+    assert capsys.readouterr().out.count('Not A School') == 1
+
+def test_draft_record_table(df_draft, df_results):
+    df_table = buildDraftRecordTable(df_draft, df_results)
+    assert df_table[['school', 'season', 'picks', 'rounds']].values.tolist() == [
+        ['Iowa', 2020, 1, '3'], ['Iowa', 2021, 1, '7'],
+        ['Nebraska', 2020, 2, '1,2'], ['Nebraska', 2021, 0, '']]
+
+def test_missing_team_keys_are_named(df_draft, df_results):
+    dict_team_ids = {'Nebraska':0}
+    with pytest.raises(ValueError, match = 'Iowa'):
+        aggregateDraftPicks(df_draft, dict_team_ids)
+    df_picks = aggregateDraftPicks(df_draft[df_draft['college'] == 'Nebraska'],
+                                   dict_team_ids)
+    with pytest.raises(ValueError, match = 'Iowa'):
+        joinDraftToRecords(df_picks, df_results, dict_team_ids, [2020, 2021])
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 19:45:00 2026
+
+@author: agent
+
+:DESCRIPTION: Check range and nearest-neighbor season queries against
+    brute-force filters over the table.
+
+:REQUIRES: pytest
+
+:TODO: NONE
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from season_query import buildSeasonIndex, queryNearest, queryRange
+
+@pytest.fixture(scope = 'module')
+def df_table():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({'school':np.repeat([f'School {i}' for i in range(50)], 20),
+                         'season':np.tile(np.arange(2000, 2020), 50),
+                         'wins':rng.integers(0, 13, 1000),
+                         'losses':rng.integers(0, 13, 1000),
+                         'picks':rng.integers(0, 40, 1000)})
+
+def test_range_matches_filter(df_table):
+    dict_index = buildSeasonIndex(df_table)
+    df_matches = queryRange(dict_index, {'wins':(None, 3), 'picks':(4, None)})
+    pd.testing.assert_frame_equal(
+        df_matches, df_table[(df_table['wins'] <= 3) & (df_table['picks'] >= 4)])
+    pd.testing.assert_frame_equal(queryRange(dict_index, {}), df_table)
+
+def test_nearest_uses_standardized_features(df_table):
+    dict_index = buildSeasonIndex(df_table)
+    df_matches = queryNearest(dict_index, 'School 3', 2010, k = 10)
+
+    df_features = df_table[['wins', 'losses', 'picks']]
+    df_scaled = (df_features - df_features.mean()) / df_features.std(ddof = 0)
+    array_dist = np.sqrt(((df_scaled - df_scaled.iloc[70]) ** 2).sum(axis = 1))
+    array_dist = array_dist.drop(index = 70).sort_values(kind = 'mergesort')
+    np.testing.assert_allclose(df_matches['distance'], array_dist.iloc[:10])
+    assert 70 not in df_matches.index
+
+def test_nearest_unknown_season(df_table):
+    dict_index = buildSeasonIndex(df_table)
+    with pytest.raises(ValueError, match = 'School 3.*2000-2019'):
+        queryNearest(dict_index, 'School 3', 2021)
+    with pytest.raises(ValueError, match = 'none'):
+        queryNearest(dict_index, 'Nebraska', 2010)
@@ -17,13 +17,23 @@ Created on Mon Apr 25 10:00:41 2022
 #==============================================================================
 # Package Import
 #==============================================================================
-import glob
-import matplotlib.pyplot as plt
-import math
 import os  
 import pandas as pd
 import pathlib
-from matplotlib.offsetbox import OffsetImage, AnnotationBbox
+import sys
+
+# modules shared by every project (`huskerProjects/common`)
+path_common = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            os.pardir, os.pardir, 'common'))
+if path_common not in sys.path:
+    sys.path.append(path_common)
+
+from render_figures import renderFigures
+from run_metrics import endRun, startRun, timeStage
+from scrape_turnovers import (fillMissingRecords, scrapeTurnoverRankings,
+                              seedRankingPages)
+from turnover_metrics import computeTurnoverMetrics, lookupTeam
+from turnover_plots import plotStatsMargin, plotStatsWinPct, plotTeamReports
 
 #==============================================================================
 # Reference Variable Declaration
@@ -98,270 +108,94 @@ def rename_school_helper(name_school, dict_school_names):
         print(f'School not found in school abbreviations .csv file: {name_school} ')
         return name_school
 
-def loadTurnoverData():
+def main():
     '''
-    Purpose: Read in the turnover data for each year 
-        (as reported on https://stats.ncaa.org/rankings/)
+    Purpose: Run the analysis: ingest every season's turnover rankings, plot
+        them and compare every team to the league average
 
-    Inputs   
+    Inputs
     ------
         NONE
-            
+
     Outputs
     -------
-        df_all_years : Pandas DataFrame
-            Contains turnover data for all FBS teams from 2012-2021
+        df : Pandas DataFrame
+            Turnover table of every team-season
+        df_metrics : Pandas DataFrame
+            Every team-season compared to the league average (see
+            `computeTurnoverMetrics`)
+        df_events : Pandas DataFrame
+            Stage metrics of the run (see `endRun`)
     '''
-    # identify file paths for all turnover data
-    list_files = list(glob.iglob(r'data\*.xlsx'))
-    
-    # load turnover data for each year
-    df_all_years = pd.DataFrame()
-    for fpath in list_files:
-        # Load data
-        df_year = pd.read_excel(fpath)
-        year = int(fpath.split(' ')[-1].replace('.xlsx',''))
-        df_year['Year'] = year
-        if year == 2012:
-            df_year = df_year.rename(
-                columns = {'Team':'School', 'Fum Rec':'Opp_Fum', 'Int':'Opp_Int',
-                           'Turnovers Gained':'Opp_TO', 'Fum Lost':'Fum', 'Int.1':'Int', 
-                           'Turnovers Lost':'TO'})
-            df_year['Margin'] = df_year['Opp_TO'] - df_year['TO']
-        else:
-            df_year = df_year.rename(
-                columns = {'Team':'School', 'Fum Rec':'Opp_Fum', 'Opp Int':'Opp_Int',
-                           'Turn Gain':'Opp_TO', 'Fum Lost':'Fum', 'Turn Lost':'TO'})
-            df_year['Margin/G'] = df_year['Margin']/df_year['G']    
-            
-        # Retrieve team conference from team name
-        df_year['Conf']   = df_year['School'].apply(lambda x: x.split('(')[1].replace(")",""))
-        df_year['School'] = df_year['School'].apply(lambda x: x.split(' (')[0])
-
-        # Rename teams
-        df_year = renameSchool(df_year, 'School')
-    
-        if year == 2012:
-            # fill in win/loss records for 2012
-            df_results = pd.read_csv(r'C:\Users\reideej1\Projects\a_Personal\cfbAnalysis\data\raw\Team History\team_history_fb_1936_to_2020.csv')
-            df_results = df_results[['School', 'Year', 'Overall_W', 'Overall_L']]
-            df_results = renameSchool(df_results, 'School')
-            df_year = pd.merge(df_year, df_results, how = 'left',
-                                on = ['Year', 'School'])
-            df_year = df_year.rename(columns = {'Overall_W':'W',
-                                                  'Overall_L':'L'})
-            df_year = df_year[['Year', 'School', 'Conf', 'Rank', 'G', 
-                                 'W', 'L', 'Opp_Fum', 'Opp_Int', 'Opp_TO', 
-                                 'Fum', 'Int', 'TO', 'Margin', 'Margin/G']]
-            # update Idaho's record
-            df_year['W'] = df_year['W'].fillna(1)
-            df_year['L'] = df_year['L'].fillna(11)
-            df_year.to_csv(r'data/2012.csv', index = False)
-    
-        else:
-            # create win/loss columns
-            df_year['W'] = df_year['W-L'].apply(lambda x: int(x.split('-')[0]))
-            df_year['L'] = df_year['W-L'].apply(lambda x: int(x.split('-')[1]))
-            
-            df_year = df_year[['Year', 'School', 'Conf', 'Rank', 'G', 
-                                 'W', 'L', 'Opp_Fum', 'Opp_Int', 'Opp_TO', 
-                                 'Fum', 'Int', 'TO', 'Margin', 'Margin/G']]
-            df_year.to_csv(rf'data/Nebraska_{year}.csv', index = False)
-            
-        if len(df_all_years) == 0:
-            df_all_years = df_year.copy()
-        else:
-            df_all_years = df_all_years.append(df_year)
-
-    return df_all_years
-
-def importTurnoverFiles():
-    list_files = list(glob.iglob(r'data\*.csv'))
-    df_turnovers = pd.DataFrame()
-    for x in list_files:
-        df_turnovers = df_turnovers.append(pd.read_csv(x))
-    return df_turnovers
-
-def plotStatsWinPct():
-    # Set font and background colour
-    # plt.rcParams.update({'font.family':'Avenir'})
-    bgcol = '#fafafa'
-
-    # Create initial plot
-    fig, ax = plt.subplots(figsize=(6, 4), dpi=1200)
-    ax.scatter(df['Margin'], df['Win_Pct'], s = 10, alpha = 0.5)
-    fig.set_facecolor(bgcol)
-    ax.set_facecolor(bgcol)
-
-    # Change plot spines
-    ax.spines['right'].set_visible(False)
-    ax.spines['top'].set_visible(False)
-    ax.spines['left'].set_color('#ccc8c8')
-    ax.spines['bottom'].set_color('#ccc8c8')
-
-    # Change ticks
-    plt.tick_params(axis='x', labelsize=12, color='#ccc8c8')
-    plt.tick_params(axis='y', labelsize=12, color='#ccc8c8')
-
-    # Plot badges
-    def getImage(path):
-        return OffsetImage(plt.imread(path), zoom=.3, alpha = 1)
-
-    for index, row in df.iterrows():
-        ab = AnnotationBbox(getImage(row['Logo']), (
-            row['Margin'], row['Win_Pct']), frameon=False)
-        if row['School'] == 'Nebraska':
-            ax.add_artist(ab)
-        
-    # Ensure X-Axis are whole numbers
-    def round_down(m, n):
-        return m // n * n
-    def round_up(n):
-        return n + (5 - n) % 5
-    min_xaxis = round_down(math.floor(df['Margin'].min()),5)
-    max_xaxis = round_up(math.ceil(df['Margin'].max()))
-    # new_xaxis = range(min_xaxis, max_xaxis+5, 5)
-    # ax.set_xticks(list(new_xaxis))
-
-    # Set Y-Axis to traditional height values (i.e. 6'1" etc)
-    min_yaxis = math.floor(df['Win_Pct'].min())
-    max_yaxis = math.ceil(df['Win_Pct'].max())
-    new_yaxis = range(min_yaxis, max_yaxis+1)
-    new_yaxis = list(range(0, 10, 1))
-    new_yaxis = [x/10 for x in new_yaxis]
-                      
-    # ax.set_yticks(list(new_yaxis))
-    # yaxis_labels = [str(x) for x in new_yaxis]
-    # yaxis_labels = [str(math.floor(int(y)/12)) + '-' + str(int(y)%12) for y in yaxis_labels]
-    # ax.set_yticklabels(yaxis_labels)
-
-    # Add average lines
-    plt.hlines(df['Win_Pct'].median(), 
-               min_xaxis, 
-               max_xaxis, 
-               color='#c2c1c0')
-    plt.vlines(df['Margin'].median(), 
-               min_yaxis, 
-               max_yaxis, 
-               color='#c2c1c0')
-         
-    fig.text(.15,.98,'Turnovers in FBS 2012-2021',size=20)
-    fig.text(.15,.93,'Winning Pct. vs. Turnover Margin', size=12)
-
-    # Set Axis Labels
-    ax.set_xlabel('Tunover Margin.')
-    ax.set_ylabel('Win Pct.')
-
-    # Add Made by to bottom of image
-    fig.text(.68, .02, 'Created by @Stewmanji', size=8, color='#c2c1c0')
-
-    ## Save plot
-    plt.savefig(r'images/plots/turnover_stats_win_pct.png', dpi=1200, bbox_inches = "tight")
-    plt.savefig(r'images/plots/turnover_stats_win_pct.pdf', format = 'pdf', bbox_inches = "tight")
-
-def plotStatsMargin():
-    # Set font and background colour
-    # plt.rcParams.update({'font.family':'Avenir'})
-    bgcol = '#fafafa'
-
-    # Create initial plot
-    fig, ax = plt.subplots(figsize=(6, 4), dpi=1200)
-    ax.scatter(df['TO'], df['Opp_TO'], s = 10, alpha = 0.5)
-    fig.set_facecolor(bgcol)
-    ax.set_facecolor(bgcol)
-
-    # Change plot spines
-    ax.spines['right'].set_visible(False)
-    ax.spines['top'].set_visible(False)
-    ax.spines['left'].set_color('#ccc8c8')
-    ax.spines['bottom'].set_color('#ccc8c8')
-
-    # Change ticks
-    plt.tick_params(axis='x', labelsize=12, color='#ccc8c8')
-    plt.tick_params(axis='y', labelsize=12, color='#ccc8c8')
-
-    # Plot badges
-    def getImage(path):
-        return OffsetImage(plt.imread(path), zoom=.3, alpha = 1)
-
-    for index, row in df.iterrows():
-        ab = AnnotationBbox(getImage(row['Logo']), (
-            row['TO'], row['Opp_TO']), frameon=False)
-        if row['School'] == 'Nebraska':
-            ax.add_artist(ab)
-        
-    # Ensure X-Axis are whole numbers
-    def round_down(m, n):
-        return m // n * n
-    def round_up(n):
-        return n + (5 - n) % 5
-    min_xaxis = round_down(math.floor(df['TO'].min()),5)
-    max_xaxis = round_up(math.ceil(df['TO'].max()))
-    # new_xaxis = range(min_xaxis, max_xaxis+5, 5)
-    # ax.set_xticks(list(new_xaxis))
-
-    # Set Y-Axis to traditional height values (i.e. 6'1" etc)
-    min_yaxis = math.floor(df['Opp_TO'].min())
-    max_yaxis = math.ceil(df['Opp_TO'].max())
-    new_yaxis = range(min_yaxis, max_yaxis+1)
-    new_yaxis = list(range(0, 10, 1))
-    new_yaxis = [x/10 for x in new_yaxis]
-                      
-    # ax.set_yticks(list(new_yaxis))
-    # yaxis_labels = [str(x) for x in new_yaxis]
-    # yaxis_labels = [str(math.floor(int(y)/12)) + '-' + str(int(y)%12) for y in yaxis_labels]
-    # ax.set_yticklabels(yaxis_labels)
-
-    # Add average lines
-    plt.hlines(df['TO'].median(), 
-               min_xaxis, 
-               max_xaxis, 
-               color='#c2c1c0')
-    plt.vlines(df['Opp_TO'].median(), 
-               min_yaxis, 
-               max_yaxis, 
-               color='#c2c1c0')
-         
-    fig.text(.15,.98,'Turnovers in FBS 2012-2021',size=20)
-    fig.text(.15,.93,'Turnovers Gained vs. Turnovers Lost', size=12)
-
-    # Set Axis Labels
-    ax.set_xlabel('Turnovers')
-    ax.set_ylabel('Opponent Turnovers')
-
-    # Add Made by to bottom of image
-    fig.text(.68, .02, 'Created by @Stewmanji', size=8, color='#c2c1c0')
-
-    ## Save plot
-    plt.savefig(r'images/plots/turnover_stats_margin.png', dpi=1200, bbox_inches = "tight")
-    plt.savefig(r'images/plots/turnover_stats_margin.pdf', format = 'pdf', bbox_inches = "tight")
+    # Set the project working directory
+    path_dir = pathlib.Path(r'huskerProjects\20220513_TurnoverMargin')
+    os.chdir(path_dir)
+
+    # record request, parse and stage metrics (saved to data/metrics)
+    startRun('analyze_turnovers')
+
+    # ingest turnover data for all available years (scraped seasons are cached;
+    #   the seasons on file in `data/Nebraska_*.csv` are saved as pages first so
+    #   that only newer seasons are requested)
+    with timeStage('scrapeTurnoverRankings') as stage:
+        seedRankingPages(r'data/ncaa_rankings/pages')
+        df_turnovers = scrapeTurnoverRankings(path_pages = r'data/ncaa_rankings/pages')
+        stage['Rows'] = len(df_turnovers)
+
+    # fill in win/loss records for seasons without them (i.e. 2012)
+    with timeStage('fillMissingRecords') as stage:
+        df_results = pd.read_csv(r'C:\Users\reideej1\Projects\a_Personal\cfbAnalysis\data\raw\Team History\team_history_fb_1936_to_2020.csv')
+        df_results = df_results[['School', 'Year', 'Overall_W', 'Overall_L']]
+        df_results = df_results.rename(columns = {'Overall_W':'W', 'Overall_L':'L'})
+        df_results = renameSchool(df_results, 'School')
+        df_turnovers = fillMissingRecords(df_turnovers, df_results)
+        stage['Rows'] = len(df_turnovers)
+
+    df_turnovers['Win_Pct'] = df_turnovers['W']/df_turnovers['G']
+    df_turnovers['Margin'] = df_turnovers['Opp_TO'] - df_turnovers['TO']
+    df = df_turnovers[['Year', 'School', 'Conf', 'Rank', 'G', 'W', 'L', 'Win_Pct', 
+                       'Opp_Fum', 'Opp_Int', 'Opp_TO', 'Fum', 'Int', 'TO', 
+                       'Margin/G', 'Margin']].copy()
+    # Add Logos to table
+    list_image_paths = []
+    for school in df['School']:
+        list_image_paths.append(rf'images/logos_school_square/{school}.png')
+    df['Logo'] = list_image_paths
+
+    # plot turnover stats, one figure per worker process
+    list_tasks = [{'name':'Win Pct', 'func':plotStatsWinPct, 
+                   'shared':{'df':'df', 'dict_atlas':'dict_atlas'}},
+                  {'name':'Margin', 'func':plotStatsMargin, 
+                   'shared':{'df':'df', 'dict_atlas':'dict_atlas'}}]
+    with timeStage('renderFigures') as stage:
+        df_render, seconds_total = renderFigures(list_tasks, {'df':df})
+        stage['Rows'] = len(df_render)
+
+    # both charts for every team (in `images/plots/teams/`)
+    with timeStage('plotTeamReports') as stage:
+        df_reports, seconds_reports = plotTeamReports(df)
+        stage['Rows'] = len(df_reports)
+
+    # what is the avg margin of each 64th placed team
+    df64 = df[df['Rank'] == 64]
+
+    # compare every team to the league average in every season
+    with timeStage('computeTurnoverMetrics') as stage:
+        df_metrics, df_coef = computeTurnoverMetrics(df)
+        stage['Rows'] = len(df_metrics)
+
+    # how far from average is Nebraska?
+    df_nebraska = lookupTeam(df_metrics, 'Nebraska')
+
+    df_events = endRun()
+
+    return df, df_metrics, df_events
 
 #==============================================================================
 # Working Code
 #==============================================================================
 
-# Set the project working directory
-path_dir = pathlib.Path(r'huskerProjects\20220513_TurnoverMargin')
-os.chdir(path_dir)
-
-# ingest turnvoer data for all available years
-df_turnovers = loadTurnoverData()
-
-df_turnovers = importTurnoverFiles()
-df_turnovers['Win_Pct'] = df_turnovers['W']/df_turnovers['G']
-df_turnovers['Margin'] = df_turnovers['Opp_TO'] - df_turnovers['TO']
-df = df_turnovers[['Year', 'School', 'Conf', 'Rank', 'G', 'W', 'L', 'Win_Pct', 
-                   'Opp_Fum', 'Opp_Int', 'Opp_TO', 'Fum', 'Int', 'TO', 
-                   'Margin/G', 'Margin']].copy()
-# Add Logos to table
-list_image_paths = []
-for school in df['School']:
-    list_image_paths.append(rf'images/logos_school_square/{school}.png')
-df['Logo'] = list_image_paths
-
-# plot turnover stats
-plotStatsWinPct()
-plotStatsMargin()
-
-# what is the avg margin of each 64th placed team
-df64 = df[df['Rank'] == 64]
\ No newline at end of file
+# run the analysis only when executed as a script (render workers re-import
+#   this module and must not rerun it)
+if __name__ == '__main__':
+    df, df_metrics, df_events = main()
@@ -0,0 +1,545 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:00:15 2026
+
+@author: agent
+
+:DESCRIPTION: Scrape the FBS turnover margin rankings for every season from
+    https://stats.ncaa.org/rankings/ (in place of manually downloading a
+    `NCAA Statistics 20XX.xlsx` file for each season).
+
+    The ranking page(s) of every season are listed in
+    `references/ncaa_ranking_pages.csv` and are fetched concurrently through
+    a single pooled, rate-limited session. Every page is parsed straight
+    into the typed turnover table:
+
+        Year, School, Conf, Rank, G, W, L, Opp_Fum, Opp_Int, Opp_TO,
+        Fum, Int, TO, Margin, Margin/G
+
+    Both page layouts are handled by matching column headers (2012 lists
+    `Turnovers Gained/Lost` and two `Int` columns and has no `W-L` column;
+    later seasons list `Turn Gain/Lost`, `Opp Int` and `W-L`). Seasons
+    without a `W-L` column are left with missing records which can be
+    filled with `fillMissingRecords`.
+
+    Parsed seasons are cached in `data/ncaa_rankings/{year}.csv` and only
+    seasons missing from the cache are requested. If `path_pages` is given,
+    every page fetched is saved there as `{year}_{page}.html` and pages
+    already saved are read from disk; with `offline = True` only saved
+    pages are used (fixture mode for testing, no network access).
+    `seedRankingPages` renders the season tables saved before the rankings
+    were scraped (`data/Nebraska_{year}.csv`) as saved pages, so those
+    seasons are never requested.
+
+    Requests, saved pages and cached seasons (cache hits), waits, parses
+    and season builds are recorded as events of the active run (see
+    `run_metrics`).
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import concurrent.futures
+import glob
+import os
+import pandas as pd
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+# modules shared by every project (`huskerProjects/common`)
+path_common = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            os.pardir, os.pardir, 'common'))
+if path_common not in sys.path:
+    sys.path.append(path_common)
+
+from run_metrics import createSession, fetchUrl, recordEvent, timeStage, waitForHost
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+dict_turnover_types = {'Year':'int16',
+                       'School':str,
+                       'Conf':str,
+                       'Rank':'int16',
+                       'G':'int8',
+                       'W':'Int8',
+                       'L':'Int8',
+                       'Opp_Fum':'int16',
+                       'Opp_Int':'int16',
+                       'Opp_TO':'int16',
+                       'Fum':'int16',
+                       'Int':'int16',
+                       'TO':'int16',
+                       'Margin':'int16',
+                       'Margin/G':'float64'}
+
+# ranking page headers (lower case) for every column; `Int` is resolved by
+#   position as 2012 lists interceptions gained and lost under the same name
+dict_ranking_columns = {'rank':'Rank', 'team':'Team', 'g':'G', 'w-l':'W-L',
+                        'fum rec':'Opp_Fum', 'opp int':'Opp_Int',
+                        'turn gain':'Opp_TO', 'turnovers gained':'Opp_TO',
+                        'fum lost':'Fum', 'turn lost':'TO',
+                        'turnovers lost':'TO', 'margin':'Margin',
+                        'avg':'Margin/G', 'margin/g':'Margin/G'}
+
+# records missing from the results data used by `fillMissingRecords`
+dict_record_fixes = {(2012, 'Idaho'):(1, 11)}
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def renameSchool(df, name_var):
+    '''
+    Purpose: Rename a school/university to a standard name as specified in
+        the file `school_abbreviations.csv` (applied to the whole column at
+        once, with unknown names reported once each)
+
+    Inputs
+    ------
+        df : Pandas Dataframe
+            DataFrame containing a school-name variable for which the names
+            need to be standardized
+        name_var : string
+            Name of the variable which is to be renamed/standardized
+
+    Outputs
+    -------
+        df : Pandas DataFrame
+            Original DataFrame with `name_var` standardized based on the
+            first value in the row in the file `school_abbreviations.csv`
+    '''
+    # read in school name information
+    df_school_names = pd.read_csv(r'references/school_abbreviations_and_pictures.csv',
+                                  encoding = 'latin-1')
+
+    # convert the dataframe to a dictionary such that the keys are the
+    #   optional spelling of each school and the value is the standardized
+    #   name of the school
+    dict_school_names = {}
+    list_name_cols = [x for x in df_school_names.columns if 'Name' in x]
+    for row in df_school_names.itertuples(index = False):
+        row = row._asdict()
+        list_names = [row[x] for x in list_name_cols if str(row[x]) != 'nan']
+        list_names.append(row['Team'])
+        for name in list_names:
+            dict_school_names[name] = row['Team']
+            dict_school_names[name + ' ' + row['Nickname']] = row['Team']
+
+    # standardize every name at once, leaving unknown names as-is
+    series_names = df[name_var].map(dict_school_names)
+    list_missing = df.loc[series_names.isna() & df[name_var].notna(),
+                          name_var].unique()
+    for name_school in list_missing:
+        print(f'School not found in school abbreviations .csv file: {name_school} ')
+    df[name_var] = series_names.fillna(df[name_var]).fillna('')
+
+    return df
+
+def fetchRankingPage(session, row, path_pages = None, offline = False,
+                     min_interval = 1.0):
+    '''
+    Purpose: Retrieve the HTML of one ranking page, from the saved pages if
+        available and from stats.ncaa.org otherwise
+
+    Inputs
+    ------
+        session : requests Session
+            Session returned by `createSession`
+        row : Pandas Series
+            Row of `references/ncaa_ranking_pages.csv` (year, page, url)
+        path_pages : string
+            Folder of saved pages (`{year}_{page}.html`); pages fetched
+            online are saved here (default: None = don't save pages)
+        offline : boolean
+            Only read saved pages (default: False)
+        min_interval : float
+            Minimum number of seconds between requests to the same host
+            (default: 1.0)
+
+    Outputs
+    -------
+        page : string
+            HTML of the ranking page
+    '''
+    path_page = None
+    if path_pages is not None:
+        path_page = os.path.join(path_pages, f"{row['year']}_{row['page']}.html")
+        if os.path.exists(path_page):
+            time_start = time.perf_counter()
+            with open(path_page, 'r', encoding = 'utf-8') as file:
+                page = file.read()
+            recordEvent('fetch', URL = row['url'], Status = None, Bytes = len(page),
+                        Cache = 'hit', Seconds = time.perf_counter() - time_start)
+            return page
+    if offline:
+        raise FileNotFoundError(f'No saved page for {row["year"]} '
+                                f'(page {row["page"]}) in {path_pages}')
+
+    waitForHost(row['url'], min_interval)
+    r = fetchUrl(session, row['url'], timeout = 30)
+    r.raise_for_status()
+    page = r.text
+
+    if path_page is not None:
+        os.makedirs(path_pages, exist_ok = True)
+        with open(path_page, 'w', encoding = 'utf-8') as file:
+            file.write(page)
+
+    return page
+
+def parseRankingPage(page):
+    '''
+    Purpose: Extract the turnover margin ranking table from a ranking page
+
+    Inputs
+    ------
+        page : string
+            HTML of a stats.ncaa.org turnover margin ranking page
+
+    Outputs
+    -------
+        df_page : Pandas DataFrame
+            One row per team with the recognized columns (`Team` still
+            contains the conference, e.g. 'Oregon (Pac-12)')
+    '''
+    time_start = time.perf_counter()
+    soup = BeautifulSoup(page, 'html.parser')
+    time_soup = time.perf_counter()
+    recordEvent('html', Bytes = len(page), Seconds = time_soup - time_start)
+
+    df_page = pd.DataFrame(columns = ['Team'])
+    for table in soup.find_all('table'):
+        list_headers = [th.get_text(' ', strip = True).lower()
+                        for th in table.select('thead th')]
+        if 'team' not in list_headers:
+            continue
+
+        # interceptions listed before turnovers gained are the opponent's
+        list_columns = []
+        for header in list_headers:
+            if header == 'int':
+                list_columns.append('Int' if 'Opp_TO' in list_columns or
+                                    'Opp_Int' in list_columns else 'Opp_Int')
+            else:
+                list_columns.append(dict_ranking_columns.get(header))
+
+        list_rows = []
+        for tr in table.select('tbody tr'):
+            list_cells = [td.get_text(' ', strip = True)
+                          for td in tr.find_all(['td', 'th'])]
+            list_rows.append({column:cell for column, cell in
+                              zip(list_columns, list_cells) if column})
+
+        df_page = pd.DataFrame(list_rows, columns = [x for x in list_columns if x])
+        break
+
+    recordEvent('parse', Parser = 'ncaa_ranking', Rows = len(df_page),
+                Seconds = time.perf_counter() - time_soup)
+
+    return df_page
+
+def buildSeasonTable(df_season, year):
+    '''
+    Purpose: Convert the parsed ranking page(s) of a season to the typed
+        turnover table
+
+    Inputs
+    ------
+        df_season : Pandas DataFrame
+            Output of `parseRankingPage` for every page of the season
+        year : int
+            Season of the rankings
+
+    Outputs
+    -------
+        df_season : Pandas DataFrame
+            Typed turnover table (see `dict_turnover_types`)
+    '''
+    df_season = df_season[df_season['Team'].fillna('') != ''].copy()
+    df_season['Year'] = year
+
+    # split team and conference, e.g. 'Boise St. (Mountain West)'
+    df_names = df_season['Team'].str.extract(r'^(.*?)\s*\(([^()]*)\)\s*$')
+    df_season['School'] = df_names[0].fillna(df_season['Team'])
+    df_season['Conf'] = df_names[1]
+
+    # ties may be listed without a rank
+    df_season['Rank'] = pd.to_numeric(df_season['Rank'].str.extract(
+        r'(\d+)', expand = False), errors = 'coerce').ffill()
+
+    # win/loss records (not listed on every season's page)
+    if 'W-L' in df_season.columns:
+        df_record = df_season['W-L'].str.extract(r'(\d+)\D+(\d+)')
+        df_season['W'] = pd.to_numeric(df_record[0], errors = 'coerce')
+        df_season['L'] = pd.to_numeric(df_record[1], errors = 'coerce')
+    else:
+        df_season['W'] = pd.NA
+        df_season['L'] = pd.NA
+
+    list_counts = ['G', 'Opp_Fum', 'Opp_Int', 'Opp_TO', 'Fum', 'Int', 'TO']
+    df_season[list_counts] = df_season[list_counts].apply(
+        lambda x: pd.to_numeric(x.str.replace(',', ''), errors = 'coerce'))
+    df_season['Margin'] = df_season['Opp_TO'] - df_season['TO']
+    df_season['Margin/G'] = df_season['Margin'] / df_season['G']
+
+    # rename teams
+    df_season = renameSchool(df_season, 'School')
+
+    return df_season[list(dict_turnover_types.keys())].astype(dict_turnover_types)
+
+def scrapeTurnoverRankings(list_years = None, path_cache = r'data/ncaa_rankings',
+                           path_pages = None, offline = False, refresh = False,
+                           max_workers = 4, min_interval = 1.0,
+                           path_sources = r'references/ncaa_ranking_pages.csv'):
+    '''
+    Purpose: Retrieve the typed turnover table for every season, scraping
+        only the seasons that are not already cached
+
+    Inputs
+    ------
+        list_years : list of ints
+            Seasons to retrieve (default: None = every season in
+            `path_sources`)
+        path_cache : string
+            Folder of cached seasons (`{year}.csv`)
+            (default: 'data/ncaa_rankings')
+        path_pages : string
+            Folder of saved ranking pages (see `fetchRankingPage`)
+            (default: None)
+        offline : boolean
+            Only read saved pages (default: False)
+        refresh : boolean
+            Scrape every season even if it is cached (default: False)
+        max_workers : int
+            Number of pages fetched at the same time (default: 4)
+        min_interval : float
+            Minimum number of seconds between requests to stats.ncaa.org
+            (default: 1.0)
+        path_sources : string
+            File path of the ranking page table
+            (default: 'references/ncaa_ranking_pages.csv')
+
+    Outputs
+    -------
+        df_turnovers : Pandas DataFrame
+            Typed turnover table for every season retrieved
+    '''
+    df_sources = pd.read_csv(path_sources)
+    if list_years is None:
+        list_years = sorted(df_sources['year'].unique())
+    for year in set(list_years) - set(df_sources['year']):
+        print(f'No ranking pages listed for {year} in {path_sources}')
+
+    # read cached seasons
+    dict_seasons = {}
+    for year in list_years:
+        path_year = os.path.join(path_cache, f'{year}.csv')
+        if not refresh and os.path.exists(path_year):
+            time_start = time.perf_counter()
+            dict_seasons[year] = pd.read_csv(path_year).astype(dict_turnover_types)
+            recordEvent('fetch', URL = path_year, Status = None,
+                        Bytes = os.path.getsize(path_year), Cache = 'hit',
+                        Seconds = time.perf_counter() - time_start)
+
+    # fetch and parse every page of the remaining seasons at the same time
+    df_sources = df_sources[df_sources['year'].isin(list_years) &
+                            ~df_sources['year'].isin(list(dict_seasons.keys()))]
+    session = createSession(max_workers)
+    dict_pages = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers = max_workers) as executor:
+        dict_futures = {executor.submit(fetchRankingPage, session, row, path_pages,
+                                        offline, min_interval):(row['year'], row['page'])
+                        for index, row in df_sources.iterrows()}
+        for future in concurrent.futures.as_completed(dict_futures):
+            year, page = dict_futures[future]
+            try:
+                dict_pages[(year, page)] = parseRankingPage(future.result())
+            except Exception as e:
+                print(f'Unable to retrieve {year} rankings (page {page}): {e}')
+
+    # build and cache every complete season
+    os.makedirs(path_cache, exist_ok = True)
+    for year, df_year in df_sources.groupby('year'):
+        list_keys = [(year, page) for page in df_year['page']]
+        if not all(x in dict_pages for x in list_keys):
+            continue
+        with timeStage('buildSeasonTable', Year = year) as stage:
+            dict_seasons[year] = buildSeasonTable(
+                pd.concat([dict_pages[x] for x in list_keys], ignore_index = True), year)
+            stage['Rows'] = len(dict_seasons[year])
+        dict_seasons[year].to_csv(os.path.join(path_cache, f'{year}.csv'), index = False)
+        print(f'Done with: {year} ({len(dict_seasons[year])} teams)')
+
+    list_seasons = [dict_seasons[x] for x in list_years if x in dict_seasons]
+    if len(list_seasons) == 0:
+        return pd.DataFrame(columns = list(dict_turnover_types.keys()))
+    return pd.concat(list_seasons, ignore_index = True)
+
+def fillMissingRecords(df_turnovers, df_results):
+    '''
+    Purpose: Fill in win/loss records for seasons whose ranking pages don't
+        list them (i.e. 2012)
+
+    Inputs
+    ------
+        df_turnovers : Pandas DataFrame
+            Typed turnover table
+        df_results : Pandas DataFrame
+            Contains `School`, `Year`, `W` and `L` with standardized school
+            names
+
+    Outputs
+    -------
+        df_turnovers : Pandas DataFrame
+            Turnover table with missing records filled in from `df_results`
+            (and then from `dict_record_fixes`)
+    '''
+    df_records = df_turnovers[['Year', 'School']].merge(
+        df_results[['Year', 'School', 'W', 'L']].drop_duplicates(['Year', 'School']),
+        how = 'left', on = ['Year', 'School'])
+    for stat in ['W', 'L']:
+        df_turnovers[stat] = df_turnovers[stat].fillna(
+            pd.Series(df_records[stat].to_numpy(), index = df_turnovers.index)
+            .astype('Int8'))
+
+    for (year, school), (wins, losses) in dict_record_fixes.items():
+        mask = ((df_turnovers['Year'] == year) & (df_turnovers['School'] == school)
+                & df_turnovers['W'].isna())
+        df_turnovers.loc[mask, 'W'] = wins
+        df_turnovers.loc[mask, 'L'] = losses
+
+    return df_turnovers
+
+def renderRankingPage(df_year):
+    '''
+    Purpose: Render a season of the typed turnover table in the layout of
+        the stats.ncaa.org ranking page (e.g. to create offline fixtures from
+        existing data)
+
+        Like the real page, `Avg` is rounded to 2 decimals. `buildSeasonTable`
+        recomputes `Margin/G` from `Margin` and `G`, so every column of a
+        rendered season parses back exactly except `Margin/G` of seasons
+        whose source value was itself rounded (e.g. 2012), which differs by
+        less than 0.005.
+
+    Inputs
+    ------
+        df_year : Pandas DataFrame
+            One season of the typed turnover table
+
+    Outputs
+    -------
+        page : string
+            HTML of the ranking page
+    '''
+    df_page = pd.DataFrame({'Rank':df_year['Rank'],
+                            'Team':(df_year['School'] + ' (' + df_year['Conf']
+                                    + ')').fillna(df_year['School']),
+                            'G':df_year['G']})
+    if df_year['W'].notna().all():
+        df_page['W-L'] = (df_year['W'].astype(int).astype(str) + '-'
+                          + df_year['L'].astype(int).astype(str))
+    df_page['Fum Rec'] = df_year['Opp_Fum']
+    df_page['Opp Int'] = df_year['Opp_Int']
+    df_page['Turn Gain'] = df_year['Opp_TO']
+    df_page['Fum Lost'] = df_year['Fum']
+    df_page['Int'] = df_year['Int']
+    df_page['Turn Lost'] = df_year['TO']
+    df_page['Margin'] = df_year['Margin']
+    df_page['Avg'] = df_year['Margin/G'].round(2)
+
+    return ('<html><body>' + df_page.to_html(index = False,
+                                             table_id = 'rankings_table')
+            + '</body></html>')
+
+def writeFixturePages(df_turnovers, path_pages):
+    '''
+    Purpose: Save every season of a turnover table as a ranking page for
+        use with `offline = True`
+
+    Inputs
+    ------
+        df_turnovers : Pandas DataFrame
+            Typed turnover table
+        path_pages : string
+            Folder in which to write `{year}_1.html` for every season
+
+    Outputs
+    -------
+        NONE
+    '''
+    os.makedirs(path_pages, exist_ok = True)
+    for year, df_year in df_turnovers.groupby('Year'):
+        with open(os.path.join(path_pages, f'{year}_1.html'), 'w',
+                  encoding = 'utf-8') as file:
+            file.write(renderRankingPage(df_year))
+
+def loadSeasonTables(path_tables = r'data/Nebraska_*.csv'):
+    '''
+    Purpose: Read the season tables saved before the rankings were scraped
+        (one `Nebraska_{year}.csv` per season, 2012 without `Margin`)
+
+    Inputs
+    ------
+        path_tables : string
+            Glob pattern of the season tables (default: 'data/Nebraska_*.csv')
+
+    Outputs
+    -------
+        df_turnovers : Pandas DataFrame
+            Typed turnover table for every saved season
+    '''
+    list_files = sorted(glob.glob(path_tables))
+    if len(list_files) == 0:
+        return pd.DataFrame(columns = list(dict_turnover_types.keys()))
+    df_turnovers = pd.concat([pd.read_csv(x) for x in list_files], ignore_index = True)
+    df_turnovers['Margin'] = df_turnovers['Opp_TO'] - df_turnovers['TO']
+
+    return df_turnovers[list(dict_turnover_types.keys())].astype(dict_turnover_types)
+
+def seedRankingPages(path_pages = r'data/ncaa_rankings/pages',
+                     path_tables = r'data/Nebraska_*.csv'):
+    '''
+    Purpose: Save every season of the saved season tables as a ranking page
+        (seasons that already have a saved page are left as-is), so that
+        `scrapeTurnoverRankings` doesn't request them
+
+    Inputs
+    ------
+        path_pages : string
+            Folder of saved ranking pages (default: 'data/ncaa_rankings/pages')
+        path_tables : string
+            Glob pattern of the season tables (default: 'data/Nebraska_*.csv')
+
+    Outputs
+    -------
+        list_years : list of ints
+            Seasons for which a page was written
+    '''
+    df_turnovers = loadSeasonTables(path_tables)
+    list_years = [int(year) for year in df_turnovers['Year'].unique() if not
+                  os.path.exists(os.path.join(path_pages, f'{year}_1.html'))]
+    writeFixturePages(df_turnovers[df_turnovers['Year'].isin(list_years)], path_pages)
+
+    return list_years
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Save the seasons on file as ranking pages (2012-2021 are then never requested)
+# seedRankingPages(r'data/ncaa_rankings/pages')
+
+# # Scrape every season (cached seasons are not requested again)
+# df_turnovers = scrapeTurnoverRankings(path_pages = r'data/ncaa_rankings/pages')
+
+# # Re-build every season from the saved pages only (no network access)
+# df_turnovers = scrapeTurnoverRankings(path_pages = r'data/ncaa_rankings/pages',
+#                                       offline = True, refresh = True)
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:55:35 2026
+
+@author: agent
+
+:DESCRIPTION: Write synthetic turnover margin ranking pages (in the layout
+    of the stats.ncaa.org pages, see `writeFixturePages`) at multiples of
+    the real data's size, and benchmark the turnover data pipeline on them:
+
+        - scrapeTurnoverRankings : saved ranking pages -> typed turnover
+                                   table (offline, every season re-parsed)
+        - fillMissingRecords     : records of the season without `W-L`
+        - computeTurnoverMetrics : league-relative metrics of every team
+                                   and season
+
+    Scale 1 matches the real data (10 seasons of ~130 FBS teams). Larger
+    scales add seasons (up to 50) and then teams. As in 2012, the first
+    season's page has no `W-L` column and its records are filled from a
+    synthetic team history (`data/team_history.csv`). Schools are listed
+    under their standard or an alternate name (standardized through the
+    synthetic `school_abbreviations` file like the real data).
+
+    Usage from the command line (run from the project root):
+        python src/synthetic_turnovers.py --scales 1 10 100 --output data/benchmarks/stages.csv
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import argparse
+import numpy as np
+import os
+import pandas as pd
+import sys
+
+# modules shared by every project (`huskerProjects/common`)
+path_common = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            os.pardir, os.pardir, 'common'))
+if path_common not in sys.path:
+    sys.path.append(path_common)
+
+from benchmark_stages import (benchmarkStages, plotScaling, summarizeScaling,
+                              writeSyntheticSchools)
+from scrape_turnovers import (dict_turnover_types, fillMissingRecords,
+                              scrapeTurnoverRankings, writeFixturePages)
+from turnover_metrics import computeTurnoverMetrics
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+# size of the real data
+real_seasons = 10
+real_teams   = 130
+last_season  = 2022
+
+# saved ranking pages of the synthetic project
+path_synthetic_pages = r'data/ncaa_rankings/pages'
+url_ranking_page = (r'https://stats.ncaa.org/rankings/national_ranking?academic_year={}.0'
+                    r'&division=11.0&sport_code=MFB&stat_seq=29.0')
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def getScaleSize(scale):
+    '''
+    Purpose: Number of seasons and teams of a synthetic project
+
+    Inputs
+    ------
+        scale : int
+            Multiple of the real data's size
+
+    Outputs
+    -------
+        seasons : int
+            Number of seasons (up to 50)
+        teams : int
+            Number of teams in every season
+    '''
+    seasons = min(real_seasons * scale, 50)
+
+    return seasons, round(real_teams * real_seasons * scale / seasons)
+
+def writeSyntheticProject(path_dir, scale = 1, seed = 0):
+    '''
+    Purpose: Write a synthetic project (ranking pages and their listing,
+        team history and school names) at a multiple of the real data's size
+
+    Inputs
+    ------
+        path_dir : string
+            Project root of the synthetic project
+        scale : int
+            Multiple of the real data's size (default: 1)
+        seed : int
+            Seed of the random number generator (default: 0)
+
+    Outputs
+    -------
+        rows : int
+            Number of team-seasons written
+    '''
+    rng = np.random.default_rng(seed)
+    seasons, teams = getScaleSize(scale)
+    df_schools = writeSyntheticSchools(path_dir, teams,
+                                       conference_size = 12, seed = seed)
+    array_names = np.stack([df_schools['Team'], df_schools['Name1'],
+                            df_schools['Name2']], axis = 1)
+
+    rows = seasons * teams
+    df = pd.DataFrame({'Year':np.repeat(np.arange(last_season - seasons, last_season), teams),
+                       'Team':np.tile(df_schools['Team'], seasons),
+                       'School':array_names[np.tile(np.arange(teams), seasons),
+                                            rng.integers(0, 3, rows)],
+                       'Conf':np.tile(df_schools['Conference'], seasons),
+                       'G':rng.integers(11, 15, rows)})
+    df['W'] = rng.binomial(df['G'], rng.random(rows))
+    df['L'] = df['G'] - df['W']
+    for stat, mean in [('Opp_Fum', 8), ('Opp_Int', 11), ('Fum', 8), ('Int', 11)]:
+        df[stat] = rng.poisson(mean, rows)
+    df['Opp_TO'] = df['Opp_Fum'] + df['Opp_Int']
+    df['TO'] = df['Fum'] + df['Int']
+    df['Margin'] = df['Opp_TO'] - df['TO']
+    df['Margin/G'] = df['Margin'] / df['G']
+    df['Rank'] = df.groupby('Year')['Margin/G'].rank(method = 'min', ascending = False)
+    df = df.sort_values(['Year', 'Rank'])
+
+    # the team history lists every record under the standard name, the
+    #   first season's page doesn't list records (like 2012)
+    os.makedirs(os.path.join(path_dir, 'data'), exist_ok = True)
+    df[['Team', 'Year', 'W', 'L']].rename(columns = {'Team':'School'}).to_csv(
+        os.path.join(path_dir, 'data', 'team_history.csv'), index = False)
+    df = df[list(dict_turnover_types.keys())].astype(dict_turnover_types)
+    df.loc[df['Year'] == df['Year'].min(), ['W', 'L']] = pd.NA
+
+    # saved pages and their listing (never requested, see `offline`)
+    writeFixturePages(df, os.path.join(path_dir, path_synthetic_pages))
+    list_years = sorted(df['Year'].unique())
+    pd.DataFrame({'year':list_years, 'page':1,
+                  'url':[url_ranking_page.format(year + 1) for year in list_years]}
+                 ).to_csv(os.path.join(path_dir, 'references', 'ncaa_ranking_pages.csv'),
+                          index = False)
+
+    return rows
+
+def parseSavedPages():
+    '''
+    Purpose: Re-build every season of the synthetic project from its saved
+        ranking pages (no network access)
+
+    Inputs
+    ------
+        NONE
+
+    Outputs
+    -------
+        df_turnovers : Pandas DataFrame
+            Typed turnover table for every season
+    '''
+    return scrapeTurnoverRankings(path_pages = path_synthetic_pages,
+                                  offline = True, refresh = True)
+
+def loadRecordInputs():
+    '''
+    Purpose: Input of `fillMissingRecords` (the cached turnover table and
+        the synthetic team history)
+
+    Inputs
+    ------
+        NONE
+
+    Outputs
+    -------
+        inputs : tuple
+            (df_turnovers, df_results)
+    '''
+    return (scrapeTurnoverRankings(path_pages = path_synthetic_pages, offline = True),
+            pd.read_csv(r'data/team_history.csv'))
+
+def loadMetricInputs():
+    '''
+    Purpose: Input of `computeTurnoverMetrics` (the turnover table with
+        records filled and win pct. added, as in `analyze_turnovers.py`)
+
+    Inputs
+    ------
+        NONE
+
+    Outputs
+    -------
+        inputs : tuple
+            (df,)
+    '''
+    df = fillMissingRecords(*loadRecordInputs())
+    df['Win_Pct'] = df['W'] / df['G']
+
+    return (df,)
+
+# stages of the turnover pipeline (run in order, see `benchmarkStages`)
+dict_pipeline_stages = {'scrapeTurnoverRankings':(None, parseSavedPages),
+                        'fillMissingRecords':(loadRecordInputs, fillMissingRecords),
+                        'computeTurnoverMetrics':(loadMetricInputs, computeTurnoverMetrics)}
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Write synthetic projects at 1x and 10x and benchmark the pipeline on both
+# dict_paths = {scale:rf'data/synthetic/scale_{scale}' for scale in [1, 10]}
+# for scale, path in dict_paths.items():
+#     writeSyntheticProject(path, scale)
+# df_stages = benchmarkStages(dict_pipeline_stages, dict_paths)
+# df_summary = summarizeScaling(df_stages)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description = 'Benchmark the turnover pipeline on synthetic data')
+    parser.add_argument('--scales', type = int, nargs = '+', default = [1, 10, 100],
+                        help = 'multiples of the real data size to benchmark')
+    parser.add_argument('--path', default = os.path.join('data', 'synthetic'),
+                        help = 'folder of the synthetic projects')
+    parser.add_argument('--repeat', type = int, default = 1,
+                        help = 'runs per stage (fastest is reported)')
+    parser.add_argument('--output', default = None,
+                        help = 'path of the .csv results (a .png of the '
+                               'scaling curves is saved alongside)')
+    args = parser.parse_args()
+
+    dict_paths = {}
+    for scale in args.scales:
+        dict_paths[scale] = os.path.join(args.path, f'scale_{scale}')
+        rows = writeSyntheticProject(dict_paths[scale], scale)
+        print(f'Wrote {rows:,} team-seasons at {scale}x to {dict_paths[scale]}')
+    df_stages = benchmarkStages(dict_pipeline_stages, dict_paths, args.repeat)
+
+    pd.set_option('display.width', 200)
+    print(df_stages.round(3).to_string(index = False))
+    print(summarizeScaling(df_stages).round(3).to_string(index = False))
+    if args.output is not None:
+        if os.path.dirname(args.output):
+            os.makedirs(os.path.dirname(args.output), exist_ok = True)
+        df_stages.to_csv(args.output, index = False)
+        plotScaling(df_stages, os.path.splitext(args.output)[0] + '.png')
+        print(f'Saved results to {args.output}')
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:01:33 2026
+
+@author: agent
+
+:DESCRIPTION: Compute league-relative turnover metrics for every FBS team in
+    every season of the turnover table (i.e. the output of
+    `scrapeTurnoverRankings` with `Win_Pct` added):
+
+        - per-game rates (e.g. `TO/G`)
+        - difference from the season average (e.g. `Margin_vs_Avg`)
+        - per-season z-scores and percentiles (e.g. `Margin_Z`, `Margin_Pctl`)
+        - the previous season's value (e.g. `Margin_Prev`)
+        - the regression to the mean from one season to the next (the slope
+          of this season's difference from average on last season's, 0 =
+          full regression to the mean, 1 = none) and the expected value
+          given last season's (e.g. `Margin_Exp`)
+
+    Every statistic comes from a groupby-transform over the whole table, so
+    all teams and seasons are computed in one pass and the result is indexed
+    by (School, Year) to answer "how far from average is Nebraska?" for any
+    team with a single lookup.
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+# counting stats to convert to per-game rates
+list_per_game_vars = ['Opp_Fum', 'Opp_Int', 'Opp_TO', 'Fum', 'Int', 'TO', 'Margin']
+
+# stats to compare against the league
+list_metric_vars = ['Margin', 'Margin/G', 'Opp_TO/G', 'TO/G', 'Win_Pct']
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def addPerGameStats(df, list_vars = list_per_game_vars):
+    '''
+    Purpose: Add a per-game rate for every counting stat
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Turnover table with a `G` variable
+        list_vars : list of strings
+            Counting stats to convert (default: `list_per_game_vars`)
+
+    Outputs
+    -------
+        df : Pandas DataFrame
+            Original DataFrame with `{var}/G` added for every variable
+    '''
+    df_rates = df[list_vars].astype(float).div(df['G'].astype(float), axis = 0)
+    df_rates.columns = [f'{var}/G' for var in list_vars]
+    df[df_rates.columns] = df_rates
+
+    return df
+
+def addSeasonRelativeStats(df, list_vars = list_metric_vars, season_var = 'Year'):
+    '''
+    Purpose: Compare every team to the rest of the league in the same season
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Turnover table
+        list_vars : list of strings
+            Stats to compare (default: `list_metric_vars`)
+        season_var : string
+            Name of the season variable (default: 'Year')
+
+    Outputs
+    -------
+        df : Pandas DataFrame
+            Original DataFrame with `{var}_Avg` (season average),
+            `{var}_vs_Avg` (difference from the average), `{var}_Z` (z-score)
+            and `{var}_Pctl` (percentile between 0 and 1) added for every
+            variable
+    '''
+    df_values = df[list_vars].astype(float)
+    grouped = df_values.groupby(df[season_var])
+    df_avg = grouped.transform('mean')
+    df_std = grouped.transform('std')
+    df_pct = grouped.rank(pct = True)
+
+    for var in list_vars:
+        df[f'{var}_Avg'] = df_avg[var]
+        df[f'{var}_vs_Avg'] = df_values[var] - df_avg[var]
+        df[f'{var}_Z'] = df[f'{var}_vs_Avg'] / df_std[var]
+        df[f'{var}_Pctl'] = df_pct[var]
+
+    return df
+
+def addYearOverYearStats(df, list_vars = list_metric_vars, team_var = 'School',
+                         season_var = 'Year'):
+    '''
+    Purpose: Add every team's previous season (where the team played in the
+        immediately preceding season) and estimate how much of a team's
+        difference from average carries over from one season to the next
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Output of `addSeasonRelativeStats`
+        list_vars : list of strings
+            Stats to compare (default: `list_metric_vars`)
+        team_var : string
+            Name of the team variable (default: 'School')
+        season_var : string
+            Name of the season variable (default: 'Year')
+
+    Outputs
+    -------
+        df : Pandas DataFrame
+            Original DataFrame sorted by team and season with `{var}_Prev`,
+            `{var}_RTM` (share of last season's difference from average
+            expected to carry over, estimated within each season) and
+            `{var}_Exp` (season average plus the carried over difference)
+            added for every variable
+        df_coef : Pandas DataFrame
+            Carry-over coefficients by season plus an 'All' row pooled over
+            every pair of consecutive seasons
+    '''
+    df = df.sort_values(by = [team_var, season_var]).reset_index(drop = True)
+    grouped = df.groupby(team_var)
+
+    # previous season only where the team played the season before
+    series_consecutive = grouped[season_var].shift() == df[season_var] - 1
+    list_dev = [f'{var}_vs_Avg' for var in list_vars]
+    df_prev = grouped[list_vars].shift().where(series_consecutive, axis = 0)
+    df_dev_prev = grouped[list_dev].shift().where(series_consecutive, axis = 0)
+
+    # least squares slope through the origin of this season's difference
+    #   from average on last season's
+    df_dev_prev.columns = list_vars
+    df_dev = df[list_dev].set_axis(list_vars, axis = 1)
+    df_cross = df_dev * df_dev_prev
+    df_square = df_dev_prev ** 2
+    df_square = df_square.where(df_cross.notna())
+    df_cross_season = df_cross.groupby(df[season_var]).transform('sum')
+    df_square_season = df_square.groupby(df[season_var]).transform('sum')
+    df_rtm = df_cross_season / df_square_season.where(df_square_season > 0)
+
+    for var in list_vars:
+        df[f'{var}_Prev'] = df_prev[var]
+        df[f'{var}_RTM'] = df_rtm[var]
+        df[f'{var}_Exp'] = df[f'{var}_Avg'] + df_rtm[var] * df_dev_prev[var]
+
+    # coefficients by season and pooled over all seasons
+    df_coef = (df_cross.groupby(df[season_var]).sum(min_count = 1)
+               / df_square.groupby(df[season_var]).sum(min_count = 1))
+    df_coef.loc['All'] = df_cross.sum() / df_square.sum()
+
+    return df, df_coef
+
+def computeTurnoverMetrics(df, list_vars = list_metric_vars, team_var = 'School',
+                           season_var = 'Year'):
+    '''
+    Purpose: Compute every league-relative turnover metric for every team
+        and season
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Turnover table with `Win_Pct` added
+        list_vars : list of strings
+            Stats to compare (default: `list_metric_vars`)
+        team_var : string
+            Name of the team variable (default: 'School')
+        season_var : string
+            Name of the season variable (default: 'Year')
+
+    Outputs
+    -------
+        df_metrics : Pandas DataFrame
+            Turnover table with every metric added, indexed by team and
+            season (sorted, so single-team lookups don't scan the table)
+        df_coef : Pandas DataFrame
+            Carry-over coefficients (see `addYearOverYearStats`)
+    '''
+    df_metrics = addPerGameStats(df.copy())
+    df_metrics = addSeasonRelativeStats(df_metrics, list_vars, season_var)
+    df_metrics, df_coef = addYearOverYearStats(df_metrics, list_vars, team_var,
+                                               season_var)
+
+    return df_metrics.set_index([team_var, season_var]).sort_index(), df_coef
+
+def lookupTeam(df_metrics, school, list_vars = ['Margin', 'Win_Pct'],
+               list_stats = ['', '_Avg', '_vs_Avg', '_Z', '_Pctl', '_Exp']):
+    '''
+    Purpose: Show how far a team is from the league average in every season
+
+    Inputs
+    ------
+        df_metrics : Pandas DataFrame
+            Output of `computeTurnoverMetrics`
+        school : string
+            Standardized school name (e.g. 'Nebraska')
+        list_vars : list of strings
+            Stats to show (default: ['Margin', 'Win_Pct'])
+        list_stats : list of strings
+            Metric suffixes to show for every stat ('' = the stat itself)
+            (default: ['', '_Avg', '_vs_Avg', '_Z', '_Pctl', '_Exp'])
+
+    Outputs
+    -------
+        df_team : Pandas DataFrame
+            One row per season for the team
+    '''
+    return df_metrics.loc[school, [f'{var}{stat}' for var in list_vars
+                                   for stat in list_stats]]
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Compute every metric for every team and season
+# df_metrics, df_coef = computeTurnoverMetrics(df)
+
+# # How far from average is Nebraska?
+# df_nebraska = lookupTeam(df_metrics, 'Nebraska')
+
+# # Teams furthest above average in turnover margin per game
+# df_best = df_metrics.sort_values(by = 'Margin/G_Z', ascending = False).head(10)
@@ -0,0 +1,495 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:17:54 2026
+
+@author: agent
+
+:DESCRIPTION: Plot turnover stats of every FBS team-season from 2012-2021,
+    highlighting Nebraska, and produce the same charts for every team.
+
+    Team reports draw everything the teams share (points, median lines,
+    axes, titles) once per process and cache the rendered canvas (only the
+    latest chart's, as a publish canvas is ~150 MB). Every
+    team's chart then restores that canvas and draws only the team's logos
+    and labels on top (matplotlib's blitting), and the teams are spread
+    across a process pool by `renderFigures`.
+
+    The plots live in their own module (rather than in `analyze_turnovers.py`)
+    so that `render_figures.py` can import them in worker processes without
+    running the analysis script.
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import math
+import matplotlib.pyplot as plt
+import numpy as np
+import os
+import sys
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.text import Text
+from PIL import Image
+
+# modules shared by every project (`huskerProjects/common`)
+path_common = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            os.pardir, os.pardir, 'common'))
+if path_common not in sys.path:
+    sys.path.append(path_common)
+
+from logo_atlas import LogoLayer, loadLogoAtlas, scatterLogos
+from render_figures import (capDpi, dict_render_profiles, findStaleOutputs,
+                            getHashPath, getOutputHash, getOutputPath,
+                            hashPlotData, list_default_profiles, renderFigures,
+                            saveFigure)
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+# charts available as team reports
+dict_report_plots = {
+    'win_pct':{'name':'turnover_stats_win_pct', 'x':'Margin', 'y':'Win_Pct',
+               'subtitle':'Winning Pct. vs. Turnover Margin',
+               'xlabel':'Turnover Margin', 'ylabel':'Win Pct.'},
+    'margin':{'name':'turnover_stats_margin', 'x':'TO', 'y':'Opp_TO',
+              'subtitle':'Turnovers Gained vs. Turnovers Lost',
+              'xlabel':'Turnovers', 'ylabel':'Opponent Turnovers'}}
+
+# variables the team reports are drawn from
+list_report_vars = ['Year', 'School', 'Margin', 'Win_Pct', 'TO', 'Opp_TO']
+
+# base layer last drawn by this process (see `getReportBase`; one at a time,
+#   i.e. at most two full-resolution canvases per process)
+dict_report_bases = {}
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def plotStatsWinPct(df, dict_atlas = None, list_profiles = list_default_profiles,
+                    force = False):
+    '''
+    Purpose: Plot win pct. vs. turnover margin for every team-season, with
+        Nebraska's seasons as logos
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Turnover table with `Win_Pct` and `Margin`
+        dict_atlas : dictionary
+            Output of `loadLogoAtlas` (default: None = load it)
+        list_profiles : list of strings
+            Render profiles to save (default: `list_default_profiles`, i.e.
+            1200 dpi .png and .pdf)
+        force : Boolean
+            Save every output even if its data and profile are unchanged
+            (default: False)
+
+    Outputs
+    -------
+        list_paths : list of strings
+            File paths of the outputs of every profile
+    '''
+    # Skip the plot if every output is up to date
+    name = 'turnover_stats_win_pct'
+    hash_data = hashPlotData('plotStatsWinPct', df[['School', 'Margin', 'Win_Pct']])
+    list_paths = [getOutputPath(name, x) for x in list_profiles]
+    list_stale = list_profiles if force else findStaleOutputs(
+        name, hash_data, list_profiles)
+    if len(list_stale) == 0:
+        return list_paths
+
+    # Load pre-scaled logos (memory-mapped, no PNG decoding)
+    if dict_atlas is None:
+        dict_atlas = loadLogoAtlas()
+
+    # Set font and background colour
+    # plt.rcParams.update({'font.family':'Avenir'})
+    bgcol = '#fafafa'
+
+    # Create initial plot
+    fig, ax = plt.subplots(figsize=(6, 4), dpi=1200)
+    fig.set_facecolor(bgcol)
+    ax.set_facecolor(bgcol)
+
+    # Change plot spines
+    ax.spines['right'].set_visible(False)
+    ax.spines['top'].set_visible(False)
+    ax.spines['left'].set_color('#ccc8c8')
+    ax.spines['bottom'].set_color('#ccc8c8')
+
+    # Change ticks
+    plt.tick_params(axis='x', labelsize=12, color='#ccc8c8')
+    plt.tick_params(axis='y', labelsize=12, color='#ccc8c8')
+
+    # Plot Nebraska's badges (composited by a single artist) and every other
+    #   team-season as a point
+    scatterLogos(ax, df['Margin'], df['Win_Pct'], df['School'], dict_atlas,
+                 zoom = .3, list_highlight = ['Nebraska'], s = 10, alpha = 0.5)
+        
+    # Ensure X-Axis are whole numbers
+    def round_down(m, n):
+        return m // n * n
+    def round_up(n):
+        return n + (5 - n) % 5
+    min_xaxis = round_down(math.floor(df['Margin'].min()),5)
+    max_xaxis = round_up(math.ceil(df['Margin'].max()))
+    # new_xaxis = range(min_xaxis, max_xaxis+5, 5)
+    # ax.set_xticks(list(new_xaxis))
+
+    # Set Y-Axis to traditional height values (i.e. 6'1" etc)
+    min_yaxis = math.floor(df['Win_Pct'].min())
+    max_yaxis = math.ceil(df['Win_Pct'].max())
+    new_yaxis = range(min_yaxis, max_yaxis+1)
+    new_yaxis = list(range(0, 10, 1))
+    new_yaxis = [x/10 for x in new_yaxis]
+                      
+    # ax.set_yticks(list(new_yaxis))
+    # yaxis_labels = [str(x) for x in new_yaxis]
+    # yaxis_labels = [str(math.floor(int(y)/12)) + '-' + str(int(y)%12) for y in yaxis_labels]
+    # ax.set_yticklabels(yaxis_labels)
+
+    # Add average lines
+    plt.hlines(df['Win_Pct'].median(), 
+               min_xaxis, 
+               max_xaxis, 
+               color='#c2c1c0')
+    plt.vlines(df['Margin'].median(), 
+               min_yaxis, 
+               max_yaxis, 
+               color='#c2c1c0')
+         
+    fig.text(.15,.98,'Turnovers in FBS 2012-2021',size=20)
+    fig.text(.15,.93,'Winning Pct. vs. Turnover Margin', size=12)
+
+    # Set Axis Labels
+    ax.set_xlabel('Tunover Margin.')
+    ax.set_ylabel('Win Pct.')
+
+    # Add Made by to bottom of image
+    fig.text(.68, .02, 'Created by @Stewmanji', size=8, color='#c2c1c0')
+
+    ## Save plot (only the outputs that are out of date)
+    saveFigure(fig, name, hash_data, list_stale)
+
+    return list_paths
+
+def plotStatsMargin(df, dict_atlas = None, list_profiles = list_default_profiles,
+                    force = False):
+    '''
+    Purpose: Plot turnovers gained vs. turnovers lost for every team-season,
+        with Nebraska's seasons as logos
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Turnover table with `TO` and `Opp_TO`
+        dict_atlas : dictionary
+            Output of `loadLogoAtlas` (default: None = load it)
+        list_profiles : list of strings
+            Render profiles to save (default: `list_default_profiles`, i.e.
+            1200 dpi .png and .pdf)
+        force : Boolean
+            Save every output even if its data and profile are unchanged
+            (default: False)
+
+    Outputs
+    -------
+        list_paths : list of strings
+            File paths of the outputs of every profile
+    '''
+    # Skip the plot if every output is up to date
+    name = 'turnover_stats_margin'
+    hash_data = hashPlotData('plotStatsMargin', df[['School', 'TO', 'Opp_TO']])
+    list_paths = [getOutputPath(name, x) for x in list_profiles]
+    list_stale = list_profiles if force else findStaleOutputs(
+        name, hash_data, list_profiles)
+    if len(list_stale) == 0:
+        return list_paths
+
+    # Load pre-scaled logos (memory-mapped, no PNG decoding)
+    if dict_atlas is None:
+        dict_atlas = loadLogoAtlas()
+
+    # Set font and background colour
+    # plt.rcParams.update({'font.family':'Avenir'})
+    bgcol = '#fafafa'
+
+    # Create initial plot
+    fig, ax = plt.subplots(figsize=(6, 4), dpi=1200)
+    fig.set_facecolor(bgcol)
+    ax.set_facecolor(bgcol)
+
+    # Change plot spines
+    ax.spines['right'].set_visible(False)
+    ax.spines['top'].set_visible(False)
+    ax.spines['left'].set_color('#ccc8c8')
+    ax.spines['bottom'].set_color('#ccc8c8')
+
+    # Change ticks
+    plt.tick_params(axis='x', labelsize=12, color='#ccc8c8')
+    plt.tick_params(axis='y', labelsize=12, color='#ccc8c8')
+
+    # Plot Nebraska's badges (composited by a single artist) and every other
+    #   team-season as a point
+    scatterLogos(ax, df['TO'], df['Opp_TO'], df['School'], dict_atlas,
+                 zoom = .3, list_highlight = ['Nebraska'], s = 10, alpha = 0.5)
+        
+    # Ensure X-Axis are whole numbers
+    def round_down(m, n):
+        return m // n * n
+    def round_up(n):
+        return n + (5 - n) % 5
+    min_xaxis = round_down(math.floor(df['TO'].min()),5)
+    max_xaxis = round_up(math.ceil(df['TO'].max()))
+    # new_xaxis = range(min_xaxis, max_xaxis+5, 5)
+    # ax.set_xticks(list(new_xaxis))
+
+    # Set Y-Axis to traditional height values (i.e. 6'1" etc)
+    min_yaxis = math.floor(df['Opp_TO'].min())
+    max_yaxis = math.ceil(df['Opp_TO'].max())
+    new_yaxis = range(min_yaxis, max_yaxis+1)
+    new_yaxis = list(range(0, 10, 1))
+    new_yaxis = [x/10 for x in new_yaxis]
+                      
+    # ax.set_yticks(list(new_yaxis))
+    # yaxis_labels = [str(x) for x in new_yaxis]
+    # yaxis_labels = [str(math.floor(int(y)/12)) + '-' + str(int(y)%12) for y in yaxis_labels]
+    # ax.set_yticklabels(yaxis_labels)
+
+    # Add average lines
+    plt.hlines(df['Opp_TO'].median(), 
+               min_xaxis, 
+               max_xaxis, 
+               color='#c2c1c0')
+    plt.vlines(df['TO'].median(), 
+               min_yaxis, 
+               max_yaxis, 
+               color='#c2c1c0')
+         
+    fig.text(.15,.98,'Turnovers in FBS 2012-2021',size=20)
+    fig.text(.15,.93,'Turnovers Gained vs. Turnovers Lost', size=12)
+
+    # Set Axis Labels
+    ax.set_xlabel('Turnovers')
+    ax.set_ylabel('Opponent Turnovers')
+
+    # Add Made by to bottom of image
+    fig.text(.68, .02, 'Created by @Stewmanji', size=8, color='#c2c1c0')
+
+    ## Save plot (only the outputs that are out of date)
+    saveFigure(fig, name, hash_data, list_stale)
+
+    return list_paths
+
+def getReportBase(df, plot, profile, hash_base):
+    '''
+    Purpose: Draw (or reuse from this process's cache) everything a team
+        report shares with every other team: all team-seasons as points,
+        median lines, axes, titles and labels
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Turnover table (see `list_report_vars`)
+        plot : string
+            Chart to draw (a key of `dict_report_plots`)
+        profile : string
+            Render profile (must be a .png profile)
+        hash_base : string
+            Hash of the data the base is drawn from (cache key)
+
+    Outputs
+    -------
+        dict_base : dictionary
+            Contains the figure ('fig'), axes ('ax'), team subtitle ('text'),
+            dpi ('dpi') and the rendered canvas to restore ('background')
+    '''
+    key = (plot, profile, hash_base)
+    if key in dict_report_bases:
+        return dict_report_bases[key]
+
+    # keep a single base per process (the tasks of a chart are consecutive)
+    dict_report_bases.clear()
+
+    dict_plot = dict_report_plots[plot]
+    bgcol = '#fafafa'
+
+    # figure outside of pyplot so it is never shown or closed by pyplot
+    fig = Figure(figsize=(6.5, 5))
+    FigureCanvasAgg(fig)
+    dpi = capDpi(fig, dict_render_profiles[profile]['dpi'],
+                 dict_render_profiles[profile]['max_pixels'])
+    fig.set_dpi(dpi)
+    ax = fig.add_subplot()
+    fig.subplots_adjust(left=.12, right=.96, top=.8, bottom=.12)
+    fig.set_facecolor(bgcol)
+    ax.set_facecolor(bgcol)
+
+    # Change plot spines
+    ax.spines['right'].set_visible(False)
+    ax.spines['top'].set_visible(False)
+    ax.spines['left'].set_color('#ccc8c8')
+    ax.spines['bottom'].set_color('#ccc8c8')
+
+    # Change ticks
+    ax.tick_params(axis='x', labelsize=12, color='#ccc8c8')
+    ax.tick_params(axis='y', labelsize=12, color='#ccc8c8')
+
+    # Every team-season as a point
+    ax.scatter(df[dict_plot['x']], df[dict_plot['y']], s = 10, alpha = 0.3,
+               color = '#8fb3d9')
+
+    # Add median lines
+    ax.axhline(df[dict_plot['y']].median(), color='#c2c1c0', zorder = 1)
+    ax.axvline(df[dict_plot['x']].median(), color='#c2c1c0', zorder = 1)
+
+    fig.text(.12,.92,'Turnovers in FBS 2012-2021',size=20)
+    text_team = fig.text(.12,.86,'', size=12, animated=True)
+
+    # Set Axis Labels
+    ax.set_xlabel(dict_plot['xlabel'])
+    ax.set_ylabel(dict_plot['ylabel'])
+
+    # Add Made by to bottom of image
+    fig.text(.74, .02, 'Created by @Stewmanji', size=8, color='#c2c1c0')
+
+    fig.canvas.draw()
+    dict_report_bases[key] = {'fig':fig, 'ax':ax, 'text':text_team, 'dpi':dpi,
+                              'background':fig.canvas.copy_from_bbox(fig.bbox)}
+
+    return dict_report_bases[key]
+
+def plotTeamReport(df, team, plot = 'win_pct', dict_atlas = None,
+                   profile = 'publish', path_dir = r'images/plots/teams',
+                   force = False):
+    '''
+    Purpose: Save one team's report chart: its seasons as logos (labelled
+        with the season) drawn over the cached base layer
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Turnover table (see `list_report_vars`)
+        team : string
+            Standardized school name
+        plot : string
+            Chart to draw (a key of `dict_report_plots`, default: 'win_pct')
+        dict_atlas : dictionary
+            Output of `loadLogoAtlas` (default: None = load it)
+        profile : string
+            Render profile, which must save a .png (default: 'publish')
+        path_dir : string
+            Folder of the reports (default: 'images/plots/teams')
+        force : Boolean
+            Save the chart even if its data are unchanged (default: False)
+
+    Outputs
+    -------
+        list_paths : list of strings
+            File path of the chart
+    '''
+    if dict_render_profiles[profile]['format'] != 'png':
+        raise ValueError(f'Team reports are rasters; profile {profile} is not')
+    dict_plot = dict_report_plots[plot]
+
+    # Skip the chart if it is up to date
+    name = f"{team}_{dict_plot['name']}"
+    hash_base = hashPlotData('getReportBase', df[list_report_vars])
+    hash_data = hashPlotData('plotTeamReport', hash_base, team, plot)
+    path = getOutputPath(name, profile, path_dir)
+    if not force and len(findStaleOutputs(name, hash_data, [profile], path_dir)) == 0:
+        return [path]
+
+    # Load pre-scaled logos (memory-mapped, no PNG decoding)
+    if dict_atlas is None:
+        dict_atlas = loadLogoAtlas()
+
+    dict_base = getReportBase(df, plot, profile, hash_base)
+    fig, ax = dict_base['fig'], dict_base['ax']
+    df_team = df[df['School'] == team]
+
+    # Restore the base layer and draw only the team's logos and labels
+    fig.canvas.restore_region(dict_base['background'])
+    ax.draw_artist(LogoLayer(ax, df_team[dict_plot['x']], df_team[dict_plot['y']],
+                             df_team['School'], dict_atlas, zoom = .3))
+    for index, row in df_team.iterrows():
+        text_year = Text(row[dict_plot['x']], row[dict_plot['y']], f"  '{row['Year'] % 100:02d}",
+                         size=7, color='#5f5e5d', va='center')
+        text_year.set_figure(fig)
+        text_year.set_transform(ax.transData)
+        text_year.set_clip_on(False)
+        ax.draw_artist(text_year)
+    dict_base['text'].set_text(f"{dict_plot['subtitle']}: {team}")
+    fig.draw_artist(dict_base['text'])
+
+    ## Save chart
+    os.makedirs(path_dir, exist_ok = True)
+    Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).save(
+        path, dpi = (dict_base['dpi'],) * 2)
+    os.makedirs(os.path.dirname(getHashPath(path)), exist_ok = True)
+    with open(getHashPath(path), 'w') as file:
+        file.write(getOutputHash(hash_data, profile))
+
+    return [path]
+
+def plotTeamReports(df, list_teams = None, list_plots = list(dict_report_plots),
+                    profile = 'publish', max_workers = None, force = False):
+    '''
+    Purpose: Save the report charts of every team on a process pool (every
+        worker draws a chart's base layer once for all of its teams)
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Turnover table (see `list_report_vars`)
+        list_teams : list of strings
+            Teams to report (default: None = every team in `df`)
+        list_plots : list of strings
+            Charts to draw (default: every key of `dict_report_plots`)
+        profile : string
+            Render profile, which must save a .png (default: 'publish')
+        max_workers : int
+            Number of processes (default: None = one per CPU)
+        force : Boolean
+            Save every chart even if its data are unchanged (default: False)
+
+    Outputs
+    -------
+        df_render : Pandas DataFrame
+            One row per chart (see `renderFigures`)
+        seconds_total : float
+            Wall time to save every chart
+    '''
+    if list_teams is None:
+        list_teams = sorted(df['School'].unique())
+
+    list_tasks = [{'name':f'{team} {plot}', 'func':plotTeamReport,
+                   'kwargs':{'team':team, 'plot':plot, 'profile':profile,
+                             'force':force},
+                   'shared':{'df':'df', 'dict_atlas':'dict_atlas'}}
+                  for plot in list_plots for team in list_teams]
+    try:
+        return renderFigures(list_tasks, {'df':df[list_report_vars]}, max_workers)
+    finally:
+        # free the base canvas when the charts were saved by this process
+        dict_report_bases.clear()
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Plot win pct. and turnovers gained/lost for every team-season
+# plotStatsWinPct(df)
+# plotStatsMargin(df)
+
+# # Quick low-resolution look (saved as `turnover_stats_win_pct_preview.png`)
+# plotStatsWinPct(df, list_profiles = ['preview'])
+
+# # One team's chart
+# plotTeamReport(df, 'Nebraska', plot = 'margin', profile = 'preview')
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:02:37 2026
+
+@author: agent
+
+:DESCRIPTION: Quantify the relationship between turnover margin and winning
+    percentage with bootstrap confidence intervals and permutation tests:
+
+        - the correlation and regression slope of `Win_Pct` on `Margin` for
+          every season and for all seasons combined
+        - a team's (e.g. Nebraska's) residual from each season's regression
+          line, i.e. how many more/fewer games it won than its turnover
+          margin would predict
+
+    Replicates are generated as blocks of index arrays (one row per
+    replicate) and every statistic is computed for the whole block at once
+    from per-season sums (`np.add.reduceat` over the season-sorted rows), so
+    there is no Python loop per replicate. Teams are resampled (bootstrap)
+    or win pcts shuffled (permutation) within each season. Blocks are
+    spread across a process pool, each with its own seed spawned from a
+    single seed so results are reproducible regardless of the number of
+    workers.
+
+    NOTE: the process pool requires the calling script to be guarded with
+        `if __name__ == '__main__':` on Windows.
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import concurrent.futures
+import numpy as np
+import pandas as pd
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+list_resample_stats = ['corr', 'slope', 'resid']
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def prepareResampleData(df, x_var = 'Margin', y_var = 'Win_Pct',
+                        group_var = 'Year', team_var = 'School',
+                        team = 'Nebraska'):
+    '''
+    Purpose: Convert the turnover table to season-sorted arrays for
+        resampling
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Turnover table with `Win_Pct` added
+        x_var : string
+            Name of the explanatory variable (default: 'Margin')
+        y_var : string
+            Name of the response variable (default: 'Win_Pct')
+        group_var : string
+            Name of the season variable (default: 'Year')
+        team_var : string
+            Name of the team variable (default: 'School')
+        team : string
+            Team whose residuals are computed (default: 'Nebraska')
+
+    Outputs
+    -------
+        dict_data : dictionary
+            Contains `x` and `y` (sorted by season, rows missing either value
+            dropped), the first row ('starts') and number of rows ('sizes')
+            of every season, the season labels ('groups'), the season of
+            every row ('codes') and the team's x and y in every season
+            ('team_x', 'team_y'; NaN where the team has no data)
+    '''
+    df = df[[group_var, team_var, x_var, y_var]].dropna()
+    df = df.sort_values(by = [group_var, team_var]).reset_index(drop = True)
+    array_groups, array_codes, array_sizes = np.unique(
+        df[group_var].to_numpy(), return_inverse = True, return_counts = True)
+
+    df_team = df[df[team_var] == team].set_index(group_var)
+    df_team = df_team.reindex(array_groups)
+
+    return {'x':df[x_var].to_numpy(dtype = float),
+            'y':df[y_var].to_numpy(dtype = float),
+            'starts':np.concatenate([[0], np.cumsum(array_sizes)[:-1]]),
+            'sizes':array_sizes,
+            'groups':array_groups,
+            'codes':array_codes,
+            'team_x':df_team[x_var].to_numpy(dtype = float),
+            'team_y':df_team[y_var].to_numpy(dtype = float)}
+
+def computeLinearStats(array_x, array_y, dict_data):
+    '''
+    Purpose: Compute the correlation, slope and team residual of every
+        season (and of all seasons combined) for a block of replicates
+
+    Inputs
+    ------
+        array_x : NumPy array
+            Explanatory values, one row per replicate (rows in season order)
+        array_y : NumPy array
+            Response values, one row per replicate (rows in season order)
+        dict_data : dictionary
+            Output of `prepareResampleData`
+
+    Outputs
+    -------
+        dict_stats : dictionary
+            Keys are `list_resample_stats`, values are arrays with one row
+            per replicate and one column per season followed by a column for
+            all seasons combined (the combined residual is the team's
+            average residual)
+    '''
+    array_x = np.atleast_2d(array_x)
+    array_y = np.atleast_2d(array_y)
+    starts = dict_data['starts']
+
+    # per-season sums, then all seasons combined
+    list_sums = [np.add.reduceat(x, starts, axis = 1) for x in
+                 [array_x, array_y, array_x * array_x, array_y * array_y,
+                  array_x * array_y]]
+    list_sums = [np.hstack([x, x.sum(axis = 1, keepdims = True)]) for x in list_sums]
+    sum_x, sum_y, sum_xx, sum_yy, sum_xy = list_sums
+    n = np.append(dict_data['sizes'], dict_data['sizes'].sum()).astype(float)
+
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        cov_xy = sum_xy - sum_x * sum_y / n
+        var_x = sum_xx - sum_x ** 2 / n
+        var_y = sum_yy - sum_y ** 2 / n
+        slope = cov_xy / var_x
+        corr = cov_xy / np.sqrt(var_x * var_y)
+
+        # team residual from each season's regression line
+        intercept = (sum_y - slope * sum_x) / n
+        resid = (dict_data['team_y'] - intercept[:, :-1]
+                 - slope[:, :-1] * dict_data['team_x'])
+    resid = np.hstack([resid, np.nanmean(resid, axis = 1, keepdims = True)
+                       if np.isfinite(resid).any() else
+                       np.full((len(resid), 1), np.nan)])
+
+    return {'corr':corr, 'slope':slope, 'resid':resid}
+
+def resampleBlock(dict_data, kind, n_reps, seed):
+    '''
+    Purpose: Generate and evaluate one block of replicates
+
+    Inputs
+    ------
+        dict_data : dictionary
+            Output of `prepareResampleData`
+        kind : string
+            'bootstrap' (resample teams with replacement within each season)
+            or 'permutation' (shuffle `y` within each season)
+        n_reps : int
+            Number of replicates in the block
+        seed : NumPy SeedSequence
+            Seed of the block
+
+    Outputs
+    -------
+        dict_stats : dictionary
+            Output of `computeLinearStats` for the block
+    '''
+    rng = np.random.default_rng(seed)
+    n_rows = len(dict_data['x'])
+    array_starts = dict_data['starts'][dict_data['codes']]
+    array_sizes = dict_data['sizes'][dict_data['codes']]
+
+    if kind == 'bootstrap':
+        # every position draws a row from its own season
+        array_index = array_starts + (rng.random((n_reps, n_rows))
+                                      * array_sizes).astype(int)
+        return computeLinearStats(dict_data['x'][array_index],
+                                  dict_data['y'][array_index], dict_data)
+
+    # sorting random keys offset by season shuffles rows within each season
+    array_keys = rng.random((n_reps, n_rows)) + dict_data['codes']
+    array_index = np.argsort(array_keys, axis = 1)
+    return computeLinearStats(np.broadcast_to(dict_data['x'], (n_reps, n_rows)),
+                              dict_data['y'][array_index], dict_data)
+
+def runResampling(dict_data, kind = 'bootstrap', n_reps = 100000,
+                  block_size = 1000, seed = 2022, max_workers = None):
+    '''
+    Purpose: Run all replicates in blocks across a process pool
+
+    Inputs
+    ------
+        dict_data : dictionary
+            Output of `prepareResampleData`
+        kind : string
+            'bootstrap' or 'permutation' (default: 'bootstrap')
+        n_reps : int
+            Total number of replicates (default: 100000)
+        block_size : int
+            Replicates per block, which bounds memory use at roughly
+            block_size x rows x 8 bytes per array (default: 1000)
+        seed : int
+            Seed from which every block's seed is spawned (default: 2022)
+        max_workers : int
+            Number of processes (default: None = one per CPU; 1 = run in
+            the current process)
+
+    Outputs
+    -------
+        dict_reps : dictionary
+            Keys are `list_resample_stats`, values are arrays with one row
+            per replicate (see `computeLinearStats`)
+    '''
+    list_sizes = [block_size] * (n_reps // block_size)
+    if n_reps % block_size > 0:
+        list_sizes.append(n_reps % block_size)
+    list_seeds = np.random.SeedSequence(seed).spawn(len(list_sizes))
+    list_args = [(dict_data, kind, size, seed_block)
+                 for size, seed_block in zip(list_sizes, list_seeds)]
+
+    if max_workers == 1:
+        list_blocks = [resampleBlock(*args) for args in list_args]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers = max_workers) as executor:
+            list_blocks = list(executor.map(resampleBlock, *zip(*list_args)))
+
+    return {stat:np.vstack([x[stat] for x in list_blocks])
+            for stat in list_resample_stats}
+
+def summarizeResampling(df, team = 'Nebraska', n_reps = 100000, alpha = 0.05,
+                        seed = 2022, max_workers = None, **kwargs):
+    '''
+    Purpose: Estimate the correlation and slope of win pct on turnover margin
+        and a team's residual, with bootstrap confidence intervals and
+        permutation p-values, for every season and all seasons combined
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            Turnover table with `Win_Pct` added
+        team : string
+            Team whose residuals are computed (default: 'Nebraska')
+        n_reps : int
+            Number of bootstrap and of permutation replicates
+            (default: 100000)
+        alpha : float
+            Confidence intervals cover 1 - alpha (default: 0.05)
+        seed : int
+            Seed of the resampling (default: 2022)
+        max_workers : int
+            Number of processes (default: None = one per CPU)
+        **kwargs
+            Passed on to `prepareResampleData` (e.g. `x_var`, `y_var`)
+
+    Outputs
+    -------
+        df_summary : Pandas DataFrame
+            One row per season plus 'All' with the observed value of every
+            statistic (`corr`, `slope`, `resid`), its confidence interval
+            (`{stat}_Low`, `{stat}_High`) and, for `corr` and `slope`, the
+            two-sided permutation p-value (`{stat}_P`)
+    '''
+    dict_data = prepareResampleData(df, team = team, **kwargs)
+    dict_obs = computeLinearStats(dict_data['x'], dict_data['y'], dict_data)
+    dict_boot = runResampling(dict_data, 'bootstrap', n_reps, seed = seed,
+                              max_workers = max_workers)
+    dict_perm = runResampling(dict_data, 'permutation', n_reps, seed = seed + 1,
+                              max_workers = max_workers)
+
+    df_summary = pd.DataFrame(index = list(dict_data['groups']) + ['All'])
+    for stat in list_resample_stats:
+        df_summary[stat] = dict_obs[stat][0]
+        df_summary[f'{stat}_Low'] = np.nanquantile(dict_boot[stat], alpha / 2, axis = 0)
+        df_summary[f'{stat}_High'] = np.nanquantile(dict_boot[stat], 1 - alpha / 2, axis = 0)
+        if stat != 'resid':
+            # share of shuffles at least as extreme as observed (plus one)
+            array_extreme = np.abs(dict_perm[stat]) >= np.abs(dict_obs[stat])
+            df_summary[f'{stat}_P'] = (array_extreme.sum(axis = 0) + 1) / (n_reps + 1)
+
+    return df_summary
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# if __name__ == '__main__':
+#     # Correlation/slope of win pct on turnover margin and Nebraska's residual
+#     df_summary = summarizeResampling(df, team = 'Nebraska', n_reps = 100000)
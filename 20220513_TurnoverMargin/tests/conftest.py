@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:11:30 2026
+
+@author: agent
+
+:DESCRIPTION: Make the project's `src` modules importable by the tests
+    along with the modules shared by every project in `common` (the modules
+    import each other by their bare module name), and provide a fixture that
+    runs a test from the project root along with the plot fixtures shared
+    by every project (`common/tests/plot_fixtures.py`).
+
+:REQUIRES: pytest
+
+:TODO: NONE
+"""
+
+import os
+import pytest
+import sys
+
+path_project = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(path_project, 'src'))
+sys.path.append(os.path.join(path_project, '..', 'common'))
+sys.path.append(os.path.join(path_project, '..', 'common', 'tests'))
+
+from plot_fixtures import dict_atlas
+
+@pytest.fixture
+def project_root(monkeypatch):
+    '''
+    Run a test from the project root (modules read `references/` and `data/`
+    relative to it)
+    '''
+    monkeypatch.chdir(path_project)
+    return path_project
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:11:30 2026
+
+@author: agent
+
+:DESCRIPTION: Check that the season tables on file survive a round trip
+    through rendered ranking pages (`seedRankingPages`) and the ranking page
+    parser (`scrapeTurnoverRankings` offline), and that a page in the 2012
+    layout is mapped to the same columns with its records filled in.
+
+:REQUIRES: pytest
+
+:TODO: NONE
+"""
+
+import os
+import pandas as pd
+
+from scrape_turnovers import (buildSeasonTable, dict_record_fixes, fillMissingRecords,
+                              loadSeasonTables, parseRankingPage,
+                              scrapeTurnoverRankings, seedRankingPages)
+
+def test_saved_seasons_round_trip(project_root, tmp_path):
+    df_expected = loadSeasonTables(r'data/Nebraska_*.csv')
+    path_pages = str(tmp_path / 'pages')
+    list_years = seedRankingPages(path_pages, r'data/Nebraska_*.csv')
+    assert sorted(list_years) == sorted(df_expected['Year'].unique())
+
+    # saved pages are left as-is
+    assert seedRankingPages(path_pages, r'data/Nebraska_*.csv') == []
+
+    df = scrapeTurnoverRankings(path_cache = str(tmp_path / 'cache'),
+                                path_pages = path_pages, offline = True)
+    list_keys = ['Year', 'Rank', 'School']
+    df = df.sort_values(list_keys).reset_index(drop = True)
+    df_expected = df_expected.sort_values(list_keys).reset_index(drop = True)
+
+    # every column but `Margin/G` parses back exactly
+    list_exact = [x for x in df.columns if x != 'Margin/G']
+    pd.testing.assert_frame_equal(df[list_exact], df_expected[list_exact])
+
+    # `Margin/G` is recomputed: exact where the source was (2013+) and within
+    #   the page's rounding where it wasn't (2012)
+    series_diff = (df['Margin/G'] - df_expected['Margin/G']).abs()
+    assert (series_diff[df['Year'] > 2012] < 1e-12).all()
+    assert (series_diff < 0.005).all()
+    assert ((df['Margin/G'] - df['Margin'] / df['G']).abs() < 1e-12).all()
+
+def test_cached_seasons_match_parsed(project_root, tmp_path):
+    path_pages = str(tmp_path / 'pages')
+    seedRankingPages(path_pages, r'data/Nebraska_*.csv')
+    df_parsed = scrapeTurnoverRankings(path_cache = str(tmp_path / 'cache'),
+                                       path_pages = path_pages, offline = True)
+    df_cached = scrapeTurnoverRankings(path_cache = str(tmp_path / 'cache'),
+                                       path_pages = path_pages, offline = True)
+    assert len(os.listdir(tmp_path / 'cache')) == df_parsed['Year'].nunique()
+    pd.testing.assert_frame_equal(df_cached, df_parsed)
+
+def test_2012_layout(project_root):
+    # 2012 layout: `Turnovers Gained/Lost`, interceptions gained and lost
+    #   both listed as `Int` and no `W-L` column
+    list_headers = ['Rank', 'Team', 'G', 'Fum Rec', 'Int', 'Turnovers Gained',
+                    'Fum Lost', 'Int', 'Turnovers Lost', 'Margin', 'Avg']
+    list_rows = [['1', 'Oregon (Pac-12)', '13', '18', '22', '40', '8', '6', '14', '26', '2.00'],
+                 ['-', 'Nebraska (Big Ten)', '14', '11', '12', '23', '17', '11', '28', '-5', '-0.36'],
+                 ['120', 'Idaho (WAC)', '12', '5', '6', '11', '9', '14', '23', '-12', '-1.00']]
+    page = ('<html><body><table><thead><tr>'
+            + ''.join(f'<th>{x}</th>' for x in list_headers) + '</tr></thead><tbody>'
+            + ''.join('<tr>' + ''.join(f'<td>{x}</td>' for x in row) + '</tr>'
+                      for row in list_rows)
+            + '</tbody></table></body></html>')
+
+    df_page = parseRankingPage(page)
+    assert list(df_page.columns) == ['Rank', 'Team', 'G', 'Opp_Fum', 'Opp_Int',
+                                     'Opp_TO', 'Fum', 'Int', 'TO', 'Margin', 'Margin/G']
+
+    df = buildSeasonTable(df_page, 2012).set_index('School')
+    assert list(df.index) == ['Oregon', 'Nebraska', 'Idaho']
+    assert list(df['Rank']) == [1, 1, 120]
+    assert df.loc['Nebraska', ['Opp_Int', 'Opp_TO', 'Int', 'TO']].tolist() == [12, 23, 11, 28]
+    assert df.loc['Nebraska', 'Margin'] == -5
+    assert df['W'].isna().all() and df['L'].isna().all()
+
+    # records from the results data, then from `dict_record_fixes` (Idaho)
+    df_results = pd.DataFrame({'Year':[2012, 2012, 2011],
+                               'School':['Oregon', 'Nebraska', 'Idaho'],
+                               'W':[12, 10, 2], 'L':[1, 4, 10]})
+    df = fillMissingRecords(df.reset_index(), df_results).set_index('School')
+    assert df.loc['Oregon', ['W', 'L']].tolist() == [12, 1]
+    assert df.loc['Nebraska', ['W', 'L']].tolist() == [10, 4]
+    assert df.loc['Idaho', ['W', 'L']].tolist() == list(dict_record_fixes[(2012, 'Idaho')])
+    assert str(df['W'].dtype) == 'Int8'
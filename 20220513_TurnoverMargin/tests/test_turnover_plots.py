@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:15:31 2026
+
+@author: agent
+
+:DESCRIPTION: Check the median lines of the turnover charts and that team
+    reports keep at most one base layer per process.
+
+:REQUIRES: pytest
+
+:TODO: NONE
+"""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.collections import LineCollection
+
+import turnover_plots
+from turnover_plots import plotStatsMargin, plotTeamReport, plotTeamReports
+
+@pytest.fixture
+def df_turnovers():
+    rng = np.random.default_rng(0)
+    list_schools = ['Nebraska', 'Iowa', 'Ohio State', 'Purdue']
+    df = pd.DataFrame({'Year':np.repeat(np.arange(2012, 2022), len(list_schools)),
+                       'School':list_schools * 10})
+    df['TO'] = rng.integers(5, 20, len(df))
+    df['Opp_TO'] = rng.integers(20, 35, len(df))
+    df['Margin'] = df['Opp_TO'] - df['TO']
+    df['Win_Pct'] = rng.random(len(df))
+    return df
+
+@pytest.fixture
+def dict_atlas(dict_atlas):
+    '''
+    Shared logo atlas (see `plot_fixtures`), clearing the report base layers
+    kept by the tests
+    '''
+    yield dict_atlas
+    turnover_plots.dict_report_bases.clear()
+
+def test_margin_median_lines(df_turnovers, dict_atlas):
+    plotStatsMargin(df_turnovers, dict_atlas, list_profiles = ['preview'])
+    ax = plt.gcf().axes[0]
+    list_segments = [collection.get_segments()[0] for collection in ax.collections
+                     if isinstance(collection, LineCollection)]
+    list_h = [x for x in list_segments if x[0][1] == x[1][1]]
+    list_v = [x for x in list_segments if x[0][0] == x[1][0]]
+    # x is turnovers (TO), y is opponent turnovers (Opp_TO)
+    assert [x[0][1] for x in list_h] == [df_turnovers['Opp_TO'].median()]
+    assert [x[0][0] for x in list_v] == [df_turnovers['TO'].median()]
+
+def test_report_keeps_one_base(df_turnovers, dict_atlas):
+    for plot in ['win_pct', 'margin']:
+        plotTeamReport(df_turnovers, 'Nebraska', plot, dict_atlas, profile = 'preview')
+        assert [key[0] for key in turnover_plots.dict_report_bases] == [plot]
+
+    plotTeamReports(df_turnovers, ['Nebraska', 'Iowa'], profile = 'preview',
+                    max_workers = 1, force = True)
+    assert turnover_plots.dict_report_bases == {}
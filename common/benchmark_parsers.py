@@ -0,0 +1,346 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:40:25 2026
+
+@author: agent
+
+:DESCRIPTION: Benchmark the page parsers on a set of saved pages (no
+    network access) so parser changes can be compared against a stored
+    baseline run.
+
+    A page set is a folder of saved pages listed in `pages.csv` (file name,
+    page layout and the keyword arguments of the layout's clean step). Page
+    sets are created with `recordPages` (fetch real pages once and save
+    them as-is) or with the parser module's `writeFixturePages` (render
+    existing data into every layout). The layouts and their extract/clean
+    steps come from the project's parser module (`dict_page_parsers` of
+    e.g. `results_parsers.py` or `draft_parsers.py`).
+
+    Every page is timed in three phases:
+        - html    : BeautifulSoup parse of the page
+        - extract : finding the table(s) and converting them to DataFrames
+        - cleanup : turning the raw DataFrames into the output table
+
+    For every layout the benchmark reports pages/s, rows/s, seconds per
+    phase (best of `repeat` runs) and the peak memory allocated while
+    parsing (measured in a separate, untimed run with tracemalloc, which
+    does not see memory allocated inside lxml). Results are saved as JSON
+    and can be compared to a baseline file with `compareBenchmark`.
+
+    Usage from the command line (run from the project root):
+        python ../common/benchmark_parsers.py results_parsers --fixtures --output data/benchmarks/baseline.json
+        python ../common/benchmark_parsers.py results_parsers --baseline data/benchmarks/baseline.json
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import argparse
+import bs4
+import datetime
+import importlib
+import json
+import os
+import pandas as pd
+import platform
+import requests
+import sys
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+from requests.packages.urllib3.util.retry import Retry
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+# timed phases of every page
+list_benchmark_phases = ['HTML', 'Extract', 'Cleanup']
+
+# columns compared against a baseline run
+list_compare_cols = ['Seconds', 'Seconds_HTML', 'Seconds_Extract',
+                     'Seconds_Cleanup', 'Peak_MB']
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def recordPages(df_pages, path_pages, min_interval = 1.0):
+    '''
+    Purpose: Fetch pages once and save them as-is to create a page set
+
+    Inputs
+    ------
+        df_pages : Pandas DataFrame
+            One row per page with its file name (`File`), layout (`Parser`),
+            address (`URL`) and keyword arguments of its clean step
+            (`Context`, JSON)
+        path_pages : string
+            Folder in which to save the pages and `pages.csv`
+        min_interval : float
+            Seconds between requests (default: 1.0)
+
+    Outputs
+    -------
+        df_pages : Pandas DataFrame
+            Pages saved, with the HTTP status (`Status`) of every page
+    '''
+    session = requests.Session()
+    retry = Retry(connect=3, backoff_factor=0.5)
+    adapter = requests.adapters.HTTPAdapter(max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    os.makedirs(path_pages, exist_ok = True)
+    df_pages = df_pages.copy()
+    list_status = []
+    for row in df_pages.itertuples(index = False):
+        r = session.get(row.URL, timeout = 30)
+        with open(os.path.join(path_pages, row.File), 'wb') as file:
+            file.write(r.content)
+        list_status.append(r.status_code)
+        time.sleep(min_interval)
+    df_pages['Status'] = list_status
+    df_pages.to_csv(os.path.join(path_pages, 'pages.csv'), index = False)
+
+    return df_pages
+
+def loadPages(path_pages, list_parsers = None):
+    '''
+    Purpose: Read a page set into memory
+
+    Inputs
+    ------
+        path_pages : string
+            Folder containing the pages and `pages.csv`
+        list_parsers : list of strings
+            Page layouts to read (default: None = all)
+
+    Outputs
+    -------
+        list_pages : list of dictionaries
+            Contains the file name ('File'), layout ('Parser'), clean step
+            arguments ('Context') and contents ('Content', bytes) of every
+            page
+    '''
+    df_pages = pd.read_csv(os.path.join(path_pages, 'pages.csv'),
+                           keep_default_na = False)
+    if list_parsers is not None:
+        df_pages = df_pages[df_pages['Parser'].isin(list_parsers)]
+
+    list_pages = []
+    for row in df_pages.itertuples(index = False):
+        with open(os.path.join(path_pages, row.File), 'rb') as file:
+            list_pages.append({'File':row.File, 'Parser':row.Parser,
+                               'Context':json.loads(row.Context or '{}'),
+                               'Content':file.read()})
+
+    return list_pages
+
+def parsePages(list_pages, dict_parsers):
+    '''
+    Purpose: Parse every page and time its phases
+
+    Inputs
+    ------
+        list_pages : list of dictionaries
+            Output of `loadPages`
+        dict_parsers : dictionary
+            Extract/clean steps of every layout (the parser module's
+            `dict_page_parsers`)
+
+    Outputs
+    -------
+        df_times : Pandas DataFrame
+            One row per page with its seconds per phase and rows parsed
+    '''
+    list_times = []
+    for page in list_pages:
+        extract, clean = dict_parsers[page['Parser']]
+        time_start = time.perf_counter()
+        soup = BeautifulSoup(page['Content'], 'html.parser')
+        time_html = time.perf_counter()
+        list_tables = extract(soup)
+        time_extract = time.perf_counter()
+        df_page = clean(list_tables, **page['Context'])
+        time_cleanup = time.perf_counter()
+        list_times.append({'File':page['File'], 'Parser':page['Parser'],
+                           'Bytes':len(page['Content']), 'Rows':len(df_page),
+                           'Seconds_HTML':time_html - time_start,
+                           'Seconds_Extract':time_extract - time_html,
+                           'Seconds_Cleanup':time_cleanup - time_extract})
+
+    return pd.DataFrame(list_times)
+
+def benchmarkParsers(path_pages, dict_parsers, list_parsers = None, repeat = 3):
+    '''
+    Purpose: Benchmark every page layout on a page set
+
+    Inputs
+    ------
+        path_pages : string
+            Folder containing the pages and `pages.csv`
+        dict_parsers : dictionary
+            Extract/clean steps of every layout (the parser module's
+            `dict_page_parsers`)
+        list_parsers : list of strings
+            Page layouts to benchmark (default: None = all in the page set)
+        repeat : int
+            Timed runs over the pages of every layout; the fastest run is
+            reported (default: 3)
+
+    Outputs
+    -------
+        df_bench : Pandas DataFrame
+            One row per layout with its pages, rows, megabytes of HTML,
+            seconds per phase and in total, pages/s, rows/s and peak
+            megabytes allocated
+    '''
+    list_pages = loadPages(path_pages, list_parsers)
+
+    list_bench = []
+    for parser in pd.unique(pd.Series([page['Parser'] for page in list_pages])):
+        list_parser_pages = [page for page in list_pages if page['Parser'] == parser]
+
+        # fastest of the timed runs
+        df_best = None
+        for run in range(repeat):
+            df_times = parsePages(list_parser_pages, dict_parsers)
+            if (df_best is None or df_times.filter(like = 'Seconds').sum().sum()
+                    < df_best.filter(like = 'Seconds').sum().sum()):
+                df_best = df_times
+
+        # peak memory of a separate run (tracemalloc slows parsing down)
+        tracemalloc.start()
+        parsePages(list_parser_pages, dict_parsers)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        dict_bench = {'Parser':parser, 'Pages':len(df_best),
+                      'Rows':int(df_best['Rows'].sum()),
+                      'MB':df_best['Bytes'].sum() / 1e6}
+        for phase in list_benchmark_phases:
+            dict_bench[f'Seconds_{phase}'] = df_best[f'Seconds_{phase}'].sum()
+        dict_bench['Seconds'] = sum(dict_bench[f'Seconds_{phase}']
+                                    for phase in list_benchmark_phases)
+        dict_bench['Pages_Per_Sec'] = dict_bench['Pages'] / dict_bench['Seconds']
+        dict_bench['Rows_Per_Sec'] = dict_bench['Rows'] / dict_bench['Seconds']
+        dict_bench['Peak_MB'] = peak / 1e6
+        list_bench.append(dict_bench)
+
+    return pd.DataFrame(list_bench)
+
+def saveBenchmark(df_bench, path, path_pages = None):
+    '''
+    Purpose: Save benchmark results (and the versions they were run with)
+        as JSON
+
+    Inputs
+    ------
+        df_bench : Pandas DataFrame
+            Output of `benchmarkParsers`
+        path : string
+            File path of the .json file
+        path_pages : string
+            Folder of the page set benchmarked (default: None)
+
+    Outputs
+    -------
+        NONE
+    '''
+    dict_run = {'Created':datetime.datetime.now().isoformat(timespec = 'seconds'),
+                'Pages':path_pages,
+                'Python':platform.python_version(),
+                'Pandas':pd.__version__,
+                'BeautifulSoup':bs4.__version__,
+                'Results':df_bench.to_dict(orient = 'records')}
+
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+    with open(path, 'w') as file:
+        json.dump(dict_run, file, indent = 2)
+
+def compareBenchmark(df_bench, path_baseline):
+    '''
+    Purpose: Compare benchmark results to a saved baseline run
+
+    Inputs
+    ------
+        df_bench : Pandas DataFrame
+            Output of `benchmarkParsers`
+        path_baseline : string
+            File path of a .json file saved by `saveBenchmark`
+
+    Outputs
+    -------
+        df_compare : Pandas DataFrame
+            One row per layout with the baseline and current value and the
+            ratio (current / baseline, below 1 = faster/smaller) of every
+            compared column
+    '''
+    with open(path_baseline, 'r') as file:
+        df_baseline = pd.DataFrame(json.load(file)['Results'])
+
+    df_compare = df_baseline[['Parser'] + list_compare_cols].merge(
+        df_bench[['Parser'] + list_compare_cols], on = 'Parser', how = 'outer',
+        suffixes = ('_Baseline', ''))
+    for col in list_compare_cols:
+        df_compare[f'{col}_Ratio'] = df_compare[col] / df_compare[f'{col}_Baseline']
+
+    return df_compare
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Create a page set from the existing data and save a baseline run
+# from results_parsers import dict_page_parsers, writeFixturePages
+# writeFixturePages(r'data/benchmark_pages')
+# df_bench = benchmarkParsers(r'data/benchmark_pages', dict_page_parsers)
+# saveBenchmark(df_bench, r'data/benchmarks/baseline.json', r'data/benchmark_pages')
+
+# # After changing a parser, compare against the baseline
+# df_compare = compareBenchmark(benchmarkParsers(r'data/benchmark_pages', dict_page_parsers),
+#                               r'data/benchmarks/baseline.json')
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description = 'Benchmark the page parsers on saved pages')
+    parser.add_argument('module',
+                        help = 'parser module of the project (e.g. results_parsers)')
+    parser.add_argument('--src', default = 'src',
+                        help = 'folder of the project\'s modules')
+    parser.add_argument('--pages', default = os.path.join('data', 'benchmark_pages'),
+                        help = 'folder of the page set (with pages.csv)')
+    parser.add_argument('--fixtures', action = 'store_true',
+                        help = 'first render the page set from the existing data')
+    parser.add_argument('--parsers', nargs = '+', default = None,
+                        help = 'page layouts to benchmark (default: all)')
+    parser.add_argument('--repeat', type = int, default = 3,
+                        help = 'timed runs per layout (fastest is reported)')
+    parser.add_argument('--output', default = None,
+                        help = 'path of the .json results')
+    parser.add_argument('--baseline', default = None,
+                        help = 'path of a .json baseline run to compare to')
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.abspath(args.src))
+    module_parsers = importlib.import_module(args.module)
+    if args.fixtures:
+        module_parsers.writeFixturePages(args.pages)
+    df_bench = benchmarkParsers(args.pages, module_parsers.dict_page_parsers,
+                                args.parsers, args.repeat)
+
+    pd.set_option('display.width', 200)
+    print(df_bench.round(4).to_string(index = False))
+    if args.output is not None:
+        saveBenchmark(df_bench, args.output, args.pages)
+        print(f'Saved results to {args.output}')
+    if args.baseline is not None:
+        df_compare = compareBenchmark(df_bench, args.baseline)
+        print(df_compare[['Parser'] + [f'{col}_Ratio' for col in list_compare_cols]]
+              .round(3).to_string(index = False))
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:55:35 2026
+
+@author: agent
+
+:DESCRIPTION: Time the stages of a data pipeline on synthetic projects of
+    increasing size and report how every stage scales.
+
+    A pipeline is a dictionary of stages (`{name: (setup, func)}`, run in
+    order). Every stage is measured in a fresh process that changes to the
+    project root, runs `setup()` (untimed, e.g. to load the stage's input)
+    and then runs `func(*inputs)`. For every stage and project the
+    benchmark reports:
+
+        - Seconds     : wall time of the stage (fastest of `repeat` runs)
+        - CPU_Seconds : CPU time of the stage
+        - Base_RSS_MB : resident memory of the process before the stage
+                        (imports and setup)
+        - Peak_RSS_MB : peak resident memory of the process during the stage
+        - Rows        : rows of the stage's output (if it returns a table)
+
+    On Linux the peak is reset after setup; elsewhere the peak of a stage
+    can't be told apart from a higher peak during imports and setup.
+
+    Synthetic projects are written by the `synthetic_*.py` modules, which
+    also define each project's pipeline and run the benchmark from the
+    command line, with the school names of every synthetic project written
+    by `writeSyntheticSchools`. `summarizeScaling` fits the exponent of every stage's
+    scaling curve (1 = linear in the size of the data).
+
+:REQUIRES: See Package Import section for required packages
+    (peak memory on Windows requires `psutil`)
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import concurrent.futures
+import math
+import matplotlib.pyplot as plt
+import multiprocessing
+import numpy as np
+import os
+import pandas as pd
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+# measurements reported for every stage
+list_stage_measures = ['Seconds', 'CPU_Seconds', 'Base_RSS_MB', 'Peak_RSS_MB', 'Rows']
+
+# peak resident memory of the process and its reset (Linux)
+path_proc_status     = r'/proc/self/status'
+path_proc_clear_refs = r'/proc/self/clear_refs'
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def getPeakRss():
+    '''
+    Purpose: Retrieve the peak resident memory of the current process (since
+        it started or since the last `resetPeakRss`)
+
+    Inputs
+    ------
+        NONE
+
+    Outputs
+    -------
+        peak_mb : float
+            Peak resident memory in megabytes (NaN if it can't be measured)
+    '''
+    # Linux reports the (resettable) peak in /proc
+    if os.path.exists(path_proc_status):
+        with open(path_proc_status, 'r') as file:
+            for line in file:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1e3
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kilobytes on Linux, bytes on macOS
+        return peak / 1e6 if sys.platform == 'darwin' else peak / 1e3
+    try:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / 1e6
+    except (ImportError, AttributeError):
+        return math.nan
+
+def resetPeakRss():
+    '''
+    Purpose: Reset the peak resident memory of the current process to its
+        current resident memory (Linux only), so the peak of a stage isn't
+        hidden by the memory used by imports and setup
+
+    Inputs
+    ------
+        NONE
+
+    Outputs
+    -------
+        reset : boolean
+            True if the peak was reset
+    '''
+    try:
+        with open(path_proc_clear_refs, 'w') as file:
+            file.write('5')
+        return True
+    except OSError:
+        return False
+
+def runStage(setup, func, path_dir):
+    '''
+    Purpose: Run and measure one stage in the current process (called in a
+        fresh worker process by `benchmarkStages`)
+
+    Inputs
+    ------
+        setup : function
+            Returns the tuple of arguments of `func` (untimed); None if
+            `func` takes no arguments
+        func : function
+            Stage to measure
+        path_dir : string
+            Project root in which the stage is run
+
+    Outputs
+    -------
+        dict_run : dictionary
+            Measurements of the stage (see `list_stage_measures`)
+    '''
+    os.chdir(path_dir)
+    inputs = setup() if setup is not None else ()
+
+    resetPeakRss()
+    base_rss = getPeakRss()
+    time_start = time.perf_counter()
+    cpu_start = time.process_time()
+    output = func(*inputs)
+    cpu_end = time.process_time()
+    time_end = time.perf_counter()
+
+    # stages that return more than one table report the rows of the first
+    if isinstance(output, tuple):
+        output = output[0]
+
+    return {'Seconds':time_end - time_start,
+            'CPU_Seconds':cpu_end - cpu_start,
+            'Base_RSS_MB':base_rss,
+            'Peak_RSS_MB':getPeakRss(),
+            'Rows':len(output) if hasattr(output, '__len__') else math.nan}
+
+def benchmarkStages(dict_stages, dict_paths, repeat = 1):
+    '''
+    Purpose: Measure every stage of a pipeline on every synthetic project
+
+    Inputs
+    ------
+        dict_stages : dictionary
+            Keys are stage names, values are (setup, func) tuples of
+            module-level functions (see `runStage`), in the order the
+            stages are run
+        dict_paths : dictionary
+            Keys are scales (e.g. 1, 10, 100), values are the project root
+            of the synthetic project of that scale
+        repeat : int
+            Runs of every stage; the fastest run is reported (default: 1)
+
+    Outputs
+    -------
+        df_stages : Pandas DataFrame
+            One row per scale and stage with its measurements
+    '''
+    # spawned workers start clean (no memory inherited from this process)
+    context = multiprocessing.get_context('spawn')
+
+    list_stages = []
+    for scale, path_dir in dict_paths.items():
+        for stage, (setup, func) in dict_stages.items():
+            dict_best = None
+            for run in range(repeat):
+                with concurrent.futures.ProcessPoolExecutor(
+                        max_workers = 1, mp_context = context) as executor:
+                    dict_run = executor.submit(runStage, setup, func,
+                                               os.path.abspath(path_dir)).result()
+                if dict_best is None or dict_run['Seconds'] < dict_best['Seconds']:
+                    dict_best = dict_run
+            list_stages.append({'Scale':scale, 'Stage':stage, **dict_best})
+            print(f'Done with: {stage} at {scale}x '
+                  f'({dict_best["Seconds"]:.2f} s, {dict_best["Peak_RSS_MB"]:.0f} MB)')
+
+    return pd.DataFrame(list_stages)
+
+def summarizeScaling(df_stages):
+    '''
+    Purpose: Summarize how every stage scales with the size of the data
+
+    Inputs
+    ------
+        df_stages : Pandas DataFrame
+            Output of `benchmarkStages`
+
+    Outputs
+    -------
+        df_summary : Pandas DataFrame
+            One row per stage with its seconds and peak memory at every
+            scale and the fitted exponents of both (slope of the log-log
+            curve; 1 = linear, 2 = quadratic)
+    '''
+    list_stages = list(pd.unique(df_stages['Stage']))
+    df_seconds = df_stages.pivot(index = 'Stage', columns = 'Scale',
+                                 values = 'Seconds').loc[list_stages]
+    df_memory = df_stages.pivot(index = 'Stage', columns = 'Scale',
+                                values = 'Peak_RSS_MB').loc[list_stages]
+
+    df_summary = pd.concat([df_seconds.add_prefix('Seconds_'),
+                            df_memory.add_prefix('Peak_RSS_MB_')], axis = 1)
+    if len(df_seconds.columns) > 1:
+        array_scales = np.log(df_seconds.columns.to_numpy(dtype = float))
+        df_summary['Seconds_Exponent'] = [np.polyfit(array_scales, np.log(row), 1)[0]
+                                          for row in df_seconds.to_numpy(dtype = float)]
+        df_summary['Peak_RSS_Exponent'] = [np.polyfit(array_scales, np.log(row), 1)[0]
+                                           for row in df_memory.to_numpy(dtype = float)]
+
+    return df_summary.reset_index()
+
+def plotScaling(df_stages, path = None):
+    '''
+    Purpose: Plot the scaling curve (seconds and peak memory vs. scale) of
+        every stage on log-log axes
+
+    Inputs
+    ------
+        df_stages : Pandas DataFrame
+            Output of `benchmarkStages`
+        path : string
+            File path of the image (default: None = don't save)
+
+    Outputs
+    -------
+        fig : matplotlib Figure
+            Figure with one panel for seconds and one for peak memory
+    '''
+    fig, (ax_time, ax_memory) = plt.subplots(1, 2, figsize = (12, 5))
+    for stage, df_stage in df_stages.groupby('Stage', sort = False):
+        ax_time.plot(df_stage['Scale'], df_stage['Seconds'], marker = 'o',
+                     label = stage)
+        ax_memory.plot(df_stage['Scale'], df_stage['Peak_RSS_MB'], marker = 'o',
+                       label = stage)
+
+    for ax, ylabel in [(ax_time, 'Seconds'), (ax_memory, 'Peak RSS (MB)')]:
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel('Scale (x real data)')
+        ax.set_ylabel(ylabel)
+        ax.grid(True, which = 'both', alpha = 0.3)
+    ax_time.legend()
+    fig.tight_layout()
+
+    if path is not None:
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok = True)
+        fig.savefig(path, dpi = 150)
+
+    return fig
+
+def writeSyntheticSchools(path_dir, schools, conference_size = 12, seed = 0):
+    '''
+    Purpose: Write a synthetic `school_abbreviations_and_pictures.csv` with
+        a standard name, nickname and alternate names for every school
+
+    Inputs
+    ------
+        path_dir : string
+            Project root of the synthetic project
+        schools : int
+            Number of schools
+        conference_size : int
+            Average number of schools per conference (default: 12)
+        seed : int
+            Seed of the random number generator (default: 0)
+
+    Outputs
+    -------
+        df_schools : Pandas DataFrame
+            Contents of the file
+    '''
+    rng = np.random.default_rng(seed)
+    list_conferences = [f'Conference {i:02d}' for i in
+                        range(1, schools // conference_size + 2)]
+
+    df_schools = pd.DataFrame({'Team':[f'School {i:05d}' for i in range(schools)]})
+    df_schools['Conference'] = rng.choice(list_conferences, schools)
+    df_schools['ConferenceAbbrev'] = df_schools['Conference'].str.replace(
+        'Conference ', 'C')
+    df_schools['Power5'] = rng.random(schools) < 0.5
+    df_schools['FBS'] = True
+    df_schools['Nickname'] = [f'Mascots {i:05d}' for i in range(schools)]
+    df_schools['Name1'] = [f'SCH{i:05d}' for i in range(schools)]
+    df_schools['Name2'] = [f'Sch. {i:05d}' for i in range(schools)]
+    for col in ['Name3', 'Name4', 'Name5', 'Name6', 'Name7']:
+        df_schools[col] = np.nan
+    df_schools['urlSchool'] = ''
+
+    os.makedirs(os.path.join(path_dir, 'references'), exist_ok = True)
+    df_schools.to_csv(os.path.join(path_dir, 'references',
+                                   'school_abbreviations_and_pictures.csv'),
+                      index = False, encoding = 'latin-1')
+
+    return df_schools
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Benchmark a pipeline on synthetic projects (see the `synthetic_*.py` modules)
+# df_stages = benchmarkStages(dict_pipeline_stages, {1:'data/synthetic/scale_1',
+#                                                    10:'data/synthetic/scale_10'})
+# df_summary = summarizeScaling(df_stages)
+# plotScaling(df_stages, r'data/benchmarks/stage_scaling.png')
@@ -0,0 +1,452 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:05:55 2026
+
+@author: agent
+
+:DESCRIPTION: Pack every school logo in `images/logos_school_square/` into a
+    single pre-scaled logo atlas so plots never decode a PNG.
+
+    Every logo is decoded once, padded to a square, resized to `logo_size`
+    pixels and stored as one uint8 RGBA array of shape
+    (# logos, logo_size, logo_size, 4) in `images/logo_atlas_{size}.npy`,
+    with a `.json` sidecar that maps each school name (the PNG's file name)
+    to its row and records the size and modification time of every source
+    PNG. The atlas is memory-mapped read-only when loaded and is rebuilt
+    only when a PNG is added, removed or changed.
+
+    `scatterLogos` draws the highlighted teams of a scatter plot as logos
+    and every other team as a plain point. All logos are resized once per
+    school and composited in one pass at draw time by a single artist
+    (instead of one `AnnotationBbox` per team). Only the tiles of the
+    figure that contain a logo are rasterized, so a plot with hundreds of
+    logos costs about as much to render as a plot with a few.
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import glob
+import json
+import numpy as np
+import os
+
+from matplotlib.artist import Artist
+from matplotlib.transforms import Bbox
+from PIL import Image
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+# pixel size of every logo in the atlas (the size of the source logos)
+logo_size = 50
+
+# pixel size of the tiles logos are composited onto when drawn
+logo_tile_size = 512
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def scanLogoSources(path_logos = r'images/logos_school_square'):
+    '''
+    Purpose: Record the size and modification time of every source logo
+
+    Inputs
+    ------
+        path_logos : string
+            Folder containing the `{school}.png` logos
+            (default: 'images/logos_school_square')
+
+    Outputs
+    -------
+        dict_sources : dictionary
+            Keys are school names, values are [file size, modification time
+            in nanoseconds]
+    '''
+    dict_sources = {}
+    for path in sorted(glob.glob(os.path.join(path_logos, '*.png'))):
+        stat = os.stat(path)
+        name = os.path.basename(path)[:-len('.png')]
+        dict_sources[name] = [stat.st_size, stat.st_mtime_ns]
+
+    return dict_sources
+
+def decodeLogo(path, size = logo_size):
+    '''
+    Purpose: Decode a logo, pad it to a square and resize it
+
+    Inputs
+    ------
+        path : string
+            File path of the logo
+        size : int
+            Width/height of the output in pixels (default: `logo_size`)
+
+    Outputs
+    -------
+        array_logo : NumPy array
+            uint8 RGBA logo of shape (size, size, 4)
+    '''
+    image = Image.open(path).convert('RGBA')
+    if image.width != image.height:
+        image_square = Image.new('RGBA', (max(image.size),) * 2, (0, 0, 0, 0))
+        image_square.paste(image, ((max(image.size) - image.width) // 2,
+                                   (max(image.size) - image.height) // 2))
+        image = image_square
+    if image.size != (size, size):
+        image = image.resize((size, size), Image.LANCZOS)
+
+    return np.asarray(image, dtype = np.uint8)
+
+def buildLogoAtlas(path_logos = r'images/logos_school_square', size = logo_size,
+                   path_atlas = None):
+    '''
+    Purpose: Decode and resize every logo and write the atlas (and its
+        sidecar) to disk
+
+    Inputs
+    ------
+        path_logos : string
+            Folder containing the `{school}.png` logos
+            (default: 'images/logos_school_square')
+        size : int
+            Width/height of every logo in pixels (default: `logo_size`)
+        path_atlas : string
+            File path of the `.npy` atlas (default: None =
+            `logo_atlas_{size}.npy` next to the logo folder)
+
+    Outputs
+    -------
+        NONE
+    '''
+    if path_atlas is None:
+        path_atlas = os.path.join(os.path.dirname(os.path.normpath(path_logos)),
+                                  f'logo_atlas_{size}.npy')
+    dict_sources = scanLogoSources(path_logos)
+
+    atlas = np.lib.format.open_memmap(path_atlas, mode = 'w+', dtype = np.uint8,
+                                      shape = (len(dict_sources), size, size, 4))
+    for idx, name in enumerate(dict_sources.keys()):
+        atlas[idx] = decodeLogo(os.path.join(path_logos, f'{name}.png'), size)
+    atlas.flush()
+    del atlas
+
+    with open(path_atlas.replace('.npy', '.json'), 'w') as file:
+        json.dump({'size':size,
+                   'index':{name:idx for idx, name in enumerate(dict_sources)},
+                   'sources':dict_sources}, file, indent = 1)
+
+def loadLogoAtlas(path_logos = r'images/logos_school_square', size = logo_size,
+                  path_atlas = None):
+    '''
+    Purpose: Memory-map the logo atlas, (re)building it first if any source
+        logo has been added, removed or changed since it was built
+
+    Inputs
+    ------
+        path_logos : string
+            Folder containing the `{school}.png` logos
+            (default: 'images/logos_school_square')
+        size : int
+            Width/height of every logo in pixels (default: `logo_size`)
+        path_atlas : string
+            File path of the `.npy` atlas (default: None =
+            `logo_atlas_{size}.npy` next to the logo folder)
+
+    Outputs
+    -------
+        dict_atlas : dictionary
+            Contains the read-only memory-mapped logos ('images') and the
+            school name -> row lookup ('index')
+    '''
+    if path_atlas is None:
+        path_atlas = os.path.join(os.path.dirname(os.path.normpath(path_logos)),
+                                  f'logo_atlas_{size}.npy')
+    path_sidecar = path_atlas.replace('.npy', '.json')
+
+    # rebuild if the atlas is missing or out of date
+    dict_sidecar = None
+    if os.path.exists(path_atlas) and os.path.exists(path_sidecar):
+        with open(path_sidecar, 'r') as file:
+            dict_sidecar = json.load(file)
+    if dict_sidecar is None or dict_sidecar['sources'] != scanLogoSources(path_logos):
+        buildLogoAtlas(path_logos, size, path_atlas)
+        with open(path_sidecar, 'r') as file:
+            dict_sidecar = json.load(file)
+
+    return {'images':np.load(path_atlas, mmap_mode = 'r'),
+            'index':dict_sidecar['index']}
+
+def getLogo(dict_atlas, school):
+    '''
+    Purpose: Retrieve a school's logo from the atlas
+
+    Inputs
+    ------
+        dict_atlas : dictionary
+            Output of `loadLogoAtlas`
+        school : string
+            Standardized school name (i.e. the logo's file name)
+
+    Outputs
+    -------
+        array_logo : NumPy array
+            uint8 RGBA logo (a view into the memory-mapped atlas)
+    '''
+    return dict_atlas['images'][dict_atlas['index'][school]]
+
+def resizeLogos(dict_atlas, list_schools, size_px):
+    '''
+    Purpose: Resize the logo of every school once for compositing
+
+    Inputs
+    ------
+        dict_atlas : dictionary
+            Output of `loadLogoAtlas`
+        list_schools : list of strings
+            Standardized school names (duplicates are resized only once)
+        size_px : int
+            Width/height of the resized logos in pixels
+
+    Outputs
+    -------
+        dict_logos : dictionary
+            Keys are school names, values are float32 RGBA logos with
+            premultiplied alpha (values between 0 and 1)
+    '''
+    dict_logos = {}
+    for school in set(list_schools):
+        image = Image.fromarray(np.asarray(getLogo(dict_atlas, school)))
+        if image.size != (size_px, size_px):
+            # like matplotlib's default interpolation, enlarge by 3x or more
+            #   with nearest neighbour
+            image = image.resize((size_px, size_px), Image.NEAREST
+                                 if size_px >= 3 * image.width else Image.LANCZOS)
+        array_logo = np.asarray(image, dtype = np.float32) / 255
+        array_logo[..., :3] *= array_logo[..., 3:]
+        dict_logos[school] = array_logo
+
+    return dict_logos
+
+def compositeLogos(dict_logos, list_schools, array_cols, array_rows, width,
+                   height, tile_size = logo_tile_size):
+    '''
+    Purpose: Composite logos onto a transparent canvas in a single pass
+        (later logos are drawn on top of earlier ones), keeping only the
+        tiles of the canvas that contain a logo
+
+    Inputs
+    ------
+        dict_logos : dictionary
+            Output of `resizeLogos`
+        list_schools : list of strings
+            School of every logo, in drawing order
+        array_cols : NumPy array
+            Column of every logo's top left corner on the canvas
+        array_rows : NumPy array
+            Row of every logo's top left corner on the canvas (row 0 = top)
+        width : int
+            Width of the canvas in pixels
+        height : int
+            Height of the canvas in pixels
+        tile_size : int
+            Width/height of the canvas tiles in pixels
+            (default: `logo_tile_size`)
+
+    Outputs
+    -------
+        list_tiles : list of tuples
+            (row, column, uint8 RGBA tile) of every tile containing a logo,
+            each cropped to the logos it contains
+    '''
+    # tiles covered by every logo, clipped to the canvas
+    dict_tiles = {}
+    for idx, (school, col, row) in enumerate(zip(list_schools, array_cols, array_rows)):
+        size_px = len(dict_logos[school])
+        col_0, row_0 = max(col, 0), max(row, 0)
+        col_1, row_1 = min(col + size_px, width), min(row + size_px, height)
+        if col_0 >= col_1 or row_0 >= row_1:
+            continue
+        for tile_row in range(row_0 // tile_size, (row_1 - 1) // tile_size + 1):
+            for tile_col in range(col_0 // tile_size, (col_1 - 1) // tile_size + 1):
+                dict_tiles.setdefault((tile_row, tile_col), []).append(
+                    (idx, row_0, col_0, row_1, col_1))
+
+    list_tiles = []
+    for (tile_row, tile_col), list_rects in dict_tiles.items():
+        # crop the tile to the logos it contains
+        array_rects = np.array([rect[1:] for rect in list_rects])
+        row_t = max(array_rects[:, 0].min(), tile_row * tile_size)
+        col_t = max(array_rects[:, 1].min(), tile_col * tile_size)
+        row_e = min(array_rects[:, 2].max(), (tile_row + 1) * tile_size)
+        col_e = min(array_rects[:, 3].max(), (tile_col + 1) * tile_size)
+        array_tile = np.zeros((row_e - row_t, col_e - col_t, 4), dtype = np.float32)
+
+        for idx, row_0, col_0, row_1, col_1 in list_rects:
+            array_logo = dict_logos[list_schools[idx]]
+            row_0, col_0 = max(row_0, row_t), max(col_0, col_t)
+            row_1, col_1 = min(row_1, row_e), min(col_1, col_e)
+            array_src = array_logo[row_0 - array_rows[idx]:row_1 - array_rows[idx],
+                                   col_0 - array_cols[idx]:col_1 - array_cols[idx]]
+            array_dst = array_tile[row_0 - row_t:row_1 - row_t, col_0 - col_t:col_1 - col_t]
+            array_dst *= 1 - array_src[..., 3:]
+            array_dst += array_src
+
+        # convert from premultiplied alpha back to straight alpha
+        array_alpha = array_tile[..., 3:]
+        np.divide(array_tile[..., :3], array_alpha, out = array_tile[..., :3],
+                  where = array_alpha > 0)
+        list_tiles.append((row_t, col_t,
+                           (np.clip(array_tile, 0, 1) * 255 + 0.5).astype(np.uint8)))
+
+    return list_tiles
+
+class LogoLayer(Artist):
+    '''
+    Purpose: Draw every logo of a scatter plot in one compositing pass,
+        each sized like an `OffsetImage` with the same zoom
+    '''
+    zorder = 3
+
+    def __init__(self, ax, array_x, array_y, list_schools, dict_atlas, zoom = 1):
+        super().__init__()
+        self.axes = ax
+        self.set_transform(ax.transData)
+        self.array_xy = np.column_stack([array_x, array_y]).astype(float)
+        self.list_schools = list(list_schools)
+        self.dict_atlas = dict_atlas
+        self.zoom = zoom
+        self.dict_logos = {}
+        self.composite = {}
+
+    def getLogoExtents(self, renderer):
+        # centers (display units) of the logos inside the axes, and logo size
+        array_centers = self.get_transform().transform(self.array_xy)
+        x0, y0, x1, y1 = self.axes.bbox.extents
+        array_inside = ((array_centers[:, 0] >= x0) & (array_centers[:, 0] <= x1) &
+                        (array_centers[:, 1] >= y0) & (array_centers[:, 1] <= y1))
+        size = len(self.dict_atlas['images'][0]) * self.zoom * renderer.points_to_pixels(1.)
+        return array_centers, array_inside, size
+
+    def get_window_extent(self, renderer = None):
+        if renderer is None:
+            return Bbox.null()
+        array_centers, array_inside, size = self.getLogoExtents(renderer)
+        if not array_inside.any():
+            return Bbox.null()
+        array_centers = array_centers[array_inside]
+        return Bbox([array_centers.min(axis = 0) - size / 2,
+                     array_centers.max(axis = 0) + size / 2])
+
+    def draw(self, renderer):
+        if not self.get_visible():
+            return
+        array_centers, array_inside, size = self.getLogoExtents(renderer)
+        if not array_inside.any():
+            return
+        array_centers = array_centers[array_inside]
+        list_schools = [x for x, inside in zip(self.list_schools, array_inside) if inside]
+
+        # raster pixels per display unit (> 1 for vector output)
+        mag = renderer.get_image_magnification()
+        size_px = max(int(round(size * mag)), 1)
+        if self.dict_logos.get('size') != size_px:
+            self.dict_logos = {'size':size_px, 'logos':resizeLogos(
+                self.dict_atlas, self.list_schools, size_px)}
+
+        # canvas covering every logo, limited to the figure
+        width, height = renderer.get_canvas_width_height()
+        x0 = max(array_centers[:, 0].min() - size / 2, 0)
+        y0 = max(array_centers[:, 1].min() - size / 2, 0)
+        x1 = min(array_centers[:, 0].max() + size / 2, width)
+        y1 = min(array_centers[:, 1].max() + size / 2, height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        array_cols = np.round((array_centers[:, 0] - size / 2 - x0) * mag).astype(int)
+        array_rows = np.round((y1 - array_centers[:, 1] - size / 2) * mag).astype(int)
+        # a figure saved with a tight bounding box is drawn twice with the
+        #   same logo layout, so the last composite is reused
+        key = (size_px, int(np.ceil((x1 - x0) * mag)), int(np.ceil((y1 - y0) * mag)),
+               tuple(list_schools), array_cols.tobytes(), array_rows.tobytes())
+        if self.composite.get('key') != key:
+            self.composite = {'key':key, 'tiles':compositeLogos(
+                self.dict_logos['logos'], list_schools, array_cols, array_rows,
+                key[1], key[2])}
+
+        gc = renderer.new_gc()
+        gc.set_alpha(self.get_alpha())
+        for row, col, array_tile in self.composite['tiles']:
+            renderer.draw_image(gc, x0 + col / mag, y1 - (row + len(array_tile)) / mag,
+                                array_tile[::-1])
+        gc.restore()
+        self.stale = False
+
+def scatterLogos(ax, array_x, array_y, list_schools, dict_atlas, zoom = 1,
+                 list_highlight = None, **kwargs):
+    '''
+    Purpose: Scatter plot that draws the highlighted schools as logos (all
+        composited by a single artist) and every other point as a marker
+
+    Inputs
+    ------
+        ax : Matplotlib Axes
+            Axes to draw on
+        array_x : array-like
+            x values
+        array_y : array-like
+            y values
+        list_schools : array-like of strings
+            Standardized school name of every point
+        dict_atlas : dictionary
+            Output of `loadLogoAtlas`
+        zoom : float
+            Logo zoom, as for `OffsetImage` (default: 1)
+        list_highlight : list of strings
+            Schools drawn as logos (default: None = every school)
+        **kwargs
+            Passed on to `ax.scatter` for the points that are not logos
+            (e.g. `s`, `alpha`, `c`)
+
+    Outputs
+    -------
+        layer : LogoLayer
+            Artist drawing the logos
+        points : Matplotlib PathCollection
+            Artist drawing the other points
+    '''
+    array_x = np.asarray(array_x, dtype = float)
+    array_y = np.asarray(array_y, dtype = float)
+    array_schools = np.asarray(list_schools, dtype = object)
+    array_logo = (np.ones(len(array_schools), dtype = bool) if list_highlight is None
+                  else np.isin(array_schools, list(list_highlight)))
+
+    points = ax.scatter(array_x[~array_logo], array_y[~array_logo], **kwargs)
+    layer = LogoLayer(ax, array_x[array_logo], array_y[array_logo],
+                      array_schools[array_logo], dict_atlas, zoom)
+    ax.add_artist(layer)
+
+    # logos count towards the axis limits like the points do
+    ax.update_datalim(layer.array_xy)
+    ax.autoscale_view()
+
+    return layer, points
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Load (building or refreshing if needed) the logo atlas
+# dict_atlas = loadLogoAtlas()
+
+# # Nebraska's logo, ready for `OffsetImage`
+# array_logo = getLogo(dict_atlas, 'Nebraska')
+
+# # Nebraska's seasons as logos, every other team-season as a point
+# fig, ax = plt.subplots()
+# scatterLogos(ax, df['Margin'], df['Win_Pct'], df['School'], dict_atlas,
+#              zoom = .3, list_highlight = ['Nebraska'], s = 10, alpha = 0.5)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 15:52:46 2026
+
+@author: agent
+
+:DESCRIPTION: Standardize raw position codes from team rosters and NFL draft
+    data using a single taxonomy table shared by every project
+    (`common/references/position_taxonomy.csv`):
+
+        raw code -> standard position -> position group -> side of ball
+
+    e.g. 'CB' -> DB -> Defensive Backs -> Defense
+         'T'  -> OL -> Offensive Linemen -> Offense
+
+    Codes are matched case-insensitively. The raw column is converted to a
+    categorical once and every taxonomy level is mapped over its (small) set
+    of categories, so a column of any length is standardized in one pass.
+    Codes missing from the taxonomy are reported together at the end.
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import numpy as np
+import os
+import pandas as pd
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+list_taxonomy_levels = ['position', 'position_group', 'side']
+
+# taxonomy table next to this module (found from any project root)
+path_taxonomy = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             'references', 'position_taxonomy.csv')
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def loadPositionTaxonomy(path = path_taxonomy):
+    '''
+    Purpose: Load the position taxonomy table
+
+    Inputs
+    ------
+        path : string
+            File path of the taxonomy table
+            (default: `path_taxonomy`, i.e.
+            'common/references/position_taxonomy.csv')
+
+    Outputs
+    -------
+        df_taxonomy : Pandas DataFrame
+            Taxonomy table indexed by (upper-case) raw position code
+    '''
+    df_taxonomy = pd.read_csv(path)
+    df_taxonomy['code'] = df_taxonomy['code'].str.upper()
+
+    return df_taxonomy.set_index('code')
+
+def standardizePositions(df, pos_var, list_names = ['Pos_Std', 'Pos_Group',
+                                                   'Pos_Side'],
+                         df_taxonomy = None):
+    '''
+    Purpose: Add the standard position, position group and side of ball for
+        every raw position code
+
+    Inputs
+    ------
+        df : Pandas DataFrame
+            DataFrame containing a raw position variable
+        pos_var : string
+            Name of the raw position variable
+        list_names : list of strings
+            Names of the standard position, position group and side of ball
+            variables to add (default: ['Pos_Std', 'Pos_Group', 'Pos_Side'])
+        df_taxonomy : Pandas DataFrame
+            Output of `loadPositionTaxonomy` (default: None = load it)
+
+    Outputs
+    -------
+        df : Pandas DataFrame
+            Original DataFrame with the variables in `list_names` added
+            (unknown codes keep their raw value as the standard position and
+            have no group or side)
+    '''
+    if df_taxonomy is None:
+        df_taxonomy = loadPositionTaxonomy()
+
+    # convert raw codes to categories once
+    series_codes = df[pos_var].astype(str).str.strip().str.upper()
+    series_codes = series_codes.where(df[pos_var].notna())
+    categorical = pd.Categorical(series_codes)
+    array_codes = categorical.codes
+
+    # map every taxonomy level over the categories only
+    df_levels = df_taxonomy.reindex(categorical.categories)[list_taxonomy_levels]
+    df_levels['position'] = df_levels['position'].fillna(
+        pd.Series(categorical.categories, index = df_levels.index))
+
+    # expand the category-level values back to every row (-1 = missing)
+    for name, level in zip(list_names, list_taxonomy_levels):
+        array_values = np.append(df_levels[level].to_numpy(dtype = object), np.nan)
+        df[name] = array_values[array_codes]
+
+    # report unknown codes all at once
+    list_unknown = [x for x in categorical.categories if x not in df_taxonomy.index]
+    if len(list_unknown) > 0:
+        series_counts = series_codes[series_codes.isin(list_unknown)].value_counts()
+        print('Positions not found in position taxonomy .csv file: ' +
+              ', '.join([f'{code} ({count})' for code, count in series_counts.items()]))
+
+    return df
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Standardize roster positions
+# df = standardizePositions(df, 'POS.')
+
+# # Standardize draft positions
+# df_draft = standardizePositions(df_draft, 'position',
+#                                 ['position_std', 'position_group', 'side'])
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:17:54 2026
+
+@author: agent
+
+:DESCRIPTION: Render a set of figures in parallel, one figure per task on a
+    process pool, so the whole set takes about as long as the slowest plot,
+    and save figures according to named render profiles.
+
+    Every task names a plotting function (which must live in an importable
+    module rather than in an analysis script), its keyword arguments and
+    the shared objects it needs. Shared objects (e.g. the
+    stats table) are pickled once to a temporary file that every worker
+    reads once at start-up, so tasks only carry their names. Every worker
+    memory-maps the logo atlas (available to tasks as 'dict_atlas') and
+    draws with the non-interactive Agg backend.
+
+    Render profiles (`dict_render_profiles`) set the format, resolution and
+    maximum raster size of every output: 'preview' (quick low-dpi .png),
+    'publish' (1200 dpi .png) and 'vector' (.pdf). The dpi of a raster
+    output is lowered when needed to keep it under the profile's pixel
+    budget, which bounds the memory of the Agg canvas (4 bytes per pixel).
+    Every output records a hash of the plotted data and its profile in
+    `{folder}/.hashes/`, and plots skip outputs whose hash is unchanged.
+
+    NOTE: the process pool requires the calling script to be guarded with
+        `if __name__ == '__main__':` on Windows.
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import concurrent.futures
+import hashlib
+import json
+import math
+import matplotlib
+import matplotlib.pyplot as plt
+import os
+import pandas as pd
+import pickle
+import tempfile
+import time
+
+from logo_atlas import loadLogoAtlas
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+# shared objects of the current worker process (set by `initRenderWorker`)
+dict_worker = {}
+
+# output settings of every render profile (max_pixels caps the raster size,
+#   i.e. 36 million pixels = ~144 MB canvas; suffix is added to file names)
+dict_render_profiles = {
+    'preview':{'format':'png', 'dpi':150, 'max_pixels':4e6, 'suffix':'_preview'},
+    'publish':{'format':'png', 'dpi':1200, 'max_pixels':36e6, 'suffix':''},
+    'vector':{'format':'pdf', 'dpi':1200, 'max_pixels':None, 'suffix':''}}
+
+# profiles rendered when none are specified
+list_default_profiles = ['publish', 'vector']
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def getOutputPath(name, profile, path_dir = r'images/plots'):
+    '''
+    Purpose: File path of a figure saved with a render profile
+
+    Inputs
+    ------
+        name : string
+            Name of the figure (i.e. its file name without extension)
+        profile : string
+            Name of the render profile (see `dict_render_profiles`)
+        path_dir : string
+            Folder of the figures (default: 'images/plots')
+
+    Outputs
+    -------
+        path : string
+            File path of the output
+    '''
+    dict_profile = dict_render_profiles[profile]
+
+    return os.path.join(path_dir, f"{name}{dict_profile['suffix']}.{dict_profile['format']}")
+
+def hashPlotData(*list_objs):
+    '''
+    Purpose: Hash everything a figure is drawn from
+
+    Inputs
+    ------
+        *list_objs
+            DataFrames/Series (hashed by content) and any other values
+            (hashed by their repr, e.g. titles or names)
+
+    Outputs
+    -------
+        hash_data : string
+            Hex digest of the inputs
+    '''
+    hasher = hashlib.sha1()
+    for obj in list_objs:
+        if isinstance(obj, (pd.DataFrame, pd.Series)):
+            hasher.update(pd.util.hash_pandas_object(obj).to_numpy().tobytes())
+            hasher.update(repr(list(obj.columns) if isinstance(obj, pd.DataFrame)
+                               else obj.name).encode())
+        else:
+            hasher.update(repr(obj).encode())
+
+    return hasher.hexdigest()
+
+def getOutputHash(hash_data, profile):
+    '''
+    Purpose: Combine the hash of the plotted data with the settings of a
+        render profile
+
+    Inputs
+    ------
+        hash_data : string
+            Output of `hashPlotData`
+        profile : string
+            Name of the render profile
+
+    Outputs
+    -------
+        hash_output : string
+            Hex digest identifying the output
+    '''
+    return hashlib.sha1((hash_data + json.dumps(dict_render_profiles[profile],
+                                                sort_keys = True)).encode()).hexdigest()
+
+def getHashPath(path):
+    '''
+    Purpose: File path of the hash recorded for an output
+
+    Inputs
+    ------
+        path : string
+            File path of the output
+
+    Outputs
+    -------
+        path_hash : string
+            `{folder}/.hashes/{file name}.sha1`
+    '''
+    return os.path.join(os.path.dirname(path), '.hashes', os.path.basename(path) + '.sha1')
+
+def findStaleOutputs(name, hash_data, list_profiles = list_default_profiles,
+                     path_dir = r'images/plots'):
+    '''
+    Purpose: Identify the profiles whose output is missing or was drawn from
+        different data/settings
+
+    Inputs
+    ------
+        name : string
+            Name of the figure
+        hash_data : string
+            Output of `hashPlotData`
+        list_profiles : list of strings
+            Render profiles (default: `list_default_profiles`)
+        path_dir : string
+            Folder of the figures (default: 'images/plots')
+
+    Outputs
+    -------
+        list_stale : list of strings
+            Profiles that need to be rendered
+    '''
+    list_stale = []
+    for profile in list_profiles:
+        path = getOutputPath(name, profile, path_dir)
+        hash_saved = None
+        if os.path.exists(path) and os.path.exists(getHashPath(path)):
+            with open(getHashPath(path), 'r') as file:
+                hash_saved = file.read().strip()
+        if hash_saved != getOutputHash(hash_data, profile):
+            list_stale.append(profile)
+
+    return list_stale
+
+def capDpi(fig, dpi, max_pixels):
+    '''
+    Purpose: Lower a dpi so the figure's raster stays within a pixel budget
+
+    Inputs
+    ------
+        fig : Matplotlib Figure
+            Figure to save
+        dpi : float
+            Requested dpi
+        max_pixels : float
+            Maximum number of pixels (None = no limit)
+
+    Outputs
+    -------
+        dpi : float
+            dpi to save with
+    '''
+    width, height = fig.get_size_inches()
+    if max_pixels is not None and width * height * dpi ** 2 > max_pixels:
+        dpi = math.floor(math.sqrt(max_pixels / (width * height)))
+
+    return dpi
+
+def saveFigure(fig, name, hash_data, list_profiles = list_default_profiles,
+               path_dir = r'images/plots'):
+    '''
+    Purpose: Save a figure with every render profile and record the hash of
+        every output
+
+    Inputs
+    ------
+        fig : Matplotlib Figure
+            Figure to save
+        name : string
+            Name of the figure
+        hash_data : string
+            Output of `hashPlotData`
+        list_profiles : list of strings
+            Render profiles (default: `list_default_profiles`)
+        path_dir : string
+            Folder of the figures (default: 'images/plots')
+
+    Outputs
+    -------
+        list_paths : list of strings
+            File paths of the saved outputs
+    '''
+    list_paths = []
+    for profile in list_profiles:
+        dict_profile = dict_render_profiles[profile]
+        path = getOutputPath(name, profile, path_dir)
+        fig.savefig(path, format = dict_profile['format'], bbox_inches = 'tight',
+                    dpi = capDpi(fig, dict_profile['dpi'], dict_profile['max_pixels']))
+
+        os.makedirs(os.path.dirname(getHashPath(path)), exist_ok = True)
+        with open(getHashPath(path), 'w') as file:
+            file.write(getOutputHash(hash_data, profile))
+        list_paths.append(path)
+
+    return list_paths
+
+def initRenderWorker(path_shared, path_logos = r'images/logos_school_square'):
+    '''
+    Purpose: Prepare a worker process: switch to the Agg backend, load the
+        shared objects and memory-map the logo atlas
+
+    Inputs
+    ------
+        path_shared : string
+            File path of the pickled shared objects (None = no objects)
+        path_logos : string
+            Folder containing the `{school}.png` logos
+            (default: 'images/logos_school_square')
+
+    Outputs
+    -------
+        NONE
+    '''
+    matplotlib.use('Agg')
+    dict_worker.clear()
+    if path_shared is not None:
+        with open(path_shared, 'rb') as file:
+            dict_worker.update(pickle.load(file))
+    dict_worker['dict_atlas'] = loadLogoAtlas(path_logos)
+
+def renderTask(task, dict_shared = None):
+    '''
+    Purpose: Render one figure in the current (worker) process
+
+    Inputs
+    ------
+        task : dictionary
+            Contains the name of the figure ('name'), the plotting function
+            ('func'), its keyword arguments ('kwargs', optional) and the
+            shared objects it receives ('shared', optional: keys are argument
+            names, values are keys of the shared objects)
+        dict_shared : dictionary
+            Shared objects (default: None = those of the worker process)
+
+    Outputs
+    -------
+        dict_result : dictionary
+            Name of the figure ('Task'), file paths returned by the plotting
+            function ('Paths'), seconds taken ('Seconds') and the process
+            that rendered it ('PID')
+    '''
+    if dict_shared is None:
+        dict_shared = dict_worker
+    dict_kwargs = dict(task.get('kwargs', {}))
+    for arg, key in task.get('shared', {}).items():
+        dict_kwargs[arg] = dict_shared[key]
+
+    # close only the figures the task opened (other figures of the calling
+    #   process stay open when rendering in the current process)
+    set_open = set(plt.get_fignums())
+    time_start = time.perf_counter()
+    list_paths = task['func'](**dict_kwargs)
+    seconds = time.perf_counter() - time_start
+    for num in set(plt.get_fignums()) - set_open:
+        plt.close(num)
+
+    return {'Task':task['name'], 'Paths':list_paths, 'Seconds':seconds,
+            'PID':os.getpid()}
+
+def renderFigures(list_tasks, dict_shared = None, max_workers = None,
+                  path_logos = r'images/logos_school_square'):
+    '''
+    Purpose: Render every figure on a process pool
+
+    Inputs
+    ------
+        list_tasks : list of dictionaries
+            Figures to render (see `renderTask`)
+        dict_shared : dictionary
+            Objects shared by the tasks, e.g. {'df':df_stats}
+            (default: None = none besides the logo atlas)
+        max_workers : int
+            Number of processes (default: None = one per task, up to one
+            per CPU; 1 = render in the current process, keeping its backend)
+        path_logos : string
+            Folder containing the `{school}.png` logos
+            (default: 'images/logos_school_square')
+
+    Outputs
+    -------
+        df_render : Pandas DataFrame
+            One row per figure with its file paths, seconds taken and process
+            (in the order of `list_tasks`)
+        seconds_total : float
+            Wall time to render every figure
+    '''
+    time_start = time.perf_counter()
+    list_columns = ['Task', 'Paths', 'Seconds', 'PID']
+
+    # nothing to render (and no pool to start)
+    if len(list_tasks) == 0:
+        return pd.DataFrame(columns = list_columns), time.perf_counter() - time_start
+
+    # render in the current process with its own backend (pyplot figures are
+    #   not shown while rendering, and are saved through their format's canvas)
+    if max_workers == 1:
+        dict_local = dict(dict_shared or {})
+        dict_local['dict_atlas'] = loadLogoAtlas(path_logos)
+        with plt.ioff():
+            list_results = [renderTask(task, dict_local) for task in list_tasks]
+
+    else:
+        # build (or refresh) the logo atlas once, before any worker maps it
+        loadLogoAtlas(path_logos)
+
+        # pickle the shared objects once for every worker
+        path_shared = None
+        if dict_shared:
+            with tempfile.NamedTemporaryFile(suffix = '.pkl', delete = False) as file:
+                pickle.dump(dict_shared, file, protocol = pickle.HIGHEST_PROTOCOL)
+                path_shared = file.name
+
+        try:
+            if max_workers is None:
+                max_workers = min(len(list_tasks), os.cpu_count() or 1)
+            with concurrent.futures.ProcessPoolExecutor(
+                    max_workers = max_workers, initializer = initRenderWorker,
+                    initargs = (path_shared, path_logos)) as executor:
+                list_results = list(executor.map(renderTask, list_tasks))
+        finally:
+            if path_shared is not None:
+                os.remove(path_shared)
+
+    df_render = pd.DataFrame(list_results, columns = list_columns)
+
+    return df_render, time.perf_counter() - time_start
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# if __name__ == '__main__':
+#     # Render the defensive and offensive line plots at the same time
+#     list_tasks = [{'name':'Defensive Linemen', 'func':plotStats,
+#                    'kwargs':{'name_position':'Defensive Linemen'},
+#                    'shared':{'df':'DL', 'dict_atlas':'dict_atlas'}},
+#                   {'name':'Offensive Linemen', 'func':plotStats,
+#                    'kwargs':{'name_position':'Offensive Linemen'},
+#                    'shared':{'df':'OL', 'dict_atlas':'dict_atlas'}}]
+#     df_render, seconds_total = renderFigures(
+#         list_tasks, {'DL':df_stats[df_stats.Pos == 'DL'],
+#                      'OL':df_stats[df_stats.Pos == 'OL']})
@@ -0,0 +1,435 @@
+#!/usr/bin/env python3.7
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:01:19 2026
+
+@author: agent
+
+:DESCRIPTION: Record structured metrics of a run (a scrape or an analysis)
+    so slow runs can be broken down into time spent on the network,
+    waiting between requests, parsing HTML, extracting tables and
+    transforming data.
+
+    A run is started with `startRun` and ended with `endRun`. While a run
+    is active every event is written as one JSON line to
+    `data/metrics/{name}_{timestamp}.jsonl` (outside of a run, events are
+    ignored). Every event has the run name, time and kind plus the fields
+    of its kind:
+
+        - fetch : URL, Status, Bytes, Seconds (latency) and Cache (miss =
+                  requested, hit = read from saved pages/cache)
+        - wait  : URL and Seconds spent sleeping between requests
+        - html  : URL, Bytes and Seconds to build the BeautifulSoup tree
+        - parse : Parser, Seconds (and Seconds_Extract/Seconds_Cleanup
+                  where the parser has both steps) and Rows emitted
+        - stage : Stage, Seconds (wall), CPU_Seconds and Rows
+
+    Scrapers share one pooled session (`createSession`) and space their
+    requests to the same host with `waitForHost`, which records each sleep
+    as a `wait` event.
+
+    `endRun` prints a summary of the run (request counts by status and
+    cache hit/miss, time per parser and stage) with text histograms of
+    the seconds of every kind. Saved runs can be summarized again with
+    `summarizeEvents(loadEvents(path))`.
+
+    Usage from the command line (run from the project root):
+        python ../common/run_metrics.py data/metrics/scrape_results_20261019_163000.jsonl
+
+:REQUIRES: See Package Import section for required packages
+
+:TODO: NONE
+"""
+
+#==============================================================================
+# Package Import
+#==============================================================================
+import argparse
+import contextlib
+import datetime
+import json
+import math
+import numpy as np
+import os
+import pandas as pd
+import requests
+import threading
+import time
+import urllib.parse
+
+from requests.packages.urllib3.util.retry import Retry
+
+#==============================================================================
+# Reference Variable Declaration
+#==============================================================================
+# active run (name, start time, JSON lines file) shared by all threads
+dict_run = {}
+lock_events = threading.Lock()
+
+# next time a request may be sent to each host (shared by all threads)
+dict_next_request = {}
+lock_rate = threading.Lock()
+
+# histogram bucket edges in seconds
+list_histogram_edges = [0, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2,
+                        0.5, 1, 2, 5, 10, 20, 50, 100, math.inf]
+histogram_width = 40
+
+#==============================================================================
+# Function Definitions
+#==============================================================================
+def startRun(name, path_dir = r'data/metrics'):
+    '''
+    Purpose: Start recording the events of a run (ending the active run,
+        if any)
+
+    Inputs
+    ------
+        name : string
+            Name of the run (e.g. 'scrape_results')
+        path_dir : string
+            Folder of the JSON lines files (default: 'data/metrics')
+
+    Outputs
+    -------
+        path_events : string
+            File path of the run's JSON lines file
+    '''
+    if dict_run:
+        endRun(print_summary = False)
+
+    os.makedirs(path_dir, exist_ok = True)
+    ts = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+    path_events = os.path.join(path_dir, f'{name}_{ts}.jsonl')
+    with lock_events:
+        dict_run.update({'name':name, 'path':path_events,
+                         'start':time.perf_counter(),
+                         'file':open(path_events, 'w', encoding = 'utf-8'),
+                         'events':[]})
+
+    return path_events
+
+def recordEvent(kind, **dict_fields):
+    '''
+    Purpose: Record one event of the active run (ignored outside of a run)
+
+    Inputs
+    ------
+        kind : string
+            Kind of event (fetch, wait, html, parse or stage)
+        **dict_fields
+            Fields of the event (e.g. URL = url, Seconds = 0.25)
+
+    Outputs
+    -------
+        NONE
+    '''
+    if not dict_run:
+        return
+
+    dict_event = {'Run':dict_run['name'],
+                  'Time':datetime.datetime.now().isoformat(timespec = 'milliseconds'),
+                  'Kind':kind, **dict_fields}
+    with lock_events:
+        if not dict_run:
+            return
+        dict_run['events'].append(dict_event)
+        dict_run['file'].write(json.dumps(dict_event, default = str) + '\n')
+        dict_run['file'].flush()
+
+@contextlib.contextmanager
+def timeStage(stage, **dict_fields):
+    '''
+    Purpose: Record the wall and CPU time of a block of code as a `stage`
+        event (set `dict_stage['Rows']` inside the block to record the rows
+        it produced)
+
+    Inputs
+    ------
+        stage : string
+            Name of the stage (e.g. 'mergeAllData')
+        **dict_fields
+            Additional fields of the event
+
+    Outputs
+    -------
+        dict_stage : dictionary
+            Fields of the event (yielded to the block)
+    '''
+    dict_stage = dict(dict_fields)
+    time_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        yield dict_stage
+    finally:
+        # CPU time is that of the whole process (i.e. all threads)
+        recordEvent('stage', Stage = stage,
+                    Seconds = time.perf_counter() - time_start,
+                    CPU_Seconds = time.process_time() - cpu_start,
+                    **dict_stage)
+
+def fetchUrl(session, url, **kwargs):
+    '''
+    Purpose: Request a URL and record its latency, status and size as a
+        `fetch` event
+
+    Inputs
+    ------
+        session : requests Session
+            Session used for the request
+        url : string
+            URL to request
+        **kwargs
+            Keyword arguments of `session.get` (e.g. timeout = 30)
+
+    Outputs
+    -------
+        r : requests Response
+            Response of the request (exceptions are recorded and re-raised)
+    '''
+    time_start = time.perf_counter()
+    try:
+        r = session.get(url, **kwargs)
+    except Exception as e:
+        recordEvent('fetch', URL = url, Status = None, Bytes = 0, Cache = 'miss',
+                    Seconds = time.perf_counter() - time_start,
+                    Error = type(e).__name__)
+        raise
+    recordEvent('fetch', URL = url, Status = r.status_code, Bytes = len(r.content),
+                Cache = 'miss', Seconds = time.perf_counter() - time_start)
+
+    return r
+
+def createSession(max_workers = 8):
+    '''
+    Purpose: Create a session whose connection pool is large enough for
+        every worker thread and which retries failed connections
+
+    Inputs
+    ------
+        max_workers : int
+            Number of threads sharing the session (default: 8)
+
+    Outputs
+    -------
+        session : requests Session
+            Pooled session for all requests of a scraper
+    '''
+    session = requests.Session()
+    retry = Retry(connect = 3, read = 2, backoff_factor = 0.5,
+                  status_forcelist = [429, 500, 502, 503, 504])
+    adapter = requests.adapters.HTTPAdapter(pool_connections = max_workers,
+                                            pool_maxsize = max_workers,
+                                            max_retries = retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['User-Agent'] = 'Mozilla/5.0'
+
+    return session
+
+def waitForHost(url, min_interval):
+    '''
+    Purpose: Block until a request may be sent to the host of `url` such
+        that requests to the same host are at least `min_interval` seconds
+        apart (slots are reserved under a lock, the wait happens outside it
+        and is recorded as a `wait` event)
+
+    Inputs
+    ------
+        url : string
+            URL about to be requested
+        min_interval : float
+            Minimum number of seconds between requests to the same host
+
+    Outputs
+    -------
+        NONE
+    '''
+    host = urllib.parse.urlsplit(url).netloc
+    with lock_rate:
+        time_now = time.monotonic()
+        time_send = max(time_now, dict_next_request.get(host, 0))
+        dict_next_request[host] = time_send + min_interval
+    time.sleep(time_send - time_now)
+    recordEvent('wait', URL = url, Seconds = time_send - time_now)
+
+def sleepBetweenRequests(seconds, url = None):
+    '''
+    Purpose: Sleep between requests and record it as a `wait` event
+
+    Inputs
+    ------
+        seconds : float
+            Seconds to sleep
+        url : string
+            URL the wait precedes or follows (default: None)
+
+    Outputs
+    -------
+        NONE
+    '''
+    time.sleep(seconds)
+    recordEvent('wait', URL = url, Seconds = seconds)
+
+def loadEvents(path):
+    '''
+    Purpose: Read the events of a saved run
+
+    Inputs
+    ------
+        path : string
+            File path of a run's JSON lines file
+
+    Outputs
+    -------
+        df_events : Pandas DataFrame
+            One row per event
+    '''
+    with open(path, 'r', encoding = 'utf-8') as file:
+        return pd.DataFrame([json.loads(line) for line in file if line.strip()])
+
+def printHistogram(series, title):
+    '''
+    Purpose: Print a text histogram of durations in seconds
+
+    Inputs
+    ------
+        series : Pandas Series
+            Durations in seconds
+        title : string
+            Title printed above the histogram
+
+    Outputs
+    -------
+        NONE
+    '''
+    series = pd.to_numeric(series, errors = 'coerce').dropna()
+    if len(series) == 0:
+        return
+
+    array_counts = pd.cut(series, list_histogram_edges, right = False).value_counts(
+        sort = False).to_numpy()
+    list_nonzero = np.flatnonzero(array_counts)
+    print(f'  {title}: n = {len(series)}, total = {series.sum():.2f} s, '
+          f'p50 = {series.median():.3f} s, p90 = {series.quantile(0.9):.3f} s, '
+          f'max = {series.max():.3f} s')
+    for i in range(list_nonzero[0], list_nonzero[-1] + 1):
+        label = f'{list_histogram_edges[i]:g}-{list_histogram_edges[i + 1]:g} s'
+        bar = '#' * math.ceil(histogram_width * array_counts[i] / array_counts.max())
+        print(f'    {label:>13} | {bar:<{histogram_width}} {array_counts[i]}')
+
+def summarizeEvents(df_events, seconds_total = None):
+    '''
+    Purpose: Print a summary of a run's events with a histogram of the
+        seconds of every kind of event
+
+    Inputs
+    ------
+        df_events : Pandas DataFrame
+            Events of a run (see `loadEvents`)
+        seconds_total : float
+            Wall time of the run (default: None = not printed)
+
+    Outputs
+    -------
+        NONE
+    '''
+    if len(df_events) == 0:
+        print('No events recorded')
+        return
+
+    run = df_events['Run'].iloc[0]
+    print(f'=== Run summary: {run} ({len(df_events)} events'
+          + (f', {seconds_total:.1f} s' if seconds_total is not None else '') + ')')
+
+    df_fetch = df_events[df_events['Kind'] == 'fetch']
+    if len(df_fetch) > 0:
+        dict_cache = df_fetch['Cache'].value_counts().to_dict()
+        # pages read from a cache have no status
+        dict_status = (df_fetch.loc[df_fetch['Cache'] == 'miss', 'Status']
+                       .fillna('error').astype(str)
+                       .str.replace(r'\.0$', '', regex = True).value_counts().to_dict())
+        print(f"Fetch: {len(df_fetch)} pages ({dict_cache.get('miss', 0)} requested, "
+              f"{dict_cache.get('hit', 0)} from cache), "
+              f"{pd.to_numeric(df_fetch['Bytes']).sum() / 1e6:.2f} MB"
+              + (', status: ' + ', '.join(f'{k} x{v}' for k, v in dict_status.items())
+                 if dict_status else ''))
+        printHistogram(df_fetch.loc[df_fetch['Cache'] == 'miss', 'Seconds'],
+                       'Request latency')
+
+    df_wait = df_events[df_events['Kind'] == 'wait']
+    if len(df_wait) > 0:
+        print('Wait:')
+        printHistogram(df_wait['Seconds'], 'Sleep between requests')
+
+    df_html = df_events[df_events['Kind'] == 'html']
+    if len(df_html) > 0:
+        print('HTML:')
+        printHistogram(df_html['Seconds'], 'BeautifulSoup')
+
+    df_parse = df_events[df_events['Kind'] == 'parse']
+    if len(df_parse) > 0:
+        print('Parse:')
+        for parser, df_parser in df_parse.groupby('Parser', sort = False):
+            printHistogram(df_parser['Seconds'],
+                           f"{parser} ({int(pd.to_numeric(df_parser['Rows']).sum())} rows)")
+
+    df_stage = df_events[df_events['Kind'] == 'stage']
+    if len(df_stage) > 0:
+        print('Stages:')
+        df_stages = df_stage.reindex(columns = ['Stage', 'Seconds', 'CPU_Seconds', 'Rows'])
+        df_stages = df_stages.groupby('Stage', sort = False).agg(
+            Runs = ('Seconds', 'size'), Seconds = ('Seconds', 'sum'),
+            CPU_Seconds = ('CPU_Seconds', 'sum'), Rows = ('Rows', 'sum'))
+        df_stages['Rows'] = df_stages['Rows'].round().astype('Int64')
+        print(df_stages.round(3).to_string())
+        if (df_stages['Runs'] > 1).any():
+            printHistogram(df_stage['Seconds'], 'Stage wall time')
+
+def endRun(print_summary = True):
+    '''
+    Purpose: End the active run and print its summary
+
+    Inputs
+    ------
+        print_summary : boolean
+            Print the summary of the run (default: True)
+
+    Outputs
+    -------
+        df_events : Pandas DataFrame
+            One row per event of the run
+    '''
+    with lock_events:
+        if not dict_run:
+            return pd.DataFrame()
+        dict_run['file'].close()
+        df_events = pd.DataFrame(dict_run['events'])
+        seconds_total = time.perf_counter() - dict_run['start']
+        path_events = dict_run['path']
+        dict_run.clear()
+
+    if print_summary:
+        summarizeEvents(df_events, seconds_total)
+        print(f'Events saved to {path_events}')
+
+    return df_events
+
+#==============================================================================
+# Working Code
+#==============================================================================
+
+# # Record a run and print its summary
+# startRun('analyze_results')
+# with timeStage('mergeAllData') as stage:
+#     df = mergeAllData()
+#     stage['Rows'] = len(df)
+# df_events = endRun()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description = 'Summarize the metrics of a saved run')
+    parser.add_argument('path', help = 'path of the run\'s .jsonl file')
+    args = parser.parse_args()
+
+    summarizeEvents(loadEvents(args.path))
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 18:40:12 2026
+
+@author: agent
+
+:DESCRIPTION: Make the modules shared by every project importable by the
+    tests (the modules import each other by their bare module name).
+
+:REQUIRES: pytest
+
+:TODO: NONE
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
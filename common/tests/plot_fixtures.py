@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 18:52:04 2026
+
+@author: agent
+
+:DESCRIPTION: Fixtures shared by the plot tests of every project (imported
+    by a project's `conftest.py`).
+
+:REQUIRES: pytest
+
+:TODO: NONE
+"""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from PIL import Image
+
+from logo_atlas import loadLogoAtlas
+
+@pytest.fixture
+def dict_atlas(tmp_path, monkeypatch):
+    '''
+    Logos of two schools, with figures saved under a temporary folder
+    '''
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'images' / 'plots').mkdir(parents = True)
+    path_logos = tmp_path / 'images' / 'logos_school_square'
+    path_logos.mkdir()
+    for school in ['Nebraska', 'Iowa']:
+        Image.fromarray(np.full((16, 16, 4), 255, dtype = np.uint8)).save(
+            path_logos / f'{school}.png')
+    yield loadLogoAtlas(str(path_logos))
+    plt.close('all')
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 19:25:09 2026
+
+@author: agent
+
+:DESCRIPTION: Check the synthetic school names written for every synthetic
+    project.
+
+:REQUIRES: pytest
+
+:TODO: NONE
+"""
+
+import pandas as pd
+
+from benchmark_stages import writeSyntheticSchools
+
+def test_synthetic_schools(tmp_path):
+    df_schools = writeSyntheticSchools(str(tmp_path), 140, conference_size = 14, seed = 1)
+    df_file = pd.read_csv(tmp_path / 'references' / 'school_abbreviations_and_pictures.csv',
+                          encoding = 'latin-1')
+    assert len(df_file) == 140
+    assert df_file['Team'].is_unique
+    assert df_file['Conference'].nunique() <= 140 // 14 + 1
+    pd.testing.assert_frame_equal(df_file[['Team', 'Conference', 'Name1']],
+                                  df_schools[['Team', 'Conference', 'Name1']])
+
+    # the same seed writes the same schools
+    df_again = writeSyntheticSchools(str(tmp_path), 140, conference_size = 14, seed = 1)
+    pd.testing.assert_frame_equal(df_again, df_schools)
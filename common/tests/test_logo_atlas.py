@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 18:41:37 2026
+
+@author: agent
+
+:DESCRIPTION: Check that the logo atlas is rebuilt only when a source logo
+    is added or changed, and that `scatterLogos` draws the same logos as one
+    `AnnotationBbox(OffsetImage)` per point.
+
+:REQUIRES: pytest
+
+:TODO: NONE
+"""
+
+import matplotlib
+import matplotlib.pyplot as plt
+import numpy as np
+import os
+import pytest
+from matplotlib.offsetbox import AnnotationBbox, OffsetImage
+from PIL import Image
+
+import logo_atlas
+from logo_atlas import getLogo, loadLogoAtlas, scatterLogos
+
+dict_colors = {'Nebraska':(200, 0, 0), 'Iowa':(0, 0, 200), 'Purdue':(0, 150, 0)}
+
+def writeLogo(path_logos, school, color):
+    '''
+    Write a 50 x 50 logo: an opaque square of `color` on a transparent border
+    '''
+    array_logo = np.zeros((50, 50, 4), dtype = np.uint8)
+    array_logo[8:42, 8:42] = (*color, 255)
+    Image.fromarray(array_logo).save(os.path.join(path_logos, f'{school}.png'))
+
+@pytest.fixture
+def path_logos(tmp_path):
+    path = tmp_path / 'logos_school_square'
+    path.mkdir()
+    for school, color in dict_colors.items():
+        writeLogo(path, school, color)
+    return str(path)
+
+@pytest.fixture
+def list_builds(monkeypatch):
+    '''
+    Logo folder of every `buildLogoAtlas` call
+    '''
+    list_builds = []
+    buildLogoAtlas = logo_atlas.buildLogoAtlas
+    def buildLogoAtlasLogged(path_logos, *args, **kwargs):
+        list_builds.append(path_logos)
+        return buildLogoAtlas(path_logos, *args, **kwargs)
+    monkeypatch.setattr(logo_atlas, 'buildLogoAtlas', buildLogoAtlasLogged)
+    return list_builds
+
+def test_rebuilt_only_when_logos_change(path_logos, list_builds):
+    dict_atlas = loadLogoAtlas(path_logos)
+    assert len(list_builds) == 1
+    assert sorted(dict_atlas['index']) == sorted(dict_colors)
+
+    # unchanged logos: the saved atlas is read
+    loadLogoAtlas(path_logos)
+    assert len(list_builds) == 1
+
+    # added logo
+    writeLogo(path_logos, 'Iowa State', (200, 200, 0))
+    dict_atlas = loadLogoAtlas(path_logos)
+    assert len(list_builds) == 2
+    assert getLogo(dict_atlas, 'Iowa State')[25, 25].tolist() == [200, 200, 0, 255]
+
+    # changed logo (with a later modification time)
+    path_png = os.path.join(path_logos, 'Nebraska.png')
+    stat = os.stat(path_png)
+    writeLogo(path_logos, 'Nebraska', (100, 0, 0))
+    os.utime(path_png, ns = (stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    dict_atlas = loadLogoAtlas(path_logos)
+    assert len(list_builds) == 3
+    assert getLogo(dict_atlas, 'Nebraska')[25, 25].tolist() == [100, 0, 0, 255]
+
+    loadLogoAtlas(path_logos)
+    assert len(list_builds) == 3
+
+def renderLogos(plotLogos, dpi):
+    '''
+    Render the logos drawn by `plotLogos(ax)` on an empty axes
+    '''
+    backend = matplotlib.get_backend()
+    matplotlib.use('agg')
+    try:
+        fig, ax = plt.subplots(figsize = (4, 3), dpi = dpi)
+        plotLogos(ax)
+        ax.set_xlim(0, 1)
+        ax.set_ylim(0, 1)
+        ax.axis('off')
+        fig.canvas.draw()
+        array_image = np.asarray(fig.canvas.buffer_rgba()).astype(int)
+        plt.close(fig)
+    finally:
+        matplotlib.use(backend)
+
+    return array_image
+
+@pytest.mark.parametrize('zoom, dpi', [(1, 72), (2, 150)])
+def test_scatter_matches_annotation_boxes(path_logos, zoom, dpi):
+    dict_atlas = loadLogoAtlas(path_logos)
+    list_x = [0.1, 0.5, 0.8, 0.3]
+    list_y = [0.2, 0.6, 0.3, 0.9]
+    list_schools = ['Nebraska', 'Iowa', 'Purdue', 'Nebraska']
+
+    def plotAnnotationBoxes(ax):
+        for x, y, school in zip(list_x, list_y, list_schools):
+            ax.add_artist(AnnotationBbox(OffsetImage(getLogo(dict_atlas, school),
+                                                     zoom = zoom),
+                                         (x, y), frameon = False))
+
+    array_logos = renderLogos(lambda ax: scatterLogos(
+        ax, list_x, list_y, list_schools, dict_atlas, zoom = zoom), dpi)
+    array_boxes = renderLogos(plotAnnotationBoxes, dpi)
+    assert (array_logos[..., :3] < 250).any(axis = 2).sum() > 0
+
+    # logos may be placed up to a pixel apart
+    array_diff = np.full(array_logos.shape[:2], 255)
+    for dy in [-1, 0, 1]:
+        for dx in [-1, 0, 1]:
+            array_shifted = np.roll(array_boxes, (dy, dx), axis = (0, 1))
+            array_diff = np.minimum(array_diff,
+                                    np.abs(array_logos - array_shifted).max(axis = 2))
+    assert array_diff.max() <= 2
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 19:12:46 2026
+
+@author: agent
+
+:DESCRIPTION: Check that a run writes one JSON line per event of its stages,
+    requests and waits, and that runs without events are summarized.
+
+:REQUIRES: pytest
+
+:TODO: NONE
+"""
+
+import json
+import os
+import pandas as pd
+import pytest
+
+from run_metrics import (dict_run, endRun, loadEvents, recordEvent, startRun,
+                         summarizeEvents, timeStage, waitForHost)
+
+@pytest.fixture
+def path_metrics(tmp_path):
+    path = str(tmp_path / 'metrics')
+    yield path
+    endRun(print_summary = False)
+
+def test_run_writes_json_lines(path_metrics, capsys):
+    recordEvent('fetch', URL = 'http://example.com/before')
+    path_events = startRun('test_run', path_metrics)
+    assert os.path.dirname(path_events) == path_metrics
+    assert os.path.basename(path_events).startswith('test_run_')
+
+    with timeStage('mergeAllData', Year = 2021) as stage:
+        stage['Rows'] = 12
+    recordEvent('fetch', URL = 'http://example.com/a', Status = 200, Bytes = 512,
+                Cache = 'miss', Seconds = 0.25)
+    waitForHost('http://example.com/a', 0)
+    df_events = endRun()
+    assert dict_run == {}
+
+    # events outside of the run are ignored
+    recordEvent('fetch', URL = 'http://example.com/after')
+
+    with open(path_events, 'r', encoding = 'utf-8') as file:
+        list_events = [json.loads(line) for line in file]
+    assert [x['Kind'] for x in list_events] == ['stage', 'fetch', 'wait']
+    assert all(x['Run'] == 'test_run' for x in list_events)
+    assert {key:list_events[0][key] for key in ['Stage', 'Year', 'Rows']} == {
+        'Stage':'mergeAllData', 'Year':2021, 'Rows':12}
+    assert list_events[0]['Seconds'] >= 0 and list_events[0]['CPU_Seconds'] >= 0
+    assert {key:list_events[1][key] for key in ['URL', 'Status', 'Bytes', 'Cache']} == {
+        'URL':'http://example.com/a', 'Status':200, 'Bytes':512, 'Cache':'miss'}
+    assert list_events[2]['URL'] == 'http://example.com/a'
+
+    # the events returned, saved and summarized are the same
+    pd.testing.assert_frame_equal(df_events, loadEvents(path_events))
+    out = capsys.readouterr().out
+    assert '=== Run summary: test_run (3 events' in out
+    assert 'Fetch: 1 pages (1 requested, 0 from cache)' in out
+    assert f'Events saved to {path_events}' in out
+
+def test_run_without_events(path_metrics, capsys):
+    path_events = startRun('empty_run', path_metrics)
+    df_events = endRun()
+    assert len(df_events) == 0
+    assert os.path.getsize(path_events) == 0
+    assert 'No events recorded' in capsys.readouterr().out
+
+    summarizeEvents(pd.DataFrame())
+    assert capsys.readouterr().out == 'No events recorded\n'
+
+    # ending a run twice is harmless
+    assert len(endRun()) == 0
+
+def test_requests_to_a_host_are_spaced(path_metrics):
+    path_events = startRun('wait_run', path_metrics)
+    for page in range(3):
+        waitForHost(f'http://wait.example.com/{page}', 0.05)
+    waitForHost('http://other.example.com/0', 0.05)
+    endRun(print_summary = False)
+
+    df_events = loadEvents(path_events)
+    assert df_events['Kind'].tolist() == ['wait'] * 4
+    # the first request to every host doesn't wait
+    assert df_events['Seconds'].iloc[0] == 0
+    assert (df_events['Seconds'].iloc[1:3] > 0.03).all()
+    assert df_events['Seconds'].iloc[3] == 0